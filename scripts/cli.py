@@ -1,10 +1,12 @@
 import typer
 
+from scripts.cli_tools.benchmarks import benchmark_app
 from scripts.cli_tools.prepopulate_db import database_migration_app
 
 app = typer.Typer()
 
 app.add_typer(database_migration_app, name="database_data")
+app.add_typer(benchmark_app, name="benchmark")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,384 @@
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+from typing import Annotated
+
+import typer
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import DECIMAL, UUID, Integer, String, event, func, insert, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.apps.authentication.session.adapters.adapter import (
+    FakeAuthSessionAdapter,
+    FakeOTPCodeAdapter,
+    FakePasswordResetTokenAdapter,
+)
+from src.apps.authentication.user.adapters.adapter import FakeUserAdapter
+from src.apps.authorization.access.adapters.adapter import FakeAccessAdapter
+from src.apps.authorization.role.adapters.adapter import FakePermissionsAdapter, FakeRoleAdapter
+from src.apps.comment.adapters.adapter import FakeCommentAdapter
+from src.apps.hotel.bookings.adapters.adapter import FakeBookingAdapter
+from src.apps.hotel.hotels.adapters.adapter import FakeHotelAdapter
+from src.apps.hotel.rooms.adapters.adapter import FakeRoomAdapter
+from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.common.controllers.http.coalescing import CoalescingAPIRoute, coalesce_requests
+from src.common.domain.amenities import amenities_of
+from src.config import create_configs
+from src.infrastructure.context import RequestContext
+from src.infrastructure.database.memory.database import MemoryDatabase
+from src.infrastructure.database.profiling import StatementCounter
+from src.infrastructure.database.session import ReleasingAsyncSession
+
+benchmark_app = typer.Typer(help="Performance benchmarks")
+config = create_configs()
+
+
+class _PoolUsage:
+    """Track the peak number of connections checked out of an engine pool."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.current = 0
+        self.peak = 0
+        event.listen(engine.sync_engine.pool, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine.pool, "checkin", self._on_checkin)
+
+    def _on_checkout(self, *args: object) -> None:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+
+    def _on_checkin(self, *args: object) -> None:
+        self.current -= 1
+
+
+async def _simulate_requests(
+    session_class: type[AsyncSession],
+    concurrency: int,
+    pool_size: int,
+    db_ms: int,
+    work_ms: int,
+) -> tuple[float, int, int]:
+    """Run concurrent request-like tasks: a read, some non-database work, another read."""
+    engine = create_async_engine(config.database.db_url, pool_size=pool_size, max_overflow=0, pool_timeout=5)
+    usage = _PoolUsage(engine)
+    session_factory = async_sessionmaker(engine, class_=session_class, expire_on_commit=False)
+    query = select(func.pg_sleep(db_ms / 1000))
+    timeouts = 0
+
+    async def _request() -> None:
+        nonlocal timeouts
+        try:
+            async with session_factory() as session:
+                await session.execute(query)
+                await asyncio.sleep(work_ms / 1000)
+                await session.execute(query)
+        except PoolTimeoutError:
+            timeouts += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(_request() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    await engine.dispose()
+    return elapsed, usage.peak, timeouts
+
+
+@benchmark_app.command("pool-occupancy")
+def pool_occupancy(
+    concurrency: Annotated[int, typer.Option(help="Number of concurrent simulated requests.")] = 50,
+    pool_size: Annotated[int, typer.Option(help="Connection pool size, overflow disabled.")] = 5,
+    db_ms: Annotated[int, typer.Option(help="Database time per statement in milliseconds.")] = 5,
+    work_ms: Annotated[int, typer.Option(help="Non-database work per request in milliseconds.")] = 50,
+) -> None:
+    """Compare pool saturation of request-long sessions with sessions releasing connections after reads."""
+    for label, session_class in (("request-scoped", AsyncSession), ("release-after-reads", ReleasingAsyncSession)):
+        elapsed, peak, timeouts = asyncio.run(_simulate_requests(session_class, concurrency, pool_size, db_ms, work_ms))
+        typer.secho(
+            f"{label:>20}: {concurrency} requests in {elapsed:.2f}s, "
+            f"peak connections {peak}/{pool_size}, pool timeouts {timeouts}",
+            fg=typer.colors.BLUE,
+        )
+
+
+class _BenchmarkBase(DeclarativeBase):
+    pass
+
+
+class _BenchmarkItem(_BenchmarkBase):
+    """Scratch table shaped like a room row, created and dropped by the bulk insert benchmark."""
+
+    __tablename__ = "benchmark_bulk_items"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[str | None] = mapped_column(String, nullable=True)
+    price: Mapped[Decimal] = mapped_column(DECIMAL(10, 4), nullable=False)
+
+
+def _make_items(rows: int) -> list[_BenchmarkItem]:
+    return [
+        _BenchmarkItem(id=uuid.uuid4(), name=f"Room {number}", description=None, price=Decimal("100.00"))
+        for number in range(rows)
+    ]
+
+
+async def _insert_one_by_one(session: AsyncSession, items: list[_BenchmarkItem]) -> None:
+    for item in items:
+        session.add(item)
+        await session.commit()
+
+
+async def _insert_with_one_flush(session: AsyncSession, items: list[_BenchmarkItem]) -> None:
+    session.add_all(items)
+    await session.commit()
+
+
+async def _insert_with_add_many(session: AsyncSession, items: list[_BenchmarkItem]) -> None:
+    await SQLAlchemyGateway(session, RequestContext.empty()).add_many(items)
+
+
+async def _time_bulk_insert(
+    rows: int, strategy: Callable[[AsyncSession, list[_BenchmarkItem]], Awaitable[None]]
+) -> float:
+    """Insert rows into an empty scratch table with the given strategy and return the elapsed time."""
+    engine = create_async_engine(config.database.db_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(_BenchmarkBase.metadata.drop_all)
+        await connection.run_sync(_BenchmarkBase.metadata.create_all)
+
+    items = _make_items(rows)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            started_at = time.perf_counter()
+            await strategy(session, items)
+            return time.perf_counter() - started_at
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(_BenchmarkBase.metadata.drop_all)
+        await engine.dispose()
+
+
+@benchmark_app.command("bulk-insert")
+def bulk_insert(
+    rows: Annotated[int, typer.Option(help="Number of rows to insert.")] = 10_000,
+    one_by_one: Annotated[bool, typer.Option(help="Also time one commit per row, slow for many rows.")] = True,
+) -> None:
+    """Compare inserting rows one commit at a time, with one ORM flush and with the gateway bulk insert."""
+    strategies = {
+        "commit-per-row": _insert_one_by_one,
+        "single-flush": _insert_with_one_flush,
+        "add-many": _insert_with_add_many,
+    }
+    if not one_by_one:
+        strategies.pop("commit-per-row")
+
+    for label, strategy in strategies.items():
+        elapsed = asyncio.run(_time_bulk_insert(rows, strategy))
+        typer.secho(f"{label:>15}: {rows} rows in {elapsed:.2f}s ({rows / elapsed:.0f} rows/s)", fg=typer.colors.BLUE)
+
+
+_FAKE_GATEWAYS: tuple[type[FakeGateway], ...] = (
+    FakeUserAdapter,
+    FakeAuthSessionAdapter,
+    FakePasswordResetTokenAdapter,
+    FakeOTPCodeAdapter,
+    FakeRoleAdapter,
+    FakePermissionsAdapter,
+    FakeAccessAdapter,
+    FakeHotelAdapter,
+    FakeRoomAdapter,
+    FakeBookingAdapter,
+    FakeCommentAdapter,
+)
+
+
+@benchmark_app.command("fake-gateways")
+def fake_gateways(
+    requests: Annotated[int, typer.Option(help="Number of simulated requests.")] = 10_000,
+) -> None:
+    """Measure the per-request cost of building the in-memory database and every fake gateway."""
+    shared_database = MemoryDatabase(config)
+    scenarios = {
+        # Request-scoped memory database, the default life scope
+        "request-scoped database": lambda: MemoryDatabase(config),
+        # App-scoped memory database, only the gateways are built per request
+        "app-scoped database": lambda: shared_database,
+    }
+
+    for label, get_database in scenarios.items():
+        started_at = time.perf_counter()
+        for _ in range(requests):
+            memory_db = get_database()
+            for gateway_class in _FAKE_GATEWAYS:
+                gateway_class(memory_db)
+        elapsed = time.perf_counter() - started_at
+        typer.secho(
+            f"{label:>25}: {elapsed / requests * 1_000_000:.1f}us per request "
+            f"({len(_FAKE_GATEWAYS)} gateways, {requests} requests)",
+            fg=typer.colors.BLUE,
+        )
+
+
+def _polling_app(session_factory: async_sessionmaker[AsyncSession], db_ms: int) -> FastAPI:
+    """Build an app serving the same list query from a coalesced and from a plain route."""
+    router = APIRouter(prefix="/hotels", route_class=CoalescingAPIRoute)
+    query = select(func.pg_sleep(db_ms / 1000))
+
+    async def _list_hotels(location: str) -> dict[str, str]:
+        async with session_factory() as session:
+            await session.execute(query)
+        return {"location": location}
+
+    @router.get("/coalesced")
+    @coalesce_requests
+    async def list_hotels_coalesced(location: str) -> dict[str, str]:
+        return await _list_hotels(location)
+
+    @router.get("/plain")
+    async def list_hotels_plain(location: str) -> dict[str, str]:
+        return await _list_hotels(location)
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def _time_polling(path: str, requests: int, db_ms: int) -> tuple[float, int]:
+    """Send identical concurrent requests to a route and return the elapsed time and the statement count."""
+    engine = create_async_engine(config.database.db_url, pool_size=10, max_overflow=0, pool_timeout=60)
+    # Connect once beforehand, so the dialect initialization statements are not counted
+    async with engine.connect():
+        pass
+
+    app = _polling_app(async_sessionmaker(engine, expire_on_commit=False), db_ms)
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://benchmark") as client:
+            with StatementCounter.capture(engine) as counter:
+                started_at = time.perf_counter()
+                await asyncio.gather(*(client.get(path, params={"location": "Paris"}) for _ in range(requests)))
+                elapsed = time.perf_counter() - started_at
+        return elapsed, len(counter)
+    finally:
+        await engine.dispose()
+
+
+@benchmark_app.command("request-coalescing")
+def request_coalescing(
+    requests: Annotated[int, typer.Option(help="Number of identical concurrent requests.")] = 500,
+    db_ms: Annotated[int, typer.Option(help="Database time of the list query in milliseconds.")] = 20,
+) -> None:
+    """Compare the database statements run by a burst of identical GETs with and without coalescing."""
+    for label, path in (("plain", "/hotels/plain"), ("coalesced", "/hotels/coalesced")):
+        elapsed, statements = asyncio.run(_time_polling(path, requests, db_ms))
+        typer.secho(
+            f"{label:>10}: {requests} requests in {elapsed:.2f}s, {statements} database statements",
+            fg=typer.colors.BLUE,
+        )
+
+
+class _BenchmarkRoom(_BenchmarkBase):
+    """Scratch table with the services columns of a room row, created and dropped by the services filter benchmark."""
+
+    __tablename__ = "benchmark_services_rooms"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    services: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    amenities: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+# Share of the rooms offering each service, from the ubiquitous to the rare
+_SERVICE_SHARES = {
+    "wifi": 0.9,
+    "tv": 0.7,
+    "air_conditioning": 0.5,
+    "minibar": 0.3,
+    "balcony": 0.15,
+    "kitchen": 0.05,
+    "spa": 0.02,
+    "sauna": 0.01,
+}
+
+_SERVICES_FILTERS = {
+    "common": {"wifi": True},
+    "rare": {"kitchen": True, "spa": True},
+    "uncommon key": {"wifi": True, "sauna": True},
+}
+
+
+_CREATE_SERVICES_INDEX = (
+    "CREATE INDEX ix_benchmark_services_rooms_services ON benchmark_services_rooms USING gin (services jsonb_path_ops)"
+)
+
+
+def _make_room_rows(rows: int) -> list[dict]:
+    rows_data = []
+    for _ in range(rows):
+        services = {name: random.random() < share for name, share in _SERVICE_SHARES.items()}
+        rows_data.append({"id": uuid.uuid4(), "services": services, "amenities": amenities_of(services)})
+    return rows_data
+
+
+async def _time_filter(engine: AsyncEngine, services: dict, use_amenities: bool, repeats: int) -> tuple[float, int]:
+    """Count the rooms passing a services filter and return the median elapsed time and the count."""
+    if use_amenities:
+        criteria = SQLAlchemyGateway.services_criteria(_BenchmarkRoom, services)
+    else:
+        criteria = [_BenchmarkRoom.services.op("@>")(services)]
+    query = select(func.count()).select_from(_BenchmarkRoom).where(*criteria)
+
+    timings = []
+    async with engine.connect() as connection:
+        for _ in range(repeats):
+            started_at = time.perf_counter()
+            count = (await connection.execute(query)).scalar_one()
+            timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings), count
+
+
+async def _time_services_filters(rooms: int, repeats: int) -> None:
+    """Seed the scratch table, then time every filter without an index, with the GIN index and with the bitmap."""
+    engine = create_async_engine(config.database.db_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(_BenchmarkBase.metadata.drop_all)
+        await connection.run_sync(_BenchmarkBase.metadata.create_all)
+
+    try:
+        for offset in range(0, rooms, 10_000):
+            async with engine.begin() as connection:
+                await connection.execute(insert(_BenchmarkRoom), _make_room_rows(min(10_000, rooms - offset)))
+
+        phases = {
+            "no index": (False, ()),
+            "gin jsonb_path_ops": (False, (_CREATE_SERVICES_INDEX,)),
+            "gin + amenities": (True, ()),
+        }
+        for phase, (use_amenities, statements) in phases.items():
+            async with engine.begin() as connection:
+                for statement in (*statements, "ANALYZE benchmark_services_rooms"):
+                    await connection.execute(text(statement))
+            for label, services in _SERVICES_FILTERS.items():
+                elapsed, count = await _time_filter(engine, services, use_amenities, repeats)
+                typer.secho(
+                    f"{phase:>20} | {label:>12}: {elapsed * 1000:8.2f}ms median, {count} of {rooms} rooms",
+                    fg=typer.colors.BLUE,
+                )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(_BenchmarkBase.metadata.drop_all)
+        await engine.dispose()
+
+
+@benchmark_app.command("services-filter")
+def services_filter(
+    rooms: Annotated[int, typer.Option(help="Number of rooms to seed.")] = 500_000,
+    repeats: Annotated[int, typer.Option(help="Runs of each filter query, the median is reported.")] = 5,
+) -> None:
+    """Compare services filter latency on a JSONB scan, the GIN jsonb_path_ops index and the amenities bitmap."""
+    asyncio.run(_time_services_filters(rooms, repeats))
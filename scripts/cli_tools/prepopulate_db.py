@@ -10,8 +10,11 @@ from sqlalchemy.exc import IntegrityError
 from src.apps.authentication.user.domain.models import User
 from src.apps.hotel.hotels.domain.models import Hotel
 from src.apps.hotel.rooms.domain.models import Room
+from src.common.adapters.adapter import SQLAlchemyGateway
+from src.common.exceptions.common import BaseError
 from src.common.interfaces import SecurityGatewayProto
 from src.config import create_configs
+from src.infrastructure.context import RequestContext
 from src.ioc.registry import get_providers
 from src.setup.common import create_async_container
 
@@ -62,6 +65,7 @@ async def _load_samples() -> None:
         security = await request_container.get(SecurityGatewayProto)
 
         async with AsyncSession(engine) as session:
+            gateway = SQLAlchemyGateway(session, RequestContext.empty())
             result = await session.execute(text("SELECT id FROM roles WHERE name = 'manager'"))
             manager_role_id = result.scalar_one_or_none()
 
@@ -73,108 +77,109 @@ async def _load_samples() -> None:
             sample_password: str = await security.hash_password("Password123")
 
             try:
-                for i in range(1, 4):
-                    manager = User(
-                        email=f"manager{i}@hotel.com",
-                        hashed_password=sample_password,
-                        role_id=manager_role_id,
-                        name=f"Manager {i}",
-                        phone=f"+7900000000{i}",
-                        is_active=True,
-                    )
-                    session.add(manager)
-                    managers.append(manager)
-
-                await session.flush()
-
-                hotels_data = [
-                    {
-                        "name": "Grand Palace Hotel",
-                        "location": "Moscow, Red Square",
-                        "services": {
-                            "wifi": True,
-                            "parking": True,
-                            "pool": True,
-                            "gym": True,
+                # Users, hotels and rooms are stored by the single commit of the unit of work
+                async with gateway():
+                    for i in range(1, 4):
+                        manager = User(
+                            email=f"manager{i}@hotel.com",
+                            hashed_password=sample_password,
+                            role_id=manager_role_id,
+                            name=f"Manager {i}",
+                            phone=f"+7900000000{i}",
+                            is_active=True,
+                        )
+                        session.add(manager)
+                        managers.append(manager)
+
+                    await session.flush()
+
+                    hotels_data = [
+                        {
+                            "name": "Grand Palace Hotel",
+                            "location": "Moscow, Red Square",
+                            "services": {
+                                "wifi": True,
+                                "parking": True,
+                                "pool": True,
+                                "gym": True,
+                            },
                         },
-                    },
-                    {
-                        "name": "Seaside Resort",
-                        "location": "Sochi, Beach Boulevard",
-                        "services": {
-                            "wifi": True,
-                            "beach": True,
-                            "spa": True,
-                            "restaurant": True,
+                        {
+                            "name": "Seaside Resort",
+                            "location": "Sochi, Beach Boulevard",
+                            "services": {
+                                "wifi": True,
+                                "beach": True,
+                                "spa": True,
+                                "restaurant": True,
+                            },
                         },
-                    },
-                    {
-                        "name": "Mountain View Lodge",
-                        "location": "Krasnaya Polyana, Mountain Road",
-                        "services": {
-                            "wifi": True,
-                            "ski": True,
-                            "sauna": True,
-                            "bar": True,
+                        {
+                            "name": "Mountain View Lodge",
+                            "location": "Krasnaya Polyana, Mountain Road",
+                            "services": {
+                                "wifi": True,
+                                "ski": True,
+                                "sauna": True,
+                                "bar": True,
+                            },
                         },
-                    },
-                ]
-
-                rooms_templates = [
-                    {
-                        "name": "Standard Room",
-                        "price": Decimal("2500.00"),
-                        "services": {"wifi": True, "tv": True},
-                    },
-                    {
-                        "name": "Deluxe Room",
-                        "price": Decimal("4000.00"),
-                        "services": {"wifi": True, "tv": True, "minibar": True},
-                    },
-                    {
-                        "name": "Suite",
-                        "price": Decimal("7500.00"),
-                        "services": {
-                            "wifi": True,
-                            "tv": True,
-                            "minibar": True,
-                            "jacuzzi": True,
+                    ]
+
+                    rooms_templates = [
+                        {
+                            "name": "Standard Room",
+                            "price": Decimal("2500.00"),
+                            "services": {"wifi": True, "tv": True},
                         },
-                    },
-                    {
-                        "name": "Family Room",
-                        "price": Decimal("5500.00"),
-                        "services": {"wifi": True, "tv": True, "kitchen": True},
-                    },
-                    {
-                        "name": "Presidential Suite",
-                        "price": Decimal("15000.00"),
-                        "services": {
-                            "wifi": True,
-                            "tv": True,
-                            "minibar": True,
-                            "jacuzzi": True,
-                            "balcony": True,
+                        {
+                            "name": "Deluxe Room",
+                            "price": Decimal("4000.00"),
+                            "services": {"wifi": True, "tv": True, "minibar": True},
                         },
-                    },
-                ]
-
-                for manager, hotel_data in zip(managers, hotels_data, strict=False):
-                    hotel = Hotel(
-                        name=hotel_data["name"],
-                        location=hotel_data["location"],
-                        services=hotel_data["services"],
-                        rooms_quantity=10,
-                        owner=manager.id,
-                        is_active=True,
-                    )
-                    session.add(hotel)
-                    await session.flush()
-
-                    for room_template in rooms_templates:
-                        room = Room(
-                            hotel_id=hotel.id,
+                        {
+                            "name": "Suite",
+                            "price": Decimal("7500.00"),
+                            "services": {
+                                "wifi": True,
+                                "tv": True,
+                                "minibar": True,
+                                "jacuzzi": True,
+                            },
+                        },
+                        {
+                            "name": "Family Room",
+                            "price": Decimal("5500.00"),
+                            "services": {"wifi": True, "tv": True, "kitchen": True},
+                        },
+                        {
+                            "name": "Presidential Suite",
+                            "price": Decimal("15000.00"),
+                            "services": {
+                                "wifi": True,
+                                "tv": True,
+                                "minibar": True,
+                                "jacuzzi": True,
+                                "balcony": True,
+                            },
+                        },
+                    ]
+
+                    hotels = [
+                        Hotel(
+                            name=hotel_data["name"],
+                            location=hotel_data["location"],
+                            services=hotel_data["services"],
+                            rooms_quantity=10,
                             owner=manager.id,
+                            is_active=True,
+                        )
+                        for manager, hotel_data in zip(managers, hotels_data, strict=False)
+                    ]
+                    rooms = [
+                        Room(
+                            hotel_id=hotel.id,
+                            owner=hotel.owner,
                             name=room_template["name"],
                             description=f"Comfortable {room_template['name'].lower()} at {hotel.name}",
                             price=room_template["price"],
@@ -182,12 +187,16 @@ async def _load_samples() -> None:
                             image_id=None,
                             quantity=2,
                         )
-                        session.add(room)
+                        for hotel in hotels
+                        for room_template in rooms_templates
+                    ]
+                    # Hotels and rooms go in with one multi-row insert per table
+                    await gateway.add_many(hotels)
+                    await gateway.add_many(rooms)
 
-                await session.commit()
                 typer.secho("Sample data loaded successfully", fg=typer.colors.BLUE)
 
-            except IntegrityError:
+            except (IntegrityError, BaseError):
                 typer.secho(
                     "Sample data already exists in database. Skipping...",
                     fg=typer.colors.YELLOW,
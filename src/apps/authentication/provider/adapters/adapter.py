@@ -18,7 +18,7 @@ class ProviderAdapter(SQLAlchemyGateway, ProviderGatewayProto):
             provider (Provider): The provider aggregate.
         """
         self.session.add(provider)
-        await self.session.commit()
+        await self._save()
 
     async def get_by_id(self, provider_id: UUID) -> Provider | None:
         """
@@ -24,7 +24,7 @@ class AuthSessionAdapter(SQLAlchemyGateway, AuthSessionGatewayProto):
     async def add(self, refresh_session: AuthSession) -> None:
         """Adds a refresh session to the database."""
         self.session.add(refresh_session)
-        await self.session.commit()
+        await self._save()
 
     async def get_refresh_session(
         self,
@@ -87,12 +87,14 @@ class AuthSessionAdapter(SQLAlchemyGateway, AuthSessionGatewayProto):
             auth_session (AuthSession): The auth session object.
         """
         await self.session.delete(auth_session)
+        await self._save()
 
 
 class PasswordResetTokenAdapter(SQLAlchemyGateway, PasswordResetTokenGatewayProto):
     async def add(self, password_reset_token: PasswordResetToken) -> None:
         """Adds a password reset token to the database."""
         self.session.add(password_reset_token)
+        await self._save()
 
     async def get_valid_password_reset_token(self, hashed_token: str) -> PasswordResetToken | None:
         """
@@ -134,6 +136,7 @@ class OTPCodeAdapter(SQLAlchemyGateway, OTPCodeGatewayProto):
     async def add(self, otp_code: OTPCode) -> None:
         """Adds an OTP code to the database."""
         self.session.add(otp_code)
+        await self._save()
 
     async def get_valid_otp_code(self, user_id: UUID) -> OTPCode | None:
         """
@@ -196,14 +199,7 @@ class FakeAuthSessionAdapter(FakeGateway[AuthSession], AuthSessionGatewayProto):
         Returns:
             AuthSession | None: The refresh session object if found, otherwise None.
         """
-        return next(
-            (
-                auth_session
-                for auth_session in self._collection
-                if auth_session.user_id == user_id and auth_session.hashed_refresh_token == hashed_refresh_token
-            ),
-            None,
-        )
+        return self._collection.first(hashed_refresh_token=hashed_refresh_token, user_id=user_id)
 
     async def count_active_auth_session_by_user_id(self, user_id: UUID) -> int:
         """
@@ -217,11 +213,8 @@ class FakeAuthSessionAdapter(FakeGateway[AuthSession], AuthSessionGatewayProto):
         """
         from datetime import UTC, datetime
 
-        return sum(
-            1
-            for auth_session in self._collection
-            if auth_session.user_id == user_id and auth_session.expires_at > datetime.now(UTC)
-        )
+        now = datetime.now(UTC)
+        return sum(1 for auth_session in self._collection.find(user_id=user_id) if auth_session.expires_at > now)
 
     async def remove_refresh_sessions_by_user_id(self, user_id: UUID) -> None:
         """
@@ -230,7 +223,8 @@ class FakeAuthSessionAdapter(FakeGateway[AuthSession], AuthSessionGatewayProto):
         Args:
             user_id (UUID): The unique identifier of the user.
         """
-        self._collection = {auth_session for auth_session in self._collection if auth_session.user_id != user_id}
+        for auth_session in self._collection.find(user_id=user_id):
+            self._collection.discard(auth_session)
 
     async def remove(self, auth_session: AuthSession) -> None:
         """
@@ -262,10 +256,10 @@ class FakePasswordResetTokenAdapter(FakeGateway[PasswordResetToken], PasswordRes
         return next(
             (
                 token
-                for token in self._collection
-                if token.hashed_reset_token == hashed_token
-                and token.status == PasswordResetTokenStatusEnum.CREATED
-                and token.expires_at > datetime.now(UTC)
+                for token in self._collection.find(
+                    hashed_reset_token=hashed_token, status=PasswordResetTokenStatusEnum.CREATED
+                )
+                if token.expires_at > datetime.now(UTC)
             ),
             None,
         )
@@ -277,23 +271,8 @@ class FakePasswordResetTokenAdapter(FakeGateway[PasswordResetToken], PasswordRes
         Args:
             user_id (UUID): The unique identifier of the user.
         """
-        to_replace = []
-
-        for token in self._collection:
-            if token.user_id == user_id and token.status == PasswordResetTokenStatusEnum.CREATED:
-                new_token = PasswordResetToken(
-                    id=token.id,
-                    user_id=token.user_id,
-                    hashed_reset_token=token.hashed_reset_token,
-                    created_at=token.created_at,
-                    expires_at=token.expires_at,
-                    status=PasswordResetTokenStatusEnum.SUPERSEDED,
-                )
-                to_replace.append((token, new_token))
-
-        for old_token, new_token in to_replace:
-            self._collection.discard(old_token)
-            self._collection.add(new_token)
+        for token in self._collection.find(user_id=user_id, status=PasswordResetTokenStatusEnum.CREATED):
+            self._collection.update(token, status=PasswordResetTokenStatusEnum.SUPERSEDED)
 
 
 class FakeOTPCodeAdapter(FakeGateway[OTPCode], OTPCodeGatewayProto):
@@ -315,8 +294,8 @@ class FakeOTPCodeAdapter(FakeGateway[OTPCode], OTPCodeGatewayProto):
 
         valid_codes = [
             code
-            for code in self._collection
-            if code.user_id == user_id and code.status == OTPStatusEnum.CREATED and code.expires_at > datetime.now(UTC)
+            for code in self._collection.find(user_id=user_id, status=OTPStatusEnum.CREATED)
+            if code.expires_at > datetime.now(UTC)
         ]
 
         if not valid_codes:
@@ -332,22 +311,5 @@ class FakeOTPCodeAdapter(FakeGateway[OTPCode], OTPCodeGatewayProto):
         Args:
             user_id (UUID): The unique identifier of the user.
         """
-        to_replace = []
-
-        for code in self._collection:
-            if code.user_id == user_id and code.status == OTPStatusEnum.CREATED:
-                new_code = OTPCode(
-                    id=code.id,
-                    user_id=code.user_id,
-                    hashed_otp_code=code.hashed_otp_code,
-                    created_at=code.created_at,
-                    expires_at=code.expires_at,
-                    status=OTPStatusEnum.SUPERSEDED,
-                    failed_attempts=code.failed_attempts,
-                    channel=code.channel,
-                )
-                to_replace.append((code, new_code))
-
-        for old_code, new_code in to_replace:
-            self._collection.discard(old_code)
-            self._collection.add(new_code)
+        for code in self._collection.find(user_id=user_id, status=OTPStatusEnum.CREATED):
+            self._collection.update(code, status=OTPStatusEnum.SUPERSEDED)
@@ -205,8 +205,6 @@ class AuthenticationService(ServiceBase):
         now = datetime.now(UTC)
         reset_token = self._security.generate_urlsafe_token()
         hashed_reset_token = self._security.hash_string(reset_token)
-        await self._password_reset_tokens.invalidate_unused_password_reset_tokens(cmd.user_id)
-
         expires_at = now + timedelta(minutes=self._config.auth.core.reset_password_token_lifetime_minutes)
         password_reset_token = PasswordResetToken(
             id=uuid.uuid4(),
@@ -216,7 +214,10 @@ class AuthenticationService(ServiceBase):
             expires_at=expires_at,
             status=PasswordResetTokenStatusEnum.CREATED,
         )
-        await self._password_reset_tokens.add(password_reset_token)
+        # Supersede the previous tokens and store the new one with a single commit
+        async with self._password_reset_tokens():
+            await self._password_reset_tokens.invalidate_unused_password_reset_tokens(cmd.user_id)
+            await self._password_reset_tokens.add(password_reset_token)
         password_reset_token_info = results.PasswordResetTokenInfo(
             id=password_reset_token.id,
             user_id=password_reset_token.user_id,
@@ -272,9 +273,6 @@ class AuthenticationService(ServiceBase):
         plain_code = self._security.generate_otp_code()
         hashed_plain_code = self._security.hash_string(plain_code)
 
-        # Invalidate any existing unused OTP codes for the user
-        await self._otp_codes.invalidate_unused_otp_codes(cmd.user_id)
-
         otp_expires_at = now + timedelta(minutes=self._config.auth.core.otp_lifetime_minutes)
         otp_code = OTPCode(
             id=uuid.uuid4(),
@@ -286,7 +284,10 @@ class AuthenticationService(ServiceBase):
             expires_at=otp_expires_at,
             status=OTPStatusEnum.CREATED,
         )
-        await self._otp_codes.add(otp_code)
+        # Invalidate any existing unused OTP codes for the user and store the new one with a single commit
+        async with self._otp_codes():
+            await self._otp_codes.invalidate_unused_otp_codes(cmd.user_id)
+            await self._otp_codes.add(otp_code)
 
         self._logger.info("OTP code successfully created", user_id=cmd.user_id)
         otp_code_info = results.OTPCodeInfo(
@@ -34,6 +34,7 @@ from src.apps.authentication.user.domain import commands as user_commands
 from src.apps.authorization.access.application.service import AccessService
 from src.apps.authorization.access.domain import commands as access_commands
 from src.common.exceptions.handlers import generate_responses
+from src.common.interfaces import UowProto
 from src.common.utils.auth_scheme import auth_header
 
 router = APIRouter(
@@ -168,15 +169,18 @@ async def logout_user(
 async def refresh_session(
     dto: AuthRefreshSessionRequestDTO,
     auth_service: FromDishka[AuthenticationService],
+    uow: FromDishka[UowProto],
 ) -> AuthTokensResponseDTO:
     """Refresh authentication tokens using a valid refresh token."""
-    user_id_info = await auth_service.consume_refresh_token(
-        cmd=auth_commands.ConsumeRefreshTokenCommand(refresh_token=dto.refresh_token)
-    )
+    # Rotate the refresh session atomically: the old one is removed and the new one stored by one commit
+    async with uow:
+        user_id_info = await auth_service.consume_refresh_token(
+            cmd=auth_commands.ConsumeRefreshTokenCommand(refresh_token=dto.refresh_token)
+        )
 
-    auth_tokens = await auth_service.create_auth_session(
-        cmd=auth_commands.CreateAuthSessionCommand(user_id=user_id_info.id)
-    )
+        auth_tokens = await auth_service.create_auth_session(
+            cmd=auth_commands.CreateAuthSessionCommand(user_id=user_id_info.id)
+        )
 
     return AuthTokensResponseDTO(
         access_token=auth_tokens.access_token.get_secret_value(),
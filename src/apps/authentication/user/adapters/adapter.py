@@ -1,12 +1,18 @@
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import false, func, select
+
 from src.apps.authentication.user.application.exceptions import (
     UserAlreadyExistsError,
 )
 from src.apps.authentication.user.application.interfaces.gateway import UserGatewayProto
-from src.apps.authentication.user.domain.models import User
+from src.apps.authentication.user.domain.models import AuthStatus, User
+from src.apps.authentication.user.domain.results import UserPrincipal
+from src.apps.authorization.access.domain.models import Role
 from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, Page
 
 
 class UserAdapter(SQLAlchemyGateway, UserGatewayProto):
@@ -23,6 +29,38 @@ class UserAdapter(SQLAlchemyGateway, UserGatewayProto):
         user = await self.get_item_by_id(User, user_id)
         return user
 
+    async def get_user_principal(self, user_id: UUID) -> UserPrincipal | None:
+        """
+        Retrieve the authorization principal of a user.
+
+        Only the columns needed to authorize a request are selected in a single statement,
+        so none of the user's relationships are loaded.
+
+        Args:
+            user_id (UUID): The ID of the user.
+
+        Returns:
+            UserPrincipal | None: The user principal if found, else None.
+        """
+        stmt = (
+            select(
+                User.id,
+                User.role_id,
+                Role.name,
+                User.is_active,
+                func.coalesce(AuthStatus.is_blocked, false()),
+            )
+            .join(Role, Role.id == User.role_id)
+            .outerjoin(AuthStatus, AuthStatus.user_id == User.id)
+            .where(User.id == user_id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        return UserPrincipal(*row)
+
     async def get_user_by_email(self, email: str) -> User | None:
         """
         Retrieve a user by email.
@@ -49,18 +87,27 @@ class UserAdapter(SQLAlchemyGateway, UserGatewayProto):
         user = await self.get_one_item(User, phone=phone)
         return user
 
-    async def get_users(self, **filters: Any) -> list[User]:
+    async def get_users(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[User]:
         """
-        Retrieve a list of users.
+        Retrieve a page of users ordered by email.
 
         Args:
+            profile (LoadingProfileEnum): The relationship loading profile.
+            limit (int): The maximum number of users on the page.
+            cursor (str | None): The cursor returned with the previous page.
             **filters: Filters to apply to the users query.
 
         Returns:
-            list[User]: A list of users matching the filters.
+            Page[User]: A page of users matching the filters.
         """
-        users = await self.get_items_list(User, **filters)
-        return users
+        query = select(User).options(*self.loader_options(profile)).filter_by(**filters)
+        return await self.paginate(query, User.email, limit, cursor)
 
     async def add(self, user: User) -> None:
         """
@@ -74,7 +121,7 @@ class UserAdapter(SQLAlchemyGateway, UserGatewayProto):
         """
         try:
             self.session.add(user)
-            await self.session.commit()
+            await self._save()
         except Exception:
             raise UserAlreadyExistsError from None
 
@@ -110,19 +157,40 @@ class UserAdapter(SQLAlchemyGateway, UserGatewayProto):
 class FakeUserAdapter(FakeGateway[User], UserGatewayProto):
     async def get_user_by_id(self, user_id: UUID) -> User | None:
         """Retrieve a user by filters."""
-        return next((user for user in self._collection if user.id == user_id), None)
+        return self._collection.get(user_id)
+
+    async def get_user_principal(self, user_id: UUID) -> UserPrincipal | None:
+        """Retrieve the authorization principal of a user."""
+        user = await self.get_user_by_id(user_id)
+        if user is None:
+            return None
+
+        return UserPrincipal(
+            id=user.id,
+            role_id=user.role_id,
+            role_name=user.role.name if user.role else "",
+            is_active=user.is_active,
+            is_blocked=bool(user.auth_status and user.auth_status.is_blocked),
+        )
 
     async def get_user_by_email(self, email: str) -> User | None:
         """Retrieve a user by email."""
-        return next((user for user in self._collection if user.email == email), None)
+        return self._collection.first(email=email)
 
     async def get_user_by_phone(self, phone: str) -> User | None:
         """Retrieve a user by phone number."""
-        return next((user for user in self._collection if user.phone == phone), None)
-
-    async def get_users(self, **filters: Any) -> list[User]:
-        """Retrieve a list of users."""
-        return [user for user in self._collection if all(getattr(user, k) == v for k, v in filters.items())]
+        return self._collection.first(phone=phone)
+
+    async def get_users(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[User]:
+        """Retrieve a page of users ordered by email."""
+        users = self._collection.find(**filters)
+        return self.paginate(users, User.email, limit, cursor)
 
     async def add(self, user: User) -> None:
         """Add a new user."""
@@ -130,12 +198,7 @@ class FakeUserAdapter(FakeGateway[User], UserGatewayProto):
 
     async def update_user(self, user: User, **params: Any) -> UUID | None:
         """Update an existing user."""
-        for key, value in params.items():
-            setattr(user, key, value)
-
-        self._collection.discard(user)
-        self._collection.add(user)
-
+        self._collection.update(user, **params)
         return user.id or None
 
     async def delete_user(self, user: User) -> None:
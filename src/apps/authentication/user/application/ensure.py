@@ -3,6 +3,7 @@ from uuid import UUID
 from src.apps.authentication.user.application import exceptions
 from src.apps.authentication.user.application.interfaces.gateway import UserGatewayProto
 from src.apps.authentication.user.domain.models import User
+from src.apps.authentication.user.domain.results import UserPrincipal
 from src.common.application.ensure import ServiceEnsuranceBase
 
 
@@ -19,6 +20,13 @@ class UserServiceEnsurance(ServiceEnsuranceBase):
             raise exceptions.UserNotFoundError
         return user
 
+    async def user_principal_exists(self, user_id: UUID) -> UserPrincipal:
+        """Ensure that a user exists by its ID, loading only its authorization principal."""
+        principal = await self._user.get_user_principal(user_id)
+        if principal is None:
+            raise exceptions.UserNotFoundError
+        return principal
+
     async def user_with_email_exists(self, email: str) -> User:
         """Ensure that a user exists by its email."""
         user = await self._user.get_user_by_email(email)
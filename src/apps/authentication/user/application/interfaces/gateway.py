@@ -2,6 +2,9 @@ from abc import abstractmethod
 from uuid import UUID
 
 from src.apps.authentication.user.domain.models import User
+from src.apps.authentication.user.domain.results import UserPrincipal
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, Page
 from src.common.interfaces import GatewayProto
 
 
@@ -11,6 +14,11 @@ class UserGatewayProto(GatewayProto):
         """Retrieve a user by filters."""
         ...
 
+    @abstractmethod
+    async def get_user_principal(self, user_id: UUID) -> UserPrincipal | None:
+        """Retrieve the authorization principal of a user without loading the user graph."""
+        ...
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> User | None:
         """Retrieve a user by email."""
@@ -22,8 +30,14 @@ class UserGatewayProto(GatewayProto):
         ...
 
     @abstractmethod
-    async def get_users(self, **filters) -> list[User]:
-        """Retrieve a list of users."""
+    async def get_users(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters,
+    ) -> Page[User]:
+        """Retrieve a page of users ordered by email."""
         ...
 
     @abstractmethod
@@ -88,3 +88,19 @@ class UserInfo:
             is_active=model.is_active,
             auth_info=auth_info,
         )
+
+
+@dataclass(slots=True, frozen=True)
+class UserPrincipal:
+    """Lean projection of a user used to authorize requests."""
+
+    id: UUID
+    role_id: UUID
+    role_name: str
+    is_active: bool
+    is_blocked: bool
+
+    @property
+    def is_allowed(self) -> bool:
+        """True if the user is active and not blocked."""
+        return self.is_active and not self.is_blocked
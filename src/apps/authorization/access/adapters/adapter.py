@@ -1,8 +1,16 @@
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, exists, false, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.authentication.user.domain.models import User
+from src.apps.authorization.access.application.cache import (
+    PermissionKey,
+    RolePermissionsCache,
+    RolePermissionsSnapshot,
+)
 from src.apps.authorization.access.application.interfaces.gateway import (
     AccessGatewayProto,
 )
@@ -10,7 +18,6 @@ from src.apps.authorization.access.domain import exceptions
 from src.apps.authorization.access.domain.enums import PermissionEnum, ResourceTypeEnum
 from src.apps.authorization.access.domain.models import (
     Permission,
-    Role,
     RolePermissions,
 )
 from src.apps.authorization.role.domain.enums import UserRoleEnum
@@ -19,20 +26,78 @@ from src.apps.hotel.bookings.domain.models import Booking
 from src.apps.hotel.hotels.domain.models import Hotel
 from src.apps.hotel.rooms.domain.models import Room
 from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.infrastructure.context import RequestContext
+
+resource_model_map: dict[ResourceTypeEnum, type[User | Hotel | Room | Booking | Comment]] = {
+    ResourceTypeEnum.USER: User,
+    ResourceTypeEnum.HOTEL: Hotel,
+    ResourceTypeEnum.ROOM: Room,
+    ResourceTypeEnum.BOOKING: Booking,
+    ResourceTypeEnum.COMMENT: Comment,
+}
 
-resource_model_map = {
-    resource_type: model
-    for resource_type, model in [
-        (ResourceTypeEnum.USER, User),
-        (ResourceTypeEnum.HOTEL, Hotel),
-        (ResourceTypeEnum.ROOM, Room),
-        (ResourceTypeEnum.BOOKING, Booking),
-        (ResourceTypeEnum.COMMENT, Comment),
-    ]
+# Column holding the owner of each resource type; resources without one are never owned.
+resource_owner_map = {
+    ResourceTypeEnum.USER: None,
+    ResourceTypeEnum.HOTEL: Hotel.owner,
+    ResourceTypeEnum.ROOM: Room.owner,
+    ResourceTypeEnum.BOOKING: Booking.user_id,
+    ResourceTypeEnum.COMMENT: Comment.user_id,
 }
 
 
+def _owned_by(object_type: ResourceTypeEnum, user_id: UUID) -> ColumnElement[bool]:
+    """Build the condition matching resources of object_type owned by user_id."""
+    owner_column = resource_owner_map[object_type]
+    if owner_column is None:
+        return false()
+
+    return owner_column == user_id
+
+
 class AccessAdapter(SQLAlchemyGateway, AccessGatewayProto):
+    def __init__(
+        self,
+        session: AsyncSession,
+        request_context: RequestContext,
+        permissions_cache: RolePermissionsCache,
+    ) -> None:
+        super().__init__(session, request_context)
+        self._permissions_cache = permissions_cache
+
+    async def _load_permissions_snapshot(self) -> RolePermissionsSnapshot:
+        """
+        Load the permissions of every role in a single query.
+
+        Returns:
+            RolePermissionsSnapshot: Mapping of role ID to its (resource_type, permission) pairs.
+        """
+        stmt = select(RolePermissions.role_id, Permission.resource_type, Permission.name).join(
+            Permission, Permission.id == RolePermissions.permission_id
+        )
+        result = await self.session.execute(stmt)
+
+        grouped: dict[UUID, set[PermissionKey]] = {}
+        for role_id, resource_type, name in result:
+            grouped.setdefault(role_id, set()).add((resource_type, name))
+
+        return {role_id: frozenset(keys) for role_id, keys in grouped.items()}
+
+    async def _get_permissions_snapshot(self) -> RolePermissionsSnapshot:
+        """
+        Return the cached permissions snapshot, reloading it when missing or expired.
+
+        Returns:
+            RolePermissionsSnapshot: Mapping of role ID to its (resource_type, permission) pairs.
+        """
+        snapshot = self._permissions_cache.get_snapshot()
+        if snapshot is None:
+            generation = self._permissions_cache.generation
+            snapshot = await self._load_permissions_snapshot()
+            self._permissions_cache.store(snapshot, generation)
+
+        return snapshot
+
     async def _get_role_permissions(self, role_id: UUID) -> list[Permission]:
         """
         Retrieve all permissions associated with role_id.
@@ -69,20 +134,56 @@ class AccessAdapter(SQLAlchemyGateway, AccessGatewayProto):
         if not obj_model:
             raise exceptions.UnknownResourceTypeError
 
-        resource = await self.get_one_item(obj_model, id=object_id)
-        if not resource:
+        # Existence and ownership are resolved in one round trip without loading the resource.
+        stmt = select(
+            exists().where(obj_model.id == object_id),
+            exists().where(obj_model.id == object_id, _owned_by(object_type, user_id)),
+        )
+        found, owned = (await self.session.execute(stmt)).one()
+        if not found:
             raise exceptions.ResourceNotFoundError
 
-        owner_id = getattr(resource, "owner", None) or getattr(resource, "user_id", None)
-        if not owner_id:
-            return False
+        return owned
+
+    async def get_owned_resource_ids(
+        self,
+        user_id: UUID,
+        object_type: ResourceTypeEnum,
+        object_ids: Sequence[UUID | int],
+    ) -> set[Any]:
+        """
+        Select the resources owned by the user among the given ones.
 
-        return owner_id == user_id  # type: ignore
+        Args:
+            user_id (UUID): The unique identifier of the user.
+            object_type (ResourceTypeEnum): The type of the objects.
+            object_ids (Sequence[UUID | int]): The unique identifiers of the objects.
+
+        Returns:
+            set[Any]: Identifiers of the objects owned by the user. Missing objects are omitted.
+        """
+        return await self._select_resource_ids(object_type, object_ids, _owned_by(object_type, user_id))
+
+    async def _select_resource_ids(
+        self, object_type: ResourceTypeEnum, object_ids: Sequence[UUID | int], *criteria: ColumnElement[bool]
+    ) -> set[Any]:
+        """Select the existing resources among the given ones that match the criteria, in one statement."""
+        obj_model = resource_model_map.get(object_type, None)
+
+        if not obj_model:
+            raise exceptions.UnknownResourceTypeError
+
+        if not object_ids:
+            return set()
+
+        stmt = select(obj_model.id).where(obj_model.id.in_(object_ids), *criteria)
+        result = await self.session.execute(stmt)
+        return set(result.scalars())
 
     async def check_object_access(
         self,
         user_id: UUID,
-        user_role: UUID,
+        role_name: str,
         object_type: ResourceTypeEnum,
         object_id: UUID | int,
     ) -> bool:
@@ -91,20 +192,43 @@ class AccessAdapter(SQLAlchemyGateway, AccessGatewayProto):
 
         Args:
             user_id (UUID): The unique identifier of the user.
-            user_role (UUID): The unique identifier of the user's role_id.
+            role_name (str): The name of the user's role.
             object_type (ResourceTypeEnum): The type of the object.
             object_id (UUID | int): The unique identifier of the object.
 
         Returns:
             bool: True if the user has access, False otherwise.
         """
-        role = await self.get_item_by_id(Role, user_role)
-
-        if role.name == UserRoleEnum.ADMIN:  # type: ignore
+        if role_name == UserRoleEnum.ADMIN:
             return True
 
         return await self.is_resource_owner(user_id, object_type, object_id)
 
+    async def get_denied_resource_ids(
+        self,
+        user_id: UUID,
+        role_name: str,
+        object_type: ResourceTypeEnum,
+        object_ids: Sequence[UUID | int],
+    ) -> set[Any]:
+        """
+        Select the objects among the given ones that a user has no access to.
+
+        Args:
+            user_id (UUID): The unique identifier of the user.
+            role_name (str): The name of the user's role.
+            object_type (ResourceTypeEnum): The type of the objects.
+            object_ids (Sequence[UUID | int]): The unique identifiers of the objects.
+
+        Returns:
+            set[Any]: Identifiers of the objects the user has no access to. Missing objects are omitted.
+        """
+        if role_name == UserRoleEnum.ADMIN:
+            # Admins may access every resource, no statement is needed
+            return set()
+
+        return await self._select_resource_ids(object_type, object_ids, not_(_owned_by(object_type, user_id)))
+
     async def check_permission(
         self, role_id: UUID, resource_type: ResourceTypeEnum, permission: PermissionEnum
     ) -> bool:
@@ -119,11 +243,8 @@ class AccessAdapter(SQLAlchemyGateway, AccessGatewayProto):
         Returns:
             bool: True if the user has the permission, False otherwise.
         """
-        role_permissions = await self._get_role_permissions(role_id)
-        if any(perm.name == permission and perm.resource_type == resource_type for perm in role_permissions):
-            return True
-
-        return False
+        snapshot = await self._get_permissions_snapshot()
+        return (resource_type, permission) in snapshot.get(role_id, frozenset())
 
 
 class FakeAccessAdapter(FakeGateway[RolePermissions], AccessGatewayProto):
@@ -153,10 +274,29 @@ class FakeAccessAdapter(FakeGateway[RolePermissions], AccessGatewayProto):
         """
         return True
 
+    async def get_owned_resource_ids(
+        self,
+        user_id: UUID,
+        object_type: ResourceTypeEnum,
+        object_ids: Sequence[UUID | int],
+    ) -> set[Any]:
+        """
+        Select the resources owned by the user among the given ones.
+
+        Args:
+            user_id (UUID): The unique identifier of the user.
+            object_type (ResourceTypeEnum): The type of the objects.
+            object_ids (Sequence[UUID | int]): The unique identifiers of the objects.
+
+        Returns:
+            set[Any]: Identifiers of the objects owned by the user. Missing objects are omitted.
+        """
+        return set(object_ids)
+
     async def check_object_access(
         self,
         user_id: UUID,
-        user_role: UUID,
+        role_name: str,
         object_type: ResourceTypeEnum,
         object_id: UUID | int,
     ) -> bool:
@@ -165,7 +305,7 @@ class FakeAccessAdapter(FakeGateway[RolePermissions], AccessGatewayProto):
 
         Args:
             user_id (UUID): The unique identifier of the user.
-            user_role (UUID): The unique identifier of the user's role_id.
+            role_name (str): The name of the user's role.
             object_type (ResourceTypeEnum): The type of the object.
             object_id (UUID | int): The unique identifier of the object.
 
@@ -174,6 +314,27 @@ class FakeAccessAdapter(FakeGateway[RolePermissions], AccessGatewayProto):
         """
         return True
 
+    async def get_denied_resource_ids(
+        self,
+        user_id: UUID,
+        role_name: str,
+        object_type: ResourceTypeEnum,
+        object_ids: Sequence[UUID | int],
+    ) -> set[Any]:
+        """
+        Select the objects among the given ones that a user has no access to.
+
+        Args:
+            user_id (UUID): The unique identifier of the user.
+            role_name (str): The name of the user's role.
+            object_type (ResourceTypeEnum): The type of the objects.
+            object_ids (Sequence[UUID | int]): The unique identifiers of the objects.
+
+        Returns:
+            set[Any]: Identifiers of the objects the user has no access to.
+        """
+        return set()
+
     async def check_permission(
         self, role_id: UUID, resource_type: ResourceTypeEnum, permission: PermissionEnum
     ) -> bool:
@@ -0,0 +1,62 @@
+from collections.abc import Mapping
+from time import monotonic
+from uuid import UUID
+
+from src.config import Configs
+
+type PermissionKey = tuple[str, str]
+type RolePermissionsSnapshot = Mapping[UUID, frozenset[PermissionKey]]
+
+
+class RolePermissionsCache:
+    """
+    Process-wide snapshot of role permissions.
+
+    Holds a ``role_id -> {(resource_type, permission)}`` mapping loaded in a single
+    query, so that non-object permission checks become set lookups. The snapshot
+    expires after a configured TTL and is dropped explicitly once a change of
+    role permissions made in this process is committed; the TTL bounds
+    staleness for changes made by other workers.
+    """
+
+    def __init__(self, config: Configs) -> None:
+        self._ttl = config.authorization.permissions_cache_ttl_seconds
+        self._snapshot: RolePermissionsSnapshot | None = None
+        self._loaded_at = 0.0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every invalidation, used to discard snapshots loaded before it."""
+        return self._generation
+
+    def get_snapshot(self) -> RolePermissionsSnapshot | None:
+        """
+        Return the current snapshot if it is still fresh.
+
+        Returns:
+            RolePermissionsSnapshot | None: The snapshot, or None if it is missing or expired.
+        """
+        if self._snapshot is None or monotonic() - self._loaded_at > self._ttl:
+            return None
+
+        return self._snapshot
+
+    def store(self, snapshot: RolePermissionsSnapshot, generation: int) -> None:
+        """
+        Replace the current snapshot unless it was invalidated while loading.
+
+        Args:
+            snapshot (RolePermissionsSnapshot): Freshly loaded role permissions.
+            generation (int): The cache generation observed before the load started.
+        """
+        if generation != self._generation:
+            return
+
+        self._snapshot = snapshot
+        self._loaded_at = monotonic()
+
+    def invalidate(self) -> None:
+        """Drop the current snapshot so the next check reloads it."""
+        self._snapshot = None
+        self._generation += 1
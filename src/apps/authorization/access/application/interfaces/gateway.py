@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
 from src.apps.authorization.access.domain.enums import PermissionEnum, ResourceTypeEnum
@@ -21,11 +23,31 @@ class AccessGatewayProto(GatewayProto):
         """
         ...
 
+    @abstractmethod
+    async def get_owned_resource_ids(
+        self,
+        user_id: UUID,
+        object_type: ResourceTypeEnum,
+        object_ids: Sequence[UUID | int],
+    ) -> set[Any]:
+        """
+        Select the resources owned by the user among the given ones.
+
+        Args:
+            user_id (UUID): The unique identifier of the user.
+            object_type (ResourceTypeEnum): The type of the objects.
+            object_ids (Sequence[UUID | int]): The unique identifiers of the objects.
+
+        Returns:
+            set[Any]: Identifiers of the objects owned by the user. Missing objects are omitted.
+        """
+        ...
+
     @abstractmethod
     async def check_object_access(
         self,
         user_id: UUID,
-        user_role: UUID,
+        role_name: str,
         object_type: ResourceTypeEnum,
         object_id: UUID | int,
     ) -> bool:
@@ -34,7 +56,7 @@ class AccessGatewayProto(GatewayProto):
 
         Args:
             user_id (UUID): The unique identifier of the user.
-            user_role (UUID): The unique identifier of the user's role_id.
+            role_name (str): The name of the user's role.
             object_type (ResourceTypeEnum): The type of the object.
             object_id (UUID | int): The unique identifier of the object.
 
@@ -43,6 +65,28 @@ class AccessGatewayProto(GatewayProto):
         """
         ...
 
+    @abstractmethod
+    async def get_denied_resource_ids(
+        self,
+        user_id: UUID,
+        role_name: str,
+        object_type: ResourceTypeEnum,
+        object_ids: Sequence[UUID | int],
+    ) -> set[Any]:
+        """
+        Select the objects among the given ones that a user has no access to.
+
+        Args:
+            user_id (UUID): The unique identifier of the user.
+            role_name (str): The name of the user's role.
+            object_type (ResourceTypeEnum): The type of the objects.
+            object_ids (Sequence[UUID | int]): The unique identifiers of the objects.
+
+        Returns:
+            set[Any]: Identifiers of the objects the user has no access to. Missing objects are omitted.
+        """
+        ...
+
     @abstractmethod
     async def check_permission(
         self, role_id: UUID, resource_type: ResourceTypeEnum, permission: PermissionEnum
@@ -51,6 +51,9 @@ class AccessService(ServiceBase):
         """
         Authorize a user for a specific resource and permission.
 
+        Only the user's principal (id, role and status flags) is loaded, so authorization
+        issues a constant number of statements regardless of the size of the user's graph.
+
         Args:
             cmd (commands.Authorize): Command object containing authorization details.
 
@@ -58,15 +61,20 @@ class AccessService(ServiceBase):
             UserAccessInfo: Information about the user's access rights.
 
         Raises:
-            Forbidden: If the user is not authorized for the requested resource.
+            Forbidden: If the user is inactive, blocked or not authorized for the requested resource.
         """
-        user_info = await self.verify_user_by_token(commands.VerifyUserByTokenCommand(access_token=cmd.access_token))
+        user_id = await self._security.verify_token(cmd.access_token, AuthTokenTypeEnum.ACCESS)
+        principal = await self._user_ensure.user_principal_exists(user_id)
+
+        if not principal.is_allowed:
+            self._logger.error("User is inactive or blocked", user_id=principal.id)
+            raise Forbidden
 
         if cmd.resource_id is None:
-            has_permission = await self._access.check_permission(user_info.role, cmd.resource_type, cmd.permission)
+            has_permission = await self._access.check_permission(principal.role_id, cmd.resource_type, cmd.permission)
         else:
             has_permission = await self._access.check_object_access(
-                user_info.id, user_info.role, cmd.resource_type, cmd.resource_id
+                principal.id, principal.role_name, cmd.resource_type, cmd.resource_id
             )
 
         if not has_permission:
@@ -78,8 +86,49 @@ class AccessService(ServiceBase):
             raise Forbidden
 
         return UserAccessInfo(
-            user_id=user_info.id,
+            user_id=principal.id,
             role=cmd.permission,
             resource_id=cmd.resource_id,  # type: ignore
             resource_type=cmd.resource_type,
         )
+
+    async def authorize_many(self, cmd: commands.AuthorizeMany) -> UserAccessInfo:
+        """
+        Authorize a user for a permission on many resources at once.
+
+        The access to every resource is checked by a single statement, whatever their number.
+        Resources that do not exist are skipped.
+
+        Args:
+            cmd (commands.AuthorizeMany): Command object containing authorization details.
+
+        Returns:
+            UserAccessInfo: Information about the user's access rights.
+
+        Raises:
+            Forbidden: If the user is inactive, blocked, or not authorized for one of the resources.
+        """
+        user_id = await self._security.verify_token(cmd.access_token, AuthTokenTypeEnum.ACCESS)
+        principal = await self._user_ensure.user_principal_exists(user_id)
+
+        if not principal.is_allowed:
+            self._logger.error("User is inactive or blocked", user_id=principal.id)
+            raise Forbidden
+
+        denied = await self._access.get_denied_resource_ids(
+            principal.id, principal.role_name, cmd.resource_type, cmd.resource_ids
+        )
+        if denied:
+            self._logger.error(
+                "User is not authorized for resources",
+                resource_type=cmd.resource_type,
+                resource_ids=sorted(map(str, denied)),
+            )
+            raise Forbidden
+
+        return UserAccessInfo(
+            user_id=principal.id,
+            role=cmd.permission,
+            resource_id=None,  # type: ignore
+            resource_type=cmd.resource_type,
+        )
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.apps.authorization.access.domain.enums import PermissionEnum, ResourceTypeEnum
@@ -21,3 +22,18 @@ class Authorize(Command):
             f" resource_type={self.resource_type},"
             f" resource_id={self.resource_id})"
         )
+
+
+class AuthorizeMany(Command):
+    access_token: str
+    permission: PermissionEnum
+    resource_type: ResourceTypeEnum
+    resource_ids: Sequence[UUID | int]
+
+    def __repr__(self) -> str:
+        """Represent the command as a string."""
+        return (
+            f"AuthorizeMany(permission={self.permission},"
+            f" resource_type={self.resource_type},"
+            f" resource_ids={self.resource_ids})"
+        )
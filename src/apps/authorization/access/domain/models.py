@@ -60,14 +60,14 @@ class Permission(AuthorizationBase):
         self.description = description
 
     def __hash__(self) -> int:
-        """Returns the hash of the object's id."""
-        return hash(self.id)
+        """Returns the hash of the object's name and resource type."""
+        return hash((self.name, self.resource_type))
 
     def __eq__(self, other: object) -> bool:
-        """True if the other object is a Permission and has the same name. False otherwise."""
+        """True if the other object is a Permission with the same name and resource type. False otherwise."""
         if not isinstance(other, Permission):
             raise NotImplementedError
-        return self.name == other.name
+        return (self.name, self.resource_type) == (other.name, other.resource_type)
 
     @classmethod
     def returning_columns(cls) -> list[Any]:
@@ -1,6 +1,7 @@
 from dishka import AsyncContainer, Provider, Scope, provide, provide_all
 
 from src.apps.authorization.access.adapters.adapter import AccessAdapter
+from src.apps.authorization.access.application.cache import RolePermissionsCache
 from src.apps.authorization.access.application.interfaces.gateway import (
     AccessGatewayProto,
 )
@@ -32,6 +33,8 @@ class AuthorizationGatewayProviders(Provider):
 
     scope = Scope.REQUEST
 
+    _permissions_cache = provide(RolePermissionsCache, scope=Scope.APP)
+
     _alchemy_role_gateway = provide(RoleAdapter)
     _alchemy_access_gateway = provide(AccessAdapter)
     _alchemy_permission_gateway = provide(PermissionsAdapter)
@@ -1,9 +1,10 @@
 from uuid import UUID
 
 from sqlalchemy import delete, select
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.apps.authentication.user.domain.models import User
-from src.apps.authorization.access.domain.models import Permission, Role
+from src.apps.authorization.access.domain.models import Permission, Role, RolePermissions
 from src.apps.authorization.role.application.interfaces.gateway import (
     PermissionGatewayProto,
     RoleGatewayProto,
@@ -24,6 +25,7 @@ class RoleAdapter(SQLAlchemyGateway, RoleGatewayProto):
             None
         """
         self.session.add(role)
+        await self._save()
 
     async def get(self, role_id: UUID) -> Role | None:
         """
@@ -65,6 +67,28 @@ class RoleAdapter(SQLAlchemyGateway, RoleGatewayProto):
         query_result = await self.session.execute(query)
         return list(query_result.scalars().all())
 
+    async def assign_permissions(self, role: Role, permissions: list[Permission]) -> None:
+        """
+        Grants permissions to a role_id with one multi-row insert into the association table.
+
+        The role_id's loaded permissions are updated in place without marking it dirty, so the
+        association rows are not written a second time on the next flush.
+
+        Args:
+            role (Role): The role_id entity to grant the permissions to.
+            permissions (list[Permission]): The permissions to grant.
+
+        Returns:
+            None
+        """
+        granted = await role.awaitable_attrs.permissions
+        new_permissions = [permission for permission in permissions if permission not in granted]
+        await self.add_many(
+            [RolePermissions(role_id=role.id, permission_id=permission.id) for permission in new_permissions],
+            ignore_conflicts=True,
+        )
+        set_committed_value(role, "permissions", [*granted, *new_permissions])
+
     async def delete(self, role_id: UUID) -> bool:
         """
         Deletes a role_id from the database by its unique identifier.
@@ -77,6 +101,7 @@ class RoleAdapter(SQLAlchemyGateway, RoleGatewayProto):
         """
         stmt = delete(Role).where(Role.id == role_id)
         removed_info = await self.session.execute(stmt)
+        await self._save()
         return removed_info.rowcount != 0
 
 
@@ -84,6 +109,7 @@ class PermissionsAdapter(SQLAlchemyGateway, PermissionGatewayProto):
     async def add(self, permission: Permission) -> None:
         """Adds a new permission to the database."""
         self.session.add(permission)
+        await self._save()
 
     async def list_all_permissions(self) -> list[Permission]:
         """
@@ -134,7 +160,7 @@ class FakeRoleAdapter(FakeGateway[Role], RoleGatewayProto):
         Returns:
             Role | None: The Role object if found, otherwise None.
         """
-        return next((role for role in self._collection if role.id == role_id), None)
+        return self._collection.get(role_id)
 
     async def get_by_name(self, role_name: UserRoleEnum) -> Role | None:
         """
@@ -146,7 +172,7 @@ class FakeRoleAdapter(FakeGateway[Role], RoleGatewayProto):
         Returns:
             Role | None: The Role object if found, otherwise None.
         """
-        return next((role for role in self._collection if role.name == role_name), None)
+        return self._collection.first(name=role_name)
 
     async def get_all_users_granted_to_role(self, role_id: UUID) -> list[UUID]:
         """
@@ -158,12 +184,21 @@ class FakeRoleAdapter(FakeGateway[Role], RoleGatewayProto):
         Returns:
             list[UUID]: A list of user IDs granted to the role_id.
         """
-        users = []
-        for role in self._collection:
-            if role.id == role_id:
-                users.extend(role.users)
+        role = self._collection.get(role_id)
+        return [user.id for user in role.users] if role is not None else []
+
+    async def assign_permissions(self, role: Role, permissions: list[Permission]) -> None:
+        """
+        Grants permissions to a role_id, skipping those it already has.
+
+        Args:
+            role (Role): The role_id entity to grant the permissions to.
+            permissions (list[Permission]): The permissions to grant.
 
-        return [user.id for user in users]
+        Returns:
+            None
+        """
+        await role.add_permissions(permissions)
 
     async def delete(self, role_id: UUID) -> bool:
         """
@@ -175,7 +210,7 @@ class FakeRoleAdapter(FakeGateway[Role], RoleGatewayProto):
         Returns:
             bool: True if the role_id was deleted, False if the role_id was not found.
         """
-        role = next((role for role in self._collection if role.id == role_id), None)
+        role = self._collection.get(role_id)
         if role is None:
             return False
 
@@ -207,4 +242,5 @@ class FakePermissionsAdapter(FakeGateway[Permission], PermissionGatewayProto):
         Returns:
             list[Permission]: List of Permissions
         """
-        return [permission for permission in self._collection if permission.id in permission_ids]
+        permissions = (self._collection.get(permission_id) for permission_id in permission_ids)
+        return [permission for permission in permissions if permission is not None]
@@ -59,6 +59,20 @@ class RoleGatewayProto(GatewayProto):
         """
         ...
 
+    @abstractmethod
+    async def assign_permissions(self, role: Role, permissions: list[Permission]) -> None:
+        """
+        Grants permissions to a role_id, skipping those it already has.
+
+        Args:
+            role (Role): The role_id entity to grant the permissions to.
+            permissions (list[Permission]): The permissions to grant.
+
+        Returns:
+            None
+        """
+        ...
+
     @abstractmethod
     async def delete(self, role_id: UUID) -> bool:
         """
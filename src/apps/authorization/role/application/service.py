@@ -1,3 +1,4 @@
+from src.apps.authorization.access.application.cache import RolePermissionsCache
 from src.apps.authorization.access.domain.models import Role
 from src.apps.authorization.role.application.ensure import RoleServiceEnsurance
 from src.apps.authorization.role.application.exceptions import RoleIsNotFoundError
@@ -15,9 +16,11 @@ class RoleManagementService:  # noqa: WPS214
         gateway: RoleGatewayProto,
         permissions: PermissionGatewayProto,
         logger: CustomLoggerProto,
+        permissions_cache: RolePermissionsCache,
     ) -> None:
         self._gateway = gateway
         self._permissions = permissions
+        self._permissions_cache = permissions_cache
         self._logger = logger
         self._ensure = RoleServiceEnsurance(gateway, logger)
 
@@ -42,8 +45,10 @@ class RoleManagementService:  # noqa: WPS214
             name=cmd.name,
             description=cmd.description,
         )
-        await role.add_permissions(permissions)
-        await self._gateway.add(role)
+        async with self._gateway():
+            await role.add_permissions(permissions)
+            await self._gateway.add(role)
+        self._permissions_cache.invalidate()
 
         self._logger.debug("Role created", role_id=role.id, role_name=cmd.name)
         return results.RoleInfo.from_model(role)
@@ -65,7 +70,9 @@ class RoleManagementService:  # noqa: WPS214
         await self._ensure.role_name_is_not_base(role.name)
         await self._ensure.no_users_granted_to_role(role.id)
 
-        await self._gateway.delete(role.id)
+        async with self._gateway():
+            await self._gateway.delete(role.id)
+        self._permissions_cache.invalidate()
 
         self._logger.debug("Role deleted", role_id=role.id, role_name=role.name)
         return results.RoleInfo.from_model(role)
@@ -127,8 +134,9 @@ class RoleManagementService:  # noqa: WPS214
         role = await self._ensure.role_exists(cmd.role_id)
         permissions = await self._permissions.get_list(cmd.permissions)
 
-        await role.add_permissions(permissions)
-        await self._gateway.add(role)
+        async with self._gateway():
+            await self._gateway.assign_permissions(role, permissions)
+        self._permissions_cache.invalidate()
 
         self._logger.debug("Permissions assigned to role_id", role_id=role.id, role_name=role.name)
         return results.RoleInfo.from_model(role)
@@ -149,6 +157,7 @@ class RoleManagementService:  # noqa: WPS214
             role = await self._ensure.role_exists(cmd.role_id)
             await role.remove_permissions(permissions)
             await self._gateway.add(role)
+        self._permissions_cache.invalidate()
 
-            self._logger.debug("Permissions removed from role_id", role_id=role.id, role_name=role.name)
-            return results.RoleInfo.from_model(role)
+        self._logger.debug("Permissions removed from role_id", role_id=role.id, role_name=role.name)
+        return results.RoleInfo.from_model(role)
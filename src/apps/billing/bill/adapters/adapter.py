@@ -12,7 +12,7 @@ class BillAdapter(SQLAlchemyGateway, BillGatewayProto):
     async def add(self, bill: Bill) -> None:
         """Add a new bill."""
         self.session.add(bill)
-        await self.session.commit()
+        await self._save()
 
     async def get_bill_by_id(self, bill_id: UUID) -> Bill | None:
         """Retrieve a bill by its ID."""
@@ -32,6 +32,6 @@ class BillAdapter(SQLAlchemyGateway, BillGatewayProto):
     async def update_bill_status(self, bill: Bill, status: BillStatusEnum) -> UUID | None:
         """Update the status of a bill."""
         bill.status = status
-        await self.session.commit()
+        await self._save()
         return bill.id
 
@@ -7,6 +7,8 @@ from src.apps.comment.application.interfaces.gateway import CommentGatewayProto
 from src.apps.comment.domain.excepitions import CommentAlreadyExistsError
 from src.apps.comment.domain.models import Comment
 from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, ListVersion, Page
 
 
 class CommentAdapter(SQLAlchemyGateway, CommentGatewayProto):
@@ -14,50 +16,81 @@ class CommentAdapter(SQLAlchemyGateway, CommentGatewayProto):
         """Add a new comment."""
         try:
             self.session.add(comment)
-            await self.session.commit()
+            await self._save()
         except Exception:
             raise CommentAlreadyExistsError from None
 
-    async def get_comment_by_id(self, comment_id: UUID) -> Comment | None:
+    async def get_comment_by_id(
+        self, comment_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> Comment | None:
         """
         Retrieve a comment by its ID.
 
         Args:
             comment_id (UUID): The ID of the comment to retrieve.
+            profile (LoadingProfileEnum): The relationship loading profile.
 
         Returns:
             Comment | None: The comment if found, otherwise None.
         """
-        comment = await self.get_item_by_id(Comment, comment_id)
+        comment = await self.get_item_by_id(Comment, comment_id, profile)
         return comment
 
-    async def get_comments_by_user_id(self, user_id: UUID) -> list[Comment]:
+    async def get_comments_by_user_id(
+        self,
+        user_id: UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Comment]:
         """
-        Retrieve a list of comments made by a specific user.
+        Retrieve a page of comments made by a specific user, newest first.
 
         Args:
             user_id (UUID): The ID of the user whose comments to retrieve.
+            profile (LoadingProfileEnum): The relationship loading profile.
+            limit (int): The maximum number of comments on the page.
+            cursor (str | None): The cursor returned with the previous page.
 
         Returns:
-            list[Comment]: A list of comments made by the user.
+            Page[Comment]: A page of comments made by the user.
         """
-        result = await self.session.execute(select(Comment).where(Comment.user_id == user_id))
-
-        return list(result.scalars())
-
-    async def get_comments_by_hotel_id(self, hotel_id: UUID) -> list[Comment]:
+        query = select(Comment).options(*self.loader_options(profile)).where(Comment.user_id == user_id)
+        return await self.paginate(query, Comment.created_at, limit, cursor, descending=True)
+
+    async def get_comments_by_hotel_id(
+        self,
+        hotel_id: UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Comment]:
         """
-        Retrieve a list of comments for a specific hotel.
+        Retrieve a page of comments for a specific hotel, newest first.
 
         Args:
             hotel_id (UUID): The ID of the hotel whose comments to retrieve.
+            profile (LoadingProfileEnum): The relationship loading profile.
+            limit (int): The maximum number of comments on the page.
+            cursor (str | None): The cursor returned with the previous page.
 
         Returns:
-            list[Comment]: A list of comments for the hotel.
+            Page[Comment]: A page of comments for the hotel.
+        """
+        query = select(Comment).options(*self.loader_options(profile)).where(Comment.hotel_id == hotel_id)
+        return await self.paginate(query, Comment.created_at, limit, cursor, descending=True)
+
+    async def get_hotel_comments_version(self, hotel_id: UUID) -> ListVersion:
         """
-        result = await self.session.execute(select(Comment).where(Comment.hotel_id == hotel_id))
+        Retrieve the version signal of the comments of a hotel without loading them.
 
-        return list(result.scalars())
+        Args:
+            hotel_id (UUID): The ID of the hotel.
+
+        Returns:
+            ListVersion: The number of comments of the hotel and their latest modification time.
+        """
+        return await self.get_list_version(Comment, Comment.hotel_id == hotel_id)
 
     async def update_comment(self, comment: Comment, **params: Any) -> UUID | None:
         """
@@ -93,26 +126,41 @@ class FakeCommentAdapter(FakeGateway[Comment], CommentGatewayProto):
         """Add a new comment."""
         self._collection.add(comment)
 
-    async def get_comment_by_id(self, comment_id: UUID) -> Comment | None:
+    async def get_comment_by_id(
+        self, comment_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> Comment | None:
         """Retrieve a comment by its ID."""
-        return next((comment for comment in self._collection if comment.id == comment_id), None)
-
-    async def get_comments_by_user_id(self, user_id: UUID) -> list[Comment]:
-        """Retrieve a list of comments made by a specific user."""
-        return [comment for comment in self._collection if comment.user_id == user_id]
-
-    async def get_comments_by_hotel_id(self, hotel_id: UUID) -> list[Comment]:
-        """Retrieve a list of comments for a specific hotel."""
-        return [comment for comment in self._collection if comment.hotel_id == hotel_id]
+        return self._collection.get(comment_id)
+
+    async def get_comments_by_user_id(
+        self,
+        user_id: UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Comment]:
+        """Retrieve a page of comments made by a specific user, newest first."""
+        comments = self._collection.find(user_id=user_id)
+        return self.paginate(comments, Comment.created_at, limit, cursor, descending=True)
+
+    async def get_comments_by_hotel_id(
+        self,
+        hotel_id: UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Comment]:
+        """Retrieve a page of comments for a specific hotel, newest first."""
+        comments = self._collection.find(hotel_id=hotel_id)
+        return self.paginate(comments, Comment.created_at, limit, cursor, descending=True)
+
+    async def get_hotel_comments_version(self, hotel_id: UUID) -> ListVersion:
+        """Retrieve the version signal of the comments of a hotel."""
+        return self.list_version(self._collection.find(hotel_id=hotel_id))
 
     async def update_comment(self, comment: Comment, **params: Any) -> UUID | None:
         """Update an existing comment."""
-        for key, value in params.items():
-            setattr(comment, key, value)
-
-        self._collection.discard(comment)
-        self._collection.add(comment)
-
+        self._collection.update(comment, **params)
         return comment.id or None
 
     async def delete_comment(self, comment: Comment) -> None:
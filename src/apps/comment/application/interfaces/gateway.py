@@ -2,6 +2,8 @@ from abc import abstractmethod
 from uuid import UUID
 
 from src.apps.comment.domain.models import Comment
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, ListVersion, Page
 from src.common.interfaces import GatewayProto
 
 
@@ -12,18 +14,37 @@ class CommentGatewayProto(GatewayProto):
         ...
 
     @abstractmethod
-    async def get_comment_by_id(self, comment_id: UUID) -> Comment | None:
+    async def get_comment_by_id(
+        self, comment_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> Comment | None:
         """Retrieve a comment by its ID."""
         ...
 
     @abstractmethod
-    async def get_comments_by_user_id(self, user_id: UUID) -> list[Comment]:
-        """Retrieve a list of comments made by a specific user."""
+    async def get_comments_by_user_id(
+        self,
+        user_id: UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Comment]:
+        """Retrieve a page of comments made by a specific user, newest first."""
         ...
 
     @abstractmethod
-    async def get_comments_by_hotel_id(self, hotel_id: UUID) -> list[Comment]:
-        """Retrieve a list of comments for a specific hotel."""
+    async def get_comments_by_hotel_id(
+        self,
+        hotel_id: UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Comment]:
+        """Retrieve a page of comments for a specific hotel, newest first."""
+        ...
+
+    @abstractmethod
+    async def get_hotel_comments_version(self, hotel_id: UUID) -> ListVersion:
+        """Retrieve the version signal of the comments of a hotel without loading them."""
         ...
 
     @abstractmethod
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime
 from uuid import UUID
 
 from src.apps.authentication.user.application.ensure import UserServiceEnsurance
@@ -17,6 +18,8 @@ from src.apps.comment.domain.models import Comment
 from src.apps.comment.domain.results import CommentInfo
 from src.apps.hotel.hotels.application.ensure import HotelServiceEnsurance
 from src.common.application.service import ServiceBase
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import ListVersion, Page
 from src.common.interfaces import CustomLoggerProto
 
 
@@ -51,7 +54,7 @@ class CommentService(ServiceBase):
 
     async def get_comment(self, fetch: GetCommentInfo) -> CommentInfo:
         """Get details of a specific comment by its ID."""
-        comment = await self._comment.get_comment_by_id(fetch.comment_id)
+        comment = await self._comment.get_comment_by_id(fetch.comment_id, LoadingProfileEnum.DETAIL)
 
         if comment is None:
             self._logger.info("Comment not found", comment_id=fetch.comment_id)
@@ -59,19 +62,29 @@ class CommentService(ServiceBase):
 
         return CommentInfo.from_model(comment)
 
-    async def list_user_comments(self, fetch: ListUserComments) -> list[CommentInfo]:
-        """List comments made by a specific user."""
+    async def list_user_comments(self, fetch: ListUserComments) -> Page[CommentInfo]:
+        """List one page of comments made by a specific user."""
         user = await self._user_ensure.user_exists(fetch.user_id)
-        comments = await self._comment.get_comments_by_user_id(user.id)
+        comments = await self._comment.get_comments_by_user_id(user.id, limit=fetch.limit, cursor=fetch.cursor)
 
-        return [CommentInfo.from_model(comment) for comment in comments]
+        return Page(
+            items=[CommentInfo.from_model(comment) for comment in comments.items],
+            next_cursor=comments.next_cursor,
+        )
+
+    async def list_hotel_comments(self, fetch: ListHotelComments) -> Page[CommentInfo]:
+        """List one page of comments for a specific hotel."""
+        hotel = await self._hotel_ensure.hotel_exists(fetch.hotel_id, LoadingProfileEnum.DETAIL)
+        comments = await self._comment.get_comments_by_hotel_id(hotel.id, limit=fetch.limit, cursor=fetch.cursor)
 
-    async def list_hotel_comments(self, fetch: ListHotelComments) -> list[CommentInfo]:
-        """List comments for a specific hotel."""
-        hotel = await self._hotel_ensure.hotel_exists(fetch.hotel_id)
-        comments = await self._comment.get_comments_by_hotel_id(hotel.id)
+        return Page(
+            items=[CommentInfo.from_model(comment) for comment in comments.items],
+            next_cursor=comments.next_cursor,
+        )
 
-        return [CommentInfo.from_model(comment) for comment in comments]
+    async def get_hotel_comments_version(self, fetch: ListHotelComments) -> ListVersion:
+        """Get the version signal of the comments of a hotel, without loading them."""
+        return await self._comment.get_hotel_comments_version(fetch.hotel_id)
 
     async def update_comment_info(self, cmd: UpdateCommentInfoCommand) -> None:
         """Update an existing comment's information."""
@@ -82,6 +95,7 @@ class CommentService(ServiceBase):
             raise CommentNotFoundError
 
         updating_params = cmd.model_dump(exclude={"comment_id"}, exclude_unset=True)
+        updating_params["updated_at"] = datetime.now(UTC)
         for key, value in updating_params.items():
             setattr(comment, key, value)
 
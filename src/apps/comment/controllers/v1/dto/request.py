@@ -1,6 +1,6 @@
 import uuid
 
-from src.common.controllers.dto.base import BaseDTO
+from src.common.controllers.dto.base import BaseDTO, PageRequestDTO
 
 
 class AddCommentRequestDTO(BaseDTO):
@@ -9,7 +9,7 @@ class AddCommentRequestDTO(BaseDTO):
     rating: int | None = None
 
 
-class ListCommentsRequestDTO(BaseDTO):
+class ListCommentsRequestDTO(PageRequestDTO):
     hotel_id: uuid.UUID
     rating: int | None = None
 
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Request, Response, status
 
 from src.apps.authentication.user.application.exceptions import (
     Unauthorized,
@@ -17,11 +17,15 @@ from src.apps.authorization.access.domain.enums import (
 )
 from src.apps.authorization.access.domain.exceptions import Forbidden
 from src.apps.comment.application.service import CommentService
-from src.apps.comment.controllers.v1.dto import request, response
+from src.apps.comment.controllers.v1.dto import request as request_dto
+from src.apps.comment.controllers.v1.dto import response as response_dto
 from src.apps.comment.controllers.v1.dto.request import ListCommentsRequestDTO
 from src.apps.comment.domain import commands, fetches
 from src.apps.comment.domain.excepitions import CommentNotFoundError
 from src.apps.hotel.hotels.application.exceptions import HotelNotFoundError
+from src.common.controllers.dto.base import PageResponseDTO
+from src.common.controllers.http.etag import check_etag, make_etag
+from src.common.exceptions.common import InvalidCursorError
 from src.common.exceptions.handlers import generate_responses
 from src.common.utils.auth_scheme import auth_header
 
@@ -43,10 +47,12 @@ router = APIRouter(
 @inject
 async def get_comment(
     comment_id: UUID,
+    request: Request,
+    response: Response,
     comment_service: FromDishka[CommentService],
     access_service: FromDishka[AccessService],
     token: str = auth_header,
-) -> response.CommentInfoResponseDTO:
+) -> response_dto.CommentInfoResponseDTO:
     """Get comment by ID."""
     # Authorize user
     await access_service.authorize(
@@ -59,8 +65,10 @@ async def get_comment(
     )
 
     comment_info = await comment_service.get_comment(fetch=fetches.GetCommentInfo(comment_id=comment_id))
+    # Tagged with the last modification of the comment served
+    check_etag(request, response, make_etag(request, comment_info.updated_at))
 
-    return response.CommentInfoResponseDTO.from_model(comment_info)
+    return response_dto.CommentInfoResponseDTO.from_model(comment_info)
 
 
 @router.get(
@@ -70,16 +78,19 @@ async def get_comment(
         Forbidden,
         UserNotFoundError,
         HotelNotFoundError,
+        InvalidCursorError,
     ),
 )
 @inject
 async def list_comments(
+    request: Request,
+    response: Response,
     filter_query: Annotated[ListCommentsRequestDTO, Query()],
     comment_service: FromDishka[CommentService],
     access_service: FromDishka[AccessService],
     token: str = auth_header,
-) -> list[response.CommentInfoResponseDTO]:
-    """List comments for a specific hotel."""
+) -> PageResponseDTO[response_dto.CommentInfoResponseDTO]:
+    """List one page of comments for a specific hotel, newest first."""
     # Authorize user
     await access_service.authorize(
         Authorize(
@@ -89,11 +100,20 @@ async def list_comments(
         )
     )
 
-    comments_info = await comment_service.list_hotel_comments(
-        fetch=fetches.ListHotelComments(hotel_id=filter_query.hotel_id)
+    fetch = fetches.ListHotelComments(
+        hotel_id=filter_query.hotel_id,
+        limit=filter_query.limit,
+        cursor=filter_query.cursor,
     )
+    version = await comment_service.get_hotel_comments_version(fetch=fetch)
+    check_etag(request, response, make_etag(request, version.count, version.last_modified))
 
-    return [response.CommentInfoResponseDTO.from_model(comment) for comment in comments_info]
+    comments_info = await comment_service.list_hotel_comments(fetch=fetch)
+
+    return PageResponseDTO[response_dto.CommentInfoResponseDTO](
+        items=[response_dto.CommentInfoResponseDTO.from_model(comment) for comment in comments_info.items],
+        next_cursor=comments_info.next_cursor,
+    )
 
 
 @router.post(
@@ -108,11 +128,11 @@ async def list_comments(
 )
 @inject
 async def add_comment(
-    dto: request.AddCommentRequestDTO,
+    dto: request_dto.AddCommentRequestDTO,
     comment_service: FromDishka[CommentService],
     access_service: FromDishka[AccessService],
     token: str = auth_header,
-) -> response.AddCommentResponseDTO:
+) -> response_dto.AddCommentResponseDTO:
     """Add a new comment to a hotel."""
     # Authorize user
     authorization_info = await access_service.authorize(
@@ -132,7 +152,7 @@ async def add_comment(
         )
     )
 
-    return response.AddCommentResponseDTO(id=comment_id)
+    return response_dto.AddCommentResponseDTO(id=comment_id)
 
 
 @router.patch(
@@ -147,11 +167,11 @@ async def add_comment(
 @inject
 async def update_comment(
     comment_id: UUID,
-    dto: request.UpdateCommentRequestDTO,
+    dto: request_dto.UpdateCommentRequestDTO,
     comment_service: FromDishka[CommentService],
     access_service: FromDishka[AccessService],
     token: str = auth_header,
-) -> response.UpdateCommentResponseDTO:
+) -> response_dto.UpdateCommentResponseDTO:
     """Update an existing comment."""
     # Authorize user
     await access_service.authorize(
@@ -171,7 +191,7 @@ async def update_comment(
         )
     )
 
-    return response.UpdateCommentResponseDTO(id=comment_id)
+    return response_dto.UpdateCommentResponseDTO(id=comment_id)
 
 
 @router.delete(
@@ -189,7 +209,7 @@ async def delete_comment(
     comment_service: FromDishka[CommentService],
     access_service: FromDishka[AccessService],
     token: str = auth_header,
-) -> response.DeleteCommentResponseDTO:
+) -> response_dto.DeleteCommentResponseDTO:
     """Delete a comment by ID."""
     # Authorize user
     await access_service.authorize(
@@ -207,4 +227,4 @@ async def delete_comment(
         )
     )
 
-    return response.DeleteCommentResponseDTO(id=comment_id)
+    return response_dto.DeleteCommentResponseDTO(id=comment_id)
@@ -1,6 +1,8 @@
 import uuid
 from dataclasses import dataclass
 
+from src.common.domain.results import DEFAULT_PAGE_LIMIT
+
 
 @dataclass(slots=True, frozen=True)
 class GetCommentInfo:
@@ -10,8 +12,12 @@ class GetCommentInfo:
 @dataclass(slots=True, frozen=True)
 class ListUserComments:
     user_id: uuid.UUID
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: str | None = None
 
 
 @dataclass(slots=True, frozen=True)
 class ListHotelComments:
     hotel_id: uuid.UUID
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: str | None = None
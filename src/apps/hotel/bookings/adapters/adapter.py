@@ -1,71 +1,210 @@
+from collections.abc import AsyncIterator
 from datetime import date
+from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import ColumnElement, Date, Subquery, and_, cast, func, or_, select, true, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 
 from src.apps.hotel.bookings.application.interfaces.gateway import BookingGatewayProto
-from src.apps.hotel.bookings.domain.enums import BookingStatusEnum
-from src.apps.hotel.bookings.domain.models import Booking
+from src.apps.hotel.bookings.domain.enums import ACTIVE_BOOKING_STATUSES, BookingStatusEnum
+from src.apps.hotel.bookings.domain.models import Booking, RoomInventory
+from src.apps.hotel.bookings.domain.results import RoomAvailability, RoomCalendar
+from src.apps.hotel.hotels.domain.models import Hotel
 from src.apps.hotel.rooms.domain.models import Room
-from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.common.adapters.adapter import DEFAULT_YIELD_PER, FakeGateway, SQLAlchemyGateway
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, Page
 from src.infrastructure.database.memory.database import MemoryDatabase
 
 
+def stay_days(date_from: date, date_to: date) -> Subquery:
+    """
+    Build a one-column (`day`) derived table with every night of a stay.
+
+    Args:
+        date_from (date): The check-in date.
+        date_to (date): The check-out date, excluded from the stay.
+
+    Returns:
+        Subquery: The derived table of days.
+    """
+    offsets = func.generate_series(0, (date_to - date_from).days - 1).table_valued("n").render_derived()
+    return select((cast(date_from, Date) + offsets.c.n).label("day")).subquery("stay_days")
+
+
+def active_bookings_on(room_id: Any, day: Any) -> ColumnElement[int]:
+    """
+    Build a correlated count of the active bookings of a room covering a day.
+
+    Args:
+        room_id: The room ID column or value.
+        day: The day column or value.
+
+    Returns:
+        ColumnElement[int]: The scalar count expression.
+    """
+    return (
+        select(func.count(Booking.id))
+        .where(
+            Booking.room_id == room_id,
+            Booking.status.in_(ACTIVE_BOOKING_STATUSES),
+            Booking.date_from <= day,
+            Booking.date_to > day,
+        )
+        .scalar_subquery()
+    )
+
+
+# Columns of a booking export row, in file order.
+BOOKING_EXPORT_COLUMNS = (
+    "id",
+    "hotel_id",
+    "room_id",
+    "user_id",
+    "date_from",
+    "date_to",
+    "total_days",
+    "price",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+
+def _booking_criteria(**filters: Any) -> list[ColumnElement[bool]]:
+    """Build the WHERE criteria of the booking list filters."""
+    criteria = []
+    user_id = filters.get("user_id", None)
+    status = filters.get("status", None)
+    date_from = filters.get("date_from", None)
+    date_to = filters.get("date_to", None)
+
+    if user_id is not None:
+        criteria.append(Booking.user_id == user_id)
+    if status is not None:
+        criteria.append(Booking.status == status)
+    if date_from is not None:
+        criteria.append(Booking.date_from >= date_from)
+    if date_to is not None:
+        criteria.append(Booking.date_to <= date_to)
+    return criteria
+
+
 class BookingAdapter(SQLAlchemyGateway, BookingGatewayProto):
     async def add(self, booking: Booking) -> None:
         """Add a new booking."""
         self.session.add(booking)
-        await self.session.commit()
+        await self._save()
 
-    async def get_booking_by_id(self, booking_id: UUID, **filters: Any) -> Booking | None:
+    async def get_booking_by_id(
+        self, booking_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE, **filters: Any
+    ) -> Booking | None:
         """
         Retrieve a booking by its ID.
 
         Args:
             booking_id (UUID): The ID of the booking to retrieve.
+            profile (LoadingProfileEnum): The relationship loading profile.
             **filters: Additional filters to apply.
 
         Returns:
             Booking | None: The booking if found, else None.
         """
-        booking = await self.get_one_item(Booking, id=booking_id, **filters)
+        booking = await self.get_one_item(Booking, profile, id=booking_id, **filters)
         return booking
 
-    async def get_bookings(self, **filters: Any) -> list[Booking]:
+    async def get_bookings(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[Booking]:
         """
-        Retrieve a list of bookings.
+        Retrieve a page of bookings ordered by check-in date.
 
         Args:
+            profile (LoadingProfileEnum): The relationship loading profile.
+            limit (int): The maximum number of bookings on the page.
+            cursor (str | None): The cursor returned with the previous page.
             **filters: Filters to apply to the bookings query.
 
         Returns:
-            list[Booking]: A list of bookings matching the filters.
+            Page[Booking]: A page of bookings matching the filters.
         """
-        criteria = []
-        user_id = filters.get("user_id", None)
-        status = filters.get("status", None)
-        date_from = filters.get("date_from", None)
-        date_to = filters.get("date_to", None)
-
-        if user_id is not None:
-            criteria.append(Booking.user_id == user_id)
-        if status is not None:
-            criteria.append(Booking.status == status)
-        if date_from is not None:
-            criteria.append(Booking.date_from >= date_from)
-        if date_to is not None:
-            criteria.append(Booking.date_to <= date_to)
-
-        stmt = select(Booking).filter(*criteria)
-        bookings = await self.session.execute(stmt)
-        return list(bookings.scalars())
-
-    async def get_active_bookings(self, **filters: Any) -> list[Booking]:
+        stmt = select(Booking).options(*self.loader_options(profile)).filter(*_booking_criteria(**filters))
+        return await self.paginate(stmt, Booking.date_from, limit, cursor)
+
+    async def stream_bookings(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        yield_per: int = DEFAULT_YIELD_PER,
+        **filters: Any,
+    ) -> AsyncIterator[Booking]:
+        """
+        Stream all bookings ordered by check-in date through a server-side cursor.
+
+        Args:
+            profile (LoadingProfileEnum): The relationship loading profile.
+            yield_per (int): The number of bookings fetched from the cursor at a time.
+            **filters: Filters to apply to the bookings query, the same as for get_bookings.
+
+        Yields:
+            Booking: The bookings matching the filters.
+        """
+        stmt = (
+            select(Booking)
+            .options(*self.loader_options(profile))
+            .filter(*_booking_criteria(**filters))
+            .order_by(Booking.date_from, Booking.id)
+        )
+        async for booking in self.stream_scalars(stmt, yield_per):
+            yield booking
+
+    async def stream_owner_bookings(
+        self,
+        owner: UUID,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        yield_per: int = DEFAULT_YIELD_PER,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream the export rows of the bookings of every hotel of an owner through a server-side cursor.
+
+        Only plain columns are selected, so no ORM instance is built or tracked per row.
+
+        Args:
+            owner (UUID): The ID of the hotels owner.
+            date_from (date | None): Keep bookings starting on or after this date.
+            date_to (date | None): Keep bookings ending on or before this date.
+            yield_per (int): The number of rows fetched from the cursor at a time.
+
+        Yields:
+            dict[str, Any]: The booking columns listed in BOOKING_EXPORT_COLUMNS.
+        """
+        columns = [
+            Room.hotel_id if column == "hotel_id" else getattr(Booking, column) for column in BOOKING_EXPORT_COLUMNS
+        ]
+        stmt = (
+            select(*columns)
+            .join(Room, Room.id == Booking.room_id)
+            .join(Hotel, Hotel.id == Room.hotel_id)
+            .where(Hotel.owner == owner, *_booking_criteria(date_from=date_from, date_to=date_to))
+            .order_by(Booking.date_from, Booking.id)
+        )
+        async for row in self.stream_rows(stmt, yield_per):
+            yield row._asdict()
+
+    async def get_active_bookings(
+        self, profile: LoadingProfileEnum = LoadingProfileEnum.LIST, **filters: Any
+    ) -> list[Booking]:
         """
         Retrieve a list of active bookings.
 
         Args:
+            profile (LoadingProfileEnum): The relationship loading profile.
             **filters: Filters to apply to the bookings query.
 
         Returns:
@@ -73,6 +212,7 @@ class BookingAdapter(SQLAlchemyGateway, BookingGatewayProto):
         """
         active_bookings = await self.session.execute(
             select(Booking)
+            .options(*self.loader_options(profile))
             .where(
                 or_(
                     Booking.status == BookingStatusEnum.PENDING,
@@ -87,6 +227,9 @@ class BookingAdapter(SQLAlchemyGateway, BookingGatewayProto):
         """
         Retrieve the number of free rooms left for a given room and date range.
 
+        Reads the inventory ledger and falls back to counting active bookings for the days
+        the ledger has not been materialized for yet.
+
         Args:
             room_id (UUID): The ID of the room.
             date_from (date): The start date of the booking.
@@ -95,35 +238,275 @@ class BookingAdapter(SQLAlchemyGateway, BookingGatewayProto):
         Returns:
             int: The number of free rooms left.
         """
-        booked_rooms = (
-            select(Booking)
-            .where(
-                and_(
-                    Booking.room_id == room_id,
-                    or_(
-                        and_(Booking.date_from >= date_from, Booking.date_from < date_to),
-                        and_(Booking.date_from <= date_from, Booking.date_to > date_from),
-                    ),
-                )
+        days = stay_days(date_from, date_to)
+        free = func.coalesce(RoomInventory.remaining, Room.quantity - active_bookings_on(Room.id, days.c.day))
+        rooms_left_query = (
+            select(func.min(free))
+            .select_from(Room)
+            .join(days, true())
+            .outerjoin(
+                RoomInventory,
+                and_(RoomInventory.room_id == Room.id, RoomInventory.day == days.c.day),
             )
-            .cte("booked_rooms")
+            .where(Room.id == room_id)
         )
 
-        rooms_left_query = (
-            select((Room.quantity - func.coalesce(func.count(booked_rooms.c.room_id), 0)).label("room_left"))
+        rooms_left = await self.session.scalar(rooms_left_query)
+        return max(rooms_left or 0, 0)
+
+    async def search_available_rooms(
+        self,
+        date_from: date,
+        date_to: date,
+        location: str | None = None,
+        rooms: int = 1,
+        price_from: Decimal | None = None,
+        price_to: Decimal | None = None,
+        services: dict | None = None,
+    ) -> list[RoomAvailability]:
+        """
+        Search rooms of active hotels that are free for a whole date range.
+
+        Every matching room is expanded to the nights of the stay and the free count of
+        each night is read from the inventory ledger (or derived from active bookings),
+        so the whole search is answered by one grouped query.
+
+        Args:
+            date_from (date): The check-in date.
+            date_to (date): The check-out date.
+            location (str | None): The location of the hotel.
+            rooms (int): The number of rooms that must be free for every night.
+            price_from (Decimal | None): The minimum price per night.
+            price_to (Decimal | None): The maximum price per night.
+            services (dict | None): The services the room must offer.
+
+        Returns:
+            list[RoomAvailability]: The available rooms, cheapest first.
+        """
+        nights = (date_to - date_from).days
+        if nights < 1:
+            return []
+
+        criteria: list[ColumnElement[bool]] = [Hotel.is_active.is_(True)]
+        if location:
+            criteria.append(Hotel.location == location)
+        if price_from is not None:
+            criteria.append(Room.price >= price_from)
+        if price_to is not None:
+            criteria.append(Room.price <= price_to)
+        if services:
+            criteria.extend(self.services_criteria(Room, services))
+
+        days = stay_days(date_from, date_to)
+        rooms_left = func.min(
+            func.coalesce(RoomInventory.remaining, Room.quantity - active_bookings_on(Room.id, days.c.day))
+        )
+        stmt = (
+            select(Room.id, Room.hotel_id, Hotel.name, Hotel.location, Room.name, Room.price, rooms_left)
             .select_from(Room)
-            .outerjoin(booked_rooms, booked_rooms.c.room_id == Room.id)
+            .join(Hotel, Hotel.id == Room.hotel_id)
+            .join(days, true())
+            .outerjoin(
+                RoomInventory,
+                and_(RoomInventory.room_id == Room.id, RoomInventory.day == days.c.day),
+            )
+            .where(*criteria)
+            .group_by(Room.id, Hotel.id)
+            .having(rooms_left >= rooms)
+            .order_by(Room.price, Room.id)
+        )
+
+        result = await self.session.execute(stmt)
+        return [
+            RoomAvailability(
+                room_id=room_id,
+                hotel_id=hotel_id,
+                hotel_name=hotel_name,
+                location=hotel_location,
+                room_name=room_name,
+                price=price,
+                rooms_left=left,
+                total_price=price * nights * rooms,
+            )
+            for room_id, hotel_id, hotel_name, hotel_location, room_name, price, left in result
+        ]
+
+    async def get_availability_calendar(
+        self, date_from: date, date_to: date, room_id: UUID | None = None, hotel_id: UUID | None = None
+    ) -> list[RoomCalendar]:
+        """
+        Retrieve the free count of every day of a window for a room or the rooms of a hotel.
+
+        The days are generated on the database side and aggregated into one ordered array
+        per room, so the whole calendar is a single query.
+
+        Args:
+            date_from (date): The first day of the window.
+            date_to (date): The day after the last day of the window.
+            room_id (UUID | None): The ID of the room.
+            hotel_id (UUID | None): The ID of the hotel whose rooms are returned.
+
+        Returns:
+            list[RoomCalendar]: The per-day free counts of every matching room.
+        """
+        if date_to <= date_from:
+            return []
+
+        criteria = []
+        if room_id is not None:
+            criteria.append(Room.id == room_id)
+        if hotel_id is not None:
+            criteria.append(Room.hotel_id == hotel_id)
+
+        days = stay_days(date_from, date_to)
+        free = func.greatest(
+            func.coalesce(RoomInventory.remaining, Room.quantity - active_bookings_on(Room.id, days.c.day)), 0
+        )
+        stmt = (
+            select(Room.id, func.array_agg(aggregate_order_by(free, days.c.day)))
+            .select_from(Room)
+            .join(days, true())
+            .outerjoin(
+                RoomInventory,
+                and_(RoomInventory.room_id == Room.id, RoomInventory.day == days.c.day),
+            )
+            .where(*criteria)
+            .group_by(Room.id)
+            .order_by(Room.id)
+        )
+
+        result = await self.session.execute(stmt)
+        return [RoomCalendar(room_id=id_, date_from=date_from, free=list(free_days)) for id_, free_days in result]
+
+    async def _materialize_inventory(self, room_id: UUID, date_from: date, date_to: date) -> None:
+        """
+        Create the missing inventory ledger rows of a room for a date range.
+
+        The remaining count of a new row is the room's quantity minus the active bookings
+        covering that day. Rows that already exist are left untouched.
+
+        Args:
+            room_id (UUID): The ID of the room.
+            date_from (date): The first day of the range.
+            date_to (date): The day after the last day of the range.
+        """
+        days = stay_days(date_from, date_to)
+        rows = (
+            select(Room.id, days.c.day, Room.quantity - active_bookings_on(Room.id, days.c.day))
+            .select_from(Room)
+            .join(days, true())
             .where(Room.id == room_id)
-            .group_by(Room.quantity, booked_rooms.c.room_id)
         )
+        stmt = (
+            insert(RoomInventory)
+            .from_select(["room_id", "day", "remaining"], rows)
+            .on_conflict_do_nothing(index_elements=[RoomInventory.room_id, RoomInventory.day])
+        )
+        await self.session.execute(stmt)
 
-        rooms_left = await self.session.scalar(rooms_left_query)
-        return rooms_left or 0
+    async def _reserve_inventory(self, room_id: UUID, date_from: date, date_to: date) -> bool:
+        """
+        Take one unit of a room for every day of a date range.
+
+        The ledger rows are locked in day order and decremented by a single conditional
+        `UPDATE ... WHERE remaining > 0`. The reservation runs in a savepoint that is rolled
+        back unless every day of the range could be decremented.
+
+        Args:
+            room_id (UUID): The ID of the room.
+            date_from (date): The first day of the range.
+            date_to (date): The day after the last day of the range.
+
+        Returns:
+            bool: True if the whole range was reserved, False otherwise.
+        """
+        nights = (date_to - date_from).days
+        savepoint = await self.session.begin_nested()
+
+        await self._materialize_inventory(room_id, date_from, date_to)
+        locked = (
+            select(RoomInventory.room_id, RoomInventory.day)
+            .where(
+                RoomInventory.room_id == room_id,
+                RoomInventory.day >= date_from,
+                RoomInventory.day < date_to,
+            )
+            .order_by(RoomInventory.day)
+            .with_for_update()
+            .cte("locked_inventory")
+        )
+        stmt = (
+            update(RoomInventory)
+            .where(
+                RoomInventory.room_id == locked.c.room_id,
+                RoomInventory.day == locked.c.day,
+                RoomInventory.remaining > 0,
+            )
+            .values(remaining=RoomInventory.remaining - 1)
+            .returning(RoomInventory.day)
+        )
+        reserved_days = (await self.session.scalars(stmt)).all()
+
+        if len(reserved_days) < nights:
+            await savepoint.rollback()
+            return False
+
+        await savepoint.commit()
+        return True
+
+    async def _release_inventory(self, booking: Booking) -> None:
+        """
+        Give back the units of a room held by a booking.
+
+        Args:
+            booking (Booking): The booking whose days are released.
+        """
+        stmt = (
+            update(RoomInventory)
+            .where(
+                RoomInventory.room_id == booking.room_id,
+                RoomInventory.day >= booking.date_from,
+                RoomInventory.day < booking.date_to,
+            )
+            .values(remaining=RoomInventory.remaining + 1)
+        )
+        await self.session.execute(stmt)
+
+    async def _move_inventory(self, booking: Booking, room_id: UUID, date_from: date, date_to: date) -> bool:
+        """
+        Move the units held by an active booking to another room or date range.
+
+        The old days are materialized before being released, so days first counted from the
+        bookings do not count the moved booking twice. The release is rolled back with its
+        savepoint if the new range cannot be reserved.
+
+        Args:
+            booking (Booking): The active booking, still holding its old days.
+            room_id (UUID): The ID of the room to book.
+            date_from (date): The new first day of the booking.
+            date_to (date): The day after the new last day of the booking.
+
+        Returns:
+            bool: True if the units were moved, False if the new range is not available.
+        """
+        savepoint = await self.session.begin_nested()
+
+        await self._materialize_inventory(booking.room_id, booking.date_from, booking.date_to)
+        await self._release_inventory(booking)
+        if not await self._reserve_inventory(room_id, date_from, date_to):
+            await savepoint.rollback()
+            return False
+
+        await savepoint.commit()
+        return True
 
     async def add_booking(self, user_id: UUID, room_id: UUID, date_from: date, date_to: date) -> Booking | None:
         """
         Add a new booking.
 
+        The room is reserved in the inventory ledger before the booking is inserted, in the
+        same transaction, so concurrent requests can never oversell a room.
+
         Args:
             user_id (UUID): The ID of the user making the booking.
             room_id (UUID): The ID of the room to be booked.
@@ -133,29 +516,36 @@ class BookingAdapter(SQLAlchemyGateway, BookingGatewayProto):
         Returns:
             Booking | None: The newly created booking if successful, else None.
         """
-        rooms_left = await self.get_free_rooms_left(room_id, date_from, date_to)
+        if date_to <= date_from:
+            return None
 
-        if rooms_left > 0:
-            price_query = select(Room.price).filter_by(id=room_id)
-            price = await self.session.scalar(price_query)
+        price = await self.session.scalar(select(Room.price).filter_by(id=room_id))
+        if price is None:
+            return None
 
-            new_booking = Booking(
-                room_id=room_id,
-                user_id=user_id,
-                date_from=date_from,
-                date_to=date_to,
-                price=price,  # type: ignore
-            )
+        if not await self._reserve_inventory(room_id, date_from, date_to):
+            return None
 
-            await self.add(new_booking)
-            return new_booking
+        new_booking = Booking(
+            room_id=room_id,
+            user_id=user_id,
+            date_from=date_from,
+            date_to=date_to,
+            price=price,
+        )
 
-        return None
+        await self.add(new_booking)
+        return new_booking
 
     async def update_booking(self, booking: Booking, only_active: bool = False, **updating_params: Any) -> UUID | None:
         """
         Update a booking.
 
+        A booking becoming active reserves its room in the inventory ledger before any
+        change is applied, so a full room leaves the booking untouched; one becoming
+        inactive gives its units back. An active booking moved to other days gives back
+        the units of its old days and reserves the new ones in the same transaction.
+
         Args:
             booking (Booking): The booking to update.
             only_active (bool): If True, only update if the booking is active.
@@ -164,8 +554,22 @@ class BookingAdapter(SQLAlchemyGateway, BookingGatewayProto):
         Returns:
             UUID | None: The ID of the updated booking if successful, else None.
         """
-        active_statuses = [BookingStatusEnum.PENDING, BookingStatusEnum.CONFIRMED]
-        if only_active and booking.status not in active_statuses:
+        was_active = booking.status in ACTIVE_BOOKING_STATUSES
+        if only_active and not was_active:
+            return None
+
+        is_active = updating_params.get("status", booking.status) in ACTIVE_BOOKING_STATUSES
+        room_id = updating_params.get("room_id", booking.room_id)
+        date_from = updating_params.get("date_from", booking.date_from)
+        date_to = updating_params.get("date_to", booking.date_to)
+        is_moved = (room_id, date_from, date_to) != (booking.room_id, booking.date_from, booking.date_to)
+
+        if was_active and not is_active:
+            await self._release_inventory(booking)
+        elif is_active and not was_active:
+            if not await self._reserve_inventory(room_id, date_from, date_to):
+                return None
+        elif is_active and is_moved and not await self._move_inventory(booking, room_id, date_from, date_to):
             return None
 
         for key, value in updating_params.items():
@@ -184,6 +588,9 @@ class BookingAdapter(SQLAlchemyGateway, BookingGatewayProto):
         Returns:
             None
         """
+        if booking.status in ACTIVE_BOOKING_STATUSES:
+            await self._release_inventory(booking)
+
         await self.delete_item(booking)
 
 
@@ -191,48 +598,187 @@ class FakeBookingAdapter(FakeGateway[Booking], BookingGatewayProto):
     def __init__(self, memory_db: MemoryDatabase) -> None:
         super().__init__(memory_db)
         self._rooms_collection = memory_db.rooms
+        self._hotels_collection = memory_db.hotels
 
     async def add(self, booking: Booking) -> None:
         """Add a new booking."""
         self._collection.add(booking)
 
-    async def get_booking_by_id(self, booking_id: UUID, **filters: Any) -> Booking | None:
+    async def get_booking_by_id(
+        self, booking_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE, **filters: Any
+    ) -> Booking | None:
         """Retrieve a booking by its ID."""
-        return next(
+        booking = self._collection.get(booking_id)
+        if booking is None or any(getattr(booking, k) != v for k, v in filters.items()):
+            return None
+        return booking
+
+    async def get_bookings(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[Booking]:
+        """Retrieve a page of bookings ordered by check-in date."""
+        bookings = self._collection.find(**filters)
+        return self.paginate(bookings, Booking.date_from, limit, cursor)
+
+    async def stream_bookings(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        yield_per: int = DEFAULT_YIELD_PER,
+        **filters: Any,
+    ) -> AsyncIterator[Booking]:
+        """Stream all bookings ordered by check-in date."""
+        bookings = sorted(self._collection.find(**filters), key=lambda booking: (booking.date_from, booking.id))
+        for booking in bookings:
+            yield booking
+
+    async def stream_owner_bookings(
+        self,
+        owner: UUID,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        yield_per: int = DEFAULT_YIELD_PER,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the export rows of the bookings of every hotel of an owner, ordered by check-in date."""
+        room_hotels = {
+            room.id: hotel.id
+            for hotel in self._hotels_collection.find(owner=owner)
+            for room in self._rooms_collection.find(hotel_id=hotel.id)
+        }
+        bookings = sorted(
             (
                 booking
-                for booking in self._collection
-                if booking.id == booking_id and all(getattr(booking, k) == v for k, v in filters.items())
+                for room_id in room_hotels
+                for booking in self._collection.find(room_id=room_id)
+                if (date_from is None or booking.date_from >= date_from)
+                and (date_to is None or booking.date_to <= date_to)
             ),
-            None,
+            key=lambda booking: (booking.date_from, booking.id),
         )
-
-    async def get_bookings(self, **filters: Any) -> list[Booking]:
-        """Retrieve a list of bookings."""
-        return [booking for booking in self._collection if all(getattr(booking, k) == v for k, v in filters.items())]
-
-    async def get_active_bookings(self, **filters: Any) -> list[Booking]:
+        for booking in bookings:
+            row = {column: getattr(booking, column, None) for column in BOOKING_EXPORT_COLUMNS}
+            row["hotel_id"] = room_hotels[booking.room_id]
+            row["total_days"] = (booking.date_to - booking.date_from).days
+            yield row
+
+    async def get_active_bookings(
+        self, profile: LoadingProfileEnum = LoadingProfileEnum.LIST, **filters: Any
+    ) -> list[Booking]:
         """Retrieve a list of active bookings."""
-        return [
-            booking
-            for booking in self._collection
-            if booking.status in [BookingStatusEnum.PENDING, BookingStatusEnum.CONFIRMED]
-            and all(getattr(booking, k) == v for k, v in filters.items())
-        ]
+        return [booking for booking in self._collection.find(**filters) if booking.status in ACTIVE_BOOKING_STATUSES]
 
     async def get_free_rooms_left(self, room_id: UUID, date_from: date, date_to: date) -> int:
         """Retrieve the number of free rooms left for a given room and date range."""
-        booked_rooms = [
-            booking
-            for booking in self._collection
-            if booking.room_id == room_id
-            and ((date_from <= booking.date_from < date_to) or (booking.date_from <= date_from < booking.date_to))
+        room = self._rooms_collection.get(room_id)
+        if room is None or date_to <= date_from:
+            return 0
+
+        return min(self._free_per_day(room, date_from, date_to))
+
+    def _free_per_day(
+        self, room: Room, date_from: date, date_to: date, bookings: list[Booking] | None = None
+    ) -> list[int]:
+        """
+        Count the free units of a room on every day of a window.
+
+        Args:
+            room (Room): The room.
+            date_from (date): The first day of the window.
+            date_to (date): The day after the window.
+            bookings (list[Booking] | None): The bookings of the room overlapping the window,
+                looked up when not given.
+
+        Returns:
+            list[int]: The free units of each day.
+        """
+        if bookings is None:
+            bookings = self._collection.overlapping(date_from, date_to, room_id=room.id)
+
+        nights = (date_to - date_from).days
+        booked = [0] * nights
+        for booking in bookings:
+            if booking.status not in ACTIVE_BOOKING_STATUSES:
+                continue
+            first = max((booking.date_from - date_from).days, 0)
+            last = min((booking.date_to - date_from).days, nights)
+            for offset in range(first, last):
+                booked[offset] += 1
+        return [max(room.quantity - count, 0) for count in booked]
+
+    async def get_availability_calendar(
+        self, date_from: date, date_to: date, room_id: UUID | None = None, hotel_id: UUID | None = None
+    ) -> list[RoomCalendar]:
+        """Retrieve the free count of every day of a window for a room or the rooms of a hotel."""
+        if date_to <= date_from:
+            return []
+
+        if room_id is not None:
+            room = self._rooms_collection.get(room_id)
+            rooms = [room] if room is not None and (hotel_id is None or room.hotel_id == hotel_id) else []
+        elif hotel_id is not None:
+            rooms = self._rooms_collection.find(hotel_id=hotel_id)
+        else:
+            rooms = list(self._rooms_collection)
+
+        return [
+            RoomCalendar(room_id=room.id, date_from=date_from, free=self._free_per_day(room, date_from, date_to))
+            for room in sorted(rooms, key=lambda room: room.id)
         ]
 
-        rooms_count = len([room for room in self._rooms_collection if room.id == room_id])
-        left_count = rooms_count - len(booked_rooms)
+    async def search_available_rooms(
+        self,
+        date_from: date,
+        date_to: date,
+        location: str | None = None,
+        rooms: int = 1,
+        price_from: Decimal | None = None,
+        price_to: Decimal | None = None,
+        services: dict | None = None,
+    ) -> list[RoomAvailability]:
+        """Search rooms of active hotels that are free for a whole date range."""
+        nights = (date_to - date_from).days
+        if nights <= 0:
+            return []
+
+        hotels = self._hotels_collection.find(location=location) if location else self._hotels_collection
+        # One interval lookup for the whole window instead of one per room
+        window_bookings: dict[UUID, list[Booking]] = {}
+        for booking in self._collection.overlapping(date_from, date_to):
+            window_bookings.setdefault(booking.room_id, []).append(booking)
+
+        available = []
+        for hotel in hotels:
+            if not hotel.is_active:
+                continue
+            for room in self._rooms_collection.find(hotel_id=hotel.id):
+                if (
+                    (price_from is not None and room.price < price_from)
+                    or (price_to is not None and room.price > price_to)
+                    or not self.services_match(room, services)
+                ):
+                    continue
+
+                rooms_left = min(self._free_per_day(room, date_from, date_to, window_bookings.get(room.id, [])))
+                if rooms_left < rooms:
+                    continue
+
+                available.append(
+                    RoomAvailability(
+                        room_id=room.id,
+                        hotel_id=hotel.id,
+                        hotel_name=hotel.name,
+                        location=hotel.location,
+                        room_name=room.name,
+                        price=room.price,
+                        rooms_left=rooms_left,
+                        total_price=room.price * nights * rooms,
+                    )
+                )
 
-        return left_count
+        return sorted(available, key=lambda item: (item.price, item.room_id))
 
     async def add_booking(self, user_id: UUID, room_id: UUID, date_from: date, date_to: date) -> Booking | None:
         """Add a new booking."""
@@ -240,7 +786,7 @@ class FakeBookingAdapter(FakeGateway[Booking], BookingGatewayProto):
         rooms_left = await self.get_free_rooms_left(room_id, date_from, date_to)
 
         if rooms_left > 0:
-            room = next((room for room in self._rooms_collection if room.id == room_id), None)
+            room = self._rooms_collection.get(room_id)
 
             if room is None:
                 return None
@@ -261,17 +807,30 @@ class FakeBookingAdapter(FakeGateway[Booking], BookingGatewayProto):
 
     async def update_booking(self, booking: Booking, only_active: bool = False, **updating_params: Any) -> UUID | None:
         """Update a booking."""
-        active_statuses = [BookingStatusEnum.PENDING, BookingStatusEnum.CONFIRMED]
-
-        if only_active and booking.status not in active_statuses:
+        was_active = booking.status in ACTIVE_BOOKING_STATUSES
+        if only_active and not was_active:
             return None
 
-        for key, value in updating_params.items():
-            setattr(booking, key, value)
+        is_active = updating_params.get("status", booking.status) in ACTIVE_BOOKING_STATUSES
+        room_id = updating_params.get("room_id", booking.room_id)
+        date_from = updating_params.get("date_from", booking.date_from)
+        date_to = updating_params.get("date_to", booking.date_to)
+        is_moved = (room_id, date_from, date_to) != (booking.room_id, booking.date_from, booking.date_to)
 
-        self._collection.discard(booking)
-        self._collection.add(booking)
+        if is_active and (is_moved or not was_active):
+            room = self._rooms_collection.get(room_id)
+            if room is None or date_to <= date_from:
+                return None
+            # The booking does not compete with itself for its old days
+            others = [
+                item
+                for item in self._collection.overlapping(date_from, date_to, room_id=room_id)
+                if item.id != booking.id
+            ]
+            if min(self._free_per_day(room, date_from, date_to, others)) <= 0:
+                return None
 
+        self._collection.update(booking, **updating_params)
         return booking.id
 
     async def delete_booking(self, booking: Booking) -> None:
@@ -5,6 +5,7 @@ from src.apps.hotel.bookings.application.interfaces.gateway import BookingGatewa
 from src.apps.hotel.bookings.domain.enums import BookingStatusEnum
 from src.apps.hotel.bookings.domain.models import Booking
 from src.common.application.ensure import ServiceEnsuranceBase
+from src.common.domain.enums import LoadingProfileEnum
 from src.common.interfaces import CustomLoggerProto
 
 
@@ -15,9 +16,11 @@ class BookingServiceEnsurance(ServiceEnsuranceBase):
         self._booking = gateway
         self._logger = logger
 
-    async def booking_exists(self, booking_id: UUID, user_id: int | UUID) -> Booking:
+    async def booking_exists(
+        self, booking_id: UUID, user_id: int | UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> Booking:
         """Ensure that a booking exists by its ID."""
-        booking = await self._booking.get_booking_by_id(booking_id, user_id=user_id)
+        booking = await self._booking.get_booking_by_id(booking_id, profile, user_id=user_id)
         if booking is None:
             self._logger.error("Booking not found", booking_id=str(booking_id), user_id=str(user_id))
             raise exceptions.BookingNotFoundError
@@ -1,9 +1,14 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from datetime import date
+from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
 from src.apps.hotel.bookings.domain.models import Booking
+from src.apps.hotel.bookings.domain.results import RoomAvailability, RoomCalendar
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, Page
 from src.common.interfaces import GatewayProto
 
 
@@ -14,20 +19,72 @@ class BookingGatewayProto(GatewayProto):
         ...
 
     @abstractmethod
-    async def get_booking_by_id(self, booking_id: UUID, **filters: dict | Any) -> Booking | None:
+    async def get_booking_by_id(
+        self, booking_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE, **filters: dict | Any
+    ) -> Booking | None:
         """Retrieve a booking by its ID."""
         ...
 
     @abstractmethod
-    async def get_bookings(self, **filters: dict | Any) -> list[Booking]:
-        """Retrieve a list of bookings."""
+    async def get_bookings(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: dict | Any,
+    ) -> Page[Booking]:
+        """Retrieve a page of bookings ordered by check-in date."""
         ...
 
     @abstractmethod
-    async def get_active_bookings(self, **filters: dict | Any) -> list[Booking]:
+    def stream_bookings(
+        self,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        yield_per: int = 1_000,
+        **filters: dict | Any,
+    ) -> AsyncIterator[Booking]:
+        """Stream all bookings ordered by check-in date without loading them all at once."""
+        ...
+
+    @abstractmethod
+    def stream_owner_bookings(
+        self,
+        owner: UUID,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        yield_per: int = 1_000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the export rows of the bookings of every hotel of an owner, ordered by check-in date."""
+        ...
+
+    @abstractmethod
+    async def get_active_bookings(
+        self, profile: LoadingProfileEnum = LoadingProfileEnum.LIST, **filters: dict | Any
+    ) -> list[Booking]:
         """Retrieve a list of active bookings."""
         ...
 
+    @abstractmethod
+    async def search_available_rooms(
+        self,
+        date_from: date,
+        date_to: date,
+        location: str | None = None,
+        rooms: int = 1,
+        price_from: Decimal | None = None,
+        price_to: Decimal | None = None,
+        services: dict | None = None,
+    ) -> list[RoomAvailability]:
+        """Search rooms of active hotels that are free for a whole date range."""
+        ...
+
+    @abstractmethod
+    async def get_availability_calendar(
+        self, date_from: date, date_to: date, room_id: UUID | None = None, hotel_id: UUID | None = None
+    ) -> list[RoomCalendar]:
+        """Retrieve the free count of every day of a window for a room or the rooms of a hotel."""
+        ...
+
     @abstractmethod
     async def add_booking(self, user_id: UUID, room_id: UUID, date_from: date, date_to: date) -> Booking | None:
         """Add a new booking."""
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from typing import Any
 from uuid import UUID
 
 from src.apps.hotel.bookings.application import exceptions
@@ -6,7 +8,10 @@ from src.apps.hotel.bookings.application.interfaces.gateway import BookingGatewa
 from src.apps.hotel.bookings.domain import commands
 from src.apps.hotel.bookings.domain.enums import BookingStatusEnum
 from src.apps.hotel.bookings.domain.models import Booking
+from src.apps.hotel.bookings.domain.results import RoomAvailability, RoomCalendar
 from src.common.application.service import ServiceBase
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import Page
 from src.common.interfaces import CustomLoggerProto
 
 
@@ -18,7 +23,7 @@ class BookingService(ServiceBase):
 
     async def get_booking(self, cmd: commands.GetBookingCommand) -> Booking:
         """Get details of a specific booking by its ID."""
-        booking = await self._ensure.booking_exists(cmd.booking_id, cmd.user_id)
+        booking = await self._ensure.booking_exists(cmd.booking_id, cmd.user_id, LoadingProfileEnum.DETAIL)
         return booking
 
     async def get_active_bookings(self, cmd: commands.GetActiveBookingsCommand) -> list[Booking]:
@@ -26,20 +31,64 @@ class BookingService(ServiceBase):
         bookings = await self._adapter.get_active_bookings(user_id=cmd.user_id)
         return bookings
 
-    async def get_bookings_by_status(self, cmd: commands.GetBookingsByStatusCommand) -> list[Booking]:
-        """Get bookings for a user filtered by status."""
+    async def get_bookings_by_status(self, cmd: commands.GetBookingsByStatusCommand) -> Page[Booking]:
+        """Get one page of bookings for a user filtered by status."""
         bookings = await self._adapter.get_bookings(
             user_id=cmd.user_id,
             status=cmd.status,
+            limit=cmd.limit,
+            cursor=cmd.cursor,
         )
         return bookings
 
-    async def list_bookings(self, cmd: commands.ListBookingsCommand) -> list[Booking]:
-        """List bookings with optional filters."""
+    async def list_bookings(self, cmd: commands.ListBookingsCommand) -> Page[Booking]:
+        """List one page of bookings with optional filters."""
         params = cmd.model_dump(exclude={"user_id"}, exclude_unset=True, exclude_none=True)
         bookings = await self._adapter.get_bookings(user_id=cmd.user_id, **params)
         return bookings
 
+    async def export_bookings(self, cmd: commands.ExportBookingsCommand) -> AsyncIterator[dict[str, Any]]:
+        """Get a stream of the export rows of the bookings of every hotel of an owner."""
+        if cmd.date_from is not None and cmd.date_to is not None and cmd.date_from >= cmd.date_to:
+            self._logger.error(
+                "Date from/to must be before date",
+                date_from=str(cmd.date_from),
+                date_to=str(cmd.date_to),
+            )
+            raise exceptions.InvalidBookingDatesError
+
+        return self._adapter.stream_owner_bookings(owner=cmd.owner, date_from=cmd.date_from, date_to=cmd.date_to)
+
+    async def search_availability(self, cmd: commands.SearchAvailabilityCommand) -> list[RoomAvailability]:
+        """Search rooms that can be booked for the whole date range."""
+        if cmd.date_from >= cmd.date_to:
+            self._logger.error(
+                "Date from/to must be before date",
+                date_from=str(cmd.date_from),
+                date_to=str(cmd.date_to),
+            )
+            raise exceptions.InvalidBookingDatesError
+
+        params = cmd.model_dump(exclude_none=True)
+        return await self._adapter.search_available_rooms(**params)
+
+    async def get_availability_calendar(self, cmd: commands.GetAvailabilityCalendarCommand) -> list[RoomCalendar]:
+        """Get the per-day free counts of a room or of every room of a hotel."""
+        if cmd.date_from >= cmd.date_to:
+            self._logger.error(
+                "Date from/to must be before date",
+                date_from=str(cmd.date_from),
+                date_to=str(cmd.date_to),
+            )
+            raise exceptions.InvalidBookingDatesError
+
+        return await self._adapter.get_availability_calendar(
+            date_from=cmd.date_from,
+            date_to=cmd.date_to,
+            room_id=cmd.room_id,
+            hotel_id=cmd.hotel_id,
+        )
+
     async def delete_booking(self, cmd: commands.DeleteBookingCommand) -> None:
         """Delete a booking if it is cancelled or completed."""
         booking = await self._ensure.booking_exists(cmd.booking_id, cmd.user_id)
@@ -50,7 +99,7 @@ class BookingService(ServiceBase):
 
     async def create_booking(self, cmd: commands.CreateBookingCommand) -> Booking:
         """Create a new booking."""
-        if cmd.date_from > cmd.date_to:
+        if cmd.date_from >= cmd.date_to:
             self._logger.error(
                 "Date from/to must be before date",
                 user_id=cmd.user_id,
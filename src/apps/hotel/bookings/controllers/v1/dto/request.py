@@ -1,13 +1,16 @@
 from datetime import date
+from decimal import Decimal
 from uuid import UUID
 
-from pydantic import field_validator
+from pydantic import Field, field_validator, model_validator
 
 from src.apps.hotel.bookings.domain.enums import BookingStatusEnum
-from src.common.controllers.dto.base import BaseDTO
+from src.common.controllers.dto.base import BaseDTO, ExportRequestDTO, PageRequestDTO
 
+MAX_CALENDAR_DAYS = 366
 
-class ListBookingsRequestDTO(BaseDTO):
+
+class ListBookingsRequestDTO(PageRequestDTO):
     room_id: UUID | None = None
     date_from: date | None = None
     date_to: date | None = None
@@ -22,6 +25,19 @@ class ListBookingsRequestDTO(BaseDTO):
         return v
 
 
+class ExportBookingsRequestDTO(ExportRequestDTO):
+    date_from: date | None = None
+    date_to: date | None = None
+
+    @field_validator("date_to")
+    @classmethod
+    def validate_dates(cls, v: date | None, info) -> date | None:
+        """Validate that date_to is after date_from."""
+        if v and info.data.get("date_from") and v <= info.data["date_from"]:
+            raise ValueError("date_to must be after date_from")
+        return v
+
+
 class CreateBookingRequestDTO(BaseDTO):
     room_id: UUID
     date_from: date
@@ -36,3 +52,40 @@ class CreateBookingRequestDTO(BaseDTO):
             if date_to < date_from:
                 raise ValueError("date_to must be after date_from")
         return date_to
+
+
+class SearchAvailabilityRequestDTO(BaseDTO):
+    date_from: date
+    date_to: date
+    location: str | None = None
+    rooms: int = Field(default=1, ge=1)
+    price_from: Decimal | None = Field(default=None, gt=0, decimal_places=2)
+    price_to: Decimal | None = Field(default=None, gt=0, decimal_places=2)
+    services: dict | None = None
+
+    @model_validator(mode="after")
+    def validate_ranges(self):
+        """Validate that date_to is after date_from and price_to is not below price_from."""
+        if self.date_to <= self.date_from:
+            raise ValueError("date_to must be after date_from")
+        if self.price_from is not None and self.price_to is not None and self.price_to < self.price_from:
+            raise ValueError("price_to must be greater than price_from")
+        return self
+
+
+class AvailabilityCalendarRequestDTO(BaseDTO):
+    date_from: date
+    date_to: date
+    room_id: UUID | None = None
+    hotel_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def validate_calendar(self):
+        """Validate the calendar window and that exactly one of room_id and hotel_id is given."""
+        if (self.room_id is None) == (self.hotel_id is None):
+            raise ValueError("exactly one of room_id and hotel_id must be provided")
+        if self.date_to <= self.date_from:
+            raise ValueError("date_to must be after date_from")
+        if (self.date_to - self.date_from).days > MAX_CALENDAR_DAYS:
+            raise ValueError(f"calendar window must not exceed {MAX_CALENDAR_DAYS} days")
+        return self
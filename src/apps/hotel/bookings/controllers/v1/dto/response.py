@@ -3,6 +3,7 @@ from datetime import date
 from decimal import Decimal
 
 from src.apps.hotel.bookings.domain.models import Booking
+from src.apps.hotel.bookings.domain.results import RoomAvailability, RoomCalendar
 from src.common.controllers.dto.base import BaseDTO
 
 
@@ -20,3 +21,30 @@ class BookingResponseDTO(BaseDTO):
     def from_model(cls, model: "Booking") -> "BookingResponseDTO":
         """Create a booking response from the booking model."""
         return cls.model_validate(model, from_attributes=True)
+
+
+class RoomAvailabilityResponseDTO(BaseDTO):
+    room_id: uuid.UUID
+    hotel_id: uuid.UUID
+    hotel_name: str
+    location: str
+    room_name: str
+    price: Decimal
+    rooms_left: int
+    total_price: Decimal
+
+    @classmethod
+    def from_result(cls, result: "RoomAvailability") -> "RoomAvailabilityResponseDTO":
+        """Create an availability response from the search result."""
+        return cls.model_validate(result, from_attributes=True)
+
+
+class RoomCalendarResponseDTO(BaseDTO):
+    room_id: uuid.UUID
+    date_from: date
+    free: list[int]
+
+    @classmethod
+    def from_result(cls, result: "RoomCalendar") -> "RoomCalendarResponseDTO":
+        """Create a calendar response from the calendar result."""
+        return cls.model_validate(result, from_attributes=True)
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
 from src.apps.authentication.user.application.exceptions import (
     Unauthorized,
@@ -13,6 +14,7 @@ from src.apps.authorization.access.domain import commands as access_commands
 from src.apps.authorization.access.domain.commands import Authorize
 from src.apps.authorization.access.domain.enums import (
     BookingPermissionEnum,
+    HotelPermissionEnum,
     ResourceTypeEnum,
 )
 from src.apps.authorization.access.domain.exceptions import Forbidden
@@ -24,13 +26,22 @@ from src.apps.hotel.bookings.application.exceptions import (
 )
 from src.apps.hotel.bookings.application.service import BookingService
 from src.apps.hotel.bookings.controllers.v1.dto.request import (
+    AvailabilityCalendarRequestDTO,
     CreateBookingRequestDTO,
+    ExportBookingsRequestDTO,
     ListBookingsRequestDTO,
+    SearchAvailabilityRequestDTO,
+)
+from src.apps.hotel.bookings.controllers.v1.dto.response import (
+    BookingResponseDTO,
+    RoomAvailabilityResponseDTO,
+    RoomCalendarResponseDTO,
 )
-from src.apps.hotel.bookings.controllers.v1.dto.response import BookingResponseDTO
 from src.apps.hotel.bookings.domain import commands as booking_commands
 from src.apps.notification.email.application.service import EmailService
-from src.common.controllers.dto.base import BaseResponseDTO
+from src.common.controllers.dto.base import BaseResponseDTO, PageResponseDTO
+from src.common.controllers.http.export import export_response
+from src.common.exceptions.common import InvalidCursorError
 from src.common.exceptions.handlers import generate_responses
 from src.common.utils.auth_scheme import auth_header
 
@@ -39,6 +50,11 @@ router = APIRouter(
     tags=["bookings"],
 )
 
+availability_router = APIRouter(
+    prefix="/availability",
+    tags=["availability"],
+)
+
 
 @router.get(
     "",
@@ -46,6 +62,7 @@ router = APIRouter(
         Unauthorized,
         Forbidden,
         UserNotFoundError,
+        InvalidCursorError,
     ),
 )
 @inject
@@ -54,8 +71,8 @@ async def get_bookings(
     access_service: FromDishka[AccessService],
     booking_service: FromDishka[BookingService],
     token: str = auth_header,
-) -> list[BookingResponseDTO]:
-    """Get a list of bookings with optional filters."""
+) -> PageResponseDTO[BookingResponseDTO]:
+    """Get one page of bookings with optional filters."""
     # Authorize user
     authorization_info = await access_service.authorize(
         Authorize(
@@ -70,10 +87,51 @@ async def get_bookings(
         date_from=filter_query.date_from,
         date_to=filter_query.date_to,
         status=filter_query.status,
+        limit=filter_query.limit,
+        cursor=filter_query.cursor,
     )
 
     bookings = await booking_service.list_bookings(cmd)
-    return [BookingResponseDTO.from_model(booking) for booking in bookings]
+    return PageResponseDTO[BookingResponseDTO](
+        items=[BookingResponseDTO.from_model(booking) for booking in bookings.items],
+        next_cursor=bookings.next_cursor,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses=generate_responses(
+        Unauthorized,
+        Forbidden,
+        UserNotFoundError,
+        InvalidBookingDatesError,
+    ),
+)
+@inject
+async def export_bookings(
+    export_query: Annotated[ExportBookingsRequestDTO, Query()],
+    access_service: FromDishka[AccessService],
+    booking_service: FromDishka[BookingService],
+    token: str = auth_header,
+) -> StreamingResponse:
+    """Download the bookings of every hotel of the current user as an NDJSON or CSV file."""
+    # Authorize user, only hotel owners can export the bookings of their hotels
+    authorization_info = await access_service.authorize(
+        Authorize(
+            access_token=token,
+            permission=HotelPermissionEnum.CAN_EDIT,
+            resource_type=ResourceTypeEnum.HOTEL,
+        )
+    )
+
+    cmd = booking_commands.ExportBookingsCommand(
+        owner=authorization_info.user_id,
+        date_from=export_query.date_from,
+        date_to=export_query.date_to,
+    )
+    rows = await booking_service.export_bookings(cmd)
+    return export_response(rows, export_query.format, filename="bookings")
 
 
 @router.get(
@@ -185,3 +243,52 @@ async def cancel_active_booking(
 
     await booking_service.cancel_active_booking(cmd)
     return BaseResponseDTO(id=booking_id)
+
+
+@availability_router.get(
+    "/search",
+    responses=generate_responses(
+        InvalidBookingDatesError,
+    ),
+)
+@inject
+async def search_availability(
+    filter_query: Annotated[SearchAvailabilityRequestDTO, Query()],
+    booking_service: FromDishka[BookingService],
+) -> list[RoomAvailabilityResponseDTO]:
+    """Search rooms of active hotels that are free for the whole date range."""
+    cmd = booking_commands.SearchAvailabilityCommand(
+        date_from=filter_query.date_from,
+        date_to=filter_query.date_to,
+        location=filter_query.location,
+        rooms=filter_query.rooms,
+        price_from=filter_query.price_from,
+        price_to=filter_query.price_to,
+        services=filter_query.services,
+    )
+
+    rooms = await booking_service.search_availability(cmd)
+    return [RoomAvailabilityResponseDTO.from_result(room) for room in rooms]
+
+
+@availability_router.get(
+    "/calendar",
+    responses=generate_responses(
+        InvalidBookingDatesError,
+    ),
+)
+@inject
+async def get_availability_calendar(
+    filter_query: Annotated[AvailabilityCalendarRequestDTO, Query()],
+    booking_service: FromDishka[BookingService],
+) -> list[RoomCalendarResponseDTO]:
+    """Get the free count of every day of a window, as one array per room starting at `date_from`."""
+    cmd = booking_commands.GetAvailabilityCalendarCommand(
+        date_from=filter_query.date_from,
+        date_to=filter_query.date_to,
+        room_id=filter_query.room_id,
+        hotel_id=filter_query.hotel_id,
+    )
+
+    calendars = await booking_service.get_availability_calendar(cmd)
+    return [RoomCalendarResponseDTO.from_result(calendar) for calendar in calendars]
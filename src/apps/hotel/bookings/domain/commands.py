@@ -1,8 +1,9 @@
 from datetime import date
+from decimal import Decimal
 from uuid import UUID
 
 from src.apps.hotel.bookings.domain.enums import BookingStatusEnum
-from src.common.domain.commands import Command
+from src.common.domain.commands import Command, PageCommand
 
 
 class GetBookingCommand(Command):
@@ -14,12 +15,12 @@ class GetActiveBookingsCommand(Command):
     user_id: UUID
 
 
-class GetBookingsByStatusCommand(Command):
+class GetBookingsByStatusCommand(PageCommand):
     user_id: UUID
     status: BookingStatusEnum
 
 
-class ListBookingsCommand(Command):
+class ListBookingsCommand(PageCommand):
     user_id: UUID
     room_id: UUID | None
     date_from: date | None
@@ -27,6 +28,12 @@ class ListBookingsCommand(Command):
     status: BookingStatusEnum | None
 
 
+class ExportBookingsCommand(Command):
+    owner: UUID
+    date_from: date | None
+    date_to: date | None
+
+
 class DeleteBookingCommand(Command):
     user_id: UUID
     booking_id: UUID
@@ -53,3 +60,20 @@ class UpdateBookingCommand(Command):
 class CancelActiveBookingCommand(Command):
     user_id: UUID
     booking_id: UUID
+
+
+class SearchAvailabilityCommand(Command):
+    date_from: date
+    date_to: date
+    location: str | None = None
+    rooms: int = 1
+    price_from: Decimal | None = None
+    price_to: Decimal | None = None
+    services: dict | None = None
+
+
+class GetAvailabilityCalendarCommand(Command):
+    date_from: date
+    date_to: date
+    room_id: UUID | None = None
+    hotel_id: UUID | None = None
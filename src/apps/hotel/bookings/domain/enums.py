@@ -6,3 +6,7 @@ class BookingStatusEnum(StrEnum):
     CONFIRMED = "confirmed"
     CANCELLED = "cancelled"
     COMPLETED = "completed"
+
+
+# Statuses of bookings that hold a room for their dates.
+ACTIVE_BOOKING_STATUSES = (BookingStatusEnum.PENDING, BookingStatusEnum.CONFIRMED)
@@ -75,3 +75,21 @@ class Booking(BookingBase):
     def total_cost(self) -> Decimal:
         """Calculate the total cost of the booking."""
         return self.price * Decimal(self.total_days)
+
+
+class RoomInventory(BookingBase):
+    """
+    Per-room, per-day inventory ledger.
+
+    Holds the number of units of a room that are still free on a given day, i.e. the room's
+    quantity minus the active bookings covering that day. Rows are materialized lazily for the
+    days a booking touches and are kept in the same transaction as the bookings themselves.
+    """
+
+    __tablename__ = "room_inventory"
+
+    room_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("rooms.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    remaining: Mapped[int] = mapped_column(Integer, nullable=False)
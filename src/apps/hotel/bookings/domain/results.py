@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class RoomAvailability:
+    room_id: UUID
+    hotel_id: UUID
+    hotel_name: str
+    location: str
+    room_name: str
+    price: Decimal
+    rooms_left: int
+    total_price: Decimal
+
+
+@dataclass(slots=True, frozen=True)
+class RoomCalendar:
+    room_id: UUID
+    date_from: date
+    free: list[int]
@@ -1,36 +1,132 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import ColumnElement, func, or_, select, update
 from sqlalchemy.exc import IntegrityError
 
 from src.apps.hotel.hotels.application.interfaces.gateway import HotelGatewayProto
 from src.apps.hotel.hotels.domain.models import Hotel
-from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.apps.hotel.rooms.domain.models import Room
+from src.common.adapters.adapter import DEFAULT_YIELD_PER, FakeGateway, SQLAlchemyGateway
+from src.common.domain.amenities import amenities_of
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, ListVersion, Page
+from src.infrastructure.database.memory.database import MemoryDatabase
+from src.infrastructure.database.memory.trigram import WORD_SIMILARITY_THRESHOLD, prefix_match, word_similarity, words
+
+# Columns of a hotel export row, in file order.
+HOTEL_EXPORT_COLUMNS = ("id", "name", "location", "services", "rooms_quantity", "is_active", "image_id")
 
 
 class HotelAdapter(SQLAlchemyGateway, HotelGatewayProto):
-    async def get_hotels(self, only_active: bool = True, **filters: Any) -> list[Hotel]:
-        """Retrieve a list of hotels."""
+    async def get_hotels(
+        self,
+        only_active: bool = True,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[Hotel]:
+        """Retrieve a page of hotels ordered by name."""
+        stmt = (
+            select(Hotel).options(*self.loader_options(profile)).filter(*self._hotel_criteria(only_active, **filters))
+        )
+        return await self.paginate(stmt, Hotel.name, limit, cursor)
+
+    async def get_hotels_version(self, only_active: bool = True, **filters: Any) -> ListVersion:
+        """Retrieve the version signal of the hotels matching the filters of get_hotels."""
+        return await self.get_list_version(Hotel, *self._hotel_criteria(only_active, **filters))
+
+    async def search_hotels(
+        self,
+        query: str,
+        only_active: bool = True,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Hotel]:
+        """
+        Retrieve a page of hotels whose name or location matches a search query, best match first.
+
+        A hotel matches when the full-text document of its name and location contains every
+        word of the query as a prefix (Russian or English stemming), or when the query is
+        similar enough to its name or location to absorb typos (pg_trgm word similarity).
+        Every condition is served by a GIN index, so the database only ranks the candidates.
+
+        Args:
+            query (str): The search text, e.g. "sochi" or "Сочи".
+            only_active (bool): Whether to leave out inactive hotels.
+            profile (LoadingProfileEnum): The relationship loading profile.
+            limit (int): The maximum number of hotels on the page.
+            cursor (str | None): The cursor returned with the previous page.
+
+        Returns:
+            Page[Hotel]: A page of the matching hotels, ranked by relevance.
+        """
+        query_words = words(query)
+        if not query_words:
+            return Page(items=[])
+
+        prefixes = " & ".join(f"{word}:*" for word in query_words)
+        ts_query = func.to_tsquery("english", prefixes).op("||")(func.to_tsquery("russian", prefixes))
+        similarity = func.greatest(func.word_similarity(query, Hotel.name), func.word_similarity(query, Hotel.location))
+        rank = similarity + func.ts_rank_cd(Hotel.search_vector, ts_query)
+
+        criteria = [
+            or_(
+                Hotel.search_vector.op("@@")(ts_query),
+                Hotel.name.op("%>")(query),
+                Hotel.location.op("%>")(query),
+            )
+        ]
+        if only_active:
+            criteria.append(Hotel.is_active.is_(True))
+        stmt = select(Hotel).options(*self.loader_options(profile)).where(*criteria)
+        return await self.paginate_ranked(stmt, Hotel, rank, limit, cursor)
+
+    def _hotel_criteria(self, only_active: bool, **filters: Any) -> list[ColumnElement[bool]]:
         location = filters.get("location", None)
         services = filters.get("services", None)
         rooms_quantity = filters.get("rooms_quantity", None)
-        criteria = []
+        criteria: list[ColumnElement[bool]] = []
         if only_active:
             criteria.append(Hotel.is_active.is_(True))
         if location:
             criteria.append(Hotel.location == location)
         if services:
-            criteria.append(Hotel.services.op("@>")(services))
+            criteria.extend(self.services_criteria(Hotel, services))
         if rooms_quantity:
             criteria.append(Hotel.rooms_quantity >= rooms_quantity)
-        stmt = select(Hotel).filter(*criteria)
-        result = await self.session.execute(stmt)
-        return list(result.unique().scalars())
+        return criteria
+
+    async def stream_owner_hotels(
+        self, owner: UUID, yield_per: int = DEFAULT_YIELD_PER
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream the export rows of every hotel of an owner through a server-side cursor.
+
+        Args:
+            owner (UUID): The ID of the hotel owner.
+            yield_per (int): The number of rows fetched from the cursor at a time.
+
+        Yields:
+            dict[str, Any]: The hotel columns listed in HOTEL_EXPORT_COLUMNS.
+        """
+        stmt = (
+            select(*(getattr(Hotel, column) for column in HOTEL_EXPORT_COLUMNS))
+            .where(Hotel.owner == owner)
+            .order_by(Hotel.name, Hotel.id)
+        )
+        async for row in self.stream_rows(stmt, yield_per):
+            yield row._asdict()
 
-    async def get_hotel_by_id(self, hotel_id: UUID) -> Hotel | None:
+    async def get_hotel_by_id(
+        self, hotel_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> Hotel | None:
         """Retrieve a hotel by its ID."""
-        hotel = await self.get_item_by_id(Hotel, hotel_id)
+        hotel = await self.get_item_by_id(Hotel, hotel_id, profile)
         return hotel
 
     async def get_users_hotel(self, user_id: UUID, hotel_id: UUID) -> Hotel | None:
@@ -42,7 +138,7 @@ class HotelAdapter(SQLAlchemyGateway, HotelGatewayProto):
         """Add a new hotel."""
         self.session.add(hotel)
         try:
-            await self.session.commit()
+            await self._save()
             return hotel.id
         except IntegrityError:
             return None
@@ -50,37 +146,106 @@ class HotelAdapter(SQLAlchemyGateway, HotelGatewayProto):
     async def update_hotel(self, hotel: Hotel, **params: Any) -> UUID | None:
         """Update an existing hotel."""
         hotel_id = hotel.id
-        stmt = update(Hotel).where(Hotel.id == hotel_id).values(**params)
+        if "services" in params:
+            params["amenities"] = amenities_of(params["services"])
+        stmt = (
+            update(Hotel)
+            .where(Hotel.id == hotel_id)
+            .values(**params, version=Hotel.version + 1, updated_at=datetime.now(UTC))
+        )
         try:
             await self.session.execute(stmt)
+            await self._save()
             return hotel_id
         except IntegrityError:
             return None
 
+    async def get_room_ids(self, hotel_id: UUID) -> list[UUID]:
+        """
+        Retrieve the IDs of the rooms of a hotel.
+
+        Selected explicitly, since lazy loading `Hotel.rooms` is not possible on an async session.
+
+        Args:
+            hotel_id (UUID): The ID of the hotel.
+
+        Returns:
+            list[UUID]: The IDs of the hotel's rooms.
+        """
+        result = await self.session.scalars(select(Room.id).where(Room.hotel_id == hotel_id))
+        return list(result)
+
     async def delete_hotel(self, hotel: Hotel) -> None:
         """Delete a hotel by its ID."""
         await self.delete_item(hotel)
 
 
 class FakeHotelAdapter(FakeGateway[Hotel], HotelGatewayProto):
-    async def get_hotels(self, only_active: bool = True, **filters: Any) -> list[Hotel]:
-        """Retrieve a list of hotels."""
-        if only_active:
-            return [
-                hotel
-                for hotel in self._collection
-                if hotel.is_active and all(getattr(hotel, k) == v for k, v in filters.items())
-            ]
+    def __init__(self, memory_db: MemoryDatabase) -> None:
+        super().__init__(memory_db)
+        self._rooms_collection = memory_db.rooms
+
+    async def get_hotels(
+        self,
+        only_active: bool = True,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[Hotel]:
+        """Retrieve a page of hotels ordered by name."""
+        return self.paginate(self._find_hotels(only_active, **filters), Hotel.name, limit, cursor)
+
+    async def get_hotels_version(self, only_active: bool = True, **filters: Any) -> ListVersion:
+        """Retrieve the version signal of the hotels matching the filters of get_hotels."""
+        return self.list_version(self._find_hotels(only_active, **filters))
 
-        return [hotel for hotel in self._collection if all(getattr(hotel, k) == v for k, v in filters.items())]
+    def _find_hotels(self, only_active: bool, services: dict | None = None, **filters: Any) -> list[Hotel]:
+        return [
+            hotel
+            for hotel in self._collection.find(**filters)
+            if (hotel.is_active or not only_active) and self.services_match(hotel, services)
+        ]
 
-    async def get_hotel_by_id(self, hotel_id: UUID) -> Hotel | None:
+    async def search_hotels(
+        self,
+        query: str,
+        only_active: bool = True,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Hotel]:
+        """Retrieve a page of hotels matching a search query, ranked with an in-memory take on pg_trgm."""
+        ranked = []
+        for hotel in self._collection:
+            if only_active and not hotel.is_active:
+                continue
+            similarity = max(word_similarity(query, hotel.name), word_similarity(query, hotel.location))
+            if similarity >= WORD_SIMILARITY_THRESHOLD or prefix_match(query, f"{hotel.name} {hotel.location}"):
+                ranked.append((similarity, hotel))
+        return self.paginate_ranked(ranked, limit, cursor)
+
+    async def stream_owner_hotels(
+        self, owner: UUID, yield_per: int = DEFAULT_YIELD_PER
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the export rows of every hotel of an owner, ordered by name."""
+        hotels = sorted(
+            self._collection.find(owner=owner),
+            key=lambda hotel: (hotel.name, hotel.id),
+        )
+        for hotel in hotels:
+            yield {column: getattr(hotel, column) for column in HOTEL_EXPORT_COLUMNS}
+
+    async def get_hotel_by_id(
+        self, hotel_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> Hotel | None:
         """Retrieve a hotel by its ID."""
-        return next((hotel for hotel in self._collection if hotel.id == hotel_id), None)
+        return self._collection.get(hotel_id)
 
     async def get_users_hotel(self, user_id: UUID, hotel_id: UUID) -> Hotel | None:
         """Retrieve users hotel by its ID."""
-        return next((hotel for hotel in self._collection if hotel.id == hotel_id and hotel.owner == user_id), None)
+        hotel = self._collection.get(hotel_id)
+        return hotel if hotel is not None and hotel.owner == user_id else None
 
     async def add(self, hotel: Hotel) -> UUID | None:
         """Add a new hotel."""
@@ -89,14 +254,15 @@ class FakeHotelAdapter(FakeGateway[Hotel], HotelGatewayProto):
 
     async def update_hotel(self, hotel: Hotel, **params: Any) -> UUID | None:
         """Update an existing hotel."""
-        for key, value in params.items():
-            setattr(hotel, key, value)
-
-        self._collection.discard(hotel)
-        self._collection.add(hotel)
-
+        if "services" in params:
+            params["amenities"] = amenities_of(params["services"])
+        self._collection.update(hotel, **params, version=hotel.version + 1, updated_at=datetime.now(UTC))
         return hotel.id
 
+    async def get_room_ids(self, hotel_id: UUID) -> list[UUID]:
+        """Retrieve the IDs of the rooms of a hotel."""
+        return [room.id for room in self._rooms_collection.find(hotel_id=hotel_id)]
+
     async def delete_hotel(self, hotel: Hotel) -> None:
         """Delete a hotel by its ID."""
         self._collection.discard(hotel)
@@ -4,6 +4,7 @@ from src.apps.hotel.hotels.application import exceptions
 from src.apps.hotel.hotels.application.interfaces.gateway import HotelGatewayProto
 from src.apps.hotel.hotels.domain.models import Hotel
 from src.common.application.ensure import ServiceEnsuranceBase
+from src.common.domain.enums import LoadingProfileEnum
 from src.common.interfaces import CustomLoggerProto
 
 
@@ -14,9 +15,9 @@ class HotelServiceEnsurance(ServiceEnsuranceBase):
         self._hotel = gateway
         self._logger = logger
 
-    async def hotel_exists(self, hotel_id: UUID) -> Hotel:
+    async def hotel_exists(self, hotel_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE) -> Hotel:
         """Ensure that a hotel exists by its ID."""
-        hotel = await self._hotel.get_hotel_by_id(hotel_id)
+        hotel = await self._hotel.get_hotel_by_id(hotel_id, profile)
         if hotel is None:
             self._logger.error("Hotel not found", hotel_id=hotel_id)
             raise exceptions.HotelNotFoundError
@@ -1,18 +1,53 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
 from uuid import UUID
 
 from src.apps.hotel.hotels.domain.models import Hotel
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, ListVersion, Page
 from src.common.interfaces import GatewayProto
 
 
 class HotelGatewayProto(GatewayProto):
     @abstractmethod
-    async def get_hotels(self, only_active: bool = True, **filters) -> list[Hotel]:
-        """Retrieve a list of hotels."""
+    async def get_hotels(
+        self,
+        only_active: bool = True,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters,
+    ) -> Page[Hotel]:
+        """Retrieve a page of hotels ordered by name."""
         ...
 
     @abstractmethod
-    async def get_hotel_by_id(self, hotel_id: UUID) -> Hotel | None:
+    async def search_hotels(
+        self,
+        query: str,
+        only_active: bool = True,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Hotel]:
+        """Retrieve a page of hotels whose name or location matches a search query, best match first."""
+        ...
+
+    @abstractmethod
+    async def get_hotels_version(self, only_active: bool = True, **filters) -> ListVersion:
+        """Retrieve the version signal of the hotels matching the filters of get_hotels."""
+        ...
+
+    @abstractmethod
+    def stream_owner_hotels(self, owner: UUID, yield_per: int = 1_000) -> AsyncIterator[dict[str, Any]]:
+        """Stream the export rows of every hotel of an owner, ordered by name."""
+        ...
+
+    @abstractmethod
+    async def get_hotel_by_id(
+        self, hotel_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> Hotel | None:
         """Retrieve a hotel by its ID."""
         ...
 
@@ -31,6 +66,11 @@ class HotelGatewayProto(GatewayProto):
         """Update an existing hotel."""
         ...
 
+    @abstractmethod
+    async def get_room_ids(self, hotel_id: UUID) -> list[UUID]:
+        """Retrieve the IDs of the rooms of a hotel."""
+        ...
+
     @abstractmethod
     async def delete_hotel(self, hotel: Hotel) -> None:
         """Delete a hotel by its ID."""
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from typing import Any
 from uuid import UUID
 
 from src.apps.hotel.hotels.application import exceptions
@@ -5,26 +7,49 @@ from src.apps.hotel.hotels.application.ensure import HotelServiceEnsurance
 from src.apps.hotel.hotels.application.interfaces.gateway import HotelGatewayProto
 from src.apps.hotel.hotels.domain import commands
 from src.apps.hotel.hotels.domain.models import Hotel
+from src.apps.hotel.hotels.domain.results import HOTEL_CACHE_NAMESPACE, HotelDetail
+from src.apps.hotel.rooms.domain.results import ROOM_CACHE_NAMESPACE
 from src.common.application.service import ServiceBase
-from src.common.interfaces import CustomLoggerProto
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import ListVersion, Page
+from src.common.interfaces import CustomLoggerProto, ReadThroughCacheProto
 
 
 class HotelService(ServiceBase):
-    def __init__(self, gateway: HotelGatewayProto, logger: CustomLoggerProto) -> None:
+    def __init__(self, gateway: HotelGatewayProto, cache: ReadThroughCacheProto, logger: CustomLoggerProto) -> None:
         self._adapter = gateway
+        self._cache = cache
         self._logger = logger
         self._ensure = HotelServiceEnsurance(gateway, logger)
 
-    async def list_hotels(self, cmd: commands.ListHotelsCommand) -> list[Hotel]:
-        """List hotels with optional filters."""
+    async def list_hotels(self, cmd: commands.ListHotelsCommand) -> Page[Hotel]:
+        """List one page of hotels with optional filters."""
         params = cmd.model_dump(exclude_unset=True)
         hotels = await self._adapter.get_hotels(**params)
         return hotels
 
-    async def get_hotel(self, cmd: commands.GetHotelCommand) -> Hotel:
-        """Get details of a specific hotel by its ID."""
-        hotel = await self._ensure.hotel_exists(cmd.hotel_id)
-        return hotel
+    async def search_hotels(self, cmd: commands.SearchHotelsCommand) -> Page[Hotel]:
+        """Search one page of hotels by name and location, best match first."""
+        hotels = await self._adapter.search_hotels(cmd.query, limit=cmd.limit, cursor=cmd.cursor)
+        return hotels
+
+    async def get_hotels_version(self, cmd: commands.ListHotelsCommand) -> ListVersion:
+        """Get the version signal of the hotels matching the filters, without loading them."""
+        params = cmd.model_dump(exclude={"limit", "cursor"}, exclude_unset=True)
+        return await self._adapter.get_hotels_version(**params)
+
+    async def export_hotels(self, cmd: commands.ExportHotelsCommand) -> AsyncIterator[dict[str, Any]]:
+        """Get a stream of the export rows of every hotel of an owner."""
+        return self._adapter.stream_owner_hotels(owner=cmd.owner)
+
+    async def get_hotel(self, cmd: commands.GetHotelCommand) -> HotelDetail:
+        """Get details of a specific hotel by its ID, served from the cache when possible."""
+
+        async def _load() -> HotelDetail:
+            hotel = await self._ensure.hotel_exists(cmd.hotel_id, LoadingProfileEnum.DETAIL)
+            return HotelDetail.model_validate(hotel)
+
+        return await self._cache.get_or_load(HOTEL_CACHE_NAMESPACE, cmd.hotel_id, HotelDetail, _load)
 
     async def create_hotel(self, cmd: commands.CreateHotelCommand) -> UUID:
         """Create a new hotel."""
@@ -64,12 +89,17 @@ class HotelService(ServiceBase):
             self._logger.error("Hotel update failed", hotel_id=cmd.hotel_id)
             raise exceptions.HotelCannotBeUpdatedError
 
+        await self._cache.invalidate(HOTEL_CACHE_NAMESPACE, cmd.hotel_id)
         self._logger.info("Hotel's info successfully updated", hotel_id=cmd.hotel_id)
         return is_updated
 
     async def delete_hotel(self, cmd: commands.DeleteHotelCommand) -> None:
         """Delete a hotel by its ID."""
         hotel = await self._ensure.hotel_exists(cmd.hotel_id)
+        room_ids = await self._adapter.get_room_ids(hotel.id)
 
         await self._adapter.delete_hotel(hotel)
+        # The rooms are deleted with the hotel
+        await self._cache.invalidate(HOTEL_CACHE_NAMESPACE, cmd.hotel_id)
+        await self._cache.invalidate(ROOM_CACHE_NAMESPACE, *room_ids)
         self._logger.info("Hotel successfully deleted", hotel_id=cmd.hotel_id)
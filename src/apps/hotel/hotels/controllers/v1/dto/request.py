@@ -1,6 +1,8 @@
 from uuid import UUID
 
-from src.common.controllers.dto.base import BaseRequestDTO
+from pydantic import Field
+
+from src.common.controllers.dto.base import BaseRequestDTO, PageRequestDTO
 
 
 class CreateHotelRequestDTO(BaseRequestDTO):
@@ -22,7 +24,11 @@ class UpdateHotelRequestDTO(BaseRequestDTO):
     image_id: int | None = None
 
 
-class ListHotelsRequestDTO(BaseRequestDTO):
+class ListHotelsRequestDTO(PageRequestDTO):
     location: str | None = None
     services: dict | None = None
     rooms_quantity: int | None = None
+
+
+class SearchHotelsRequestDTO(PageRequestDTO):
+    q: str = Field(min_length=1, max_length=100, description="Text searched in the hotel names and locations.")
@@ -2,7 +2,8 @@ from typing import Annotated
 from uuid import UUID, uuid4
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from src.apps.authentication.user.application.exceptions import (
     Unauthorized,
@@ -25,6 +26,7 @@ from src.apps.hotel.hotels.application.service import HotelService
 from src.apps.hotel.hotels.controllers.v1.dto.request import (
     CreateHotelRequestDTO,
     ListHotelsRequestDTO,
+    SearchHotelsRequestDTO,
     UpdateHotelRequestDTO,
 )
 from src.apps.hotel.hotels.controllers.v1.dto.response import (
@@ -34,31 +36,106 @@ from src.apps.hotel.hotels.controllers.v1.dto.response import (
     UploadHotelImageResponseDTO,
 )
 from src.apps.hotel.hotels.domain import commands as hotel_commands
+from src.common.controllers.dto.base import ExportRequestDTO, PageResponseDTO
+from src.common.controllers.http.coalescing import CoalescingAPIRoute, coalesce_requests
+from src.common.controllers.http.etag import check_etag, make_etag
+from src.common.controllers.http.export import export_response
+from src.common.exceptions.common import InvalidCursorError
 from src.common.exceptions.handlers import generate_responses
 from src.common.utils.auth_scheme import auth_header
 
 router = APIRouter(
     prefix="/hotels",
     tags=["hotels"],
+    route_class=CoalescingAPIRoute,
 )
 
 
 @router.get(
     "",
+    responses=generate_responses(
+        InvalidCursorError,
+    ),
 )
+@coalesce_requests
 @inject
 async def get_hotels(
+    request: Request,
+    response: Response,
     filter_query: Annotated[ListHotelsRequestDTO, Query()],
     hotel_service: FromDishka[HotelService],
-) -> list[GetHotelsResponseDTO]:
-    """List hotels with optional filters."""
+) -> PageResponseDTO[GetHotelsResponseDTO]:
+    """List one page of hotels with optional filters."""
     cmd = hotel_commands.ListHotelsCommand(
         location=filter_query.location,
         services=filter_query.services,
         rooms_quantity=filter_query.rooms_quantity,
+        limit=filter_query.limit,
+        cursor=filter_query.cursor,
     )
+    version = await hotel_service.get_hotels_version(cmd)
+    check_etag(request, response, make_etag(request, version.count, version.last_modified))
+
     hotels = await hotel_service.list_hotels(cmd)
-    return [GetHotelsResponseDTO.model_validate(hotel, from_attributes=True) for hotel in hotels]
+    return PageResponseDTO[GetHotelsResponseDTO](
+        items=[GetHotelsResponseDTO.model_validate(hotel, from_attributes=True) for hotel in hotels.items],
+        next_cursor=hotels.next_cursor,
+    )
+
+
+@router.get(
+    "/search",
+    responses=generate_responses(
+        InvalidCursorError,
+    ),
+)
+@coalesce_requests
+@inject
+async def search_hotels(
+    search_query: Annotated[SearchHotelsRequestDTO, Query()],
+    hotel_service: FromDishka[HotelService],
+) -> PageResponseDTO[GetHotelsResponseDTO]:
+    """Search one page of hotels by name and location, tolerating typos and word prefixes, best match first."""
+    cmd = hotel_commands.SearchHotelsCommand(
+        query=search_query.q,
+        limit=search_query.limit,
+        cursor=search_query.cursor,
+    )
+    hotels = await hotel_service.search_hotels(cmd)
+    return PageResponseDTO[GetHotelsResponseDTO](
+        items=[GetHotelsResponseDTO.model_validate(hotel, from_attributes=True) for hotel in hotels.items],
+        next_cursor=hotels.next_cursor,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses=generate_responses(
+        Unauthorized,
+        Forbidden,
+        UserNotFoundError,
+    ),
+)
+@inject
+async def export_hotels(
+    export_query: Annotated[ExportRequestDTO, Query()],
+    access_service: FromDishka[AccessService],
+    hotel_service: FromDishka[HotelService],
+    token: str = auth_header,
+) -> StreamingResponse:
+    """Download every hotel of the current user as an NDJSON or CSV file."""
+    # Authorize user, only hotel owners can export their hotels
+    authorization_info = await access_service.authorize(
+        Authorize(
+            access_token=token,
+            permission=HotelPermissionEnum.CAN_EDIT,
+            resource_type=ResourceTypeEnum.HOTEL,
+        )
+    )
+
+    rows = await hotel_service.export_hotels(hotel_commands.ExportHotelsCommand(owner=authorization_info.user_id))
+    return export_response(rows, export_query.format, filename="hotels")
 
 
 @router.get(
@@ -67,13 +144,18 @@ async def get_hotels(
         HotelNotFoundError,
     ),
 )
+@coalesce_requests
 @inject
 async def get_hotel(
     hotel_id: UUID,
+    request: Request,
+    response: Response,
     hotel_service: FromDishka[HotelService],
 ) -> GetHotelsResponseDTO:
     """Get details of a specific hotel by its ID."""
     hotel = await hotel_service.get_hotel(hotel_commands.GetHotelCommand(hotel_id=hotel_id))
+    # Tagged with the version of the details served, which may come from the cache
+    check_etag(request, response, make_etag(request, hotel.version))
     return GetHotelsResponseDTO.model_validate(hotel, from_attributes=True)
 
 
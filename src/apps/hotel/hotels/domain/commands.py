@@ -1,14 +1,22 @@
 from uuid import UUID
 
-from src.common.domain.commands import Command
+from src.common.domain.commands import Command, PageCommand
 
 
-class ListHotelsCommand(Command):
+class ListHotelsCommand(PageCommand):
     location: str | None
     services: dict | None
     rooms_quantity: int | None
 
 
+class SearchHotelsCommand(PageCommand):
+    query: str
+
+
+class ExportHotelsCommand(Command):
+    owner: UUID
+
+
 class GetHotelCommand(Command):
     hotel_id: UUID
 
@@ -1,10 +1,12 @@
 import uuid
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import DDL, TIMESTAMP, Computed, ForeignKey, Index, Integer, String, UniqueConstraint, event
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column, relationship
 
+from src.common.domain.amenities import amenities_of
 from src.common.domain.models import Base
 
 if TYPE_CHECKING:
@@ -12,6 +14,13 @@ if TYPE_CHECKING:
     from src.apps.hotel.rooms.domain.models import Room
 
 
+# Weighted so that matches on the name rank above matches on the location.
+HOTEL_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', name), 'A') || setweight(to_tsvector('russian', name), 'A') || "
+    "setweight(to_tsvector('english', location), 'B') || setweight(to_tsvector('russian', location), 'B')"
+)
+
+
 class HotelBase(MappedAsDataclass, Base):
     """Base class for hotel ORM models."""
 
@@ -20,7 +29,18 @@ class HotelBase(MappedAsDataclass, Base):
 
 class Hotel(HotelBase):
     __tablename__ = "hotels"
-    __table_args__ = (UniqueConstraint("name", "location", name="unq_hotel_name_location"),)
+    __table_args__ = (
+        UniqueConstraint("name", "location", name="unq_hotel_name_location"),
+        Index("ix_hotels_services", "services", postgresql_using="gin", postgresql_ops={"services": "jsonb_path_ops"}),
+        Index("ix_hotels_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_hotels_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index(
+            "ix_hotels_location_trgm",
+            "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -29,6 +49,16 @@ class Hotel(HotelBase):
     rooms_quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     owner: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     image_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    # Full-text document of the hotel's name and location, stemmed for both Russian and English
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(HOTEL_SEARCH_VECTOR),
+        deferred=True,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     user: Mapped["User"] = relationship("User", back_populates="hotel", lazy="joined")
     rooms: Mapped[list["Room"]] = relationship(
@@ -41,6 +71,11 @@ class Hotel(HotelBase):
 
     is_active: Mapped[bool] = mapped_column(nullable=False, default=True)
 
+    # Bumped by every update, the version signal of the hotel's ETag
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Bitmap of the common services offered, see AmenityFlag; kept in sync with services by the gateways
+    amenities: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
     def __init__(
         self,
         name: str,
@@ -60,3 +95,10 @@ class Hotel(HotelBase):
         self.owner = owner
         self.is_active = is_active
         self.image_id = image_id
+        self.amenities = amenities_of(self.services)
+        self.version = 1
+        self.updated_at = datetime.now(UTC)
+
+
+# The trigram indexes of the table need the pg_trgm extension
+event.listen(Hotel.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+# Namespace of the cached hotel read models.
+HOTEL_CACHE_NAMESPACE = "hotel"
+
+
+class HotelDetail(BaseModel):
+    """Read model of a hotel's details, cached between requests."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: UUID
+    name: str
+    location: str
+    services: dict | None = None
+    rooms_quantity: int
+    owner: UUID
+    is_active: bool
+    image_id: int | None = None
+    # Version of the hotel this read model was built from, the signal of its ETag
+    version: int
@@ -1,22 +1,37 @@
 import uuid
+from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import ColumnElement, select, update
 from sqlalchemy.exc import IntegrityError
 
+from src.apps.hotel.bookings.domain.models import RoomInventory
 from src.apps.hotel.rooms.application.interfaces.gateway import RoomGatewayProto
 from src.apps.hotel.rooms.domain.models import Room
 from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.common.domain.amenities import amenities_of
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, ListVersion, Page
 
 
 class RoomAdapter(SQLAlchemyGateway, RoomGatewayProto):
-    async def list_rooms(self, hotel_id: uuid.UUID, **filters: Any) -> list[Room]:
+    async def list_rooms(
+        self,
+        hotel_id: uuid.UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[Room]:
         """
-        Retrieve a list of rooms.
+        Retrieve a page of rooms ordered by price.
 
         Args:
             hotel_id (uuid.UUID): The ID of the hotel to filter rooms by.
+            profile (LoadingProfileEnum): The relationship loading profile.
+            limit (int): The maximum number of rooms on the page.
+            cursor (str | None): The cursor returned with the previous page.
             **filters: Additional filters to apply.
 
         Supported filters:
@@ -25,35 +40,50 @@ class RoomAdapter(SQLAlchemyGateway, RoomGatewayProto):
             - price_to: Decimal
 
         Returns:
-            list[Room]: A list of rooms matching the criteria.
+            Page[Room]: A page of rooms matching the criteria.
+        """
+        stmt = select(Room).options(*self.loader_options(profile)).filter(*self._room_criteria(hotel_id, **filters))
+        return await self.paginate(stmt, Room.price, limit, cursor)
+
+    async def get_rooms_version(self, hotel_id: uuid.UUID, **filters: Any) -> ListVersion:
+        """
+        Retrieve the version signal of the rooms matching the filters of list_rooms.
+
+        Args:
+            hotel_id (uuid.UUID): The ID of the hotel to filter rooms by.
+            **filters: The filters supported by list_rooms.
+
+        Returns:
+            ListVersion: The number of matching rooms and their latest modification time.
         """
+        return await self.get_list_version(Room, *self._room_criteria(hotel_id, **filters))
+
+    def _room_criteria(self, hotel_id: uuid.UUID, **filters: Any) -> list[ColumnElement[bool]]:
         services = filters.get("services", None)
         price_from = filters.get("price_from", 0)
         price_to = filters.get("price_to", None)
         criteria = [Room.hotel_id == hotel_id]
 
         if services is not None:
-            criteria.append(Room.services.op("@>")(services))
+            criteria.extend(self.services_criteria(Room, services))
         if price_from:
             criteria.append(Room.price >= price_from)
         if price_to is not None:
             criteria.append(Room.price <= price_to)
+        return criteria
 
-        stmt = select(Room).filter(*criteria)
-        row_result = await self.session.scalars(stmt)
-        return list(row_result.all())
-
-    async def get_room(self, room_id: uuid.UUID) -> Room | None:
+    async def get_room(self, room_id: uuid.UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE) -> Room | None:
         """
         Retrieve a room by its ID.
 
         Args:
             room_id (uuid.UUID): The ID of the room to retrieve.
+            profile (LoadingProfileEnum): The relationship loading profile.
 
         Returns:
             Room | None: The room if found, otherwise None.
         """
-        room = await self.get_one_item(Room, id=room_id)
+        room = await self.get_one_item(Room, profile, id=room_id)
         return room
 
     async def add_room(
@@ -98,15 +128,34 @@ class RoomAdapter(SQLAlchemyGateway, RoomGatewayProto):
 
         self.session.add(room)
         try:
-            await self.session.commit()
+            await self._save()
             return room.id
         except IntegrityError:
             return None
 
+    async def add_rooms(self, rooms: list[Room]) -> list[uuid.UUID]:
+        """
+        Add many rooms with multi-row inserts.
+
+        Rooms conflicting with an existing room of the same hotel and name are skipped.
+
+        Args:
+            rooms (list[Room]): The rooms to add.
+
+        Returns:
+            list[uuid.UUID]: The IDs of the rooms actually added.
+        """
+        return await self.add_many(rooms, ignore_conflicts=True)
+
     async def update_room(self, room: Room, **params: Any) -> uuid.UUID | None:
         """
         Update an existing room.
 
+        A change of quantity is applied to the room's inventory ledger as well, so the
+        remaining count of every materialized day shifts by the same delta. The delta is
+        taken from the stored quantity, read under a row lock, so concurrent quantity edits
+        apply one after the other instead of both shifting from the same old value.
+
         Args:
             room (Room): The room instance to update.
             **params: The parameters to update.
@@ -115,9 +164,27 @@ class RoomAdapter(SQLAlchemyGateway, RoomGatewayProto):
             uuid.UUID | None: The ID of the updated room, or None if update failed.
         """
         room_id = room.id
-        stmt = update(Room).where(Room.id == room_id).values(**params)
+        if "services" in params:
+            params["amenities"] = amenities_of(params["services"])
+        stmt = (
+            update(Room)
+            .where(Room.id == room_id)
+            .values(**params, version=Room.version + 1, updated_at=datetime.now(UTC))
+        )
         try:
+            quantity = params.get("quantity")
+            if quantity is not None:
+                stored_quantity = await self.session.scalar(
+                    select(Room.quantity).where(Room.id == room_id).with_for_update()
+                )
+                if stored_quantity is not None and quantity != stored_quantity:
+                    await self.session.execute(
+                        update(RoomInventory)
+                        .where(RoomInventory.room_id == room_id)
+                        .values(remaining=RoomInventory.remaining + (quantity - stored_quantity))
+                    )
             await self.session.execute(stmt)
+            await self._save()
             return room_id
         except IntegrityError:
             return None
@@ -134,22 +201,45 @@ class RoomAdapter(SQLAlchemyGateway, RoomGatewayProto):
         """
         await self.delete_item(room)
 
+    async def delete_rooms(self, room_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """
+        Delete many rooms by their IDs with a single statement.
+
+        Their bookings and inventory rows are removed by the database cascades.
+
+        Args:
+            room_ids (list[uuid.UUID]): The IDs of the rooms to delete.
+
+        Returns:
+            list[uuid.UUID]: The IDs of the deleted rooms.
+        """
+        return await self.delete_many(Room, room_ids)
+
 
 class FakeRoomAdapter(FakeGateway[Room], RoomGatewayProto):
-    async def list_rooms(self, hotel_id: uuid.UUID, **filters: Any) -> list[Room]:
-        """Retrieve a list of rooms."""
+    async def list_rooms(
+        self,
+        hotel_id: uuid.UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[Room]:
+        """Retrieve a page of rooms ordered by price."""
+        return self.paginate(self._find_rooms(hotel_id, **filters), Room.price, limit, cursor)
+
+    async def get_rooms_version(self, hotel_id: uuid.UUID, **filters: Any) -> ListVersion:
+        """Retrieve the version signal of the rooms matching the filters of list_rooms."""
+        return self.list_version(self._find_rooms(hotel_id, **filters))
+
+    def _find_rooms(self, hotel_id: uuid.UUID, services: dict | None = None, **filters: Any) -> list[Room]:
         return [
-            room
-            for room in self._collection
-            if room.hotel_id == hotel_id and all(getattr(room, k) == v for k, v in filters.items())
+            room for room in self._collection.find(hotel_id=hotel_id, **filters) if self.services_match(room, services)
         ]
 
-    async def get_room(self, room_id: uuid.UUID) -> Room | None:
+    async def get_room(self, room_id: uuid.UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE) -> Room | None:
         """Retrieve a room by its ID."""
-        return next(
-            (room for room in self._collection if room.id == room_id),
-            None,
-        )
+        return self._collection.get(room_id)
 
     async def add_room(
         self,
@@ -176,16 +266,22 @@ class FakeRoomAdapter(FakeGateway[Room], RoomGatewayProto):
         self._collection.add(room)
         return room.id
 
-    async def update_room(self, room: Room, **params: dict[str, Any]) -> uuid.UUID | None:
-        """Update an existing room."""
-        for key, value in params.items():
-            setattr(room, key, value)
-
-        self._collection.discard(room)
-        self._collection.add(room)
+    async def add_rooms(self, rooms: list[Room]) -> list[uuid.UUID]:
+        """Add many rooms, skipping those conflicting with existing rooms."""
+        new_rooms = [room for room in rooms if self._collection.first(hotel_id=room.hotel_id, name=room.name) is None]
+        return await self.add_many(new_rooms)
 
+    async def update_room(self, room: Room, **params: Any) -> uuid.UUID | None:
+        """Update an existing room."""
+        if "services" in params:
+            params["amenities"] = amenities_of(params["services"])
+        self._collection.update(room, **params, version=room.version + 1, updated_at=datetime.now(UTC))
         return room.id or None
 
     async def delete_room(self, room: Room) -> None:
         """Delete a room by its ID."""
         self._collection.discard(room)
+
+    async def delete_rooms(self, room_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """Delete many rooms by their IDs."""
+        return await self.delete_many(Room, room_ids)
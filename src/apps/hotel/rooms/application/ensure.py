@@ -4,6 +4,7 @@ from src.apps.hotel.rooms.application import exceptions
 from src.apps.hotel.rooms.application.interfaces.gateway import RoomGatewayProto
 from src.apps.hotel.rooms.domain.models import Room
 from src.common.application.ensure import ServiceEnsuranceBase
+from src.common.domain.enums import LoadingProfileEnum
 from src.common.interfaces import CustomLoggerProto
 
 
@@ -14,9 +15,9 @@ class RoomServiceEnsurance(ServiceEnsuranceBase):
         self._room = gateway
         self._logger = logger
 
-    async def room_exists(self, room_id: UUID) -> Room:
+    async def room_exists(self, room_id: UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE) -> Room:
         """Ensure that a room exists by its ID."""
-        room = await self._room.get_room(room_id)
+        room = await self._room.get_room(room_id, profile)
 
         if room is None:
             self._logger.error("Room not found", room_id=room_id)
@@ -4,17 +4,31 @@ from decimal import Decimal
 from typing import Any
 
 from src.apps.hotel.rooms.domain.models import Room
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, ListVersion, Page
 from src.common.interfaces import GatewayProto
 
 
 class RoomGatewayProto(GatewayProto):
     @abstractmethod
-    async def list_rooms(self, hotel_id: uuid.UUID, **filters: Any) -> list[Room]:
-        """Retrieve a list of rooms."""
+    async def list_rooms(
+        self,
+        hotel_id: uuid.UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> Page[Room]:
+        """Retrieve a page of rooms ordered by price."""
+        ...
+
+    @abstractmethod
+    async def get_rooms_version(self, hotel_id: uuid.UUID, **filters: Any) -> ListVersion:
+        """Retrieve the version signal of the rooms matching the filters of list_rooms."""
         ...
 
     @abstractmethod
-    async def get_room(self, room_id: uuid.UUID) -> Room | None:
+    async def get_room(self, room_id: uuid.UUID, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE) -> Room | None:
         """Retrieve a room by its ID."""
         ...
 
@@ -33,6 +47,11 @@ class RoomGatewayProto(GatewayProto):
         """Add a new room."""
         ...
 
+    @abstractmethod
+    async def add_rooms(self, rooms: list[Room]) -> list[uuid.UUID]:
+        """Add many rooms at once, skipping those conflicting with existing rooms."""
+        ...
+
     @abstractmethod
     async def update_room(self, room: Room, **params: dict[str, Any]) -> uuid.UUID | None:
         """Update an existing room."""
@@ -42,3 +61,8 @@ class RoomGatewayProto(GatewayProto):
     async def delete_room(self, room: Room) -> uuid.UUID | None:
         """Delete a room by its ID."""
         ...
+
+    @abstractmethod
+    async def delete_rooms(self, room_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """Delete many rooms by their IDs, returning the IDs of the deleted ones."""
+        ...
@@ -6,8 +6,11 @@ from src.apps.hotel.rooms.application.ensure import RoomServiceEnsurance
 from src.apps.hotel.rooms.application.interfaces.gateway import RoomGatewayProto
 from src.apps.hotel.rooms.domain import commands
 from src.apps.hotel.rooms.domain.models import Room
+from src.apps.hotel.rooms.domain.results import ROOM_CACHE_NAMESPACE, RoomDetail
 from src.common.application.service import ServiceBase
-from src.common.interfaces import CustomLoggerProto
+from src.common.domain.enums import LoadingProfileEnum
+from src.common.domain.results import ListVersion, Page
+from src.common.interfaces import CustomLoggerProto, ReadThroughCacheProto
 
 
 class RoomService(ServiceBase):
@@ -15,28 +18,36 @@ class RoomService(ServiceBase):
         self,
         hotel_ensure: HotelServiceEnsurance,
         room_gateway: RoomGatewayProto,
+        cache: ReadThroughCacheProto,
         logger: CustomLoggerProto,
     ) -> None:
         self._room_adapter = room_gateway
+        self._cache = cache
         self._logger = logger
         self._hotel_ensure = hotel_ensure
         self._room_ensure = RoomServiceEnsurance(room_gateway, logger)
         super().__init__()
 
-    async def list_rooms(self, cmd: commands.ListRoomsCommand) -> list[Room]:
-        """List rooms for a specific hotel with optional filters."""
+    async def list_rooms(self, cmd: commands.ListRoomsCommand) -> Page[Room]:
+        """List one page of rooms for a specific hotel with optional filters."""
         params = cmd.model_dump(exclude={"hotel_id"}, exclude_unset=True, exclude_none=True)
         rooms = await self._room_adapter.list_rooms(cmd.hotel_id, **params)
 
         return rooms
 
-    async def get_room(self, cmd: commands.GetRoomCommand) -> Room:
-        """Get details of a specific room by its ID."""
-        room = await self._room_adapter.get_room(cmd.room_id)
-        if room is None:
-            self._logger.error("Room not found", room_id=cmd.room_id)
-            raise exceptions.RoomNotFoundError
-        return room
+    async def get_rooms_version(self, cmd: commands.ListRoomsCommand) -> ListVersion:
+        """Get the version signal of the rooms of a hotel matching the filters, without loading them."""
+        params = cmd.model_dump(exclude={"hotel_id", "limit", "cursor"}, exclude_unset=True, exclude_none=True)
+        return await self._room_adapter.get_rooms_version(cmd.hotel_id, **params)
+
+    async def get_room(self, cmd: commands.GetRoomCommand) -> RoomDetail:
+        """Get details of a specific room by its ID, served from the cache when possible."""
+
+        async def _load() -> RoomDetail:
+            room = await self._room_ensure.room_exists(cmd.room_id, LoadingProfileEnum.DETAIL)
+            return RoomDetail.model_validate(room)
+
+        return await self._cache.get_or_load(ROOM_CACHE_NAMESPACE, cmd.room_id, RoomDetail, _load)
 
     async def add_room(self, cmd: commands.AddRoomCommand) -> UUID:
         """Add a new room to a hotel."""
@@ -60,6 +71,35 @@ class RoomService(ServiceBase):
         self._logger.info("New room successfully added", hotel_id=cmd.hotel_id, room_id=room_id)
         return room_id
 
+    async def add_rooms(self, cmd: commands.AddRoomsCommand) -> list[UUID]:
+        """Add many rooms to a hotel at once, all or none of them."""
+        hotel = await self._hotel_ensure.users_hotel_exists(cmd.user_id, cmd.hotel_id)
+
+        rooms = []
+        for new_room in cmd.rooms:
+            room = Room(
+                hotel_id=hotel.id,
+                owner=cmd.user_id,
+                name=new_room.name,
+                price=new_room.price,
+                description=new_room.description,
+                services=new_room.services,
+                image_id=new_room.image_id,
+            )
+            if new_room.quantity is not None:
+                room.quantity = new_room.quantity
+            rooms.append(room)
+
+        async with self._room_adapter():
+            room_ids = await self._room_adapter.add_rooms(rooms)
+
+            if len(room_ids) < len(rooms):
+                self._logger.error("Some rooms already exist", hotel_id=cmd.hotel_id)
+                raise exceptions.RoomAlreadyExistsError
+
+        self._logger.info("New rooms successfully added", hotel_id=cmd.hotel_id, rooms=len(room_ids))
+        return room_ids
+
     async def update_room(self, cmd: commands.UpdateRoomCommand) -> UUID:
         """Update an existing room's details."""
         room = await self._room_ensure.room_exists(cmd.room_id)
@@ -76,6 +116,7 @@ class RoomService(ServiceBase):
             self._logger.error("Room cannot be updated", user_id=room.owner, room_id=cmd.room_id)
             raise exceptions.RoomCannotBeUpdatedError
 
+        await self._cache.invalidate(ROOM_CACHE_NAMESPACE, cmd.room_id)
         self._logger.info("Room successfully updated", user_id=room.owner, room_id=cmd.room_id)
         return updated_room_id
 
@@ -84,4 +125,13 @@ class RoomService(ServiceBase):
         room = await self._room_ensure.room_exists(cmd.room_id)
 
         await self._room_adapter.delete_room(room)
+        await self._cache.invalidate(ROOM_CACHE_NAMESPACE, cmd.room_id)
         self._logger.info("Room successfully deleted", room_id=cmd.room_id)
+
+    async def delete_rooms(self, cmd: commands.DeleteRoomsCommand) -> list[UUID]:
+        """Delete many rooms at once, skipping those that no longer exist."""
+        room_ids = await self._room_adapter.delete_rooms(cmd.room_ids)
+
+        await self._cache.invalidate(ROOM_CACHE_NAMESPACE, *room_ids)
+        self._logger.info("Rooms successfully deleted", user_id=cmd.user_id, rooms=len(room_ids))
+        return room_ids
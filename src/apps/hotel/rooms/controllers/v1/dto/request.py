@@ -3,10 +3,10 @@ from uuid import UUID
 
 from pydantic import Field, model_validator
 
-from src.common.controllers.dto.base import BaseRequestDTO
+from src.common.controllers.dto.base import BaseRequestDTO, PageRequestDTO
 
 
-class ListRoomsRequestDTO(BaseRequestDTO):
+class ListRoomsRequestDTO(PageRequestDTO):
     price_from: Decimal | None = Field(default=None, gt=0, decimal_places=2)
     price_to: Decimal | None = Field(default=None, gt=0, decimal_places=2)
     services: dict | None = None
@@ -29,6 +29,23 @@ class UpdateRoomRequestDTO(BaseRequestDTO):
     image_id: int | None = None
 
 
+class NewRoomRequestDTO(BaseRequestDTO):
+    name: str
+    price: Decimal = Field(gt=0, decimal_places=2)
+    quantity: int | None = Field(default=None, ge=1)
+    description: str | None = None
+    services: dict | None = None
+    image_id: int | None = None
+
+
+class AddRoomsRequestDTO(BaseRequestDTO):
+    rooms: list[NewRoomRequestDTO] = Field(min_length=1, max_length=1000)
+
+
+class DeleteRoomsRequestDTO(BaseRequestDTO):
+    room_ids: list[UUID] = Field(min_length=1, max_length=1000)
+
+
 class AddRoomRequestDTO(BaseRequestDTO):
     name: str
     hotel_id: int | UUID
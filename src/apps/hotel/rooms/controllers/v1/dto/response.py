@@ -23,5 +23,14 @@ class AddRoomResponseDTO(BaseResponseDTO):
     hotel_id: UUID
 
 
+class AddRoomsResponseDTO(BaseDTO):
+    hotel_id: UUID
+    ids: list[UUID]
+
+
 class DeleteRoomResponseDTO(BaseDTO):
     status_code: int = status.HTTP_204_NO_CONTENT
+
+
+class DeleteRoomsResponseDTO(BaseDTO):
+    ids: list[UUID]
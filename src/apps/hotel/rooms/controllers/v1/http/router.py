@@ -2,14 +2,14 @@ from typing import Annotated
 from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
 from src.apps.authentication.user.application.exceptions import (
     Unauthorized,
     UserNotFoundError,
 )
 from src.apps.authorization.access.application.service import AccessService
-from src.apps.authorization.access.domain.commands import Authorize
+from src.apps.authorization.access.domain.commands import Authorize, AuthorizeMany
 from src.apps.authorization.access.domain.enums import (
     ResourceTypeEnum,
     RoomPermissionEnum,
@@ -24,22 +24,31 @@ from src.apps.hotel.rooms.application.exceptions import (
 from src.apps.hotel.rooms.application.service import RoomService
 from src.apps.hotel.rooms.controllers.v1.dto.request import (
     AddRoomRequestDTO,
+    AddRoomsRequestDTO,
+    DeleteRoomsRequestDTO,
     ListRoomsRequestDTO,
     UpdateRoomRequestDTO,
 )
 from src.apps.hotel.rooms.controllers.v1.dto.response import (
     AddRoomResponseDTO,
+    AddRoomsResponseDTO,
     DeleteRoomResponseDTO,
+    DeleteRoomsResponseDTO,
     GetRoomResponseDTO,
     UpdateRoomResponseDTO,
 )
 from src.apps.hotel.rooms.domain import commands as room_commands
+from src.common.controllers.dto.base import PageResponseDTO
+from src.common.controllers.http.coalescing import CoalescingAPIRoute, coalesce_requests
+from src.common.controllers.http.etag import check_etag, make_etag
+from src.common.exceptions.common import InvalidCursorError
 from src.common.exceptions.handlers import generate_responses
 from src.common.utils.auth_scheme import auth_header
 
 router = APIRouter(
     prefix="/hotels",
     tags=["rooms"],
+    route_class=CoalescingAPIRoute,
 )
 
 
@@ -49,24 +58,35 @@ router = APIRouter(
         Unauthorized,
         Forbidden,
         UserNotFoundError,
+        InvalidCursorError,
     ),
 )
+@coalesce_requests
 @inject
 async def list_rooms(
     hotel_id: UUID,
+    request: Request,
+    response: Response,
     filter_query: Annotated[ListRoomsRequestDTO, Query()],
     room_service: FromDishka[RoomService],
-) -> list[GetRoomResponseDTO]:
-    """List rooms for a specific hotel with optional filters."""
+) -> PageResponseDTO[GetRoomResponseDTO]:
+    """List one page of rooms for a specific hotel with optional filters."""
     cmd = room_commands.ListRoomsCommand(
         hotel_id=hotel_id,
         price_from=filter_query.price_from,
         price_to=filter_query.price_to,
         services=filter_query.services,
+        limit=filter_query.limit,
+        cursor=filter_query.cursor,
     )
+    version = await room_service.get_rooms_version(cmd)
+    check_etag(request, response, make_etag(request, version.count, version.last_modified))
 
     rooms = await room_service.list_rooms(cmd)
-    return [GetRoomResponseDTO.model_validate(room) for room in rooms]
+    return PageResponseDTO[GetRoomResponseDTO](
+        items=[GetRoomResponseDTO.model_validate(room) for room in rooms.items],
+        next_cursor=rooms.next_cursor,
+    )
 
 
 @router.get(
@@ -75,13 +95,18 @@ async def list_rooms(
         RoomNotFoundError,
     ),
 )
+@coalesce_requests
 @inject
 async def get_room(
     room_id: UUID,
+    request: Request,
+    response: Response,
     room_service: FromDishka[RoomService],
 ) -> GetRoomResponseDTO:
     """Get details of a specific room by its ID."""
     room = await room_service.get_room(room_commands.GetRoomCommand(room_id=room_id))
+    # Tagged with the version of the details served, which may come from the cache
+    check_etag(request, response, make_etag(request, room.version))
 
     return GetRoomResponseDTO.model_validate(room)
 
@@ -130,6 +155,45 @@ async def add_room(
     return AddRoomResponseDTO(id=updated_id, hotel_id=hotel_id)
 
 
+@router.post(
+    "/{hotel_id}/rooms/batch",
+    responses=generate_responses(
+        Unauthorized,
+        Forbidden,
+        UserNotFoundError,
+        HotelNotFoundError,
+        RoomAlreadyExistsError,
+    ),
+)
+@inject
+async def add_rooms(
+    hotel_id: UUID,
+    dto: AddRoomsRequestDTO,
+    access_service: FromDishka[AccessService],
+    room_service: FromDishka[RoomService],
+    token: str = auth_header,
+) -> AddRoomsResponseDTO:
+    """Add many rooms to a specific hotel at once."""
+    # Authorize user, only hotel owners can add rooms
+    authorization_info = await access_service.authorize(
+        Authorize(
+            access_token=token,
+            permission=RoomPermissionEnum.CAN_EDIT,
+            resource_type=ResourceTypeEnum.HOTEL,
+            resource_id=hotel_id,
+        )
+    )
+
+    cmd = room_commands.AddRoomsCommand(
+        hotel_id=hotel_id,
+        user_id=authorization_info.user_id,
+        rooms=[room_commands.NewRoom(**room.model_dump()) for room in dto.rooms],
+    )
+
+    room_ids = await room_service.add_rooms(cmd=cmd)
+    return AddRoomsResponseDTO(hotel_id=hotel_id, ids=room_ids)
+
+
 @router.patch(
     "/rooms/{room_id}",
     responses=generate_responses(
@@ -174,6 +238,38 @@ async def update_room(
     return UpdateRoomResponseDTO(id=updated_id)
 
 
+@router.post(
+    "/rooms/batch-delete",
+    responses=generate_responses(
+        Unauthorized,
+        Forbidden,
+        UserNotFoundError,
+    ),
+)
+@inject
+async def delete_rooms(
+    dto: DeleteRoomsRequestDTO,
+    access_service: FromDishka[AccessService],
+    room_service: FromDishka[RoomService],
+    token: str = auth_header,
+) -> DeleteRoomsResponseDTO:
+    """Delete many rooms at once, all of which the user must be allowed to delete."""
+    # Authorize user for every room with a single ownership check
+    authorization_info = await access_service.authorize_many(
+        AuthorizeMany(
+            access_token=token,
+            permission=RoomPermissionEnum.CAN_DELETE,
+            resource_type=ResourceTypeEnum.ROOM,
+            resource_ids=dto.room_ids,
+        )
+    )
+
+    cmd = room_commands.DeleteRoomsCommand(room_ids=dto.room_ids, user_id=authorization_info.user_id)
+
+    room_ids = await room_service.delete_rooms(cmd)
+    return DeleteRoomsResponseDTO(ids=room_ids)
+
+
 @router.delete(
     "/rooms/{room_id}",
     responses=generate_responses(
@@ -1,10 +1,10 @@
 from decimal import Decimal
 from uuid import UUID
 
-from src.common.domain.commands import Command
+from src.common.domain.commands import Command, PageCommand
 
 
-class ListRoomsCommand(Command):
+class ListRoomsCommand(PageCommand):
     hotel_id: UUID
     price_from: Decimal | None
     price_to: Decimal | None
@@ -26,6 +26,21 @@ class AddRoomCommand(Command):
     image_id: int | None
 
 
+class NewRoom(Command):
+    name: str
+    price: Decimal
+    quantity: int | None
+    description: str | None
+    services: dict | None
+    image_id: int | None
+
+
+class AddRoomsCommand(Command):
+    hotel_id: UUID
+    user_id: UUID
+    rooms: list[NewRoom]
+
+
 class UpdateRoomCommand(Command):
     room_id: UUID
     user_id: UUID
@@ -40,3 +55,8 @@ class UpdateRoomCommand(Command):
 class DeleteRoomCommand(Command):
     room_id: UUID
     user_id: UUID
+
+
+class DeleteRoomsCommand(Command):
+    room_ids: list[UUID]
+    user_id: UUID
@@ -1,12 +1,14 @@
 import uuid
+from datetime import UTC, datetime
 from decimal import Decimal
 
-from sqlalchemy import DECIMAL, UUID, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import DECIMAL, TIMESTAMP, UUID, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column, relationship
 
 from src.apps.hotel.bookings.domain.models import Booking
 from src.apps.hotel.hotels.domain.models import Hotel
+from src.common.domain.amenities import amenities_of
 from src.common.domain.models import Base
 
 
@@ -18,7 +20,10 @@ class RoomBase(MappedAsDataclass, Base):
 
 class Room(RoomBase):
     __tablename__ = "rooms"
-    __table_args__ = (UniqueConstraint("hotel_id", "name", name="unq_room_hotel_name"),)
+    __table_args__ = (
+        UniqueConstraint("hotel_id", "name", name="unq_room_hotel_name"),
+        Index("ix_rooms_services", "services", postgresql_using="gin", postgresql_ops={"services": "jsonb_path_ops"}),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
     hotel_id: Mapped[uuid.UUID] = mapped_column(
@@ -31,6 +36,7 @@ class Room(RoomBase):
     price: Mapped[Decimal] = mapped_column(DECIMAL(10, 4), nullable=False)
     services: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     image_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
 
     hotel: Mapped["Hotel"] = relationship(
         "Hotel",
@@ -47,6 +53,11 @@ class Room(RoomBase):
 
     quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
+    # Bumped by every update, the version signal of the room's ETag
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Bitmap of the common services offered, see AmenityFlag; kept in sync with services by the gateways
+    amenities: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
     def __init__(
         self,
         hotel_id: uuid.UUID,
@@ -68,3 +79,6 @@ class Room(RoomBase):
         self.services = services
         self.image_id = image_id
         self.quantity = quantity
+        self.amenities = amenities_of(self.services)
+        self.version = 1
+        self.updated_at = datetime.now(UTC)
@@ -0,0 +1,25 @@
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+# Namespace of the cached room read models.
+ROOM_CACHE_NAMESPACE = "room"
+
+
+class RoomDetail(BaseModel):
+    """Read model of a room's details, cached between requests."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: UUID
+    hotel_id: UUID
+    owner: UUID
+    name: str
+    description: str | None = None
+    price: Decimal
+    services: dict | None = None
+    quantity: int
+    image_id: int | None = None
+    # Version of the room this read model was built from, the signal of its ETag
+    version: int
@@ -1,117 +1,613 @@
 import typing
-from typing import Any
+from collections.abc import AsyncIterator, Iterable, Sequence
+from itertools import batched
+from types import TracebackType
+from typing import Any, ClassVar, Self
 from uuid import UUID
 
 from fastapi import status
-from sqlalchemy import select
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Float,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    inspect,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Mapper, raiseload
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.common.adapters.pagination import decode_cursor, encode_cursor
+from src.common.domain.amenities import amenities_of
+from src.common.domain.enums import LoadingProfileEnum
 from src.common.domain.models import ORM_CLS, ORM_OBJ
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, ListVersion, Page
 from src.common.exceptions.common import BaseError
-from src.common.interfaces import SQLAlchemyGatewayProto
+from src.common.interfaces import SQLAlchemyGatewayProto, UowProto
 from src.infrastructure.context import RequestContext
-from src.infrastructure.database.factory import SqlAlchemyUnitOfWork
+from src.infrastructure.database.factory import SqlAlchemyUnitOfWork, defers_flush, in_unit_of_work
 from src.infrastructure.database.memory.database import MemoryDatabase
+from src.infrastructure.database.session import streaming
+
+# PostgreSQL accepts at most 32767 bind parameters in a single statement.
+MAX_STATEMENT_PARAMETERS = 32_767
+# Number of rows fetched from a server-side cursor at a time when streaming results.
+DEFAULT_YIELD_PER = 1_000
 
 
 class SQLAlchemyGateway(SQLAlchemyGatewayProto):
     """SQLAlchemy adapters implementing the gateway protocol."""
 
+    # Loader options applied per loading profile. List and detail reads never load relationships
+    # implicitly, so a read path touching one fails loudly instead of issuing hidden queries.
+    # Write paths keep the model defaults, which ORM cascades rely on.
+    loading_profiles: ClassVar[dict[LoadingProfileEnum, Sequence[ORMOption]]] = {
+        LoadingProfileEnum.LIST: (raiseload("*"),),
+        LoadingProfileEnum.DETAIL: (raiseload("*"),),
+        LoadingProfileEnum.WRITE: (),
+    }
+
     def __init__(self, session: AsyncSession, request_context: RequestContext) -> None:
         self.session = session
         self._request_context = request_context
 
-    def __call__(self, *args: Any, **kwargs: Any) -> SqlAlchemyUnitOfWork:
-        """Returns a SqlAlchemyUnitOfWork object."""
-        return SqlAlchemyUnitOfWork(self.session, self._request_context)
+    def __call__(self, *args: Any, batch_writes: bool = False, **kwargs: Any) -> SqlAlchemyUnitOfWork:
+        """
+        Returns a SqlAlchemyUnitOfWork object.
+
+        With `batch_writes` the writes of the unit of work are only sent to the database by its
+        final commit, so database errors of the writes surface at the end of the block.
+        """
+        return SqlAlchemyUnitOfWork(self.session, self._request_context, batch_writes=batch_writes)
+
+    async def _save(self) -> None:
+        """
+        Persist the pending changes of the session.
+
+        Inside a unit of work the changes are only flushed, or left pending when it batches its
+        writes, and the unit of work commits them all at once when it ends. Outside of one the
+        changes are committed right away.
+        """
+        if not in_unit_of_work(self.session):
+            await self.session.commit()
+        elif not defers_flush(self.session):
+            await self.session.flush()
 
     async def add(self, item: ORM_OBJ) -> Any | None:
         """Add an item to the database."""
         self.session.add(item)
         try:
-            await self.session.commit()
+            await self._save()
             return item.id
         except IntegrityError:
             raise BaseError(status_code=status.HTTP_409_CONFLICT, message="Item already exists") from None
 
-    async def get_item_by_id(self, orm_cls: ORM_CLS, item_id: int | UUID) -> ORM_OBJ | None:
+    def loader_options(self, profile: LoadingProfileEnum) -> Sequence[ORMOption]:
+        """Return the loader options of the given loading profile."""
+        return self.loading_profiles[profile]
+
+    async def get_item_by_id(
+        self,
+        orm_cls: ORM_CLS,
+        item_id: int | UUID,
+        profile: LoadingProfileEnum = LoadingProfileEnum.WRITE,
+    ) -> ORM_OBJ | None:
         """Retrieve an item by its ID."""
-        item = await self.session.get(orm_cls, item_id)
+        item = await self.session.get(orm_cls, item_id, options=self.loader_options(profile))
         return item
 
-    async def get_one_item(self, orm_cls: Any, **filters: Any) -> Any | None:
+    async def get_one_item(
+        self,
+        orm_cls: Any,
+        profile: LoadingProfileEnum = LoadingProfileEnum.WRITE,
+        **filters: Any,
+    ) -> Any | None:
         """Retrieve a single item matching the given filters."""
-        query = select(orm_cls).filter_by(**filters)
+        query = select(orm_cls).options(*self.loader_options(profile)).filter_by(**filters)
         row = await self.session.execute(query)
         return row.scalar_one_or_none()
 
-    async def get_items_list(self, orm_cls: ORM_CLS, **filters: Any) -> list[ORM_OBJ]:
+    async def get_items_list(
+        self,
+        orm_cls: ORM_CLS,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        **filters: Any,
+    ) -> list[ORM_OBJ]:
         """Retrieve a list of items matching the given filters."""
-        query = select(orm_cls).filter_by(**filters)
+        query = select(orm_cls).options(*self.loader_options(profile)).filter_by(**filters)
         rows = await self.session.execute(query)
         return list(rows.scalars())
 
+    async def stream_items(
+        self,
+        orm_cls: ORM_CLS,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        yield_per: int = DEFAULT_YIELD_PER,
+        **filters: Any,
+    ) -> AsyncIterator[ORM_OBJ]:
+        """
+        Stream the items matching the given filters through a server-side cursor.
+
+        Unlike get_items_list, the items are fetched yield_per rows at a time, so walking the
+        whole table takes constant memory. Each batch is detached from the session once it
+        has been consumed.
+
+        Args:
+            orm_cls (ORM_CLS): The class of the items.
+            profile (LoadingProfileEnum): The relationship loading profile.
+            yield_per (int): The number of rows fetched from the cursor at a time.
+            **filters (Any): Equality filters on the item columns.
+
+        Yields:
+            ORM_OBJ: The matching items.
+        """
+        query = select(orm_cls).options(*self.loader_options(profile)).filter_by(**filters)
+        async for item in self.stream_scalars(query, yield_per):
+            yield item
+
+    async def stream_scalars(self, query: Select, yield_per: int = DEFAULT_YIELD_PER) -> AsyncIterator[Any]:
+        """
+        Stream the first column of a query through a server-side cursor.
+
+        ORM instances are expunged from the session after every batch, otherwise the identity
+        map would keep all of them alive until the end of the stream.
+
+        Args:
+            query (Select): The query to stream.
+            yield_per (int): The number of rows fetched from the cursor at a time.
+
+        Yields:
+            Any: The values of the first column, usually ORM instances.
+        """
+        with streaming(self.session):
+            result = await self.session.stream_scalars(query, execution_options={"yield_per": yield_per})
+            try:
+                async for partition in result.partitions():
+                    for item in partition:
+                        yield item
+                    for item in partition:
+                        if item in self.session:
+                            self.session.expunge(item)
+            finally:
+                await result.close()
+
+    async def stream_rows(self, query: Select, yield_per: int = DEFAULT_YIELD_PER) -> AsyncIterator[Row[Any]]:
+        """
+        Stream the rows of a query through a server-side cursor.
+
+        Meant for column projections, which are not tracked by the session.
+
+        Args:
+            query (Select): The query to stream.
+            yield_per (int): The number of rows fetched from the cursor at a time.
+
+        Yields:
+            Row[Any]: The rows of the query.
+        """
+        with streaming(self.session):
+            result = await self.session.stream(query, execution_options={"yield_per": yield_per})
+            try:
+                async for partition in result.partitions():
+                    for row in partition:
+                        yield row
+            finally:
+                await result.close()
+
+    async def paginate(
+        self,
+        query: Select,
+        sort_column: InstrumentedAttribute,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        descending: bool = False,
+    ) -> Page[ORM_OBJ]:
+        """
+        Retrieve one page of a query using keyset pagination.
+
+        Items are ordered by `(sort_column, id)` and the page starts right after the position
+        encoded in the cursor, so the database seeks to it through the index instead of
+        skipping the preceding rows and the cost of a page does not depend on its depth.
+
+        Args:
+            query (Select): The filtered query selecting the items.
+            sort_column (InstrumentedAttribute): The non-nullable column the items are sorted by.
+            limit (int): The maximum number of items on the page.
+            cursor (str | None): The cursor returned with the previous page.
+            descending (bool): Whether the items are sorted in descending order.
+
+        Returns:
+            Page[ORM_OBJ]: The items of the page and the cursor of the next one, if any.
+        """
+        id_column = sort_column.class_.id
+        position = tuple_(sort_column, id_column)
+        if cursor is not None:
+            after = decode_cursor(cursor, sort_column.type.python_type, id_column.type.python_type)
+            query = query.where(position < after if descending else position > after)
+
+        if descending:
+            query = query.order_by(sort_column.desc(), id_column.desc())
+        else:
+            query = query.order_by(sort_column, id_column)
+
+        rows = await self.session.execute(query.limit(limit + 1))
+        items = list(rows.unique().scalars())
+        return _make_page(items, sort_column, limit)
+
+    async def paginate_ranked(
+        self,
+        query: Select,
+        orm_cls: ORM_CLS,
+        rank: ColumnElement[float],
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[ORM_OBJ]:
+        """
+        Retrieve one page of a query ordered by a computed relevance, best first.
+
+        Like paginate, with keyset pagination on `(rank, id)`; the rank is recomputed for the
+        cursor's filter, so it must only depend on the row and the query parameters.
+
+        Args:
+            query (Select): The filtered query selecting the items.
+            orm_cls (ORM_CLS): The class of the items.
+            rank (ColumnElement[float]): The relevance of an item, higher first.
+            limit (int): The maximum number of items on the page.
+            cursor (str | None): The cursor returned with the previous page.
+
+        Returns:
+            Page[ORM_OBJ]: The items of the page and the cursor of the next one, if any.
+        """
+        rank = cast(rank, Float)
+        id_column = orm_cls.id
+        if cursor is not None:
+            after = decode_cursor(cursor, float, id_column.type.python_type)
+            query = query.where(tuple_(rank, id_column) < after)
+
+        query = query.add_columns(rank).order_by(rank.desc(), id_column.desc()).limit(limit + 1)
+        rows = await self.session.execute(query)
+        return _make_ranked_page([(item_rank, item) for item, item_rank in rows.unique()], limit)
+
+    @staticmethod
+    def services_criteria(orm_cls: ORM_CLS, services: dict[str, Any]) -> list[ColumnElement[bool]]:
+        """
+        Build the criteria of a services containment filter, `services @> filter`.
+
+        The containment is served by the GIN index of `services`. When the filter requires
+        common services, a test on the `amenities` bitmap of the items comes first: it holds
+        for every item passing the containment and is a cheap check on the others.
+
+        Args:
+            orm_cls (ORM_CLS): The class of the items, with `services` and `amenities` columns.
+            services (dict[str, Any]): The services filter.
+
+        Returns:
+            list[ColumnElement[bool]]: The criteria, none for an empty filter.
+        """
+        if not services:
+            return []
+
+        criteria = [orm_cls.services.op("@>")(services)]
+        mask = amenities_of(services)
+        if mask:
+            criteria.insert(0, orm_cls.amenities.op("&")(mask) == mask)
+        return criteria
+
+    async def get_list_version(self, orm_cls: ORM_CLS, *criteria: ColumnElement[bool]) -> ListVersion:
+        """
+        Compute the version signal of the items matching the criteria without loading them.
+
+        The count changes when an item is removed and the latest `updated_at` when one is
+        added or changed, so together they change whenever the list does.
+
+        Args:
+            orm_cls (ORM_CLS): The class of the items, with an `updated_at` column.
+            *criteria (ColumnElement[bool]): The filters of the list.
+
+        Returns:
+            ListVersion: The number of matching items and their latest modification time.
+        """
+        query = select(func.count(), func.max(orm_cls.updated_at)).select_from(orm_cls).where(*criteria)
+        count, last_modified = (await self.session.execute(query)).one()
+        return ListVersion(count=count, last_modified=last_modified)
+
     async def delete_item(self, orm_obj: ORM_OBJ) -> None:
         """Delete an item from the database."""
         await self.session.delete(orm_obj)
-        await self.session.commit()
+        await self._save()
 
+    async def add_many(self, items: Sequence[ORM_OBJ], ignore_conflicts: bool = False) -> list[Any]:
+        """
+        Insert many items with multi-row `INSERT ... RETURNING` statements.
 
-class FakeGateway[Model]:
-    def __init__(self, memory_db: MemoryDatabase) -> None:
-        # Automatically discover the collection by iterating memory_db attributes
-        self._collection = self._find_collection_by_type(memory_db)
+        The rows are written straight to the table: the items are not attached to the session
+        and their relationships are not cascaded. Rows are sent in chunks small enough to stay
+        under the bind parameter limit of a statement.
+
+        Args:
+            items (Sequence[ORM_OBJ]): The items to insert, all of the same class.
+            ignore_conflicts (bool): Whether rows violating a unique constraint are skipped
+                with `ON CONFLICT DO NOTHING` instead of failing the whole insert.
 
-    def _find_collection_by_type(self, memory_db: MemoryDatabase) -> set[Model]:
+        Returns:
+            list[Any]: The IDs of the inserted rows, as tuples for composite primary keys.
+
+        Raises:
+            BaseError: If a row already exists and conflicts are not ignored.
         """
-        Find the collection in memory_db that contains instances of Model type.
+        if not items:
+            return []
+
+        stmt = pg_insert(type(items[0]))
+        if ignore_conflicts:
+            stmt = stmt.on_conflict_do_nothing()
+
+        try:
+            return await self._insert_many(stmt, items)
+        except IntegrityError:
+            raise BaseError(status_code=status.HTTP_409_CONFLICT, message="Item already exists") from None
 
-        Uses Pydantic model fields to find collections with matching type annotations.
+    async def upsert_many(
+        self,
+        items: Sequence[ORM_OBJ],
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Sequence[str] | None = None,
+    ) -> list[Any]:
+        """
+        Insert many items or update the rows they conflict with, using `INSERT ... ON CONFLICT DO UPDATE`.
 
         Args:
-            memory_db: The memory database instance containing collections.
+            items (Sequence[ORM_OBJ]): The items to insert or update, all of the same class.
+            conflict_columns (Sequence[str]): The columns of the unique constraint identifying a row.
+            update_columns (Sequence[str] | None): The columns overwritten on conflict,
+                all the other columns by default.
 
         Returns:
-            set[Model]: The collection containing Model instances.
+            list[Any]: The IDs of the inserted or updated rows, as tuples for composite primary keys.
+        """
+        if not items:
+            return []
 
-        Raises:
-            ValueError: If no matching collection is found.
+        mapper: Mapper[Any] = inspect(type(items[0]))
+        if update_columns is None:
+            update_columns = [
+                attr.key
+                for attr in mapper.column_attrs
+                if attr.key not in conflict_columns and not attr.columns[0].primary_key
+            ]
+
+        stmt = pg_insert(mapper.class_)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[mapper.column_attrs[key].columns[0] for key in conflict_columns],
+            set_={key: stmt.excluded[mapper.column_attrs[key].columns[0].name] for key in update_columns},
+        )
+        return await self._insert_many(stmt, items)
+
+    async def delete_many(self, orm_cls: ORM_CLS, ids: Iterable[Any]) -> list[Any]:
         """
-        model_type = self._get_model_type()
+        Delete many rows by ID with a single `DELETE ... WHERE id = ANY(...)` statement.
 
-        # Use Pydantic model_fields from the class (not instance) to avoid deprecation warnings
-        for field_name, field_info in memory_db.__class__.model_fields.items():
-            # Check if field annotation is set[ModelType]
-            annotation = field_info.annotation
-            if annotation is None:
-                continue
+        The IDs are bound as one array parameter, so the statement does not grow with their number.
+
+        Args:
+            orm_cls (ORM_CLS): The class of the rows to delete.
+            ids (Iterable[Any]): The IDs of the rows to delete.
+
+        Returns:
+            list[Any]: The IDs of the deleted rows.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+
+        id_column = orm_cls.id
+        stmt = (
+            delete(orm_cls)
+            .where(id_column == any_(bindparam("ids", ids, type_=ARRAY(id_column.type))))
+            .returning(id_column)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.session.execute(stmt)
+        deleted_ids = list(result.scalars())
+        await self._save()
+        return deleted_ids
+
+    async def _insert_many(self, stmt: Insert, items: Sequence[ORM_OBJ]) -> list[Any]:
+        """Execute a bulk insert statement for the items chunk by chunk and return the written primary keys."""
+        mapper: Mapper[Any] = inspect(type(items[0]))
+        primary_key = mapper.primary_key
+        returning_stmt = stmt.returning(*primary_key)
+        chunk_size = max(1, MAX_STATEMENT_PARAMETERS // len(mapper.column_attrs))
+
+        ids: list[Any] = []
+        for chunk in batched(items, chunk_size, strict=False):
+            result = await self.session.execute(returning_stmt, [_to_row(mapper, item) for item in chunk])
+            ids.extend(result.scalars() if len(primary_key) == 1 else map(tuple, result))
+        await self._save()
+        return ids
+
+
+class FakeUnitOfWork(UowProto):
+    """In-memory unit of work: fake gateways apply their changes right away, so there is nothing to commit."""
+
+    async def commit(self) -> None:
+        """Commit the transaction."""
 
-            # Handle set[SomeType] annotations
-            if hasattr(annotation, "__origin__") and annotation.__origin__ is set:
-                args = typing.get_args(annotation)
-                if args and args[0] is model_type:
-                    # Found matching field by type annotation
-                    attr = getattr(memory_db, field_name)
-                    if isinstance(attr, set):
-                        return attr
-
-        # Fallback: Check non-empty collections by instance type
-        for attr_name in dir(memory_db):
-            if attr_name.startswith("_") or attr_name.startswith("model_"):
+    async def rollback(self) -> None:
+        """Roll back the transaction."""
+
+    async def __aenter__(self) -> Self:
+        """Enter the unit of work."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the unit of work."""
+
+
+class FakeGateway[Model]:
+    # Model type parameter of the concrete gateway, resolved once when the class is created
+    _model_type: ClassVar[type | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the model type from the FakeGateway[Model] base of the class."""
+        super().__init_subclass__(**kwargs)
+        # Subclasses of a concrete fake gateway inherit its model type
+        for base in cls.__dict__.get("__orig_bases__", ()):
+            if typing.get_origin(base) is FakeGateway and (args := typing.get_args(base)):
+                cls._model_type = args[0]
+
+    def __init__(self, memory_db: MemoryDatabase) -> None:
+        self._collection = memory_db.table(self._get_model_type())
+
+    def __call__(self, *args: Any, batch_writes: bool = False, **kwargs: Any) -> FakeUnitOfWork:
+        """Returns a FakeUnitOfWork object."""
+        return FakeUnitOfWork()
+
+    async def add(self, item: Model) -> Any | None:
+        """Add an item and return its primary key."""
+        self._collection.add(item)
+        return self._collection.key(item)
+
+    async def stream_items(
+        self,
+        orm_cls: Any,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        yield_per: int = DEFAULT_YIELD_PER,
+        **filters: Any,
+    ) -> AsyncIterator[Model]:
+        """Stream the stored items matching the given filters."""
+        # find() returns a snapshot, the table may change while the stream is consumed
+        for item in self._collection.find(**filters):
+            yield item
+
+    async def add_many(self, items: Sequence[Model], ignore_conflicts: bool = False) -> list[Any]:
+        """Insert many items, skipping or rejecting those whose primary key is already stored."""
+        if not ignore_conflicts and any(self._collection.get(self._collection.key(item)) is not None for item in items):
+            raise BaseError(status_code=status.HTTP_409_CONFLICT, message="Item already exists")
+
+        ids = []
+        for item in items:
+            key = self._collection.key(item)
+            if self._collection.get(key) is None:
+                self._collection.add(item)
+                ids.append(key)
+        return ids
+
+    async def upsert_many(
+        self,
+        items: Sequence[Model],
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Sequence[str] | None = None,
+    ) -> list[Any]:
+        """Insert many items or update the stored items having the same conflict column values."""
+
+        def _key(item: Any) -> tuple[Any, ...]:
+            return tuple(getattr(item, column) for column in conflict_columns)
+
+        stored = {_key(item): item for item in self._collection}
+        ids = []
+        for item in items:
+            existing = stored.get(_key(item))
+            if existing is None:
+                self._collection.add(item)
+                stored[_key(item)] = item
+                ids.append(self._collection.key(item))
                 continue
 
-            attr = getattr(memory_db, attr_name)
-            if isinstance(attr, set) and attr:
-                if any(isinstance(item, model_type) for item in attr):
-                    return attr
+            columns = update_columns
+            if columns is None:
+                mapper: Mapper[Any] = inspect(type(item), raiseerr=True)
+                columns = [
+                    attr.key
+                    for attr in mapper.column_attrs
+                    if attr.key not in conflict_columns and not attr.columns[0].primary_key
+                ]
+            self._collection.update(existing, **{column: getattr(item, column) for column in columns})
+            ids.append(self._collection.key(existing))
+        return ids
+
+    async def delete_many(self, orm_cls: Any, ids: Iterable[Any]) -> list[Any]:
+        """Delete many items by ID."""
+        deleted = [item for item in map(self._collection.get, set(ids)) if item is not None]
+        for item in deleted:
+            self._collection.discard(item)
+        return [self._collection.key(item) for item in deleted]
 
-        # Return empty set if not found (for models without collections)
-        return set()
+    @staticmethod
+    def services_match(item: Any, services: dict[str, Any] | None) -> bool:
+        """Check whether an item with `services` and `amenities` attributes passes a services filter."""
+        if not services:
+            return True
+        mask = amenities_of(services)
+        item_services = item.services or {}
+        return item.amenities & mask == mask and all(
+            name in item_services and item_services[name] == value for name, value in services.items()
+        )
+
+    @staticmethod
+    def list_version(items: Iterable[Model]) -> ListVersion:
+        """Compute the version signal of a list of items with an `updated_at` attribute."""
+        items = list(items)
+        last_modified = max((item.updated_at for item in items), default=None)  # type: ignore[attr-defined]
+        return ListVersion(count=len(items), last_modified=last_modified)
+
+    def paginate(
+        self,
+        items: Iterable[Model],
+        sort_column: InstrumentedAttribute,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        descending: bool = False,
+    ) -> Page[Model]:
+        """Retrieve one page of items using keyset pagination on `(sort_column, id)`."""
+
+        def _position(item: Any) -> tuple[Any, Any]:
+            return getattr(item, sort_column.key), item.id
+
+        ordered = sorted(items, key=_position, reverse=descending)
+        if cursor is not None:
+            id_column = sort_column.class_.id
+            after = decode_cursor(cursor, sort_column.type.python_type, id_column.type.python_type)
+            ordered = [item for item in ordered if (_position(item) < after if descending else _position(item) > after)]
+
+        return _make_page(ordered[: limit + 1], sort_column, limit)
+
+    def paginate_ranked(
+        self,
+        ranked: Iterable[tuple[float, Model]],
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[Model]:
+        """Retrieve one page of ranked items, best first, using keyset pagination on `(rank, id)`."""
+
+        def _position(entry: tuple[float, Any]) -> tuple[float, Any]:
+            return entry[0], entry[1].id
+
+        ordered = sorted(ranked, key=_position, reverse=True)
+        if cursor is not None:
+            after = decode_cursor(cursor, float, self._get_model_type().id.type.python_type)  # type: ignore[attr-defined]
+            ordered = [entry for entry in ordered if _position(entry) < after]
+
+        return _make_ranked_page(ordered[: limit + 1], limit)
 
     def _get_model_type(self) -> type[Model]:
         """
-        Extract the Model type parameter from the class hierarchy.
+        Return the Model type parameter of the gateway class.
 
         Returns:
             type[Model]: The concrete type of Model used in the gateway.
@@ -119,11 +615,41 @@ class FakeGateway[Model]:
         Raises:
             ValueError: If Model type cannot be determined.
         """
-        # Check __orig_bases__ to get the generic type parameter
-        for base in self.__class__.__orig_bases__:  # type: ignore[attr-defined]
-            if hasattr(base, "__origin__") and base.__origin__ is FakeGateway:
-                args = typing.get_args(base)
-                if args:
-                    return args[0]  # type: ignore[no-any-return]
+        if self._model_type is None:
+            raise ValueError(f"Could not determine Model type for {self.__class__.__name__}")
+        return self._model_type  # type: ignore[return-value]
+
+
+def _to_row(mapper: Mapper[Any], item: ORM_OBJ) -> dict[str, Any]:
+    """Turn an item into the column values of its row, leaving out unset columns that have a default."""
+    row = {}
+    for attr in mapper.column_attrs:
+        value = getattr(item, attr.key)
+        column = attr.columns[0]
+        if value is None and (column.default is not None or column.server_default is not None):
+            continue
+        row[attr.key] = value
+    return row
+
+
+def _make_page[Item](items: list[Item], sort_column: InstrumentedAttribute, limit: int) -> Page[Item]:
+    """Cut a page out of `limit + 1` fetched items and encode the cursor of the next page."""
+    if len(items) <= limit:
+        return Page(items=items)
+
+    items = items[:limit]
+    last = items[-1]
+    return Page(
+        items=items,
+        next_cursor=encode_cursor(getattr(last, sort_column.key), last.id),  # type: ignore[attr-defined]
+    )
+
+
+def _make_ranked_page[Item](ranked: list[tuple[float, Item]], limit: int) -> Page[Item]:
+    """Cut a page out of `limit + 1` fetched `(rank, item)` pairs and encode the cursor of the next page."""
+    items = [item for _, item in ranked[:limit]]
+    if len(ranked) <= limit:
+        return Page(items=items)
 
-        raise ValueError(f"Could not determine Model type for {self.__class__.__name__}")
+    last_rank, last = ranked[limit - 1]
+    return Page(items=items, next_cursor=encode_cursor(last_rank, last.id))  # type: ignore[attr-defined]
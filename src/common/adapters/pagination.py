@@ -0,0 +1,53 @@
+import base64
+import binascii
+from datetime import date, datetime
+from typing import Any
+
+import orjson
+
+from src.common.exceptions.common import InvalidCursorError
+
+
+def encode_cursor(sort_value: Any, item_id: Any) -> str:
+    """
+    Encode the keyset position of an item into an opaque cursor.
+
+    Args:
+        sort_value: The value of the sort column of the item.
+        item_id: The ID of the item, used as the tie-breaker.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    payload = orjson.dumps([str(sort_value), str(item_id)])
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_type: type, id_type: type) -> tuple[Any, Any]:
+    """
+    Decode an opaque cursor back into a keyset position.
+
+    Args:
+        cursor (str): The cursor returned with a previous page.
+        sort_type (type): The Python type of the sort column.
+        id_type (type): The Python type of the ID column.
+
+    Returns:
+        tuple[Any, Any]: The sort value and the ID the next page starts after.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, item_id = orjson.loads(payload)
+        return _coerce(sort_value, sort_type), _coerce(item_id, id_type)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError, ArithmeticError):
+        raise InvalidCursorError from None
+
+
+def _coerce(value: str, python_type: type[Any]) -> Any:
+    """Restore a value encoded in a cursor to its column type."""
+    if issubclass(python_type, (date, datetime)):
+        return python_type.fromisoformat(value)
+    return python_type(value)
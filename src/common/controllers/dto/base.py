@@ -1,6 +1,9 @@
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.common.domain.enums import ExportFormatEnum
+from src.common.domain.results import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 
 
 class BaseDTO(BaseModel): ...
@@ -9,6 +12,20 @@ class BaseDTO(BaseModel): ...
 class BaseRequestDTO(BaseDTO): ...
 
 
+class PageRequestDTO(BaseRequestDTO):
+    limit: int = Field(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT)
+    cursor: str | None = None
+
+
+class ExportRequestDTO(BaseRequestDTO):
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON
+
+
+class PageResponseDTO[Item](BaseDTO):
+    items: list[Item]
+    next_cursor: str | None = None
+
+
 class BaseResponseDTO(BaseDTO):
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,103 @@
+import hashlib
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qsl
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from src.common.utils.single_flight import SingleFlight
+from src.infrastructure.monitoring.metrics import http_requests_coalesced_total
+
+_COALESCE_ATTRIBUTE = "_coalesce_requests"
+_COALESCIBLE_METHODS = frozenset({"GET", "HEAD"})
+
+type RequestKey = tuple[str, str, tuple[tuple[str, str], ...], bytes, str]
+
+
+def coalesce_requests[Endpoint: Callable[..., Any]](endpoint: Endpoint) -> Endpoint:
+    """
+    Mark an idempotent GET endpoint so that identical concurrent requests share one response.
+
+    Only takes effect on routers using CoalescingAPIRoute. Apply it under the route
+    decorator, e.g. ``@router.get(...)`` then ``@coalesce_requests`` then ``@inject``.
+    """
+    setattr(endpoint, _COALESCE_ATTRIBUTE, True)
+    return endpoint
+
+
+def request_key(request: Request) -> RequestKey:
+    """
+    Return what makes two requests interchangeable: method, path, query, credentials and preconditions.
+
+    The query parameters are sorted, so their order does not matter. The credentials are
+    hashed, so requests of different users or scopes never share a response. Conditional
+    requests are only grouped with the same condition, so that a 304 answer never reaches
+    a request without the cached copy it refers to.
+    """
+    query = tuple(sorted(parse_qsl(request.url.query, keep_blank_values=True)))
+    credentials = request.headers.get("authorization") or request.cookies.get("access_token") or ""
+    if_none_match = request.headers.get("if-none-match", "")
+    return request.method, request.url.path, query, hashlib.sha256(credentials.encode()).digest(), if_none_match
+
+
+@dataclass(slots=True, frozen=True)
+class _SharedResponse:
+    """Serialized response handed to every request of a coalesced group."""
+
+    status_code: int
+    raw_headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+    @classmethod
+    def from_response(cls, response: Response) -> "_SharedResponse":
+        return cls(response.status_code, tuple(response.raw_headers), bytes(response.body))
+
+    def to_response(self) -> Response:
+        response = Response(content=self.body, status_code=self.status_code)
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+class CoalescingAPIRoute(APIRoute):
+    """
+    API route coalescing identical concurrent requests of endpoints marked with coalesce_requests.
+
+    The first request runs the endpoint, dependencies and serialization included, and the
+    identical requests arriving while it runs wait for it and get a copy of its serialized
+    response instead of running their own, so a burst of polls costs one query per worker.
+    Errors raised by the endpoint are raised to every waiting request and handled per
+    request. Background tasks of the response only run for the first request. Nothing is
+    kept once the response is produced: this is not a cache.
+
+    Unmarked endpoints of the router are served as usual.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # The route handler is built by the parent constructor, which needs these already
+        self.coalesce = getattr(endpoint, _COALESCE_ATTRIBUTE, False)
+        self._responses: SingleFlight[_SharedResponse] = SingleFlight()
+        super().__init__(path, endpoint, **kwargs)
+
+        if self.coalesce and self.methods is not None and not self.methods <= _COALESCIBLE_METHODS:
+            raise ValueError(f"Only GET and HEAD requests can be coalesced, not {sorted(self.methods)} of {path}")
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Return the request handler, coalescing identical concurrent requests if the endpoint is marked."""
+        handler = super().get_route_handler()
+        if not self.coalesce:
+            return handler
+
+        async def _run_shared(request: Request) -> _SharedResponse:
+            return _SharedResponse.from_response(await handler(request))
+
+        async def coalescing_handler(request: Request) -> Response:
+            key = request_key(request)
+            if key in self._responses:
+                http_requests_coalesced_total.labels(method=request.method, endpoint=self.path).inc()
+
+            shared = await self._responses.run(key, lambda: _run_shared(request))
+            return shared.to_response()
+
+        return coalescing_handler
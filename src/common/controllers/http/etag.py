@@ -0,0 +1,61 @@
+import hashlib
+from typing import Any
+from urllib.parse import parse_qsl
+
+from fastapi import HTTPException, Request, Response, status
+
+
+class NotModified(HTTPException):
+    """Answer to a conditional GET whose cached copy is still current, sent without a body."""
+
+    def __init__(self, etag: str) -> None:
+        super().__init__(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def make_etag(request: Request, *version: Any) -> str:
+    """
+    Build the strong ETag of a response from the version signal of the data it shows.
+
+    The path and the sorted query parameters are part of the tag, so each page and each
+    filter of a listing gets its own tag.
+
+    Args:
+        request (Request): The request being answered.
+        *version (Any): The version signal of the data, e.g. a row version or the count
+            and the latest modification time of a list.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    query = sorted(parse_qsl(request.url.query, keep_blank_values=True))
+    parts = (request.url.path, *(f"{name}={value}" for name, value in query), *map(str, version))
+    digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header lists the ETag, using the weak comparison it calls for."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def check_etag(request: Request, response: Response, etag: str) -> None:
+    """
+    Set the ETag of the response, or answer 304 when the client already has this version.
+
+    Call it before loading the data, so that a revalidation only costs the version signal.
+
+    Args:
+        request (Request): The conditional request.
+        response (Response): The response of the endpoint, getting the ETag header.
+        etag (str): The ETag of the current version, see make_etag.
+
+    Raises:
+        NotModified: If the If-None-Match header of the request lists the ETag.
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise NotModified(etag)
+    response.headers["ETag"] = etag
@@ -0,0 +1,114 @@
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+from src.common.domain.enums import ExportFormatEnum
+
+# Number of rows encoded into one chunk of the response body.
+EXPORT_CHUNK_ROWS = 500
+
+_MEDIA_TYPES = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
+
+def _json_default(value: Any) -> Any:
+    # orjson only serializes exact `uuid.UUID` instances, not the UUID subclass returned by asyncpg
+    if isinstance(value, Decimal | UUID):
+        return str(value)
+    raise TypeError
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict | list):
+        return orjson.dumps(value, default=_json_default).decode()
+    return value
+
+
+async def encode_ndjson(rows: AsyncIterable[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode rows as newline-delimited JSON, one object per line.
+
+    Args:
+        rows (AsyncIterable[dict[str, Any]]): The rows to encode.
+
+    Yields:
+        bytes: Chunks of at most EXPORT_CHUNK_ROWS lines.
+    """
+    chunk: list[bytes] = []
+    async for row in rows:
+        chunk.append(orjson.dumps(row, default=_json_default, option=orjson.OPT_APPEND_NEWLINE))
+        if len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield b"".join(chunk)
+            chunk.clear()
+    if chunk:
+        yield b"".join(chunk)
+
+
+async def encode_csv(rows: AsyncIterable[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode rows as CSV with a header line taken from the keys of the first row.
+
+    Args:
+        rows (AsyncIterable[dict[str, Any]]): The rows to encode, all with the same keys.
+
+    Yields:
+        bytes: Chunks of at most EXPORT_CHUNK_ROWS lines.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header_written = False
+    pending = 0
+    async for row in rows:
+        if not header_written:
+            writer.writerow(row.keys())
+            header_written = True
+        writer.writerow([_csv_value(value) for value in row.values()])
+        pending += 1
+        if pending >= EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    rows: AsyncIterable[dict[str, Any]], export_format: ExportFormatEnum, filename: str
+) -> StreamingResponse:
+    """
+    Stream rows to the client as a downloadable NDJSON or CSV file.
+
+    Rows are encoded as they come without going through response DTOs, so an export of any
+    size is served in constant memory when the rows come from a server-side cursor.
+
+    Args:
+        rows (AsyncIterable[dict[str, Any]]): The rows to export.
+        export_format (ExportFormatEnum): The file format.
+        filename (str): The file name without extension.
+
+    Returns:
+        StreamingResponse: The response streaming the encoded rows.
+    """
+    body = encode_csv(rows) if export_format == ExportFormatEnum.CSV else encode_ndjson(rows)
+    return StreamingResponse(
+        body,
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
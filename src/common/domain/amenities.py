@@ -0,0 +1,56 @@
+import re
+from enum import IntFlag
+from typing import Any
+
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+class AmenityFlag(IntFlag):
+    """
+    Most common services of hotels and rooms, stored as bits of their `amenities` column.
+
+    A bitwise test on the column is a cheap prefilter of the JSONB containment filters on
+    these services. The values are stored: only ever add members, never renumber them.
+    """
+
+    WIFI = 1 << 0
+    PARKING = 1 << 1
+    POOL = 1 << 2
+    TV = 1 << 3
+    MINIBAR = 1 << 4
+    AIR_CONDITIONING = 1 << 5
+    BREAKFAST = 1 << 6
+    GYM = 1 << 7
+    SPA = 1 << 8
+    RESTAURANT = 1 << 9
+    KITCHEN = 1 << 10
+    BALCONY = 1 << 11
+
+
+def normalize_service(name: str) -> str:
+    """Normalize a service name, e.g. "WiFi" to "wifi" and "Air conditioning" to "air_conditioning"."""
+    return _SEPARATORS.sub("_", name.lower()).strip("_")
+
+
+def _flag_of(name: str) -> AmenityFlag | None:
+    return AmenityFlag.__members__.get(normalize_service(name).upper())
+
+
+def amenities_of(services: dict[str, Any] | None) -> int:
+    """
+    Compute the amenities bitmap of a services dict.
+
+    Applied to a services filter, it gives the bits every item passing the filter has.
+
+    Args:
+        services (dict[str, Any] | None): The services, e.g. {"WiFi": True, "pool": False}.
+
+    Returns:
+        int: The bits of the common services that are offered.
+    """
+    bits = AmenityFlag(0)
+    for name, offered in (services or {}).items():
+        flag = _flag_of(name)
+        if flag is not None and offered is True:
+            bits |= flag
+    return int(bits)
@@ -1,7 +1,16 @@
 from pydantic import BaseModel
 
+from src.common.domain.results import DEFAULT_PAGE_LIMIT
+
 
 class Command(BaseModel):
     """Base command class."""
 
     ...
+
+
+class PageCommand(Command):
+    """Base class for commands listing one page of items."""
+
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: str | None = None
@@ -36,3 +36,25 @@ class RunModeEnum(StrEnum):
     HTTP = "http"
     AMQP = "amqp"
     FULL = "full"
+
+
+class LoadingProfileEnum(StrEnum):
+    """Relationship loading profiles used by the gateways' queries."""
+
+    LIST = "list"
+    DETAIL = "detail"
+    WRITE = "write"
+
+
+class ExportFormatEnum(StrEnum):
+    """File formats of the streaming exports."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class CacheBackendEnum(StrEnum):
+    """Shared tiers of the read-through cache."""
+
+    REDIS = "redis"
+    MEMORY = "memory"
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 100
+
+
+@dataclass(slots=True, frozen=True)
+class Page[Item]:
+    """One page of a keyset-paginated list and the cursor of the page after it."""
+
+    items: list[Item]
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ListVersion:
+    """Cheap signal of the state of a filtered list, changing whenever an item is added, changed or removed."""
+
+    count: int
+    last_modified: datetime | None = None
@@ -8,6 +8,7 @@ class BaseError(Exception):
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
     message: str = "An internal server error occurred"
     loc: str = "general"
+    headers: dict[str, str] | None = None
 
     def __init__(self, message: str = "", loc: str = "", status_code: int = 0):
         # Use provided arguments, otherwise fall back to class defaults
@@ -39,3 +40,9 @@ class InternalError(BaseError):
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
     message: str = "Internal error"
     loc: str = "general"
+
+
+class InvalidCursorError(BaseError):
+    status_code: int = status.HTTP_400_BAD_REQUEST
+    message: str = "Invalid pagination cursor"
+    loc: str = "cursor"
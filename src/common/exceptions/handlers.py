@@ -83,4 +83,4 @@ def general_exception_handler(request: Request, exc: Exception) -> ORJSONRespons
         raise exc
 
     response_model = ErrorResponse(detail=[ErrorDetail(loc=exc.loc, msg=exc.message, type=exc.__class__.__name__)])
-    return ORJSONResponse(status_code=exc.status_code, content=response_model.model_dump())
+    return ORJSONResponse(status_code=exc.status_code, content=response_model.model_dump(), headers=exc.headers)
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
 from contextlib import AbstractAsyncContextManager
 from datetime import datetime
 from typing import Any, Protocol
 from uuid import UUID
 
+from pydantic import BaseModel
+
 from src.apps.authentication.session.domain.enums import AuthTokenTypeEnum
+from src.common.domain.enums import LoadingProfileEnum
 from src.common.domain.models import ORM_CLS, ORM_OBJ
 
 
@@ -191,6 +195,41 @@ class SecurityGatewayProto(Protocol):
         ...
 
 
+class ReadThroughCacheProto(Protocol):
+    @abstractmethod
+    async def get_or_load[Model: BaseModel](
+        self,
+        namespace: str,
+        key: Any,
+        model: type[Model],
+        loader: Callable[[], Awaitable[Model]],
+    ) -> Model:
+        """
+        Return the cached read model of an entity, loading and caching it on a miss.
+
+        Args:
+            namespace (str): The kind of entity, e.g. "hotel".
+            key (Any): The ID of the entity.
+            model (type[Model]): The read model class.
+            loader (Callable[[], Awaitable[Model]]): Loads the read model from the database.
+
+        Returns:
+            Model: The read model of the entity.
+        """
+        ...
+
+    @abstractmethod
+    async def invalidate(self, namespace: str, *keys: Any) -> None:
+        """
+        Drop the cached read models of entities, once their change is committed.
+
+        Args:
+            namespace (str): The kind of entity, e.g. "hotel".
+            *keys (Any): The IDs of the entities.
+        """
+        ...
+
+
 class GatewayProto(ABC):
     @abstractmethod
     def __call__(self, *args: Any, **kwargs: Any) -> AbstractAsyncContextManager[UowProto]:  # noqa: E501
@@ -210,21 +249,58 @@ class SQLAlchemyGatewayProto(GatewayProto):
         ...
 
     @abstractmethod
-    async def get_item_by_id(self, orm_cls: ORM_CLS, item_id: int) -> ORM_OBJ | None:
+    async def get_item_by_id(
+        self, orm_cls: ORM_CLS, item_id: int, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE
+    ) -> ORM_OBJ | None:
         """Retrieve an ORM object by its ID."""
         ...
 
     @abstractmethod
-    async def get_one_item(self, orm_cls: ORM_CLS, **filters: Any) -> ORM_OBJ | None:
+    async def get_one_item(
+        self, orm_cls: ORM_CLS, profile: LoadingProfileEnum = LoadingProfileEnum.WRITE, **filters: Any
+    ) -> ORM_OBJ | None:
         """Retrieve a single ORM object matching the given filters."""
         ...
 
     @abstractmethod
-    async def get_items_list(self, orm_cls: ORM_CLS, **filters: Any) -> list[ORM_OBJ]:
+    async def get_items_list(
+        self, orm_cls: ORM_CLS, profile: LoadingProfileEnum = LoadingProfileEnum.LIST, **filters: Any
+    ) -> list[ORM_OBJ]:
         """Retrieve a list of ORM objects matching the given filters."""
         ...
 
+    @abstractmethod
+    def stream_items(
+        self,
+        orm_cls: ORM_CLS,
+        profile: LoadingProfileEnum = LoadingProfileEnum.LIST,
+        yield_per: int = 1_000,
+        **filters: Any,
+    ) -> AsyncIterator[ORM_OBJ]:
+        """Stream the ORM objects matching the given filters without loading them all at once."""
+        ...
+
     @abstractmethod
     async def delete_item(self, orm_obj: ORM_OBJ) -> None:
         """Delete an ORM object from the database session."""
         ...
+
+    @abstractmethod
+    async def add_many(self, items: Sequence[ORM_OBJ], ignore_conflicts: bool = False) -> list[Any]:
+        """Insert many ORM objects with multi-row statements and return the inserted IDs."""
+        ...
+
+    @abstractmethod
+    async def upsert_many(
+        self,
+        items: Sequence[ORM_OBJ],
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Sequence[str] | None = None,
+    ) -> list[Any]:
+        """Insert many ORM objects or update the rows they conflict with and return their IDs."""
+        ...
+
+    @abstractmethod
+    async def delete_many(self, orm_cls: ORM_CLS, ids: Iterable[Any]) -> list[Any]:
+        """Delete many rows by ID and return the deleted IDs."""
+        ...
@@ -0,0 +1,64 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[Value]:
+    """
+    Run at most one call per key at a time in this worker and share its outcome.
+
+    Callers arriving while a call for the same key is running wait for it and get its
+    result or its exception, instead of running their own. A caller giving up does not
+    cancel the call of the others; if the caller running the call is cancelled, the
+    waiters run the call themselves.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Value]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether a call for the key is in flight."""
+        return key in self._calls
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Value]]) -> Value:
+        """
+        Run func, or wait for the call of the same key already in flight.
+
+        Args:
+            key (Hashable): Identifies the calls that are interchangeable.
+            func (Callable[[], Awaitable[Value]]): The call to run.
+
+        Returns:
+            Value: The result of the call.
+        """
+        running = self._calls.get(key)
+        if running is not None:
+            try:
+                # Shielded so that a cancelled waiter does not cancel the call of the others
+                return await asyncio.shield(running)
+            except asyncio.CancelledError:
+                if not running.cancelled():
+                    raise
+                # The caller running the call was cancelled, run it on our own
+                return await func()
+
+        future: asyncio.Future[Value] = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            value = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved, nobody may be waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._calls[key]
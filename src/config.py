@@ -3,7 +3,7 @@ from pathlib import Path
 from pydantic import BaseModel, EmailStr, Field, SecretStr
 from pydantic_settings import BaseSettings
 
-from src.common.domain.enums import EmailAdapterEnum, EnvironmentEnum, SMSAdapterEnum
+from src.common.domain.enums import CacheBackendEnum, EmailAdapterEnum, EnvironmentEnum, SMSAdapterEnum
 from src.infrastructure.database.memory.config import MemoryDatabaseSettings
 from src.infrastructure.database.postgres.config import DatabaseSettings
 
@@ -85,6 +85,11 @@ class SecuritySettings(CustomBaseSettings):
     secret_key: SecretStr = SecretStr("some_secret_key")
     algorithm: str = "HS256"
     jwt_key_id: str = "primary"
+    verified_token_cache_size: int = 10_000
+
+    password_hash_workers: int = 4
+    password_hash_queue_size: int = 32
+    password_hash_retry_after_seconds: int = 1
 
 
 class OAuthSettings(BaseSettings):
@@ -129,6 +134,26 @@ class AuthenticationSettings(CustomBaseSettings):
     jwt: SecuritySettings = Field(default_factory=SecuritySettings)
 
 
+class AuthorizationSettings(CustomBaseSettings):
+    """Authorization configuration settings."""
+
+    permissions_cache_ttl_seconds: int = 60
+
+
+class CacheSettings(CustomBaseSettings):
+    """Read-through cache configuration settings."""
+
+    cache_backend: CacheBackendEnum = CacheBackendEnum.REDIS
+    cache_redis_url: str = "redis://localhost:6379/1"
+    cache_socket_timeout_seconds: float = 0.5
+    cache_key_prefix: str = "trip"
+    # Lifetime of the shared entries, the bound on staleness if an invalidation is lost
+    cache_ttl_seconds: int = 300
+    # In-process tier, bounds how long a worker may miss an invalidation made by another one
+    cache_local_size: int = 1_000
+    cache_local_ttl_seconds: float = 5.0
+
+
 class SMTPSettings(CustomBaseSettings):
     """SMTP email configuration settings."""
 
@@ -188,6 +213,8 @@ class Configs(BaseSettings):
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     memory_database: MemoryDatabaseSettings = Field(default_factory=MemoryDatabaseSettings)
     auth: AuthenticationSettings = Field(default_factory=AuthenticationSettings)
+    authorization: AuthorizationSettings = Field(default_factory=AuthorizationSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     smtp_email: SMTPSettings = Field(default_factory=SMTPSettings)
     s3: S3Settings = Field(default_factory=S3Settings)
     celery: CelerySettings = Field(default_factory=CelerySettings)
@@ -0,0 +1,93 @@
+import time
+from typing import Protocol, cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+
+class CacheBackendError(Exception):
+    """The shared cache tier could not be reached."""
+
+
+class CacheBackendProto(Protocol):
+    """Shared key-value tier of the read-through cache, the subset of Redis it relies on."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key, None if it is missing or expired."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value under a key for ttl seconds."""
+        ...
+
+    async def incr(self, key: str) -> int:
+        """Increment the integer stored under a key, starting from 0, and return the new value."""
+        ...
+
+
+class RedisCacheBackend(CacheBackendProto):
+    """Shared cache tier stored in Redis, common to every worker."""
+
+    def __init__(self, client: Redis) -> None:
+        self._client = client
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key, None if it is missing or expired."""
+        try:
+            # The client does not decode responses, so values come back as the bytes stored
+            return cast(bytes | None, await self._client.get(key))
+        except (RedisError, OSError) as error:
+            raise CacheBackendError(str(error)) from error
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value under a key for ttl seconds."""
+        try:
+            await self._client.set(key, value, ex=ttl)
+        except (RedisError, OSError) as error:
+            raise CacheBackendError(str(error)) from error
+
+    async def incr(self, key: str) -> int:
+        """Increment the integer stored under a key, starting from 0, and return the new value."""
+        try:
+            return await self._client.incr(key)
+        except (RedisError, OSError) as error:
+            raise CacheBackendError(str(error)) from error
+
+
+class MemoryCacheBackend(CacheBackendProto):
+    """
+    In-process stand-in for the Redis tier, used by the tests and by single-worker setups.
+
+    It follows the Redis semantics the cache relies on: values expire after their TTL and
+    counters start from 0 and never expire.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[float | None, bytes]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored keys, expired ones included until they are read."""
+        return len(self._values)
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key, None if it is missing or expired."""
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a value under a key for ttl seconds."""
+        self._values[key] = (time.monotonic() + ttl, value)
+
+    async def incr(self, key: str) -> int:
+        """Increment the integer stored under a key, starting from 0, and return the new value."""
+        current = await self.get(key)
+        value = int(current or 0) + 1
+        self._values[key] = (None, str(value).encode())
+        return value
@@ -0,0 +1,169 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from src.common.interfaces import CustomLoggerProto, ReadThroughCacheProto
+from src.common.utils.single_flight import SingleFlight
+from src.config import CacheSettings
+from src.infrastructure.cache.backends import CacheBackendError, CacheBackendProto
+from src.infrastructure.monitoring.metrics import cache_hit_rate, cache_operations_total
+
+
+class ReadThroughCache(ReadThroughCacheProto):
+    """
+    Two-tier read-through cache of read models, shared by all requests of a worker.
+
+    Lookups go to a bounded in-process LRU first, then to the shared tier (Redis), and
+    only then to the loader. Shared entries are stored under versioned keys: each entity
+    has a version counter in the shared tier and invalidating it bumps the counter, so
+    every worker stops reading the old entry at once, and a load that raced with the
+    invalidation can only write under the old, unreachable key. The in-process tier keeps
+    entries for a few seconds only, which bounds how long a worker can serve an entity
+    invalidated by another one.
+
+    Concurrent misses on the same key in a worker share a single load. When the shared
+    tier is unreachable, lookups fall back to the loader and invalidations only reach this
+    worker; the entry TTL then bounds the staleness of the other workers.
+    """
+
+    def __init__(self, backend: CacheBackendProto, settings: CacheSettings, logger: CustomLoggerProto) -> None:
+        self._backend = backend
+        self._logger = logger
+        self._prefix = settings.cache_key_prefix
+        self._ttl = settings.cache_ttl_seconds
+        self._local_size = settings.cache_local_size
+        self._local_ttl = settings.cache_local_ttl_seconds
+        self._local: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._loads: SingleFlight[Any] = SingleFlight()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served by one of the cache tiers."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    async def get_or_load[Model: BaseModel](
+        self,
+        namespace: str,
+        key: Any,
+        model: type[Model],
+        loader: Callable[[], Awaitable[Model]],
+    ) -> Model:
+        """
+        Return the cached read model of an entity, loading and caching it on a miss.
+
+        Args:
+            namespace (str): The kind of entity, e.g. "hotel".
+            key (Any): The ID of the entity.
+            model (type[Model]): The read model class, used to decode shared entries.
+            loader (Callable[[], Awaitable[Model]]): Loads the read model from the database.
+                Its exceptions are raised to every caller sharing the load and nothing is cached.
+
+        Returns:
+            Model: The read model of the entity.
+        """
+        entity_key = f"{self._prefix}:{namespace}:{key}"
+        operation = f"{namespace}_detail"
+
+        value = self._get_local(entity_key)
+        if value is not None:
+            self._record(operation, "local_hit")
+            return value
+
+        generation = self._generation
+        try:
+            version = await self._backend.get(f"{entity_key}:version")
+            data_key = f"{entity_key}:v{int(version or 0)}"
+            payload = await self._backend.get(data_key)
+        except CacheBackendError as error:
+            self._logger.warning("Cache unavailable, loading from the database", key=entity_key, error=str(error))
+            self._record(operation, "error")
+            return await self._loads.run(entity_key, loader)
+
+        if payload is not None:
+            value = self._decode(model, data_key, payload)
+        if value is not None:
+            self._record(operation, "redis_hit")
+        else:
+            self._record(operation, "miss")
+            value = await self._loads.run(data_key, lambda: self._load_and_share(data_key, loader))
+
+        if generation == self._generation:
+            self._put_local(entity_key, value)
+        return value
+
+    async def invalidate(self, namespace: str, *keys: Any) -> None:
+        """
+        Drop the cached read models of entities in every worker.
+
+        Call it once the change is committed, otherwise a concurrent lookup could cache the
+        old state again.
+
+        Args:
+            namespace (str): The kind of entity, e.g. "hotel".
+            *keys (Any): The IDs of the entities.
+        """
+        self._generation += 1
+        operation = f"{namespace}_invalidate"
+        for key in keys:
+            entity_key = f"{self._prefix}:{namespace}:{key}"
+            self._local.pop(entity_key, None)
+            try:
+                await self._backend.incr(f"{entity_key}:version")
+            except CacheBackendError as error:
+                self._logger.error("Cache invalidation failed", key=entity_key, error=str(error))
+                cache_operations_total.labels(operation=operation, status="error").inc()
+                continue
+            cache_operations_total.labels(operation=operation, status="success").inc()
+
+    def _decode[Model: BaseModel](self, model: type[Model], data_key: str, payload: bytes) -> Model | None:
+        try:
+            return model.model_validate_json(payload)
+        except ValidationError as error:
+            # Written by a release with another shape of the read model, load it again
+            self._logger.warning("Cached entry does not match its read model", key=data_key, error=str(error))
+            return None
+
+    async def _load_and_share(self, data_key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        try:
+            await self._backend.set(data_key, value.model_dump_json().encode(), self._ttl)
+        except CacheBackendError as error:
+            self._logger.warning("Cache write failed", key=data_key, error=str(error))
+        return value
+
+    def _get_local(self, entity_key: str) -> Any | None:
+        entry = self._local.get(entity_key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local[entity_key]
+            return None
+
+        self._local.move_to_end(entity_key)
+        return value
+
+    def _put_local(self, entity_key: str, value: Any) -> None:
+        if self._local_size <= 0:
+            return
+
+        self._local[entity_key] = (time.monotonic() + self._local_ttl, value)
+        self._local.move_to_end(entity_key)
+        while len(self._local) > self._local_size:
+            self._local.popitem(last=False)
+
+    def _record(self, operation: str, status: str) -> None:
+        if status.endswith("hit"):
+            self.hits += 1
+        else:
+            self.misses += 1
+        cache_operations_total.labels(operation=operation, status=status).inc()
+        cache_hit_rate.set(self.hit_ratio * 100)
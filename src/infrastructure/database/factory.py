@@ -6,21 +6,65 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, AsyncSessionTransa
 from src.common.interfaces import UowProto
 from src.infrastructure.context import RequestContext
 from src.infrastructure.database.postgres.config import DatabaseSettings
+from src.infrastructure.database.routing import stick_to_primary
+from src.infrastructure.monitoring.database import instrument_engine
 
 
 def create_database_adapter(config: DatabaseSettings) -> AsyncEngine:
     """Creates and returns an asynchronous SQLAlchemy engine for database interaction.
 
+    The engine is instrumented to emit statement and connection pool metrics.
+
+    Args:
+        config (DatabaseSettings): The database configuration settings.
+    """
+    engine = create_async_engine(config.db_url, **config.engine.model_dump())
+    instrument_engine(engine)
+    return engine
+
+
+def create_replica_adapters(config: DatabaseSettings) -> list[AsyncEngine]:
+    """Creates one asynchronous SQLAlchemy engine, with its own pool, per configured read replica.
+
     Args:
         config (DatabaseSettings): The database configuration settings.
     """
-    return create_async_engine(config.db_url, **config.engine.model_dump())
+    engines = [create_async_engine(url, **config.engine.model_dump()) for url in config.replica_urls]
+    for engine in engines:
+        instrument_engine(engine)
+    return engines
+
+
+_DEPTH_KEY = "unit_of_work_depth"
+_BATCH_KEY = "unit_of_work_batch_writes"
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    """Return whether the session is inside a unit of work, which commits once when it ends.
+
+    Args:
+        session (AsyncSession): The session to check.
+    """
+    return bool(session.info.get(_DEPTH_KEY))
+
+
+def defers_flush(session: AsyncSession) -> bool:
+    """Return whether the unit of work of the session batches its writes into the final commit.
+
+    Args:
+        session (AsyncSession): The session to check.
+    """
+    return bool(session.info.get(_BATCH_KEY))
 
 
 class SqlAlchemyUnitOfWork(UowProto):
     """SQLAlchemy unit of work implementation.
 
     The class wraps the already existing SQLAlchemy unit of work implementations for easier usage.
+    Units of work sharing a session nest: only the outermost one opens the transaction and
+    commits it, so a whole request or command is persisted by a single commit while gateways
+    inside it only flush. With `batch_writes` the gateways do not even flush, and every
+    pending change is sent to the database by the final commit in one flush.
     """
 
     def __init__(
@@ -28,25 +72,48 @@ class SqlAlchemyUnitOfWork(UowProto):
         session: AsyncSession,
         request_context: RequestContext,
         transaction: AsyncSessionTransaction | None = None,
+        batch_writes: bool = False,
     ) -> None:
         self.session: AsyncSession = session
         self.request_context = request_context
         self.transaction: AsyncSessionTransaction | None = transaction
+        self.batch_writes = batch_writes
+        self._is_outermost = False
 
     async def commit(self) -> None:
-        """Commit the current transaction."""
-        if self.transaction is not None:
+        """Commit the current transaction, or only flush it when nested in another unit of work."""
+        if not self._is_outermost:
+            await self.session.flush()
+        elif self.transaction is not None:
             await self.transaction.commit()
+        else:
+            await self.session.commit()
 
     async def rollback(self) -> None:
         """Roll back the current transaction."""
         if self.transaction is not None:
             await self.transaction.rollback()
+        else:
+            await self.session.rollback()
 
     async def __aenter__(self) -> Self:
-        """Start a transaction on the current session and return the UoW instance."""
-        self.transaction = self.transaction or self.session.begin()
-        await self.transaction.__aenter__()
+        """Start a transaction on the current session and return the UoW instance.
+
+        Statements of a unit of work always run on the primary database. A transaction
+        already begun by preceding reads of the session is reused.
+        """
+        depth = self.session.info.get(_DEPTH_KEY, 0)
+        self.session.info[_DEPTH_KEY] = depth + 1
+        self._is_outermost = depth == 0
+        if not self._is_outermost:
+            return self
+
+        stick_to_primary(self.session)
+        self.session.info[_BATCH_KEY] = self.batch_writes
+        if self.transaction is None and not self.session.in_transaction():
+            self.transaction = self.session.begin()
+        if self.transaction is not None:
+            await self.transaction.__aenter__()
         return self
 
     async def __aexit__(
@@ -56,8 +123,21 @@ class SqlAlchemyUnitOfWork(UowProto):
         traceback: TracebackType | None,
     ) -> None:
         """Stop the current transaction and commit or rollback based on the result."""
-        if self.transaction is not None:
-            await self.transaction.__aexit__(exc_type, exc_value, traceback)
-        self.transaction = None
+        depth = self.session.info.pop(_DEPTH_KEY, 1) - 1
+        if depth:
+            self.session.info[_DEPTH_KEY] = depth
+            return
+
+        self.session.info.pop(_BATCH_KEY, None)
+        try:
+            if self.transaction is not None:
+                await self.transaction.__aexit__(exc_type, exc_value, traceback)
+            elif exc_type is None:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            self.transaction = None
+            self._is_outermost = False
 
         return
@@ -1,5 +1,3 @@
-from pydantic import BaseModel, Field
-
 from src.apps.authentication.session.domain.models import (
     AuthSession,
     OTPCode,
@@ -17,25 +15,48 @@ from src.apps.hotel.file_object.domain.models import FileObject
 from src.apps.hotel.hotels.domain.models import Hotel
 from src.apps.hotel.rooms.domain.models import Room
 from src.config import Configs
+from src.infrastructure.database.memory.table import MemoryTable
+
 
+class MemoryDatabase:
+    """In-memory storage of the fake gateways, one indexed table per model."""
 
-class MemoryDatabase(BaseModel):
-    def __init__(self, config: Configs):
-        super().__init__()
+    def __init__(self, config: Configs) -> None:
         self.config = config
 
-    # Hotel-related collections
-    bookings: set[Booking] = Field(default_factory=set)
-    hotels: set[Hotel] = Field(default_factory=set)
-    rooms: set[Room] = Field(default_factory=set)
-    file_objects: set[FileObject] = Field(default_factory=set)
-
-    # Users/Comments/Auth/Access
-    users: set[User] = Field(default_factory=set)
-    comments: set[Comment] = Field(default_factory=set)
-    permissions: set[Permission] = Field(default_factory=set)
-    roles: set[Role] = Field(default_factory=set)
-    role_permissions: set[RolePermissions] = Field(default_factory=set)
-    auth_sessions: set[AuthSession] = Field(default_factory=set)
-    password_reset_tokens: set[PasswordResetToken] = Field(default_factory=set)
-    otp_codes: set[OTPCode] = Field(default_factory=set)
+        # Hotel-related tables
+        self.bookings = MemoryTable(Booking, indexes=("room_id", "user_id"), interval=("date_from", "date_to"))
+        self.hotels = MemoryTable(Hotel, indexes=("owner",))
+        self.rooms = MemoryTable(Room, indexes=("hotel_id",))
+        self.file_objects = MemoryTable(FileObject, key_columns=("object_name",))
+
+        # Users/Comments/Auth/Access
+        self.users = MemoryTable(User, indexes=("email", "phone"))
+        self.comments = MemoryTable(Comment, indexes=("hotel_id", "user_id"))
+        self.permissions = MemoryTable(Permission)
+        self.roles = MemoryTable(Role, indexes=("name",))
+        self.role_permissions = MemoryTable(RolePermissions, indexes=("role_id",))
+        self.auth_sessions = MemoryTable(AuthSession, indexes=("user_id", "hashed_refresh_token"))
+        self.password_reset_tokens = MemoryTable(PasswordResetToken, indexes=("user_id", "hashed_reset_token"))
+        self.otp_codes = MemoryTable(OTPCode, indexes=("user_id",))
+
+        self._tables: dict[type, MemoryTable] = {
+            table.model: table for table in vars(self).values() if isinstance(table, MemoryTable)
+        }
+
+    def table[Model](self, model: type[Model]) -> MemoryTable[Model]:
+        """
+        Return the table storing the instances of a model.
+
+        Models without a declared table get an unindexed one on first use.
+
+        Args:
+            model (type[Model]): The ORM class of the rows.
+
+        Returns:
+            MemoryTable[Model]: The table of the model.
+        """
+        table = self._tables.get(model)
+        if table is None:
+            table = self._tables[model] = MemoryTable(model)
+        return table
@@ -0,0 +1,196 @@
+from bisect import bisect_left, insort
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Mapper
+
+
+class MemoryTable[Model]:
+    """
+    In-memory table of ORM instances, the storage behind the fake gateways.
+
+    Rows are stored by primary key and can be looked up through declared secondary
+    indexes on equality columns and an interval index on a pair of start/end columns,
+    so lookups stay fast with tens of thousands of rows. The values an instance was
+    indexed with are remembered, so an instance mutated in place is reindexed by
+    update() or by discarding and adding it again.
+
+    The table keeps the set methods used by the fake gateways (add, discard,
+    iteration, len), rows being identified by their primary key instead of their hash.
+    """
+
+    def __init__(
+        self,
+        model: type[Model],
+        indexes: Sequence[str] = (),
+        interval: tuple[str, str] | None = None,
+        key_columns: Sequence[str] | None = None,
+    ) -> None:
+        """
+        Create an empty table.
+
+        Args:
+            model (type[Model]): The ORM class of the rows.
+            indexes (Sequence[str]): The columns looked up by equality.
+            interval (tuple[str, str] | None): The start and end columns of a half-open
+                interval, for overlap queries.
+            key_columns (Sequence[str] | None): The columns identifying a row, the primary
+                key of the ORM mapping by default.
+        """
+        self.model = model
+        self._key_columns = tuple(key_columns) if key_columns is not None else _primary_key_columns(model)
+        self._rows: dict[Hashable, Model] = {}
+        self._indexes: dict[str, dict[Any, set[Hashable]]] = {column: {} for column in indexes}
+        self._indexed_values: dict[Hashable, tuple[Any, ...]] = {}
+        self._interval = interval
+        self._starts: list[tuple[Any, Hashable]] = []
+        self._max_length: Any = None
+
+    def key(self, item: Model) -> Hashable:
+        """Return the primary key of an instance, a tuple for composite keys."""
+        values = tuple(getattr(item, column) for column in self._key_columns)
+        return values[0] if len(values) == 1 else values
+
+    def __iter__(self) -> Iterator[Model]:
+        """Iterate over a snapshot of the rows, so the table can change during the iteration."""
+        return iter(list(self._rows.values()))
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._rows)
+
+    def __contains__(self, item: object) -> bool:
+        """Check whether the instance itself is stored."""
+        return self._rows.get(self.key(item)) is item  # type: ignore[arg-type]
+
+    def get(self, key: Hashable) -> Model | None:
+        """Return the row with the given primary key."""
+        return self._rows.get(key)
+
+    def add(self, item: Model) -> None:
+        """Insert a row, replacing the stored row with the same primary key."""
+        key = self.key(item)
+        if key in self._rows:
+            self._unindex(key)
+        self._rows[key] = item
+        self._index(key, item)
+
+    def discard(self, item: Model) -> None:
+        """Remove the row with the primary key of the instance, if stored."""
+        key = self.key(item)
+        if key in self._rows:
+            self._unindex(key)
+            del self._rows[key]
+
+    def update(self, item: Model, **values: Any) -> None:
+        """Set attributes of a stored instance and reindex it."""
+        for column, value in values.items():
+            setattr(item, column, value)
+        self.add(item)
+
+    def clear(self) -> None:
+        """Remove every row."""
+        self._rows.clear()
+        self._indexed_values.clear()
+        self._starts.clear()
+        self._max_length = None
+        for index in self._indexes.values():
+            index.clear()
+
+    def find(self, **criteria: Any) -> list[Model]:
+        """
+        Return the rows whose columns equal the given values.
+
+        The smallest bucket of the indexed columns among the criteria is scanned, the
+        whole table when none of them is indexed.
+        """
+        candidates: Iterable[Model] = self._rows.values()
+        buckets = [
+            self._indexes[column].get(value, set()) for column, value in criteria.items() if column in self._indexes
+        ]
+        if buckets:
+            candidates = [self._rows[key] for key in min(buckets, key=len)]
+        return [item for item in candidates if _matches(item, criteria)]
+
+    def first(self, **criteria: Any) -> Model | None:
+        """Return one row whose columns equal the given values."""
+        return next(iter(self.find(**criteria)), None)
+
+    def overlapping(self, start: Any, end: Any, **criteria: Any) -> list[Model]:
+        """
+        Return the rows whose interval overlaps [start, end) and whose columns equal the given values.
+
+        Only the rows starting before `end` and after `start` minus the longest stored
+        interval can overlap, so they are found from the start index. When an indexed
+        column is among the criteria and its bucket is smaller, the bucket is scanned
+        instead.
+
+        Raises:
+            ValueError: If the table has no interval index.
+        """
+        if self._interval is None:
+            raise ValueError(f"Table of {self.model.__name__} has no interval index")
+        if not self._starts:
+            return []
+
+        start_column, end_column = self._interval
+        low = bisect_left(self._starts, start - self._max_length, key=lambda entry: entry[0])
+        high = bisect_left(self._starts, end, key=lambda entry: entry[0])
+        keys: Iterable[Hashable] = (key for _, key in self._starts[low:high])
+        buckets = [
+            self._indexes[column].get(value, set()) for column, value in criteria.items() if column in self._indexes
+        ]
+        if buckets and len(smallest := min(buckets, key=len)) < high - low:
+            keys = smallest
+        rows = (self._rows[key] for key in keys)
+        return [
+            item
+            for item in rows
+            if getattr(item, start_column) < end and getattr(item, end_column) > start and _matches(item, criteria)
+        ]
+
+    def _index(self, key: Hashable, item: Model) -> None:
+        values = tuple(getattr(item, column) for column in self._indexes)
+        for index, value in zip(self._indexes.values(), values, strict=True):
+            index.setdefault(value, set()).add(key)
+
+        if self._interval is not None:
+            start, end = (getattr(item, column) for column in self._interval)
+            insort(self._starts, (start, key))
+            values = (*values, start)
+            length = end - start
+            if self._max_length is None or length > self._max_length:
+                self._max_length = length
+
+        self._indexed_values[key] = values
+
+    def _unindex(self, key: Hashable) -> None:
+        values = self._indexed_values.pop(key)
+        for index, value in zip(self._indexes.values(), values, strict=False):
+            bucket = index[value]
+            bucket.discard(key)
+            if not bucket:
+                del index[value]
+
+        if self._interval is not None:
+            position = bisect_left(self._starts, (values[-1], key))
+            del self._starts[position]
+
+
+# Primary key attributes of the ORM classes inspected so far.
+_PRIMARY_KEY_COLUMNS: dict[type[Any], tuple[str, ...]] = {}
+
+
+def _primary_key_columns(model: type[Any]) -> tuple[str, ...]:
+    """Return the primary key attributes of an ORM class, inspected once per class."""
+    columns = _PRIMARY_KEY_COLUMNS.get(model)
+    if columns is None:
+        mapper: Mapper[Any] = inspect(model)
+        columns = tuple(mapper.get_property_by_column(column).key for column in mapper.primary_key)
+        _PRIMARY_KEY_COLUMNS[model] = columns
+    return columns
+
+
+def _matches(item: Any, criteria: dict[str, Any]) -> bool:
+    return all(getattr(item, column) == value for column, value in criteria.items())
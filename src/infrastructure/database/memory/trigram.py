@@ -0,0 +1,47 @@
+import re
+from functools import lru_cache
+
+# Default of pg_trgm.word_similarity_threshold, above which the %> operator matches.
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+_WORD = re.compile(r"\w+")
+
+
+def words(text: str) -> list[str]:
+    """Split a text into lowercase words, like pg_trgm and the full-text parser do."""
+    return _WORD.findall(text.lower())
+
+
+@lru_cache(maxsize=4096)
+def trigrams(text: str) -> frozenset[str]:
+    """
+    Return the trigrams of a text the way pg_trgm extracts them.
+
+    Each word is padded with two spaces in front and one behind, so short words and
+    word starts weigh in the similarity.
+    """
+    return frozenset(
+        padded[i : i + 3] for word in words(text) for padded in (f"  {word} ",) for i in range(len(padded) - 2)
+    )
+
+
+def word_similarity(query: str, text: str) -> float:
+    """
+    Approximate the word similarity of pg_trgm: the share of the query's trigrams found in the text.
+
+    pg_trgm only counts the best matching extent of the text, this counts all of it, which
+    makes no difference for the short names and locations it is used on.
+    """
+    query_trigrams = trigrams(query)
+    if not query_trigrams:
+        return 0.0
+    return len(query_trigrams & trigrams(text)) / len(query_trigrams)
+
+
+def prefix_match(query: str, text: str) -> bool:
+    """Check whether every word of the query starts a word of the text, like a `word:*` tsquery."""
+    text_words = words(text)
+    query_words = words(query)
+    return bool(query_words) and all(
+        any(text_word.startswith(word) for text_word in text_words) for word in query_words
+    )
@@ -0,0 +1,131 @@
+import weakref
+from collections import Counter
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from typing import Any, Self
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.common.interfaces import CustomLoggerProto
+
+
+class StatementCounter:
+    """
+    Record the SQL statements sent to the database by a session or an engine.
+
+    Besides the raw count, the counter groups statements by their text to spot the
+    N+1 signature: the same statement executed over and over with different parameters.
+    """
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, Any]] = []
+        self._connections: weakref.WeakSet[Connection] = weakref.WeakSet()
+        self._session: Session | None = None
+
+    def __len__(self) -> int:
+        """Return the number of recorded statements."""
+        return len(self.statements)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the recorded statement texts."""
+        return (statement for statement, _ in self.statements)
+
+    def _before_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        self.statements.append((statement, parameters))
+
+    def _after_begin(self, session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+        if connection not in self._connections:
+            self._connections.add(connection)
+            event.listen(connection, "before_cursor_execute", self._before_cursor_execute)
+
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> Self:
+        """
+        Create a counter recording every statement issued through the session.
+
+        Args:
+            session (AsyncSession): The session to observe.
+
+        Returns:
+            StatementCounter: The attached counter; call detach() when the session is done.
+        """
+        counter = cls()
+        counter._session = session.sync_session
+        event.listen(counter._session, "after_begin", counter._after_begin)
+        return counter
+
+    def detach(self) -> None:
+        """Stop recording statements of the observed session."""
+        if self._session is not None:
+            event.remove(self._session, "after_begin", self._after_begin)
+            self._session = None
+
+        for connection in list(self._connections):
+            if event.contains(connection, "before_cursor_execute", self._before_cursor_execute):
+                event.remove(connection, "before_cursor_execute", self._before_cursor_execute)
+        self._connections.clear()
+
+    @classmethod
+    @contextmanager
+    def capture(cls, engine: AsyncEngine) -> Generator[Self]:
+        """
+        Record every statement executed by the engine inside the block, whatever the session.
+
+        Args:
+            engine (AsyncEngine): The engine to observe.
+
+        Yields:
+            StatementCounter: The counter filled while the block runs.
+        """
+        counter = cls()
+        event.listen(engine.sync_engine, "before_cursor_execute", counter._before_cursor_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", counter._before_cursor_execute)
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        """
+        Find statements executed at least threshold times with different parameters.
+
+        Args:
+            threshold (int): Minimal number of executions to report a statement.
+
+        Returns:
+            dict[str, int]: Statement text mapped to its number of executions.
+        """
+        executions = Counter(statement for statement, _ in self.statements)
+        parameter_sets: dict[str, set[str]] = {}
+        for statement, parameters in self.statements:
+            if executions[statement] >= threshold:
+                parameter_sets.setdefault(statement, set()).add(repr(parameters))
+
+        return {
+            statement: executions[statement] for statement, parameters in parameter_sets.items() if len(parameters) > 1
+        }
+
+    def report(self, logger: CustomLoggerProto, budget: int, repeat_threshold: int, **context: Any) -> None:
+        """
+        Log a warning if the recorded statements exceed the budget or look like an N+1.
+
+        Args:
+            logger (CustomLoggerProto): Logger used for the warnings.
+            budget (int): Maximal number of statements expected for one unit of work.
+            repeat_threshold (int): Number of executions of one statement considered an N+1.
+            **context (Any): Extra fields added to the log records.
+        """
+        if len(self) > budget:
+            logger.warning("Query budget exceeded", statements=len(self), budget=budget, **context)
+
+        repeated = self.repeated_statements(repeat_threshold)
+        if repeated:
+            logger.warning(
+                "Repeated statement detected, possible N+1 query",
+                statements={statement[:200]: count for statement, count in repeated.items()},
+                **context,
+            )
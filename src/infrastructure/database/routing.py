@@ -0,0 +1,63 @@
+import random
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Connection, Engine, Select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+_PRIMARY_KEY = "use_primary"
+
+
+@dataclass(frozen=True, slots=True)
+class ReplicaEngines:
+    """Engines of the configured read replicas, empty when reads go to the primary."""
+
+    engines: tuple[AsyncEngine, ...] = ()
+
+
+class RoutingSession(Session):
+    """
+    Session sending plain reads to a replica and everything else to the primary.
+
+    A SELECT without row locks is executed on a replica until the session either
+    writes, flushes or enters a unit of work. From then on every statement of the
+    session goes to the primary, so a request always reads its own writes.
+
+    The replica is chosen at random on the first read and kept for the whole session,
+    so the reads of a request see a single replica's snapshot, whatever the lag of the
+    others.
+    """
+
+    def __init__(self, *args: Any, replicas: Sequence[Engine] = (), **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._replicas = tuple(replicas)
+        self._replica: Engine | None = None
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kwargs: Any) -> Engine | Connection:
+        """Return the engine the given statement should run on."""
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+
+        if not self._replicas or self.info.get(_PRIMARY_KEY):
+            return primary
+
+        if isinstance(clause, Select) and clause._for_update_arg is None and not self._flushing:
+            if self._replica is None:
+                self._replica = random.choice(self._replicas)
+            return self._replica
+
+        # Anything that is not a plain read, or any statement of a flush, may write,
+        # so stay on the primary from now on.
+        self.info[_PRIMARY_KEY] = True
+        return primary
+
+
+def stick_to_primary(session: AsyncSession) -> None:
+    """
+    Route every following statement of the session to the primary.
+
+    Args:
+        session (AsyncSession): The session to pin.
+    """
+    session.sync_session.info[_PRIMARY_KEY] = True
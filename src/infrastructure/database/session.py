@@ -0,0 +1,106 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import Select, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction, SessionTransactionOrigin
+
+from src.infrastructure.database.factory import in_unit_of_work
+
+_WROTE_KEY = "wrote_in_transaction"
+_OPEN_STREAMS_KEY = "open_streams"
+
+
+def _on_after_flush(session: Session, flush_context: Any) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+def _on_after_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_WROTE_KEY, None)
+
+
+@contextmanager
+def streaming(session: AsyncSession) -> Generator[None]:
+    """
+    Keep the connection of the session while a server-side cursor is open on it.
+
+    Releasing the connection commits the transaction, which would close the cursor
+    under a stream that is still being consumed.
+
+    Args:
+        session (AsyncSession): The session the stream runs on.
+    """
+    info = session.sync_session.info
+    info[_OPEN_STREAMS_KEY] = info.get(_OPEN_STREAMS_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        info[_OPEN_STREAMS_KEY] -= 1
+
+
+class ReleasingAsyncSession(AsyncSession):
+    """
+    AsyncSession giving its pool connection back as soon as a read is finished.
+
+    A session only checks a connection out on its first statement, but the implicit
+    transaction started then keeps it until the request ends. This session commits
+    that implicit transaction right after a plain SELECT when nothing else is in
+    flight: no pending ORM changes, no DML executed since the transaction began,
+    no explicit or nested transaction, no unit of work and no open stream. Pool
+    occupancy then follows actual database time instead of the whole request
+    duration. Results are fully buffered and expire_on_commit is disabled, so
+    loaded rows and objects stay usable.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        event.listen(self.sync_session, "after_flush", _on_after_flush)
+        event.listen(self.sync_session, "after_transaction_end", _on_after_transaction_end)
+
+    def _is_releasable(self) -> bool:
+        sync_session = self.sync_session
+        transaction = sync_session.get_transaction()
+        return (
+            transaction is not None
+            and transaction.origin is SessionTransactionOrigin.AUTOBEGIN
+            and not sync_session.in_nested_transaction()
+            and not in_unit_of_work(self)
+            and not sync_session.info.get(_OPEN_STREAMS_KEY)
+            and not sync_session.info.get(_WROTE_KEY)
+            and not self._has_pending()
+        )
+
+    async def _release_after(self, statement: Any, had_pending: bool) -> None:
+        if not isinstance(statement, Select) or statement._for_update_arg is not None:
+            self.sync_session.info[_WROTE_KEY] = True
+            return
+
+        if not had_pending and self._is_releasable():
+            await self.commit()
+
+    def _has_pending(self) -> bool:
+        return bool(self.sync_session.new or self.sync_session.dirty or self.sync_session.deleted)
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        """Execute a statement and release the connection if it was a standalone read."""
+        had_pending = self._has_pending()
+        result = await super().execute(statement, *args, **kwargs)
+        await self._release_after(statement, had_pending)
+        return result
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        """Execute a statement returning a scalar and release the connection if it was a standalone read."""
+        had_pending = self._has_pending()
+        result = await super().scalar(statement, *args, **kwargs)
+        await self._release_after(statement, had_pending)
+        return result
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        """Load an instance by primary key and release the connection if nothing else is in flight."""
+        had_pending = self._has_pending()
+        instance = await super().get(*args, **kwargs)
+        if not had_pending and self._is_releasable():
+            await self.commit()
+        return instance
@@ -1,20 +1,36 @@
-from collections.abc import AsyncGenerator, AsyncIterable
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
+from typing import Any
 
 from aiobotocore.client import AioBaseClient
 from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
+from asgi_correlation_id import correlation_id
 from dishka import Provider, Scope, provide
 from dishka import from_context as context
 from httpx import AsyncClient, Timeout
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from structlog import BoundLogger, get_logger
 
-from src.common.interfaces import CustomLoggerProto, SecurityGatewayProto
+from src.common.domain.enums import CacheBackendEnum
+from src.common.interfaces import CustomLoggerProto, ReadThroughCacheProto, SecurityGatewayProto, UowProto
 from src.config import Configs
-from src.infrastructure.database.factory import create_database_adapter
+from src.infrastructure.cache.backends import CacheBackendProto, MemoryCacheBackend, RedisCacheBackend
+from src.infrastructure.cache.cache import ReadThroughCache
+from src.infrastructure.context import RequestContext
+from src.infrastructure.database.factory import (
+    SqlAlchemyUnitOfWork,
+    create_database_adapter,
+    create_replica_adapters,
+)
 from src.infrastructure.database.memory.database import MemoryDatabase
+from src.infrastructure.database.profiling import StatementCounter
+from src.infrastructure.database.routing import ReplicaEngines, RoutingSession
+from src.infrastructure.database.session import ReleasingAsyncSession
 from src.infrastructure.logger.adapter import CustomLoggerAdapter
 from src.infrastructure.security.adapter import SecurityAdapter
+from src.infrastructure.security.cache import VerifiedTokenCache
+from src.infrastructure.security.hashing import PasswordHashingExecutor
 
 
 class ConfigProvider(Provider):
@@ -24,12 +40,34 @@ class ConfigProvider(Provider):
 
 
 class SecurityProvider(Provider):
-    scope = Scope.REQUEST
+    scope = Scope.APP
+
+    @provide
+    def provide_password_hashing_executor(self, config: Configs) -> Iterable[PasswordHashingExecutor]:
+        """Provides the dedicated password hashing executor and shuts it down with the application."""
+        executor = PasswordHashingExecutor(
+            workers=config.auth.jwt.password_hash_workers,
+            queue_size=config.auth.jwt.password_hash_queue_size,
+            retry_after=config.auth.jwt.password_hash_retry_after_seconds,
+        )
+        yield executor
+        executor.shutdown()
+
+    @provide
+    def provide_token_cache(self, config: Configs) -> VerifiedTokenCache:
+        """Provides the worker-wide cache of verified JWT payloads."""
+        return VerifiedTokenCache(config.auth.jwt.verified_token_cache_size)
 
     @provide(provides=SecurityGatewayProto)
-    def provide_security_adapter(self, config: Configs, logger: CustomLoggerProto) -> SecurityGatewayProto:
+    def provide_security_adapter(
+        self,
+        config: Configs,
+        logger: CustomLoggerProto,
+        token_cache: VerifiedTokenCache,
+        hashing_executor: PasswordHashingExecutor,
+    ) -> SecurityGatewayProto:
         """Provides a SecurityAdapter instance configured with application settings."""
-        return SecurityAdapter(config, logger)
+        return SecurityAdapter(config, logger, token_cache, hashing_executor)
 
 
 class LoggingProvider(Provider):
@@ -104,20 +142,96 @@ class DatabaseProvider(Provider):
         yield engine
         await engine.dispose()
 
+    @provide(scope=Scope.APP)
+    async def provide_replica_engines(self, configs: Configs) -> AsyncIterable[ReplicaEngines]:
+        """Provides the engines of the configured read replicas for the application scope.
+
+        Args:
+            configs (Configs): The configuration settings.
+
+        Yields:
+            AsyncIterable[ReplicaEngines]: The replica engines, empty if no replica is configured.
+        """
+        engines = create_replica_adapters(config=configs.database)
+
+        yield ReplicaEngines(tuple(engines))
+        for engine in engines:
+            await engine.dispose()
+
     @provide(scope=Scope.REQUEST)
-    async def provide_db_session(self, engine: AsyncEngine, config: Configs) -> AsyncIterable[AsyncSession]:
+    async def provide_db_session(
+        self,
+        engine: AsyncEngine,
+        replicas: ReplicaEngines,
+        config: Configs,
+        logger: CustomLoggerProto,
+    ) -> AsyncIterable[AsyncSession]:
         """Provides a database session for the duration of a request.
 
+        The session gives its connection back to the pool after standalone reads. When read
+        replicas are configured, plain reads are routed to them until the session writes or
+        enters a unit of work. When profiling is enabled, the statements issued
+        through the session are counted and a warning is logged if the request exceeds its
+        statement budget or repeats the same statement with different parameters.
+
         Args:
             engine (AsyncEngine): The asynchronous database engine.
+            replicas (ReplicaEngines): The engines of the read replicas.
             config (Configs): The configuration settings.
+            logger (CustomLoggerProto): Logger used for the profiling warnings.
 
         Yields:
             AsyncIterable[AsyncSession]: An asynchronous session for database operations.
         """
         session_config = config.database.session
-        async with async_sessionmaker(engine, expire_on_commit=session_config.expire_on_commit)() as session:
-            yield session
+        profiling = config.database.profiling
+        session_options: dict[str, Any] = {}
+        if replicas.engines:
+            session_options = {
+                "sync_session_class": RoutingSession,
+                "replicas": [replica.sync_engine for replica in replicas.engines],
+            }
+
+        if session_config.release_connection_after_reads and not session_config.expire_on_commit:
+            session_options["class_"] = ReleasingAsyncSession
+
+        session_factory = async_sessionmaker(
+            engine, expire_on_commit=session_config.expire_on_commit, **session_options
+        )
+        async with session_factory() as session:
+            if not profiling.enabled:
+                yield session
+                return
+
+            counter = StatementCounter.for_session(session)
+            try:
+                yield session
+            finally:
+                counter.detach()
+                counter.report(
+                    logger,
+                    budget=profiling.statement_budget,
+                    repeat_threshold=profiling.repeated_statement_threshold,
+                    request_id=correlation_id.get() or "",
+                )
+
+    @provide(scope=Scope.REQUEST)
+    def provide_unit_of_work(self, session: AsyncSession, request_context: RequestContext) -> UowProto:
+        """Provides the unit of work of the request session.
+
+        Wrapping the calls of several services in it persists all their writes with a single
+        commit. Gateways inside it still flush their writes as they go, so conflicts surface in
+        the gateways that handle them; grouping the writes into the final flush is opt-in, see
+        the `batch_writes` argument of the gateways' units of work.
+
+        Args:
+            session (AsyncSession): The request database session.
+            request_context (RequestContext): The context of the current request.
+
+        Returns:
+            UowProto: A unit of work over the request session.
+        """
+        return SqlAlchemyUnitOfWork(session, request_context)
 
 
 class S3Provider(Provider):
@@ -136,6 +250,32 @@ class S3Provider(Provider):
             yield client
 
 
+class CacheProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def provide_cache_backend(self, config: Configs) -> AsyncIterable[CacheBackendProto]:
+        """Provides the shared tier of the read-through cache and closes its connections with the application."""
+        if config.cache.cache_backend == CacheBackendEnum.MEMORY:
+            yield MemoryCacheBackend()
+            return
+
+        client = Redis.from_url(
+            config.cache.cache_redis_url,
+            socket_timeout=config.cache.cache_socket_timeout_seconds,
+            socket_connect_timeout=config.cache.cache_socket_timeout_seconds,
+        )
+        yield RedisCacheBackend(client)
+        await client.aclose()
+
+    @provide(provides=ReadThroughCacheProto)
+    def provide_read_through_cache(
+        self, backend: CacheBackendProto, config: Configs, logger: CustomLoggerProto
+    ) -> ReadThroughCacheProto:
+        """Provides the worker-wide read-through cache of hotel and room read models."""
+        return ReadThroughCache(backend, config.cache, logger)
+
+
 class HttpProvider(Provider):
     @provide(scope=Scope.APP, provides=AsyncClient)
     async def provide_http_adapter(self) -> AsyncGenerator[AsyncClient]:
@@ -160,5 +300,6 @@ def get_infra_providers() -> list[Provider]:
         LoggingProvider(),
         S3Provider(),
         SecurityProvider(),
+        CacheProvider(),
         HttpProvider(),
     ]
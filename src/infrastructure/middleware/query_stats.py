@@ -0,0 +1,45 @@
+import structlog
+from asgi_correlation_id import correlation_id
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import create_configs
+from src.infrastructure.monitoring.database import track_request_queries
+from src.infrastructure.monitoring.metrics import db_queries_per_request
+
+config = create_configs()
+query_logger = structlog.stdlib.get_logger(config.logger.api_logger_name)
+
+
+class QueryStatsMiddleware:
+    """Count the database statements issued while handling each HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Track database usage of the request and report it once the response is sent.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_request_queries(correlation_id.get() or "") as stats:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                endpoint = getattr(scope.get("route"), "path", "unmatched")
+                db_queries_per_request.labels(method=scope["method"], endpoint=endpoint).observe(stats.queries)
+                query_logger.debug(
+                    "Request database usage",
+                    request_id=stats.request_id,
+                    method=scope["method"],
+                    endpoint=endpoint,
+                    queries=stats.queries,
+                    duration=round(stats.duration * 1000, 3),
+                )
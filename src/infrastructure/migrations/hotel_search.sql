@@ -0,0 +1,19 @@
+-- Full-text and trigram search of hotels, for databases created before it was added to
+-- the models. Run it with psql outside of a transaction: CREATE INDEX CONCURRENTLY
+-- cannot run inside one.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Computing the stored column rewrites the table under an exclusive lock, run it at a
+-- quiet time on large tables. The expression is HOTEL_SEARCH_VECTOR of
+-- src/apps/hotel/hotels/domain/models.py.
+ALTER TABLE hotels ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', name), 'A') || setweight(to_tsvector('russian', name), 'A') ||
+    setweight(to_tsvector('english', location), 'B') || setweight(to_tsvector('russian', location), 'B')
+) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hotels_search_vector ON hotels USING gin (search_vector);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hotels_name_trgm ON hotels USING gin (name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hotels_location_trgm ON hotels USING gin (location gin_trgm_ops);
+
+ANALYZE hotels;
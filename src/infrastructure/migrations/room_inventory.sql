@@ -0,0 +1,11 @@
+-- Per-room, per-day inventory ledger of the bookings, for databases created before it was
+-- added to the models. Run it with psql. The table starts empty: its rows are materialized
+-- from the active bookings the first time a booking touches a day, see RoomInventory of
+-- src/apps/hotel/bookings/domain/models.py.
+
+CREATE TABLE IF NOT EXISTS room_inventory (
+    room_id uuid NOT NULL REFERENCES rooms (id) ON DELETE CASCADE,
+    day date NOT NULL,
+    remaining integer NOT NULL,
+    PRIMARY KEY (room_id, day)
+);
@@ -0,0 +1,9 @@
+-- Version signals of hotels and rooms behind their ETags, for databases created before
+-- they were added to the models. Run it with psql; adding a column with a constant
+-- default does not rewrite the table.
+
+ALTER TABLE hotels ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1;
+ALTER TABLE hotels ADD COLUMN IF NOT EXISTS updated_at timestamp with time zone NOT NULL DEFAULT now();
+
+ALTER TABLE rooms ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1;
+ALTER TABLE rooms ADD COLUMN IF NOT EXISTS updated_at timestamp with time zone NOT NULL DEFAULT now();
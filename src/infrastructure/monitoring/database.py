@@ -0,0 +1,139 @@
+import re
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.monitoring.metrics import (
+    db_connections_active,
+    db_query_duration_seconds,
+    db_query_total,
+)
+
+_TABLE_PATTERNS = {
+    "select": re.compile(r"\bfrom\s+(?P<table>[\w.\"]+)", re.IGNORECASE),
+    "insert": re.compile(r"\binto\s+(?P<table>[\w.\"]+)", re.IGNORECASE),
+    "update": re.compile(r"^\s*update\s+(?P<table>[\w.\"]+)", re.IGNORECASE),
+    "delete": re.compile(r"\bfrom\s+(?P<table>[\w.\"]+)", re.IGNORECASE),
+}
+_STARTED_AT_KEY = "query_started_at"
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Database usage accumulated while handling a single request."""
+
+    request_id: str
+    queries: int = 0
+    duration: float = 0.0
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_request_queries(request_id: str) -> Generator[QueryStats]:
+    """
+    Collect the statements executed in the current context into a QueryStats object.
+
+    Args:
+        request_id (str): Correlation id of the request being handled.
+
+    Yields:
+        QueryStats: Statistics updated by the engine instrumentation as statements run.
+    """
+    stats = QueryStats(request_id=request_id)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+@lru_cache(maxsize=1024)
+def describe_statement(statement: str) -> tuple[str, str]:
+    """
+    Extract the operation and the main table of a SQL statement for metric labels.
+
+    Args:
+        statement (str): The SQL statement as sent to the driver.
+
+    Returns:
+        tuple[str, str]: Lower-cased operation and table name, "other"/"unknown" if not recognized.
+    """
+    words = statement.split(None, 1)
+    operation = words[0].lower() if words else "other"
+
+    pattern = _TABLE_PATTERNS.get(operation)
+    match = pattern.search(statement) if pattern is not None else None
+    if match is None:
+        return operation, "unknown"
+
+    return operation, match["table"].strip('"').lower()
+
+
+def _before_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+) -> None:
+    conn.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool
+) -> None:
+    duration = time.perf_counter() - conn.info[_STARTED_AT_KEY].pop()
+    _record(statement, duration, "success")
+
+
+def _handle_error(exception_context: Any) -> None:
+    conn = exception_context.connection
+    started_at = conn.info.get(_STARTED_AT_KEY) if conn is not None else None
+    if not started_at or exception_context.statement is None:
+        return
+
+    _record(exception_context.statement, time.perf_counter() - started_at.pop(), "failure")
+
+
+def _record(statement: str, duration: float, status: str) -> None:
+    operation, table = describe_statement(statement)
+    db_query_duration_seconds.labels(operation=operation, table=table).observe(duration)
+    db_query_total.labels(operation=operation, table=table, status=status).inc()
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.duration += duration
+
+
+def _on_checkout(*args: Any) -> None:
+    db_connections_active.inc()
+
+
+def _on_checkin(*args: Any) -> None:
+    db_connections_active.dec()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Emit statement and connection pool metrics for an engine.
+
+    Records per-statement latency and counts labelled by operation and table,
+    tracks checked out pool connections and feeds the QueryStats of the current
+    request, if any.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+    """
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    event.listen(sync_engine.pool, "checkout", _on_checkout)
+    event.listen(sync_engine.pool, "checkin", _on_checkin)
@@ -13,6 +13,12 @@ http_request_duration_seconds = Histogram(
     "http_request_duration_seconds", "HTTP request duration in seconds", ["method", "endpoint"]
 )
 
+http_requests_coalesced_total = Counter(
+    "http_requests_coalesced_total",
+    "Number of HTTP requests served with the response of an identical concurrent request",
+    ["method", "endpoint"],
+)
+
 # Database metrics
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds", "Database query duration in seconds", ["operation", "table"]
@@ -20,6 +26,13 @@ db_query_duration_seconds = Histogram(
 
 db_connections_active = Gauge("db_connections_active", "Number of active database connections")
 
+db_queries_per_request = Histogram(
+    "db_queries_per_request",
+    "Number of database statements issued per HTTP request",
+    ["method", "endpoint"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+
 db_query_total = Counter(
     "db_query_total", "Total number of database queries executed", ["operation", "table", "status"]
 )
@@ -29,6 +42,15 @@ cache_operations_total = Counter("cache_operations_total", "Total number of cach
 
 cache_hit_rate = Gauge("cache_hit_rate", "Cache hit rate percentage")
 
+# Password hashing metrics
+password_hash_queue_depth = Gauge(
+    "password_hash_queue_depth", "Number of password hashing operations waiting for a free worker"
+)
+
+password_hash_duration_seconds = Histogram(
+    "password_hash_duration_seconds", "Password hashing latency in seconds, including queue wait", ["operation"]
+)
+
 # Business metrics
 bookings_total = Counter("bookings_total", "Total number of bookings made", ["status", "hotel_id"])
 
@@ -1,6 +1,7 @@
 import hashlib
 import secrets
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -13,17 +14,27 @@ from jose import JWTError, jwt
 from src.apps.authentication.session.domain.enums import AuthTokenTypeEnum
 from src.common.interfaces import CustomLoggerProto, SecurityGatewayProto
 from src.config import Configs
+from src.infrastructure.security.cache import VerifiedTokenCache
 from src.infrastructure.security.exceptions import (
     ExpiredTokenError,
     InvalidTokenError,
     InvalidTokenTypeError,
 )
+from src.infrastructure.security.hashing import PasswordHashingExecutor
 
 
 class SecurityAdapter(SecurityGatewayProto):
-    def __init__(self, config: Configs, logger: CustomLoggerProto) -> None:
+    def __init__(
+        self,
+        config: Configs,
+        logger: CustomLoggerProto,
+        token_cache: VerifiedTokenCache | None = None,
+        hashing_executor: PasswordHashingExecutor | None = None,
+    ) -> None:
         self.config = config
         self.logger = logger
+        self.token_cache = token_cache
+        self.hashing_executor = hashing_executor
 
         self.hasher = PasswordHasher(
             time_cost=3,
@@ -31,6 +42,13 @@ class SecurityAdapter(SecurityGatewayProto):
             parallelism=1,
         )
 
+    async def _run_hashing[Result](self, operation: str, func: Callable[..., Result], *args: Any) -> Result:
+        """Run a password hashing function on the dedicated executor, if one is configured."""
+        if self.hashing_executor is None:
+            return await run_in_threadpool(func, *args)
+
+        return await self.hashing_executor.run(operation, func, *args)
+
     async def hash_password(self, plain_password: str) -> str:
         """
         Get the hashed password.
@@ -40,12 +58,15 @@ class SecurityAdapter(SecurityGatewayProto):
 
         Returns:
             str: The hashed password.
+
+        Raises:
+            PasswordHashingBusyError: If the password hashing executor is saturated.
         """
 
         def _hash_password(password: str) -> str:
             return self.hasher.hash(password)
 
-        return await run_in_threadpool(_hash_password, plain_password)
+        return await self._run_hashing("hash", _hash_password, plain_password)
 
     async def verify_hashed_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -57,6 +78,9 @@ class SecurityAdapter(SecurityGatewayProto):
 
         Returns:
             bool: True if the password matches the hash, otherwise False.
+
+        Raises:
+            PasswordHashingBusyError: If the password hashing executor is saturated.
         """
 
         def _verify_password(plain: str, hashed: str) -> bool:
@@ -69,7 +93,7 @@ class SecurityAdapter(SecurityGatewayProto):
                 self.logger.error("[SecurityAdapter] Password hash verification error")
                 return False
 
-        return await run_in_threadpool(_verify_password, plain_password, hashed_password)
+        return await self._run_hashing("verify", _verify_password, plain_password, hashed_password)
 
     async def create_jwt_token(
         self,
@@ -114,6 +138,7 @@ class SecurityAdapter(SecurityGatewayProto):
 
         This method verifies and decodes a JSON Web Token (JWT) using the configured
         secret key and algorithm. If the access_token format is invalid, an exception is raised.
+        Tokens already verified by this worker are served from the token cache until they expire.
 
         Args:
             token (str): The JWT access_token to decode.
@@ -124,6 +149,10 @@ class SecurityAdapter(SecurityGatewayProto):
         Raises:
             JWTError: If the access_token is invalid or cannot be decoded.
         """
+        if self.token_cache is not None:
+            payload = self.token_cache.get(token)
+            if payload is not None:
+                return payload
 
         def _decode_jwt() -> Any:
             try:
@@ -139,7 +168,11 @@ class SecurityAdapter(SecurityGatewayProto):
                 )
                 raise InvalidTokenError from None
 
-        return await run_in_threadpool(_decode_jwt)
+        payload = await run_in_threadpool(_decode_jwt)
+        if self.token_cache is not None:
+            self.token_cache.put(token, payload)
+
+        return payload
 
     async def verify_token(self, token: str, token_type: AuthTokenTypeEnum) -> UUID:
         """
@@ -0,0 +1,87 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.infrastructure.monitoring.metrics import cache_operations_total
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified JWT payloads.
+
+    Entries are keyed by a SHA-256 digest of the raw token, so the tokens themselves
+    are never kept in memory, and expire together with the token's ``exp`` claim.
+    The cache is shared by all requests of a worker; only tokens whose signature
+    was verified are ever stored.
+    """
+
+    metric_operation = "jwt_verify"
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens."""
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Any | None:
+        """
+        Return the cached payload of a token.
+
+        Args:
+            token (str): The raw JWT.
+
+        Returns:
+            Any | None: The verified payload, or None if the token is unknown or expired.
+        """
+        key = self._key(token)
+        entry = self._entries.get(key)
+
+        if entry is not None and entry[0] <= time.time():
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            cache_operations_total.labels(operation=self.metric_operation, status="miss").inc()
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        cache_operations_total.labels(operation=self.metric_operation, status="hit").inc()
+        return entry[1]
+
+    def put(self, token: str, payload: Any) -> None:
+        """
+        Store the payload of a verified token until the token expires.
+
+        Tokens without a numeric ``exp`` claim are not cached.
+
+        Args:
+            token (str): The raw JWT.
+            payload (Any): The verified payload of the token.
+        """
+        expires_at = payload.get("exp") if isinstance(payload, dict) else None
+        if not isinstance(expires_at, int | float) or expires_at <= time.time() or self._max_size <= 0:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (float(expires_at), payload)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
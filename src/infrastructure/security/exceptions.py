@@ -29,3 +29,14 @@ class TokenIsMissingError(BaseError):
 
     status_code = status.HTTP_401_UNAUTHORIZED
     detail = "Token is missing."
+
+
+class PasswordHashingBusyError(BaseError):
+    """Exception raised when too many password hashing operations are already queued."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    message = "Service is busy, please retry later."
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__()
+        self.headers = {"Retry-After": f"{retry_after}"}
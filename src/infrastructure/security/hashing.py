@@ -0,0 +1,61 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from src.infrastructure.monitoring.metrics import password_hash_duration_seconds, password_hash_queue_depth
+from src.infrastructure.security.exceptions import PasswordHashingBusyError
+
+
+class PasswordHashingExecutor:
+    """
+    Dedicated, bounded thread pool for Argon2 hashing and verification.
+
+    Keeps memory-hard hashing off the shared anyio threadpool and applies admission
+    control: once ``workers + queue_size`` operations are in flight, new ones are
+    rejected with PasswordHashingBusyError instead of piling up.
+    """
+
+    def __init__(self, workers: int, queue_size: int, retry_after: int) -> None:
+        self._workers = workers
+        self._capacity = workers + queue_size
+        self._retry_after = retry_after
+        self._in_flight = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of operations waiting for a free worker."""
+        return max(self._in_flight - self._workers, 0)
+
+    async def run[Result](self, operation: str, func: Callable[..., Result], *args: object) -> Result:
+        """
+        Run a hashing function on the dedicated pool.
+
+        Args:
+            operation (str): Operation name used as a metric label.
+            func (Callable[..., Result]): The blocking function to run.
+            *args (object): Positional arguments for the function.
+
+        Returns:
+            Result: The value returned by the function.
+
+        Raises:
+            PasswordHashingBusyError: If the pool and its queue are saturated.
+        """
+        if self._in_flight >= self._capacity:
+            raise PasswordHashingBusyError(self._retry_after)
+
+        self._in_flight += 1
+        password_hash_queue_depth.set(self.queue_depth)
+        started_at = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            password_hash_queue_depth.set(self.queue_depth)
+            password_hash_duration_seconds.labels(operation=operation).observe(time.perf_counter() - started_at)
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping operations that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
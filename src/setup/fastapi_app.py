@@ -1,9 +1,11 @@
+from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import FastAPI
 
 from src.common.controllers.http.api_v1 import http_router_v1
 from src.common.exceptions.common import BaseError
 from src.common.exceptions.handlers import general_exception_handler
 from src.infrastructure.logger.factory import setup_logging
+from src.infrastructure.middleware.query_stats import QueryStatsMiddleware
 from src.infrastructure.monitoring import setup_metrics
 from src.setup.common import app_config
 
@@ -35,6 +37,8 @@ def create_fastapi_app() -> FastAPI:
     # )
 
     # Middleware Configuration
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(CorrelationIdMiddleware)
 
     # Exception handling
     app.add_exception_handler(BaseError, general_exception_handler)
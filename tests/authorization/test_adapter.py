@@ -0,0 +1,96 @@
+import uuid
+
+import pytest
+
+from src.apps.authorization.access.application.interfaces.gateway import AccessGatewayProto
+from src.apps.authorization.access.domain.enums import ResourceTypeEnum
+from src.apps.authorization.access.domain.exceptions import ResourceNotFoundError
+from src.apps.authorization.role.domain.enums import UserRoleEnum
+from src.apps.hotel.hotels.domain.models import Hotel
+from tests.fixtures.mocks import MockHotel, MockUser
+from tests.fixtures.queries import count_statements
+
+
+@pytest.fixture
+async def access_adapter(request_container) -> AccessGatewayProto:
+    """Create an access adapter for testing."""
+    return await request_container.get(AccessGatewayProto)
+
+
+@pytest.fixture
+def manager_hotels(manager) -> list[Hotel]:
+    """Create several hotels owned by the manager."""
+    return [
+        Hotel(
+            name=f"Managed Hotel {i}",
+            location="Test location",
+            services={"wifi": True},
+            rooms_quantity=10,
+            owner=manager.id,
+        )
+        for i in range(3)
+    ]
+
+
+@pytest.fixture
+def user_hotel(user) -> Hotel:
+    """Create a hotel owned by the regular user."""
+    return Hotel(
+        name="User Hotel",
+        location="Test location",
+        services={},
+        rooms_quantity=1,
+        owner=user.id,
+    )
+
+
+@pytest.fixture(autouse=True)
+async def mock_data(save_instances, user, manager, manager_hotels, user_hotel) -> None:
+    """Save required dependencies to database for tests."""
+    await save_instances(MockUser([user, manager]))
+    await save_instances(MockHotel([*manager_hotels, user_hotel]))
+
+
+@pytest.mark.anyio
+class TestAccessAdapter:
+    async def test_is_resource_owner(self, access_adapter, sqlalchemy_engine, manager, user, manager_hotels):
+        """Test that ownership is resolved in a single statement for owners and non-owners."""
+        hotel = manager_hotels[0]
+
+        with count_statements(sqlalchemy_engine) as statements:
+            assert await access_adapter.is_resource_owner(manager.id, ResourceTypeEnum.HOTEL, hotel.id)
+
+        assert len(statements) == 1
+        assert not await access_adapter.is_resource_owner(user.id, ResourceTypeEnum.HOTEL, hotel.id)
+
+    async def test_is_resource_owner_not_found(self, access_adapter, manager):
+        """Test that checking ownership of a missing resource raises an error."""
+        with pytest.raises(ResourceNotFoundError):
+            await access_adapter.is_resource_owner(manager.id, ResourceTypeEnum.HOTEL, uuid.uuid4())
+
+    async def test_get_denied_resource_ids(
+        self, access_adapter, sqlalchemy_engine, manager, manager_hotels, user_hotel
+    ):
+        """Test that the batched check returns the existing resources not owned in a single statement."""
+        hotel_ids = [hotel.id for hotel in manager_hotels]
+
+        with count_statements(sqlalchemy_engine) as statements:
+            denied = await access_adapter.get_denied_resource_ids(
+                manager.id,
+                UserRoleEnum.MANAGER,
+                ResourceTypeEnum.HOTEL,
+                [*hotel_ids, user_hotel.id, uuid.uuid4()],
+            )
+
+        assert denied == {user_hotel.id}
+        assert len(statements) == 1
+
+    async def test_get_denied_resource_ids_admin(self, access_adapter, sqlalchemy_engine, manager, user_hotel):
+        """Test that admins are denied no resource, without any query."""
+        with count_statements(sqlalchemy_engine) as statements:
+            denied = await access_adapter.get_denied_resource_ids(
+                manager.id, UserRoleEnum.ADMIN, ResourceTypeEnum.HOTEL, [user_hotel.id, uuid.uuid4()]
+            )
+
+        assert denied == set()
+        assert not statements
@@ -0,0 +1,188 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.authentication.user.domain.models import AuthStatus, User
+from src.apps.authorization.access.application.cache import RolePermissionsCache
+from src.apps.authorization.access.application.service import AccessService
+from src.apps.authorization.access.domain.commands import Authorize
+from src.apps.authorization.access.domain.enums import HotelPermissionEnum, ResourceTypeEnum
+from src.apps.authorization.access.domain.exceptions import Forbidden
+from src.apps.authorization.access.domain.models import Permission
+from src.apps.authorization.role.application.service import RoleManagementService
+from src.apps.authorization.role.domain.commands import AssignPermissionsToRole
+from src.apps.hotel.bookings.domain.models import Booking
+from src.apps.hotel.hotels.domain.models import Hotel
+from src.apps.hotel.rooms.domain.models import Room
+from tests.fixtures.mocks import MockBooking, MockHotel, MockRoom, MockUser
+from tests.fixtures.queries import count_statements
+
+PRINCIPAL_STATEMENTS = 1
+PERMISSIONS_SNAPSHOT_STATEMENTS = 1
+
+
+@pytest.fixture
+async def access_service(request_container) -> AccessService:
+    """Create an access service for testing."""
+    return await request_container.get(AccessService)
+
+
+@pytest.fixture
+def manager_hotels(manager) -> list[Hotel]:
+    """Create several hotels owned by the manager."""
+    return [
+        Hotel(
+            name=f"Managed Hotel {i}",
+            location="Test location",
+            services={"wifi": True},
+            rooms_quantity=10,
+            owner=manager.id,
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture(autouse=True)
+async def mock_data(save_instances, user, manager, manager_hotels) -> None:
+    """Save required dependencies to database for tests."""
+    await save_instances(MockUser([user, manager]))
+    await save_instances(MockHotel(manager_hotels))
+
+
+@pytest.mark.anyio
+class TestAccessService:
+    async def test_authorize_permission_success(self, access_service, valid_manager_token, manager):
+        """Test authorizing a permission that is granted to the user's role."""
+        cmd = Authorize(
+            access_token=valid_manager_token,
+            permission=HotelPermissionEnum.CAN_CREATE,
+            resource_type=ResourceTypeEnum.HOTEL,
+        )
+
+        result = await access_service.authorize(cmd)
+
+        assert result.user_id == manager.id
+
+    async def test_authorize_permission_forbidden(self, access_service, valid_user_token):
+        """Test authorizing a permission that is not granted to the user's role."""
+        cmd = Authorize(
+            access_token=valid_user_token,
+            permission=HotelPermissionEnum.CAN_CREATE,
+            resource_type=ResourceTypeEnum.HOTEL,
+        )
+
+        with pytest.raises(Forbidden):
+            await access_service.authorize(cmd)
+
+    async def test_authorize_blocked_user_forbidden(
+        self, access_service, request_container, valid_manager_token, manager
+    ):
+        """Test that a blocked user is not authorized."""
+        session = await request_container.get(AsyncSession)
+        await session.execute(update(AuthStatus).where(AuthStatus.user_id == manager.id).values(is_blocked=True))
+        await session.commit()
+
+        cmd = Authorize(
+            access_token=valid_manager_token,
+            permission=HotelPermissionEnum.CAN_CREATE,
+            resource_type=ResourceTypeEnum.HOTEL,
+        )
+
+        with pytest.raises(Forbidden):
+            await access_service.authorize(cmd)
+
+    async def test_authorize_statement_count_is_constant(
+        self, access_service, request_container, save_instances, sqlalchemy_engine, valid_manager_token, manager
+    ):
+        """Test that authorizing issues the same statements however much data the user and the role have."""
+        cmd = Authorize(
+            access_token=valid_manager_token,
+            permission=HotelPermissionEnum.CAN_CREATE,
+            resource_type=ResourceTypeEnum.HOTEL,
+        )
+        permissions_cache = await request_container.get(RolePermissionsCache)
+
+        async def _count_statements() -> tuple[int, int]:
+            permissions_cache.invalidate()
+            with count_statements(sqlalchemy_engine) as cold:
+                await access_service.authorize(cmd)
+            with count_statements(sqlalchemy_engine) as warm:
+                await access_service.authorize(cmd)
+            return len(cold), len(warm)
+
+        assert await _count_statements() == (
+            PRINCIPAL_STATEMENTS + PERMISSIONS_SNAPSHOT_STATEMENTS,
+            PRINCIPAL_STATEMENTS,
+        )
+
+        # Grow everything the user graph used to fan out into: hotels, rooms, bookings and role members
+        hotels = [
+            Hotel(name=f"Volume Hotel {i}", location="Volume", services=None, rooms_quantity=10, owner=manager.id)
+            for i in range(50)
+        ]
+        rooms = [
+            Room(
+                hotel_id=hotel.id,
+                owner=manager.id,
+                name=f"Volume Room {i}",
+                description=None,
+                price=Decimal("100.00"),
+                quantity=5,
+                services=None,
+            )
+            for hotel in hotels
+            for i in range(4)
+        ]
+        today = date.today()
+        bookings = [
+            Booking(
+                room_id=room.id,
+                user_id=manager.id,
+                date_from=today + timedelta(days=i * 3 + 1),
+                date_to=today + timedelta(days=i * 3 + 3),
+                price=room.price,
+            )
+            for room in rooms
+            for i in range(2)
+        ]
+        role_members = [
+            User(email=f"volume_{i}@mail.com", hashed_password="hashed", role_id=manager.role_id, name=f"volume_{i}")
+            for i in range(100)
+        ]
+        await save_instances(MockUser(role_members))
+        await save_instances(MockHotel(hotels))
+        await save_instances(MockRoom(rooms))
+        await save_instances(MockBooking(bookings))
+
+        assert await _count_statements() == (
+            PRINCIPAL_STATEMENTS + PERMISSIONS_SNAPSHOT_STATEMENTS,
+            PRINCIPAL_STATEMENTS,
+        )
+
+    async def test_assigning_permissions_invalidates_cached_snapshot(
+        self, access_service, request_container, valid_user_token, user
+    ):
+        """Test that a permission granted to a role takes effect without waiting for the cache to expire."""
+        cmd = Authorize(
+            access_token=valid_user_token,
+            permission=HotelPermissionEnum.CAN_CREATE,
+            resource_type=ResourceTypeEnum.HOTEL,
+        )
+        with pytest.raises(Forbidden):
+            await access_service.authorize(cmd)
+
+        session = await request_container.get(AsyncSession)
+        permission_id = await session.scalar(
+            select(Permission.id).filter_by(name=HotelPermissionEnum.CAN_CREATE, resource_type=ResourceTypeEnum.HOTEL)
+        )
+        role_service = await request_container.get(RoleManagementService)
+        await role_service.assign_permissions_to_role(
+            AssignPermissionsToRole(role_id=user.role_id, permissions=[permission_id])
+        )
+
+        result = await access_service.authorize(cmd)
+
+        assert result.user_id == user.id
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from datetime import date, timedelta
 
@@ -6,6 +7,7 @@ import pytest
 from src.apps.hotel.bookings.adapters.adapter import BookingAdapter
 from src.apps.hotel.bookings.domain.enums import BookingStatusEnum
 from src.apps.hotel.bookings.domain.models import Booking
+from src.apps.hotel.rooms.adapters.adapter import RoomAdapter
 from tests.fixtures.mocks import MockBooking, MockHotel, MockRoom, MockUser
 
 
@@ -60,16 +62,16 @@ class TestBookingAdapter:
         """Test getting all bookings for a user."""
         result = await booking_adapter.get_bookings(user_id=user.id)
 
-        assert isinstance(result, list)
-        assert len(result) >= len(bookings)
-        assert all(isinstance(booking, Booking) for booking in result)
+        assert isinstance(result.items, list)
+        assert len(result.items) >= len(bookings)
+        assert all(isinstance(booking, Booking) for booking in result.items)
 
     async def test_get_bookings_by_status(self, booking_adapter, user, sample_booking):
         """Test getting bookings by status."""
         result = await booking_adapter.get_bookings(user_id=user.id, status=BookingStatusEnum.PENDING)
 
-        assert len(result) >= 1
-        assert all(booking.status == BookingStatusEnum.PENDING for booking in result)
+        assert len(result.items) >= 1
+        assert all(booking.status == BookingStatusEnum.PENDING for booking in result.items)
 
     async def test_get_active_bookings(self, booking_adapter, user, sample_booking, confirmed_booking):
         """Test getting active bookings."""
@@ -175,4 +177,223 @@ class TestBookingAdapter:
         today = date.today()
         result = await booking_adapter.get_bookings(user_id=user.id, date_from=today + timedelta(days=7))
 
-        assert all(booking.date_from >= today + timedelta(days=7) for booking in result)
+        assert all(booking.date_from >= today + timedelta(days=7) for booking in result.items)
+
+    async def test_add_booking_concurrent_requests_never_oversell(
+        self, app_container, mock_test_config, booking_adapter, user, existing_room
+    ):
+        """Test that hundreds of concurrent bookings of the same room never exceed its quantity."""
+        today = date.today()
+        date_from = today + timedelta(days=40)
+        date_to = today + timedelta(days=43)
+        engine_config = mock_test_config.database.engine
+        # As many requests in flight as the pool can serve, the others wait for a connection
+        in_flight = asyncio.Semaphore(engine_config.pool_size + engine_config.max_overflow)
+
+        async def _book() -> Booking | None:
+            async with in_flight, app_container() as container:
+                adapter = await container.get(BookingAdapter)
+                return await adapter.add_booking(
+                    user_id=user.id,
+                    room_id=existing_room.id,
+                    date_from=date_from,
+                    date_to=date_to,
+                )
+
+        results = await asyncio.gather(*(_book() for _ in range(400)))
+
+        created = [booking for booking in results if booking is not None]
+        assert len(created) == existing_room.quantity
+        assert await booking_adapter.get_free_rooms_left(existing_room.id, date_from, date_to) == 0
+
+    async def test_concurrent_cancel_and_rebook_keep_inventory_consistent(
+        self, app_container, booking_adapter, user, existing_room
+    ):
+        """Test that cancelling and re-confirming bookings of one room concurrently never oversells it."""
+        today = date.today()
+        date_from = today + timedelta(days=80)
+        date_to = today + timedelta(days=82)
+        cancelled = []
+        for _ in range(5):
+            booking = await booking_adapter.add_booking(
+                user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_to
+            )
+            await booking_adapter.update_booking(booking, status=BookingStatusEnum.CANCELLED)
+            cancelled.append(booking.id)
+        active = [
+            (
+                await booking_adapter.add_booking(
+                    user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_to
+                )
+            ).id
+            for _ in range(existing_room.quantity)
+        ]
+
+        async def _set_status(booking_id: uuid.UUID, status: BookingStatusEnum) -> None:
+            async with app_container() as container:
+                adapter = await container.get(BookingAdapter)
+                booking = await adapter.get_booking_by_id(booking_id)
+                await adapter.update_booking(booking, status=status)
+
+        await asyncio.gather(
+            *(_set_status(booking_id, BookingStatusEnum.CANCELLED) for booking_id in active),
+            *(_set_status(booking_id, BookingStatusEnum.CONFIRMED) for booking_id in cancelled),
+        )
+
+        async with app_container() as container:
+            adapter = await container.get(BookingAdapter)
+            still_active = await adapter.get_active_bookings(room_id=existing_room.id, date_from=date_from)
+            free = await adapter.get_free_rooms_left(existing_room.id, date_from, date_to)
+        assert len(still_active) <= existing_room.quantity
+        assert free == existing_room.quantity - len(still_active)
+
+    async def test_cancel_booking_releases_inventory(self, booking_adapter, user, existing_room):
+        """Test that cancelling a booking gives its room back."""
+        today = date.today()
+        date_from = today + timedelta(days=50)
+        date_to = today + timedelta(days=52)
+
+        booking = await booking_adapter.add_booking(
+            user_id=user.id,
+            room_id=existing_room.id,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        assert (
+            await booking_adapter.get_free_rooms_left(existing_room.id, date_from, date_to)
+            == existing_room.quantity - 1
+        )
+
+        await booking_adapter.update_booking(booking, status=BookingStatusEnum.CANCELLED)
+
+        assert await booking_adapter.get_free_rooms_left(existing_room.id, date_from, date_to) == existing_room.quantity
+
+    async def test_confirm_cancelled_booking_reserves_inventory(self, booking_adapter, user, existing_room):
+        """Test that re-confirming a cancelled booking takes its room again."""
+        today = date.today()
+        date_from = today + timedelta(days=55)
+        date_to = today + timedelta(days=57)
+        booking = await booking_adapter.add_booking(
+            user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_to
+        )
+        await booking_adapter.update_booking(booking, status=BookingStatusEnum.CANCELLED)
+
+        updated_id = await booking_adapter.update_booking(booking, status=BookingStatusEnum.CONFIRMED)
+
+        assert updated_id == booking.id
+        assert booking.status == BookingStatusEnum.CONFIRMED
+        assert (
+            await booking_adapter.get_free_rooms_left(existing_room.id, date_from, date_to)
+            == existing_room.quantity - 1
+        )
+
+    async def test_confirm_cancelled_booking_of_full_room(self, app_container, booking_adapter, user, existing_room):
+        """Test that a cancelled booking cannot be re-confirmed once its room is full, and stays cancelled."""
+        today = date.today()
+        date_from = today + timedelta(days=60)
+        date_to = today + timedelta(days=62)
+        booking = await booking_adapter.add_booking(
+            user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_to
+        )
+        await booking_adapter.update_booking(booking, status=BookingStatusEnum.CANCELLED)
+        for _ in range(existing_room.quantity):
+            await booking_adapter.add_booking(
+                user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_to
+            )
+
+        updated_id = await booking_adapter.update_booking(booking, status=BookingStatusEnum.CONFIRMED)
+
+        assert updated_id is None
+        assert booking.status == BookingStatusEnum.CANCELLED
+        assert await booking_adapter.get_free_rooms_left(existing_room.id, date_from, date_to) == 0
+        async with app_container() as container:
+            stored = await (await container.get(BookingAdapter)).get_booking_by_id(booking.id)
+        assert stored.status == BookingStatusEnum.CANCELLED
+
+    async def test_move_active_booking_moves_inventory(self, booking_adapter, user, existing_room):
+        """Test that moving an active booking gives back its old days and takes the new ones."""
+        today = date.today()
+        date_from = today + timedelta(days=100)
+        booking = await booking_adapter.add_booking(
+            user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_from + timedelta(days=2)
+        )
+
+        updated_id = await booking_adapter.update_booking(
+            booking, date_from=date_from + timedelta(days=1), date_to=date_from + timedelta(days=4)
+        )
+
+        assert updated_id == booking.id
+        quantity = existing_room.quantity
+        free = [
+            await booking_adapter.get_free_rooms_left(existing_room.id, day, day + timedelta(days=1))
+            for day in (date_from + timedelta(days=offset) for offset in range(5))
+        ]
+        assert free == [quantity, quantity - 1, quantity - 1, quantity - 1, quantity]
+
+    async def test_move_active_booking_to_full_days(self, booking_adapter, user, existing_room):
+        """Test that an active booking cannot be moved to full days and keeps holding its own."""
+        today = date.today()
+        date_from = today + timedelta(days=110)
+        date_to = today + timedelta(days=112)
+        booking = await booking_adapter.add_booking(
+            user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_to
+        )
+        full_from = today + timedelta(days=120)
+        full_to = today + timedelta(days=122)
+        for _ in range(existing_room.quantity):
+            await booking_adapter.add_booking(
+                user_id=user.id, room_id=existing_room.id, date_from=full_from, date_to=full_to
+            )
+
+        updated_id = await booking_adapter.update_booking(booking, date_from=full_from, date_to=full_to)
+
+        assert updated_id is None
+        assert (booking.date_from, booking.date_to) == (date_from, date_to)
+        assert (
+            await booking_adapter.get_free_rooms_left(existing_room.id, date_from, date_to)
+            == existing_room.quantity - 1
+        )
+        assert await booking_adapter.get_free_rooms_left(existing_room.id, full_from, full_to) == 0
+
+    async def test_concurrent_quantity_edits_keep_inventory_in_sync(
+        self, app_container, booking_adapter, user, existing_room
+    ):
+        """Test that concurrent quantity edits of a room leave its ledger matching the stored quantity."""
+        today = date.today()
+        date_from = today + timedelta(days=90)
+        date_to = today + timedelta(days=92)
+        await booking_adapter.add_booking(
+            user_id=user.id, room_id=existing_room.id, date_from=date_from, date_to=date_to
+        )
+
+        async def _set_quantity(quantity: int) -> None:
+            async with app_container() as container:
+                adapter = await container.get(RoomAdapter)
+                room = await adapter.get_room(existing_room.id)
+                await adapter.update_room(room, quantity=quantity)
+
+        await asyncio.gather(*(_set_quantity(quantity) for quantity in (5, 7, 9, 11)))
+
+        async with app_container() as container:
+            room = await (await container.get(RoomAdapter)).get_room(existing_room.id)
+            free = await (await container.get(BookingAdapter)).get_free_rooms_left(existing_room.id, date_from, date_to)
+        assert free == room.quantity - 1
+
+    async def test_search_available_rooms_excludes_fully_booked(self, booking_adapter, user, existing_room):
+        """Test that a fully booked room is not returned by the availability search."""
+        today = date.today()
+        date_from = today + timedelta(days=70)
+        date_to = today + timedelta(days=72)
+
+        for _ in range(existing_room.quantity):
+            await booking_adapter.add_booking(
+                user_id=user.id,
+                room_id=existing_room.id,
+                date_from=date_from,
+                date_to=date_to,
+            )
+
+        result = await booking_adapter.search_available_rooms(date_from, date_to)
+
+        assert existing_room.id not in {item.room_id for item in result}
+        assert all(item.rooms_left >= 1 for item in result)
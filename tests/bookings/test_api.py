@@ -1,11 +1,16 @@
+import csv
+import io
 import uuid
 from datetime import date, timedelta
+from decimal import Decimal
 
+import orjson
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
 from tests.fixtures.mocks import MockBooking, MockHotel, MockRoom, MockUser
+from tests.fixtures.queries import count_statements
 
 
 @pytest.fixture(autouse=True)
@@ -39,7 +44,7 @@ class TestBookingAPI:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) >= 1
 
@@ -160,5 +165,178 @@ class TestBookingAPI:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
+
+    async def test_get_bookings_query_count(self, http_client: AsyncClient, sqlalchemy_engine, valid_user_token):
+        """Test that listing bookings issues authorization statements plus a single select."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(
+                "/api/v1/bookings",
+                headers={"Authorization": f"Bearer {valid_user_token}"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 3
+
+    async def test_get_booking_by_id_query_count(
+        self, http_client: AsyncClient, sqlalchemy_engine, valid_user_token, sample_booking
+    ):
+        """Test that getting booking details issues authorization statements plus a single select."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(
+                f"/api/v1/bookings/{sample_booking.id}",
+                headers={"Authorization": f"Bearer {valid_user_token}"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 3
+
+    async def test_export_bookings_ndjson(self, http_client: AsyncClient, valid_manager_token, sample_booking):
+        """Test exporting the bookings of the manager's hotels as NDJSON."""
+        response = await http_client.get(
+            "/api/v1/bookings/export",
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [orjson.loads(line) for line in response.content.splitlines()]
+        assert len(rows) == 5
+        assert str(sample_booking.id) in {row["id"] for row in rows}
+
+    async def test_export_bookings_csv(self, http_client: AsyncClient, valid_manager_token):
+        """Test exporting the bookings of the manager's hotels as CSV with a header line."""
+        today = date.today()
+        response = await http_client.get(
+            "/api/v1/bookings/export",
+            params={"format": "csv", "date_from": (today + timedelta(days=5)).isoformat()},
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-disposition"] == 'attachment; filename="bookings.csv"'
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert rows
+        assert all(row["date_from"] >= (today + timedelta(days=5)).isoformat() for row in rows)
+
+    async def test_export_bookings_forbidden(self, http_client: AsyncClient, valid_user_token):
+        """Test that users without hotels management rights cannot export bookings."""
+        response = await http_client.get(
+            "/api/v1/bookings/export",
+            headers={"Authorization": f"Bearer {valid_user_token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.anyio
+class TestAvailabilityAPI:
+    async def test_search_availability(self, http_client: AsyncClient, hotel, rooms):
+        """Test searching free rooms of a location for a date range."""
+        today = date.today()
+        response = await http_client.get(
+            "/api/v1/availability/search",
+            params={
+                "location": hotel.location,
+                "date_from": str(today + timedelta(days=60)),
+                "date_to": str(today + timedelta(days=62)),
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert {item["room_id"] for item in data} == {str(room.id) for room in rooms}
+        assert all(item["hotel_id"] == str(hotel.id) for item in data)
+        assert all(item["rooms_left"] == 3 for item in data)
+
+    async def test_search_availability_price_range(self, http_client: AsyncClient, hotel, rooms):
+        """Test that the price range limits the search results and the total price covers the stay."""
+        today = date.today()
+        response = await http_client.get(
+            "/api/v1/availability/search",
+            params={
+                "location": hotel.location,
+                "date_from": str(today + timedelta(days=60)),
+                "date_to": str(today + timedelta(days=62)),
+                "rooms": 2,
+                "price_to": "105",
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["room_id"] == str(rooms[0].id)
+        assert Decimal(data[0]["total_price"]) == rooms[0].price * 2 * 2
+
+    async def test_search_availability_invalid_dates(self, http_client: AsyncClient):
+        """Test searching with date_to before date_from."""
+        today = date.today()
+        response = await http_client.get(
+            "/api/v1/availability/search",
+            params={
+                "date_from": str(today + timedelta(days=5)),
+                "date_to": str(today + timedelta(days=3)),
+            },
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_search_availability_single_statement(self, http_client: AsyncClient, sqlalchemy_engine, hotel):
+        """Test that a search is answered by a single query."""
+        today = date.today()
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(
+                "/api/v1/availability/search",
+                params={
+                    "date_from": str(today + timedelta(days=60)),
+                    "date_to": str(today + timedelta(days=62)),
+                },
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 1
+
+    async def test_availability_calendar_for_room(self, http_client: AsyncClient, existing_room, confirmed_booking):
+        """Test the per-day free counts of a room around an existing booking."""
+        date_from = confirmed_booking.date_from - timedelta(days=1)
+        date_to = confirmed_booking.date_to + timedelta(days=1)
+        response = await http_client.get(
+            "/api/v1/availability/calendar",
+            params={"room_id": str(existing_room.id), "date_from": str(date_from), "date_to": str(date_to)},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["room_id"] == str(existing_room.id)
+        assert data[0]["date_from"] == str(date_from)
+        assert data[0]["free"] == [3, 2, 2, 2, 2, 2, 3]
+
+    async def test_availability_calendar_for_hotel(self, http_client: AsyncClient, hotel, rooms):
+        """Test that a hotel calendar returns one array per room."""
+        today = date.today()
+        response = await http_client.get(
+            "/api/v1/availability/calendar",
+            params={
+                "hotel_id": str(hotel.id),
+                "date_from": str(today + timedelta(days=60)),
+                "date_to": str(today + timedelta(days=90)),
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert {item["room_id"] for item in data} == {str(room.id) for room in rooms}
+        assert all(item["free"] == [3] * 30 for item in data)
+
+    async def test_availability_calendar_requires_room_or_hotel(self, http_client: AsyncClient):
+        """Test that the calendar needs exactly one of room_id and hotel_id."""
+        today = date.today()
+        response = await http_client.get(
+            "/api/v1/availability/calendar",
+            params={"date_from": str(today), "date_to": str(today + timedelta(days=7))},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
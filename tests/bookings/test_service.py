@@ -81,15 +81,15 @@ class TestBookingService:
         cmd = commands.GetBookingsByStatusCommand(user_id=user.id, status=BookingStatusEnum.PENDING)
         result = await booking_service.get_bookings_by_status(cmd)
 
-        assert len(result) >= 1
-        assert all(booking.status == BookingStatusEnum.PENDING for booking in result)
+        assert len(result.items) >= 1
+        assert all(booking.status == BookingStatusEnum.PENDING for booking in result.items)
 
     async def test_list_bookings(self, booking_service, user, bookings):
         """Test listing bookings."""
         cmd = commands.ListBookingsCommand(user_id=user.id, room_id=None, date_from=None, date_to=None, status=None)
         result = await booking_service.list_bookings(cmd)
 
-        assert len(result) >= len(bookings)
+        assert len(result.items) >= len(bookings)
 
     async def test_create_booking_success(self, booking_service, user, existing_room):
         """Test creating a new booking."""
@@ -186,3 +186,44 @@ class TestBookingService:
         get_cmd = commands.GetBookingCommand(user_id=user.id, booking_id=cancelled_booking.id)
         with pytest.raises(exceptions.BookingNotFoundError):
             await booking_service.get_booking(get_cmd)
+
+    async def test_search_availability_invalid_dates(self, booking_service):
+        """Test searching availability for an empty date range."""
+        today = date.today()
+        cmd = commands.SearchAvailabilityCommand(
+            date_from=today + timedelta(days=5),
+            date_to=today + timedelta(days=5),
+        )
+
+        with pytest.raises(exceptions.InvalidBookingDatesError):
+            await booking_service.search_availability(cmd)
+
+    async def test_export_bookings(self, booking_service, manager, cancelled_booking):
+        """Test exporting the bookings of the hotels of an owner within a date range."""
+        today = date.today()
+        cmd = commands.ExportBookingsCommand(owner=manager.id, date_from=None, date_to=None)
+        rows = [row async for row in await booking_service.export_bookings(cmd)]
+
+        assert len(rows) == 6
+        assert [row["date_from"] for row in rows] == sorted(row["date_from"] for row in rows)
+
+        cmd = commands.ExportBookingsCommand(owner=manager.id, date_from=today, date_to=None)
+        rows = [row async for row in await booking_service.export_bookings(cmd)]
+
+        assert len(rows) == 5
+        assert cancelled_booking.id not in {row["id"] for row in rows}
+
+    async def test_export_bookings_of_other_owner(self, booking_service, user):
+        """Test that an owner without hotels exports no bookings."""
+        cmd = commands.ExportBookingsCommand(owner=user.id, date_from=None, date_to=None)
+        rows = [row async for row in await booking_service.export_bookings(cmd)]
+
+        assert rows == []
+
+    async def test_export_bookings_invalid_dates(self, booking_service, manager):
+        """Test exporting bookings for an empty date range."""
+        today = date.today()
+        cmd = commands.ExportBookingsCommand(owner=manager.id, date_from=today, date_to=today)
+
+        with pytest.raises(exceptions.InvalidBookingDatesError):
+            await booking_service.export_bookings(cmd)
@@ -0,0 +1,169 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from src.config import CacheSettings
+from src.infrastructure.cache.backends import CacheBackendError, MemoryCacheBackend
+from src.infrastructure.cache.cache import ReadThroughCache
+
+
+class Detail(BaseModel):
+    id: int
+    name: str
+
+
+class UnreachableBackend:
+    """Shared tier failing like a Redis server that is down."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Fail to read a key."""
+        raise CacheBackendError("connection refused")
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Fail to store a key."""
+        raise CacheBackendError("connection refused")
+
+    async def incr(self, key: str) -> int:
+        """Fail to increment a key."""
+        raise CacheBackendError("connection refused")
+
+
+class Loader:
+    """Loader of a read model counting its calls, optionally held until released."""
+
+    def __init__(self, name: str = "first") -> None:
+        self.name = name
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> Detail:
+        """Return the read model once released."""
+        self.calls += 1
+        await self.release.wait()
+        return Detail(id=1, name=self.name)
+
+
+@pytest.fixture
+def settings() -> CacheSettings:
+    """Cache settings with an in-process tier."""
+    return CacheSettings(cache_local_size=10, cache_local_ttl_seconds=60)
+
+
+@pytest.fixture
+def backend() -> MemoryCacheBackend:
+    """In-memory stand-in for the Redis tier."""
+    return MemoryCacheBackend()
+
+
+@pytest.fixture
+def cache(backend, settings) -> ReadThroughCache:
+    """Read-through cache of a worker."""
+    return ReadThroughCache(backend, settings, MagicMock())
+
+
+@pytest.mark.anyio
+class TestReadThroughCache:
+    async def test_miss_then_local_hit(self, cache):
+        """Test that the first lookup loads the read model and the next ones are served locally."""
+        loader = Loader()
+
+        first = await cache.get_or_load("hotel", 1, Detail, loader)
+        second = await cache.get_or_load("hotel", 1, Detail, loader)
+
+        assert first == second == Detail(id=1, name="first")
+        assert loader.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_shared_tier_serves_other_workers(self, backend, settings, cache):
+        """Test that a read model loaded by one worker is read from the shared tier by another."""
+        other_worker = ReadThroughCache(backend, settings, MagicMock())
+        loader = Loader()
+
+        await cache.get_or_load("hotel", 1, Detail, loader)
+        value = await other_worker.get_or_load("hotel", 1, Detail, loader)
+
+        assert value == Detail(id=1, name="first")
+        assert loader.calls == 1
+        assert other_worker.hits == 1
+
+    async def test_outdated_shared_entry_is_reloaded(self, backend, settings, cache):
+        """Test that a shared entry written with another shape of the read model is loaded again."""
+        await backend.set("trip:hotel:1:v0", b'{"id": 1}', 60)
+        loader = Loader()
+
+        value = await cache.get_or_load("hotel", 1, Detail, loader)
+
+        assert value == Detail(id=1, name="first")
+        assert loader.calls == 1
+
+    async def test_invalidate_reaches_every_worker(self, backend, cache):
+        """Test that an invalidation bumps the version read by workers without a local entry."""
+        other_worker = ReadThroughCache(backend, CacheSettings(cache_local_size=0), MagicMock())
+        await other_worker.get_or_load("hotel", 1, Detail, Loader("first"))
+
+        await cache.invalidate("hotel", 1)
+        value = await other_worker.get_or_load("hotel", 1, Detail, Loader("second"))
+
+        assert value.name == "second"
+
+    async def test_invalidate_drops_local_entry(self, cache):
+        """Test that an invalidation drops the entry of the worker that made it."""
+        await cache.get_or_load("hotel", 1, Detail, Loader("first"))
+
+        await cache.invalidate("hotel", 1)
+        value = await cache.get_or_load("hotel", 1, Detail, Loader("second"))
+
+        assert value.name == "second"
+
+    async def test_concurrent_misses_share_one_load(self, cache):
+        """Test that concurrent lookups of the same missing key run the loader once."""
+        loader = Loader()
+        loader.release.clear()
+
+        lookups = [asyncio.create_task(cache.get_or_load("hotel", 1, Detail, loader)) for _ in range(10)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        values = await asyncio.gather(*lookups)
+
+        assert loader.calls == 1
+        assert all(value == Detail(id=1, name="first") for value in values)
+
+    async def test_load_racing_with_invalidation_is_not_served(self, cache):
+        """Test that a value loaded before an invalidation is not cached for later lookups."""
+        stale_loader = Loader("stale")
+        stale_loader.release.clear()
+
+        lookup = asyncio.create_task(cache.get_or_load("hotel", 1, Detail, stale_loader))
+        await asyncio.sleep(0)
+        await cache.invalidate("hotel", 1)
+        stale_loader.release.set()
+        await lookup
+
+        value = await cache.get_or_load("hotel", 1, Detail, Loader("fresh"))
+        assert value.name == "fresh"
+
+    async def test_loader_errors_are_not_cached(self, cache):
+        """Test that a failing load is raised to the caller and retried by the next lookup."""
+
+        async def _fail() -> Detail:
+            raise LookupError
+
+        with pytest.raises(LookupError):
+            await cache.get_or_load("hotel", 1, Detail, _fail)
+
+        value = await cache.get_or_load("hotel", 1, Detail, Loader())
+        assert value.name == "first"
+
+    async def test_unreachable_shared_tier_falls_back_to_loader(self, settings):
+        """Test that lookups and invalidations keep working when Redis is down."""
+        cache = ReadThroughCache(UnreachableBackend(), settings, MagicMock())
+        loader = Loader()
+
+        value = await cache.get_or_load("hotel", 1, Detail, loader)
+        await cache.invalidate("hotel", 1)
+
+        assert value.name == "first"
+        assert loader.calls == 1
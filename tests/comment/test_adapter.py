@@ -55,31 +55,31 @@ class TestCommentAdapter:
         """Test getting comments by user ID."""
         result = await comment_adapter.get_comments_by_user_id(user.id)
 
-        assert isinstance(result, list)
-        assert len(result) >= 1
-        assert all(comment.user_id == user.id for comment in result)
+        assert isinstance(result.items, list)
+        assert len(result.items) >= 1
+        assert all(comment.user_id == user.id for comment in result.items)
 
     async def test_get_comments_by_user_id_empty(self, comment_adapter):
         """Test getting comments for user with no comments."""
         non_existent_user_id = uuid.uuid4()
         result = await comment_adapter.get_comments_by_user_id(non_existent_user_id)
 
-        assert result == []
+        assert result.items == []
 
     async def test_get_comments_by_hotel_id(self, comment_adapter, hotel):
         """Test getting comments by hotel ID."""
         result = await comment_adapter.get_comments_by_hotel_id(hotel.id)
 
-        assert isinstance(result, list)
-        assert len(result) >= 1
-        assert all(comment.hotel_id == hotel.id for comment in result)
+        assert isinstance(result.items, list)
+        assert len(result.items) >= 1
+        assert all(comment.hotel_id == hotel.id for comment in result.items)
 
     async def test_get_comments_by_hotel_id_empty(self, comment_adapter):
         """Test getting comments for hotel with no comments."""
         non_existent_hotel_id = uuid.uuid4()
         result = await comment_adapter.get_comments_by_hotel_id(non_existent_hotel_id)
 
-        assert result == []
+        assert result.items == []
 
     async def test_add_comment_success(self, comment_adapter, user, another_hotel):
         """Test adding a new comment."""
@@ -5,6 +5,7 @@ from fastapi import status
 from httpx import AsyncClient
 
 from tests.fixtures.mocks import MockComment, MockHotel, MockUser
+from tests.fixtures.queries import count_statements
 
 
 @pytest.fixture(autouse=True)
@@ -131,11 +132,28 @@ class TestCommentAPI:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) >= 1
         assert data[0]["hotel_id"] == str(sample_hotel.id)
 
+    async def test_list_comments_query_budget(
+        self,
+        http_client: AsyncClient,
+        query_budget,
+        valid_user_token: str,
+        sample_hotel,
+    ):
+        """Test that listing comments stays within its statement budget."""
+        with query_budget(5):
+            response = await http_client.get(
+                "/api/v1/hotels/comments",
+                params={"hotel_id": sample_hotel.id},
+                headers={"Authorization": f"Bearer {valid_user_token}"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+
     async def test_list_comments_missing_hotel_id(
         self,
         http_client: AsyncClient,
@@ -278,3 +296,69 @@ class TestCommentAPI:
         response = await http_client.delete(f"/api/v1/hotels/comments/{sample_comment.id}")
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_list_comments_query_count(
+        self, http_client: AsyncClient, sqlalchemy_engine, valid_user_token, hotel
+    ):
+        """Test that listing comments issues authorization statements, a version, a hotel check and a select."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(
+                "/api/v1/hotels/comments",
+                params={"hotel_id": str(hotel.id)},
+                headers={"Authorization": f"Bearer {valid_user_token}"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 5
+
+    async def test_get_comment_query_count(
+        self, http_client: AsyncClient, sqlalchemy_engine, valid_user_token, comment
+    ):
+        """Test that getting comment details loads the comment once, after the authorization statements."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(
+                f"/api/v1/hotels/comments/{comment.id}",
+                headers={"Authorization": f"Bearer {valid_user_token}"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 3
+
+    async def test_get_comment_etag(self, http_client: AsyncClient, sqlalchemy_engine, valid_user_token, comment):
+        """Test that a revalidated comment is answered 304 by the statements of a plain read."""
+        headers = {"Authorization": f"Bearer {valid_user_token}"}
+        response = await http_client.get(f"/api/v1/hotels/comments/{comment.id}", headers=headers)
+        etag = response.headers["ETag"]
+
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(
+                f"/api/v1/hotels/comments/{comment.id}", headers={**headers, "If-None-Match": etag}
+            )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert len(statements) == 3
+
+    async def test_list_comments_etag_changes_on_update(
+        self, http_client: AsyncClient, valid_user_token, sample_hotel, sample_comment
+    ):
+        """Test that editing a comment changes the ETag of its hotel's comments."""
+        headers = {"Authorization": f"Bearer {valid_user_token}"}
+        params = {"hotel_id": str(sample_hotel.id)}
+        response = await http_client.get("/api/v1/hotels/comments", params=params, headers=headers)
+        etag = response.headers["ETag"]
+
+        not_modified = await http_client.get(
+            "/api/v1/hotels/comments", params=params, headers={**headers, "If-None-Match": etag}
+        )
+        await http_client.patch(
+            f"/api/v1/hotels/comments/{sample_comment.id}", json={"content": "Edited comment"}, headers=headers
+        )
+        modified = await http_client.get(
+            "/api/v1/hotels/comments", params=params, headers={**headers, "If-None-Match": etag}
+        )
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert modified.status_code == status.HTTP_200_OK
+        assert modified.headers["ETag"] != etag
+        assert modified.json()["items"][0]["content"] == "Edited comment"
@@ -103,9 +103,9 @@ class TestCommentService:
 
         result = await comment_service.list_user_comments(fetch)
 
-        assert isinstance(result, list)
-        assert len(result) >= 1
-        assert all(isinstance(comment, CommentInfo) for comment in result)
+        assert isinstance(result.items, list)
+        assert len(result.items) >= 1
+        assert all(isinstance(comment, CommentInfo) for comment in result.items)
 
     async def test_list_hotel_comments(self, comment_service, hotel):
         """Test listing hotel's comments."""
@@ -113,9 +113,9 @@ class TestCommentService:
 
         result = await comment_service.list_hotel_comments(fetch)
 
-        assert isinstance(result, list)
-        assert len(result) >= 1
-        assert all(isinstance(comment, CommentInfo) for comment in result)
+        assert isinstance(result.items, list)
+        assert len(result.items) >= 1
+        assert all(isinstance(comment, CommentInfo) for comment in result.items)
 
     async def test_update_comment_info_success(self, comment_service, comment_adapter, sample_comment):
         """Test updating comment info."""
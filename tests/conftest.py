@@ -1,8 +1,10 @@
 import os
 import uuid
 from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractContextManager
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
+from functools import partial
 from typing import Any
 
 import pytest
@@ -27,15 +29,17 @@ from src.apps.hotel.bookings.domain.models import BookingBase
 from src.apps.hotel.hotels.domain.models import HotelBase
 from src.apps.hotel.rooms.domain.models import RoomBase
 from src.common.controllers.http.api_v1 import http_router_v1
-from src.common.domain.enums import DataAccessEnum, EmailAdapterEnum, SMSAdapterEnum
+from src.common.domain.enums import CacheBackendEnum, DataAccessEnum, EmailAdapterEnum, SMSAdapterEnum
 from src.common.exceptions.common import BaseError
 from src.common.exceptions.handlers import general_exception_handler
 from src.common.interfaces import SecurityGatewayProto
 from src.config import Configs
 from src.infrastructure.database.memory.database import MemoryDatabase
+from src.infrastructure.database.profiling import StatementCounter
 from src.ioc.registry import get_providers
 from src.setup.common import app_config, create_async_container
 from tests.fixtures.mocks import MockData
+from tests.fixtures.queries import assert_max_statements
 
 BUCKET_NAME = "images"
 
@@ -215,6 +219,9 @@ def default_test_config(default_config, request) -> Configs:
     new_config.general.email_adapter = EmailAdapterEnum.MEMORY
     new_config.general.sms_adapter = SMSAdapterEnum.MEMORY
 
+    # Read-through cache without a Redis server
+    new_config.cache.cache_backend = CacheBackendEnum.MEMORY
+
     # For useful testing purpose
     new_config.database.session.expire_on_commit = False
 
@@ -268,6 +275,17 @@ async def sqlalchemy_engine(app_container) -> AsyncGenerator[AsyncEngine]:
         yield engine
 
 
+@pytest.fixture
+def query_budget(sqlalchemy_engine: AsyncEngine) -> Callable[..., AbstractContextManager[StatementCounter]]:
+    """
+    Pin the number of statements a block may execute.
+
+    Usage: ``with query_budget(3): await http_client.get(...)`` fails the test if the block
+    executes more than three statements or repeats one like an N+1.
+    """
+    return partial(assert_max_statements, sqlalchemy_engine)
+
+
 @pytest.fixture
 async def http_client(get_test_app: FastAPI) -> AsyncGenerator[AsyncClient]:
     """Provide an HTTP client for testing."""
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from src.apps.hotel.rooms.domain.models import Room
+from src.common.adapters.adapter import FakeGateway, SQLAlchemyGateway
+from src.common.domain.amenities import AmenityFlag, amenities_of, normalize_service
+
+
+class TestAmenities:
+    def test_normalize_service(self):
+        """Test that case and separators do not matter."""
+        assert normalize_service("WiFi") == "wifi"
+        assert normalize_service(" Air-Conditioning ") == "air_conditioning"
+        assert normalize_service("air conditioning") == "air_conditioning"
+
+    def test_amenities_of(self):
+        """Test that only the common services that are offered set a bit."""
+        services = {"WiFi": True, "pool": False, "TV": True, "sauna": True, "gym": "yes"}
+
+        assert amenities_of(services) == AmenityFlag.WIFI | AmenityFlag.TV
+        assert amenities_of(None) == 0
+
+    def test_services_match(self):
+        """Test that the fake gateways filter by exact containment, like `services @> filter`."""
+        services = {"WiFi": True, "pool": False, "sauna": True}
+        item = SimpleNamespace(services=services, amenities=amenities_of(services))
+
+        assert FakeGateway.services_match(item, None)
+        assert FakeGateway.services_match(item, {"WiFi": True, "sauna": True})
+        assert FakeGateway.services_match(item, {"pool": False})
+        assert not FakeGateway.services_match(item, {"wifi": True})
+        assert not FakeGateway.services_match(item, {"tv": True})
+        assert not FakeGateway.services_match(item, {"sauna": False})
+
+    def test_services_criteria(self):
+        """Test that the bitmap only prefilters the full containment filter."""
+        criteria = SQLAlchemyGateway.services_criteria(Room, {"WiFi": True, "sauna": True})
+        sql = [str(criterion.compile(dialect=postgresql.dialect())) for criterion in criteria]
+
+        assert sql == ["(rooms.amenities & %(amenities_1)s) = %(param_1)s", "rooms.services @> %(services_1)s::JSONB"]
+        assert criteria[1].right.value == {"WiFi": True, "sauna": True}
+        assert SQLAlchemyGateway.services_criteria(Room, {"sauna": True})[0].right.value == {"sauna": True}
+        assert SQLAlchemyGateway.services_criteria(Room, {}) == []
@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import String, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.common.adapters import adapter
+from src.common.adapters.adapter import SQLAlchemyGateway
+from src.common.exceptions.common import BaseError
+from src.infrastructure.context import RequestContext
+from src.infrastructure.database.profiling import StatementCounter
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String, unique=True)
+    note: Mapped[str | None] = mapped_column(String, server_default="default")
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create a file-backed SQLite engine with the item table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def gateway(engine):
+    """Create a gateway over a fresh session."""
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield SQLAlchemyGateway(session, RequestContext.empty())
+
+
+async def _stored_items(gateway) -> dict[int, tuple[str, str]]:
+    rows = await gateway.session.execute(select(Item.id, Item.name, Item.note))
+    return {item_id: (name, note) for item_id, name, note in rows}
+
+
+@pytest.mark.anyio
+class TestBulkOperations:
+    async def test_add_many_inserts_in_chunks(self, engine, gateway, monkeypatch):
+        """Test that rows are inserted with multi-row statements sized under the parameter limit."""
+        monkeypatch.setattr(adapter, "MAX_STATEMENT_PARAMETERS", 30)
+
+        with StatementCounter.capture(engine) as counter:
+            ids = await gateway.add_many([Item(id=number, name=f"item {number}") for number in range(25)])
+
+        inserts = [statement for statement in counter if statement.startswith("INSERT")]
+        assert sorted(ids) == list(range(25))
+        # Three columns per row, so ten rows fit in a statement of thirty parameters
+        assert len(inserts) == 3
+        assert len(await _stored_items(gateway)) == 25
+
+    async def test_add_many_applies_server_defaults(self, gateway):
+        """Test that unset columns with a default get it instead of NULL."""
+        await gateway.add_many([Item(id=1, name="first")])
+
+        assert await _stored_items(gateway) == {1: ("first", "default")}
+
+    async def test_add_many_conflict(self, gateway):
+        """Test that a conflicting row fails the insert unless conflicts are ignored."""
+        await gateway.add_many([Item(id=1, name="first")])
+
+        ids = await gateway.add_many([Item(id=1, name="first"), Item(id=2, name="second")], ignore_conflicts=True)
+        assert ids == [2]
+
+        await gateway.session.rollback()
+        with pytest.raises(BaseError):
+            await gateway.add_many([Item(id=3, name="first")])
+
+    async def test_upsert_many(self, gateway):
+        """Test that conflicting rows are updated and the others inserted."""
+        await gateway.add_many([Item(id=1, name="first", note="kept")])
+
+        ids = await gateway.upsert_many(
+            [Item(id=1, name="renamed", note="replaced"), Item(id=2, name="second")],
+            update_columns=["name"],
+        )
+
+        assert sorted(ids) == [1, 2]
+        assert await _stored_items(gateway) == {1: ("renamed", "kept"), 2: ("second", "default")}
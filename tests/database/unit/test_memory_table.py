@@ -0,0 +1,131 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import Date, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.common.adapters.adapter import FakeGateway
+from src.config import create_configs
+from src.infrastructure.database.memory.database import MemoryDatabase
+from src.infrastructure.database.memory.table import MemoryTable
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Stay(Base):
+    __tablename__ = "stay"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    guest: Mapped[str] = mapped_column(String)
+    date_from: Mapped[date] = mapped_column(Date)
+    date_to: Mapped[date] = mapped_column(Date)
+
+
+class GuestRoom(Base):
+    __tablename__ = "guest_room"
+
+    guest: Mapped[str] = mapped_column(String, primary_key=True)
+    room: Mapped[str] = mapped_column(String, primary_key=True)
+
+
+START = date(2025, 1, 1)
+
+
+def _stay(stay_id: int, guest: str, first_day: int, nights: int) -> Stay:
+    return Stay(
+        id=stay_id,
+        guest=guest,
+        date_from=START + timedelta(days=first_day),
+        date_to=START + timedelta(days=first_day + nights),
+    )
+
+
+@pytest.fixture
+def table() -> MemoryTable[Stay]:
+    """Create a table of stays indexed by guest and by dates."""
+    return MemoryTable(Stay, indexes=("guest",), interval=("date_from", "date_to"))
+
+
+class TestMemoryTable:
+    def test_rows_are_stored_by_primary_key(self, table):
+        """Test that adding a row with a stored primary key replaces it."""
+        table.add(_stay(1, "ann", 0, 2))
+        replacement = _stay(1, "bob", 0, 2)
+        table.add(replacement)
+
+        assert len(table) == 1
+        assert table.get(1) is replacement
+        assert table.find(guest="ann") == []
+
+        table.discard(replacement)
+        assert table.get(1) is None
+
+    def test_update_reindexes_row(self, table):
+        """Test that a row updated in place is found under its new values only."""
+        stay = _stay(1, "ann", 0, 2)
+        table.add(stay)
+
+        table.update(stay, guest="bob", date_from=START + timedelta(days=10), date_to=START + timedelta(days=12))
+
+        assert table.find(guest="ann") == []
+        assert table.first(guest="bob") is stay
+        assert table.overlapping(START, START + timedelta(days=5)) == []
+        assert table.overlapping(START + timedelta(days=11), START + timedelta(days=12)) == [stay]
+
+    def test_find_without_index(self, table):
+        """Test that criteria on columns without an index are matched by a scan."""
+        table.add(_stay(1, "ann", 0, 2))
+        table.add(_stay(2, "ann", 5, 2))
+
+        assert [stay.id for stay in table.find(guest="ann", date_from=START + timedelta(days=5))] == [2]
+
+    def test_overlapping_matches_scan(self, table):
+        """Test that interval lookups return the same rows as a full scan."""
+        rng = random.Random(0)
+        for stay_id in range(500):
+            table.add(_stay(stay_id, rng.choice("abc"), rng.randrange(365), rng.randrange(1, 30)))
+
+        for _ in range(50):
+            start = START + timedelta(days=rng.randrange(365))
+            end = start + timedelta(days=rng.randrange(1, 20))
+            expected = {
+                stay.id for stay in table if stay.date_from < end and stay.date_to > start and stay.guest == "a"
+            }
+
+            assert {stay.id for stay in table.overlapping(start, end, guest="a")} == expected
+
+    def test_composite_primary_key(self):
+        """Test that rows of a model with a composite primary key are keyed by a tuple."""
+        table = MemoryTable(GuestRoom)
+        table.add(GuestRoom(guest="ann", room="101"))
+        table.add(GuestRoom(guest="ann", room="102"))
+
+        assert table.get(("ann", "102")).room == "102"
+        assert len(table) == 2
+
+
+class FakeStayGateway(FakeGateway[Stay]):
+    pass
+
+
+class FakeLongStayGateway(FakeStayGateway):
+    pass
+
+
+class TestFakeGatewayTables:
+    def test_model_type_is_resolved_with_the_class(self):
+        """Test that the model type is known from class creation, subclasses inheriting it."""
+        assert FakeStayGateway._model_type is Stay
+        assert FakeLongStayGateway._model_type is Stay
+
+    def test_gateways_of_a_model_share_its_table(self):
+        """Test that gateways of the same model get the same table, created on first use."""
+        memory_db = MemoryDatabase(create_configs())
+
+        gateway = FakeStayGateway(memory_db)
+
+        assert FakeLongStayGateway(memory_db)._collection is gateway._collection
+        assert memory_db.table(Stay) is gateway._collection
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from src.infrastructure.context import RequestContext
+from src.infrastructure.database.factory import SqlAlchemyUnitOfWork
+from src.infrastructure.database.routing import RoutingSession
+
+metadata = MetaData()
+origin = Table("origin", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+
+class _Base(DeclarativeBase):
+    metadata = metadata
+
+
+class Origin(_Base):
+    __table__ = origin
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """Create a routing session factory over two SQLite files standing in for a primary and a replica."""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+
+    for engine, name in ((primary, "primary"), (replica, "replica")):
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+            await connection.execute(origin.insert().values(id=1, name=name))
+
+    yield async_sessionmaker(primary, sync_session_class=RoutingSession, replicas=[replica.sync_engine])
+
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.mark.anyio
+class TestRoutingSession:
+    async def test_plain_reads_use_replica(self, session_factory):
+        """Test that plain selects are served by the replica."""
+        async with session_factory() as session:
+            assert await session.scalar(select(origin.c.name)) == "replica"
+
+    async def test_locking_reads_use_primary(self, session_factory):
+        """Test that row-locking selects and later reads go to the primary."""
+        async with session_factory() as session:
+            assert await session.scalar(select(origin.c.name).with_for_update()) == "primary"
+            assert await session.scalar(select(origin.c.name)) == "primary"
+
+    async def test_reads_after_write_use_primary(self, session_factory):
+        """Test that a session reads its own writes once it has written."""
+        async with session_factory() as session:
+            await session.execute(update(origin).values(name="updated"))
+
+            assert await session.scalar(select(origin.c.name)) == "updated"
+
+    async def test_reads_after_orm_commit_use_primary(self, session_factory):
+        """Test that a session reads the rows it flushed and committed through the ORM."""
+        async with session_factory() as session:
+            session.add(Origin(id=2, name="added"))
+            await session.commit()
+
+            assert await session.scalar(select(origin.c.name).where(origin.c.id == 2)) == "added"
+
+    async def test_reads_stay_on_one_replica(self, tmp_path):
+        """Test that every read of a session is served by the replica of its first read."""
+        replicas = [create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'replica{i}.db'}") for i in range(4)]
+        for number, replica in enumerate(replicas):
+            async with replica.begin() as connection:
+                await connection.run_sync(metadata.create_all)
+                await connection.execute(origin.insert().values(id=1, name=f"replica {number}"))
+        primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+        factory = async_sessionmaker(
+            primary, sync_session_class=RoutingSession, replicas=[replica.sync_engine for replica in replicas]
+        )
+
+        try:
+            async with factory() as session:
+                names = {await session.scalar(select(origin.c.name)) for _ in range(20)}
+            assert len(names) == 1
+        finally:
+            for engine in (primary, *replicas):
+                await engine.dispose()
+
+    async def test_unit_of_work_uses_primary(self, session_factory):
+        """Test that reads inside a unit of work are served by the primary."""
+        async with session_factory() as session, SqlAlchemyUnitOfWork(session, RequestContext.empty()):
+            assert await session.scalar(select(origin.c.name)) == "primary"
@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.infrastructure.database.session import ReleasingAsyncSession
+
+metadata = MetaData()
+item = Table("item", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create a file-backed SQLite engine with a connection pool."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'session.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+        await connection.execute(item.insert().values(id=1, name="initial"))
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    """Create a factory of sessions releasing connections after reads."""
+    return async_sessionmaker(engine, class_=ReleasingAsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.anyio
+class TestReleasingAsyncSession:
+    async def test_read_releases_connection(self, engine, session_factory):
+        """Test that a standalone read gives the connection back to the pool."""
+        async with session_factory() as session:
+            assert await session.scalar(select(item.c.name)) == "initial"
+
+            assert engine.sync_engine.pool.checkedout() == 0
+
+    async def test_write_keeps_connection_until_commit(self, engine, session_factory):
+        """Test that reads after a write stay in the same transaction until it is committed."""
+        async with session_factory() as session:
+            await session.execute(update(item).values(name="updated"))
+
+            assert await session.scalar(select(item.c.name)) == "updated"
+            assert engine.sync_engine.pool.checkedout() == 1
+
+            await session.rollback()
+
+            assert await session.scalar(select(item.c.name)) == "initial"
+            assert engine.sync_engine.pool.checkedout() == 0
+
+    async def test_explicit_transaction_keeps_connection(self, engine, session_factory):
+        """Test that reads inside an explicit transaction do not commit it."""
+        async with session_factory() as session, session.begin():
+            await session.scalar(select(item.c.name))
+
+            assert engine.sync_engine.pool.checkedout() == 1
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import String, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.common.adapters.adapter import SQLAlchemyGateway
+from src.infrastructure.context import RequestContext
+from src.infrastructure.database.session import ReleasingAsyncSession
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create a file-backed SQLite engine with a filled item table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stream.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            Item.__table__.insert(), [{"id": number, "name": f"item {number % 2}"} for number in range(10)]
+        )
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def gateway(engine):
+    """Create a gateway over a session releasing connections after reads."""
+    session_factory = async_sessionmaker(engine, class_=ReleasingAsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield SQLAlchemyGateway(session, RequestContext.empty())
+
+
+@pytest.mark.anyio
+class TestStreaming:
+    async def test_stream_items_yields_every_match(self, gateway):
+        """Test that streaming with a small batch size returns the same items as a plain query."""
+        items = [item async for item in gateway.stream_items(Item, yield_per=3, name="item 1")]
+
+        assert sorted(item.id for item in items) == [1, 3, 5, 7, 9]
+
+    async def test_consumed_batches_are_detached(self, gateway):
+        """Test that only the batch being consumed stays in the identity map."""
+        in_session = []
+        async for item in gateway.stream_items(Item, yield_per=4):
+            in_session.append(len(gateway.session.identity_map))
+            assert item in gateway.session
+
+        assert max(in_session) <= 4
+        assert len(gateway.session.identity_map) == 0
+
+    async def test_connection_is_kept_while_streaming(self, engine, gateway):
+        """Test that reads issued during a stream do not release the connection under its cursor."""
+        ids = []
+        async for row in gateway.stream_rows(select(Item.id).order_by(Item.id), yield_per=2):
+            await gateway.session.execute(select(Item.name).where(Item.id == row.id))
+            assert engine.sync_engine.pool.checkedout() == 1
+            ids.append(row.id)
+
+        assert ids == list(range(10))
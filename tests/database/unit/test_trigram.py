@@ -0,0 +1,69 @@
+import uuid
+
+import pytest
+
+from src.apps.hotel.hotels.adapters.adapter import FakeHotelAdapter
+from src.apps.hotel.hotels.domain.models import Hotel
+from src.config import create_configs
+from src.infrastructure.database.memory.database import MemoryDatabase
+from src.infrastructure.database.memory.trigram import prefix_match, trigrams, word_similarity
+
+
+class TestTrigrams:
+    def test_trigrams_of_padded_words(self):
+        """Test that words are lowercased and padded like pg_trgm does."""
+        assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+        assert trigrams("a, b") == {"  a", " a ", "  b", " b "}
+
+    def test_word_similarity(self):
+        """Test that the similarity tolerates case and typos and tells unrelated words apart."""
+        assert word_similarity("sochi", "Sochi") == pytest.approx(1)
+        assert word_similarity("sochy", "Sochi") >= 0.6
+        assert word_similarity("Сочи", "Гранд Сочи") == pytest.approx(1)
+        assert word_similarity("paris", "Sochi") < 0.3
+        assert word_similarity("", "Sochi") == pytest.approx(0)
+
+    def test_prefix_match(self):
+        """Test that every word of the query must start a word of the text."""
+        assert prefix_match("soc gra", "Grand Hotel Sochi")
+        assert not prefix_match("soc par", "Grand Hotel Sochi")
+        assert not prefix_match("!", "Grand Hotel Sochi")
+
+
+@pytest.fixture
+def hotel_adapter() -> FakeHotelAdapter:
+    """In-memory hotel gateway with a few hotels."""
+    adapter = FakeHotelAdapter(MemoryDatabase(create_configs()))
+    owner = uuid.uuid4()
+    for name, location, is_active in [
+        ("Grand Hotel", "Sochi", True),
+        ("Sea Breeze", "Sochi", True),
+        ("Old Sochi Inn", "Adler", True),
+        ("Closed Sochi", "Sochi", False),
+        ("Metropol", "Moscow", True),
+    ]:
+        adapter._collection.add(
+            Hotel(name=name, location=location, services=None, rooms_quantity=10, owner=owner, is_active=is_active)
+        )
+    return adapter
+
+
+@pytest.mark.anyio
+class TestFakeHotelSearch:
+    async def test_search_matches_typos_and_prefixes(self, hotel_adapter):
+        """Test that active hotels are found by a misspelt or partial word, best match first."""
+        typo = await hotel_adapter.search_hotels("sochy")
+        prefix = await hotel_adapter.search_hotels("metr")
+
+        assert {hotel.name for hotel in typo.items} == {"Grand Hotel", "Sea Breeze", "Old Sochi Inn"}
+        assert [hotel.name for hotel in prefix.items] == ["Metropol"]
+
+    async def test_search_pages(self, hotel_adapter):
+        """Test that search results are paged without gaps or repeats."""
+        first = await hotel_adapter.search_hotels("sochi", limit=2)
+        second = await hotel_adapter.search_hotels("sochi", limit=2, cursor=first.next_cursor)
+
+        assert len(first.items) == 2
+        assert second.next_cursor is None
+        names = [hotel.name for hotel in first.items + second.items]
+        assert sorted(names) == ["Grand Hotel", "Old Sochi Inn", "Sea Breeze"]
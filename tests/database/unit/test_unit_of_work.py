@@ -0,0 +1,145 @@
+import pytest
+from sqlalchemy import String, event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.common.adapters.adapter import SQLAlchemyGateway
+from src.common.exceptions.common import BaseError
+from src.infrastructure.context import RequestContext
+from src.infrastructure.database.session import ReleasingAsyncSession
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String, unique=True)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create a file-backed SQLite engine with the item table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uow.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    """Create a session releasing connections after reads, recording its commits."""
+    session_factory = async_sessionmaker(engine, class_=ReleasingAsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.info["commits"] = 0
+
+        @event.listens_for(session.sync_session, "after_commit")
+        def _count_commit(sync_session):
+            sync_session.info["commits"] += 1
+
+        yield session
+
+
+@pytest.fixture
+def gateway(session):
+    """Create a gateway over the session."""
+    return SQLAlchemyGateway(session, RequestContext.empty())
+
+
+async def _count_items(engine) -> int:
+    async with engine.connect() as connection:
+        return await connection.scalar(select(func.count()).select_from(Item))
+
+
+@pytest.mark.anyio
+class TestSqlAlchemyUnitOfWork:
+    async def test_gateway_commits_outside_unit_of_work(self, engine, session, gateway):
+        """Test that a write outside of a unit of work is committed right away."""
+        await gateway.add(Item(id=1, name="first"))
+
+        assert session.info["commits"] == 1
+        assert await _count_items(engine) == 1
+
+    async def test_writes_in_unit_of_work_are_committed_once(self, engine, session, gateway):
+        """Test that gateways only flush inside a unit of work, which commits once at its end."""
+        async with gateway():
+            await gateway.add(Item(id=1, name="first"))
+            await gateway.add(Item(id=2, name="second"))
+
+            assert session.info["commits"] == 0
+            assert not session.new
+
+        assert session.info["commits"] == 1
+        assert await _count_items(engine) == 2
+
+    async def test_nested_unit_of_work_commits_with_the_outermost(self, engine, session, gateway):
+        """Test that a unit of work opened inside another one does not commit on its own."""
+        async with gateway():
+            async with gateway():
+                await gateway.add(Item(id=1, name="first"))
+
+            assert session.info["commits"] == 0
+            await gateway.add(Item(id=2, name="second"))
+
+        assert session.info["commits"] == 1
+        assert await _count_items(engine) == 2
+
+    async def test_conflicts_surface_at_the_write(self, engine, session, gateway):
+        """Test that a unit of work not batching its writes lets the gateway handle a conflict."""
+
+        async def _add_duplicate() -> None:
+            async with gateway():
+                await gateway.add(Item(id=1, name="first"))
+                await gateway.add(Item(id=2, name="first"))
+                pytest.fail("The conflict was not raised by the gateway call")
+
+        with pytest.raises(BaseError, match="already exists"):
+            await _add_duplicate()
+
+        assert await _count_items(engine) == 0
+
+    async def test_batched_unit_of_work_defers_flush_to_commit(self, engine, session, gateway):
+        """Test that a batched unit of work leaves the writes pending until its commit."""
+        async with gateway(batch_writes=True):
+            await gateway.add(Item(id=1, name="first"))
+            await gateway.add(Item(id=2, name="second"))
+
+            assert len(session.new) == 2
+
+        assert session.info["commits"] == 1
+        assert await _count_items(engine) == 2
+
+    async def test_failure_rolls_back_every_write(self, engine, session, gateway):
+        """Test that an error inside the unit of work discards the writes flushed before it."""
+
+        async def _add_then_fail() -> None:
+            async with gateway():
+                await gateway.add(Item(id=1, name="first"))
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            await _add_then_fail()
+
+        assert session.info["commits"] == 0
+        assert await _count_items(engine) == 0
+
+    async def test_reads_inside_unit_of_work_keep_connection(self, engine, session, gateway):
+        """Test that reads inside a unit of work do not release its connection and split the transaction."""
+        await session.execute(select(Item))
+
+        async with gateway():
+            await gateway.add(Item(id=1, name="first"))
+            await session.execute(select(Item))
+
+            assert engine.sync_engine.pool.checkedout() == 1
+            # Only the standalone read before the unit of work was committed to release its connection
+            assert session.info["commits"] == 1
+
+        assert session.info["commits"] == 2
+        assert await _count_items(engine) == 1
@@ -0,0 +1,26 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.database.profiling import StatementCounter
+
+
+@contextmanager
+def count_statements(engine: AsyncEngine) -> Generator[StatementCounter]:
+    """Collect the SQL statements executed by the engine inside the block."""
+    with StatementCounter.capture(engine) as counter:
+        yield counter
+
+
+@contextmanager
+def assert_max_statements(engine: AsyncEngine, budget: int, repeat_threshold: int = 3) -> Generator[StatementCounter]:
+    """Fail if the block executes more than budget statements or repeats one like an N+1."""
+    with count_statements(engine) as counter:
+        yield counter
+
+    statements = "\n".join(counter)
+    assert len(counter) <= budget, f"Expected at most {budget} statements, got {len(counter)}:\n{statements}"
+
+    repeated = counter.repeated_statements(repeat_threshold)
+    assert not repeated, f"Repeated statements, possible N+1: {repeated}"
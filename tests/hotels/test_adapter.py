@@ -4,6 +4,8 @@ import pytest
 
 from src.apps.hotel.hotels.application.interfaces.gateway import HotelGatewayProto
 from src.apps.hotel.hotels.domain.models import Hotel
+from src.common.domain.amenities import AmenityFlag
+from src.common.exceptions.common import InvalidCursorError
 from tests.fixtures.mocks import MockHotel, MockUser
 
 
@@ -26,16 +28,16 @@ class TestHotelAdapter:
         """Test getting all hotels."""
         hotels = await hotel_adapter.get_hotels()
 
-        assert isinstance(hotels, list)
-        assert len(hotels) >= 1
-        assert all(isinstance(h, Hotel) for h in hotels)
+        assert isinstance(hotels.items, list)
+        assert len(hotels.items) >= 1
+        assert all(isinstance(h, Hotel) for h in hotels.items)
 
     async def test_get_hotels_with_filters(self, hotel_adapter, hotel):
         """Test getting hotels with filters."""
         hotels = await hotel_adapter.get_hotels(location=hotel.location)
 
-        assert len(hotels) >= 1
-        assert all(h.location == hotel.location for h in hotels)
+        assert len(hotels.items) >= 1
+        assert all(h.location == hotel.location for h in hotels.items)
 
     async def test_get_hotels_only_active(self, hotel_adapter, manager):
         """Test getting only active hotels."""
@@ -51,7 +53,7 @@ class TestHotelAdapter:
 
         hotels = await hotel_adapter.get_hotels(only_active=True)
 
-        assert all(h.is_active for h in hotels)
+        assert all(h.is_active for h in hotels.items)
 
     async def test_get_hotel_by_id_success(self, hotel_adapter, hotel):
         """Test getting hotel by id."""
@@ -168,11 +170,106 @@ class TestHotelAdapter:
 
         hotels = await hotel_adapter.get_hotels(services={"wifi": True})
 
-        assert len(hotels) >= 1
-        assert all("wifi" in h.services for h in hotels if h.services)
+        assert len(hotels.items) >= 1
+        assert all("wifi" in h.services for h in hotels.items if h.services)
+
+    async def test_get_hotels_with_common_and_uncommon_services(self, hotel_adapter, manager):
+        """Test that filters on common and uncommon services both match by exact containment."""
+        spa_hotel = Hotel(
+            name="Spa Hotel",
+            location="Amenities Location",
+            rooms_quantity=10,
+            owner=manager.id,
+            services={"WiFi": True, "Sauna": True},
+        )
+        plain_hotel = Hotel(
+            name="Plain Hotel",
+            location="Amenities Location",
+            rooms_quantity=10,
+            owner=manager.id,
+            services={"wifi": True, "sauna": False},
+        )
+        await hotel_adapter.add(spa_hotel)
+        await hotel_adapter.add(plain_hotel)
+
+        with_wifi = await hotel_adapter.get_hotels(location="Amenities Location", services={"wifi": True})
+        with_sauna = await hotel_adapter.get_hotels(
+            location="Amenities Location", services={"WiFi": True, "Sauna": True}
+        )
+
+        assert [h.id for h in with_wifi.items] == [plain_hotel.id]
+        assert [h.id for h in with_sauna.items] == [spa_hotel.id]
+
+    async def test_update_hotel_services_updates_amenities(self, hotel_adapter, hotel):
+        """Test that updating the services keeps the amenities bitmap in sync."""
+        await hotel_adapter.update_hotel(hotel, services={"pool": True, "wifi": False})
+
+        updated_hotel = await hotel_adapter.get_hotel_by_id(hotel.id)
+        assert updated_hotel.amenities == AmenityFlag.POOL
 
     async def test_get_hotels_with_rooms_quantity_filter(self, hotel_adapter, manager):
         """Test filtering hotels by minimum rooms quantity."""
         hotels = await hotel_adapter.get_hotels(rooms_quantity=5)
 
-        assert all(h.rooms_quantity >= 5 for h in hotels)
+        assert all(h.rooms_quantity >= 5 for h in hotels.items)
+
+    async def test_get_hotels_pages(self, hotel_adapter, hotel, manager):
+        """Test walking hotels page by page with cursors."""
+        for i in range(4):
+            await hotel_adapter.add(
+                Hotel(
+                    name=f"Paged Hotel {i}",
+                    location="Paged Location",
+                    rooms_quantity=5,
+                    owner=manager.id,
+                    services=None,
+                )
+            )
+
+        names, cursor = [], None
+        while True:
+            page = await hotel_adapter.get_hotels(location="Paged Location", limit=3, cursor=cursor)
+            names.extend(h.name for h in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert names == [f"Paged Hotel {i}" for i in range(4)]
+
+    async def test_get_hotels_invalid_cursor(self, hotel_adapter):
+        """Test that a malformed cursor is rejected."""
+        with pytest.raises(InvalidCursorError):
+            await hotel_adapter.get_hotels(cursor="not-a-cursor")
+
+    async def test_search_hotels(self, hotel_adapter, manager):
+        """Test searching hotels by misspelt, partial and Russian words, best match first."""
+        for name, location in [("Grand Sochi", "Sochi"), ("Sea Breeze", "Sochi"), ("Гранд Отель", "Сочи")]:
+            await hotel_adapter.add(
+                Hotel(name=name, location=location, rooms_quantity=5, owner=manager.id, services=None)
+            )
+
+        typo = await hotel_adapter.search_hotels("sochy")
+        prefix = await hotel_adapter.search_hotels("gra")
+        russian = await hotel_adapter.search_hotels("сочи")
+
+        assert typo.items[0].name == "Grand Sochi"
+        assert {h.name for h in typo.items} >= {"Grand Sochi", "Sea Breeze"}
+        assert "Grand Sochi" in {h.name for h in prefix.items}
+        assert [h.name for h in russian.items] == ["Гранд Отель"]
+
+    async def test_search_hotels_pages(self, hotel_adapter, manager):
+        """Test walking search results page by page with cursors."""
+        for i in range(4):
+            await hotel_adapter.add(
+                Hotel(name=f"Searched Hotel {i}", location="Kazan", rooms_quantity=5, owner=manager.id, services=None)
+            )
+
+        names, cursor = [], None
+        while True:
+            page = await hotel_adapter.search_hotels("kazan", limit=3, cursor=cursor)
+            names.extend(h.name for h in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert sorted(names) == [f"Searched Hotel {i}" for i in range(4)]
@@ -1,10 +1,14 @@
+import csv
+import io
 import uuid
 
+import orjson
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
 from tests.fixtures.mocks import MockHotel, MockUser
+from tests.fixtures.queries import count_statements
 
 
 @pytest.fixture(autouse=True)
@@ -21,7 +25,7 @@ class TestHotelAPI:
         response = await http_client.get("/api/v1/hotels")
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) >= 1
 
@@ -34,6 +38,19 @@ class TestHotelAPI:
         assert data["id"] == str(hotel.id)
         assert data["name"] == hotel.name
 
+    async def test_search_hotels(self, http_client: AsyncClient, hotel):
+        """Test searching hotels by a partial location."""
+        response = await http_client.get("/api/v1/hotels/search", params={"q": hotel.location[:4]})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert str(hotel.id) in [item["id"] for item in response.json()["items"]]
+
+    async def test_search_hotels_empty_query(self, http_client: AsyncClient):
+        """Test that an empty search query is rejected."""
+        response = await http_client.get("/api/v1/hotels/search", params={"q": ""})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     async def test_get_hotel_by_id_not_found(self, http_client: AsyncClient):
         """Test getting non-existent hotel."""
         hotel_id = uuid.uuid4()
@@ -186,6 +203,93 @@ class TestHotelAPI:
         response = await http_client.get("/api/v1/hotels", params={"location": hotel.location})
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert len(data) >= 1
         assert all(h["location"] == hotel.location for h in data)
+
+    async def test_export_hotels_csv(self, http_client: AsyncClient, valid_manager_token, hotel):
+        """Test exporting the manager's hotels as CSV."""
+        response = await http_client.get(
+            "/api/v1/hotels/export",
+            params={"format": "csv"},
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["id"] for row in rows] == [str(hotel.id)]
+        assert rows[0]["name"] == hotel.name
+
+    async def test_export_hotels_ndjson(self, http_client: AsyncClient, valid_manager_token, hotel):
+        """Test exporting the manager's hotels as NDJSON with their IDs as strings."""
+        response = await http_client.get(
+            "/api/v1/hotels/export",
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [orjson.loads(line) for line in response.content.splitlines()]
+        assert [row["id"] for row in rows] == [str(hotel.id)]
+        assert rows[0]["name"] == hotel.name
+
+    async def test_get_hotels_query_count(self, http_client: AsyncClient, sqlalchemy_engine, hotel):
+        """Test that listing hotels issues the version statement and a single select."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get("/api/v1/hotels")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 2
+
+    async def test_get_hotel_by_id_query_count(self, http_client: AsyncClient, sqlalchemy_engine, hotel):
+        """Test that getting hotel details issues a single select, its ETag comes with the details."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(f"/api/v1/hotels/{hotel.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 1
+
+    async def test_get_hotels_etag(self, http_client: AsyncClient, sqlalchemy_engine, hotel):
+        """Test that a listing revalidated with its ETag is answered 304 from the version statement alone."""
+        response = await http_client.get("/api/v1/hotels", params={"location": hotel.location})
+        etag = response.headers["ETag"]
+
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(
+                "/api/v1/hotels", params={"location": hotel.location}, headers={"If-None-Match": etag}
+            )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert len(statements) == 1
+
+    async def test_get_hotels_etag_differs_by_query(self, http_client: AsyncClient, hotel):
+        """Test that each filter of the listing gets its own ETag."""
+        first = await http_client.get("/api/v1/hotels", params={"location": hotel.location})
+        second = await http_client.get("/api/v1/hotels", params={"location": "Elsewhere"})
+
+        assert first.headers["ETag"] != second.headers["ETag"]
+
+    async def test_get_hotel_etag_changes_on_update(self, http_client: AsyncClient, valid_manager_token, hotel):
+        """Test that updating a hotel changes the ETag of its details, so stale copies are served again."""
+        response = await http_client.get(f"/api/v1/hotels/{hotel.id}")
+        etag = response.headers["ETag"]
+
+        await http_client.patch(
+            "/api/v1/hotels",
+            json={
+                "hotel_id": str(hotel.id),
+                "name": "Renamed Hotel",
+                "location": hotel.location,
+                "rooms_quantity": hotel.rooms_quantity,
+                "is_active": True,
+            },
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+        response = await http_client.get(f"/api/v1/hotels/{hotel.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        assert response.json()["name"] == "Renamed Hotel"
@@ -33,9 +33,9 @@ class TestHotelService:
         )
         hotels = await hotel_service.list_hotels(cmd)
 
-        assert isinstance(hotels, list)
-        assert len(hotels) >= 1
-        assert all(isinstance(h, Hotel) for h in hotels)
+        assert isinstance(hotels.items, list)
+        assert len(hotels.items) >= 1
+        assert all(isinstance(h, Hotel) for h in hotels.items)
 
     async def test_get_hotel_success(self, hotel_service, hotel):
         """Test getting an existing hotel."""
@@ -101,6 +101,48 @@ class TestHotelService:
 
         assert updated_id == hotel.id
 
+    async def test_update_hotel_bumps_version(self, hotel_service, manager, hotel):
+        """Test that an update changes the version signals of the hotel and of the hotel listing."""
+        get_cmd = commands.GetHotelCommand(hotel_id=hotel.id)
+        list_cmd = commands.ListHotelsCommand(location=hotel.location, services=None, rooms_quantity=None)
+        version = (await hotel_service.get_hotel(get_cmd)).version
+        list_version = await hotel_service.get_hotels_version(list_cmd)
+
+        cmd = commands.UpdateHotelCommand(
+            hotel_id=hotel.id,
+            owner=manager.id,
+            name="Versioned Hotel",
+            rooms_quantity=None,
+            location=None,
+            services=None,
+            is_active=None,
+            image_id=None,
+        )
+        await hotel_service.update_hotel(cmd)
+
+        assert (await hotel_service.get_hotel(get_cmd)).version == version + 1
+        assert await hotel_service.get_hotels_version(list_cmd) != list_version
+
+    async def test_update_hotel_invalidates_cached_detail(self, hotel_service, manager, hotel):
+        """Test that the hotel details served after an update reflect it."""
+        get_cmd = commands.GetHotelCommand(hotel_id=hotel.id)
+        await hotel_service.get_hotel(get_cmd)
+
+        cmd = commands.UpdateHotelCommand(
+            hotel_id=hotel.id,
+            owner=manager.id,
+            name="Renamed Hotel",
+            rooms_quantity=None,
+            location=None,
+            services=None,
+            is_active=None,
+            image_id=None,
+        )
+        await hotel_service.update_hotel(cmd)
+
+        result = await hotel_service.get_hotel(get_cmd)
+        assert result.name == "Renamed Hotel"
+
     async def test_update_hotel_cannot_be_updated(self, hotel_service, hotel, existing_hotel):
         """Test updating an existing hotel."""
         cmd = commands.UpdateHotelCommand(
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from src.common.controllers.http.coalescing import CoalescingAPIRoute, coalesce_requests
+
+
+class Endpoint:
+    """Endpoint body counting its runs, held until released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, location: str = "") -> dict:
+        """Return a payload once released."""
+        self.calls += 1
+        await self.release.wait()
+        if location == "missing":
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"location": location, "call": self.calls}
+
+
+@pytest.fixture
+def endpoint() -> Endpoint:
+    """Endpoint body shared by the coalesced and the plain routes."""
+    return Endpoint()
+
+
+@pytest.fixture
+async def client(endpoint):
+    """Client of an app with a coalesced route and a plain one, behind a prefixed parent router."""
+    router = APIRouter(prefix="/hotels", route_class=CoalescingAPIRoute)
+
+    @router.get("")
+    @coalesce_requests
+    async def list_hotels(location: str = "") -> dict:
+        return await endpoint(location)
+
+    @router.get("/plain")
+    async def list_hotels_plain(location: str = "") -> dict:
+        return await endpoint(location)
+
+    api_router = APIRouter(prefix="/api/v1")
+    api_router.include_router(router)
+    app = FastAPI()
+    app.include_router(api_router)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def _send_together(endpoint: Endpoint, *requests):
+    tasks = [asyncio.create_task(request) for request in requests]
+    # Let every request reach the endpoint or the in-flight call before releasing it
+    for _ in range(10):
+        await asyncio.sleep(0)
+    endpoint.release.set()
+    return await asyncio.gather(*tasks)
+
+
+@pytest.mark.anyio
+class TestRequestCoalescing:
+    async def test_identical_requests_share_one_run(self, client, endpoint):
+        """Test that identical concurrent requests run the endpoint once and all get its response."""
+        responses = await _send_together(
+            endpoint,
+            *(client.get("/api/v1/hotels", params={"location": "Paris"}) for _ in range(20)),
+        )
+
+        assert endpoint.calls == 1
+        assert {response.status_code for response in responses} == {200}
+        assert all(response.json() == {"location": "Paris", "call": 1} for response in responses)
+
+    async def test_query_order_does_not_matter(self, client, endpoint):
+        """Test that requests only differing by the order of their query parameters are coalesced."""
+        await _send_together(
+            endpoint,
+            client.get("/api/v1/hotels?location=Paris&limit=10"),
+            client.get("/api/v1/hotels?limit=10&location=Paris"),
+        )
+
+        assert endpoint.calls == 1
+
+    async def test_different_queries_and_credentials_are_not_coalesced(self, client, endpoint):
+        """Test that requests with other parameters, credentials or preconditions run on their own."""
+        await _send_together(
+            endpoint,
+            client.get("/api/v1/hotels", params={"location": "Paris"}),
+            client.get("/api/v1/hotels", params={"location": "Rome"}),
+            client.get("/api/v1/hotels", params={"location": "Paris"}, headers={"Authorization": "Bearer token"}),
+            client.get("/api/v1/hotels", params={"location": "Paris"}, headers={"If-None-Match": '"abc"'}),
+        )
+
+        assert endpoint.calls == 4
+
+    async def test_errors_reach_every_request(self, client, endpoint):
+        """Test that an error of the shared run is handled for each waiting request."""
+        responses = await _send_together(
+            endpoint,
+            *(client.get("/api/v1/hotels", params={"location": "missing"}) for _ in range(5)),
+        )
+
+        assert endpoint.calls == 1
+        assert {response.status_code for response in responses} == {404}
+
+    async def test_unmarked_routes_are_not_coalesced(self, client, endpoint):
+        """Test that endpoints without the marker run for every request."""
+        await _send_together(endpoint, *(client.get("/api/v1/hotels/plain") for _ in range(5)))
+
+        assert endpoint.calls == 5
+
+    async def test_responses_are_not_kept(self, client, endpoint):
+        """Test that a request arriving after the shared run finished runs the endpoint again."""
+        endpoint.release.set()
+
+        await client.get("/api/v1/hotels")
+        await client.get("/api/v1/hotels")
+
+        assert endpoint.calls == 2
+
+    def test_only_safe_methods_can_be_coalesced(self):
+        """Test that marking a non-GET endpoint is rejected."""
+        router = APIRouter(route_class=CoalescingAPIRoute)
+
+        with pytest.raises(ValueError, match="coalesced"):
+
+            @router.post("/hotels")
+            @coalesce_requests
+            async def create_hotel() -> None: ...
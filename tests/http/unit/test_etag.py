@@ -0,0 +1,67 @@
+import pytest
+from fastapi import Request, Response
+
+from src.common.controllers.http.etag import NotModified, check_etag, etag_matches, make_etag
+
+
+def _request(query: str = "", if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/hotels",
+        "query_string": query.encode(),
+        "headers": headers,
+    })
+
+
+class TestMakeETag:
+    def test_strong_and_stable(self):
+        """Test that the tag is a quoted strong ETag, the same for the same version."""
+        etag = make_etag(_request("location=Paris"), 3, "2026-01-01")
+
+        assert etag.startswith('"')
+        assert etag.endswith('"')
+        assert etag == make_etag(_request("location=Paris"), 3, "2026-01-01")
+
+    def test_changes_with_version_and_query(self):
+        """Test that another version or other query parameters give another tag."""
+        etag = make_etag(_request("location=Paris"), 3)
+
+        assert make_etag(_request("location=Paris"), 4) != etag
+        assert make_etag(_request("location=Rome"), 3) != etag
+
+    def test_query_order_does_not_matter(self):
+        """Test that the order of the query parameters does not change the tag."""
+        assert make_etag(_request("a=1&b=2"), 1) == make_etag(_request("b=2&a=1"), 1)
+
+
+class TestCheckETag:
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ['"abc"', 'W/"abc"', '"other", "abc"', "*"],
+    )
+    def test_matching_precondition(self, if_none_match):
+        """Test the forms of If-None-Match listing the current tag."""
+        assert etag_matches(if_none_match, '"abc"')
+
+    @pytest.mark.parametrize("if_none_match", [None, "", '"other"', "abc"])
+    def test_other_precondition(self, if_none_match):
+        """Test that absent or other tags do not match."""
+        assert not etag_matches(if_none_match, '"abc"')
+
+    def test_sets_etag_on_response(self):
+        """Test that a request without a matching tag gets the ETag on its response."""
+        response = Response()
+
+        check_etag(_request(if_none_match='"other"'), response, '"abc"')
+
+        assert response.headers["ETag"] == '"abc"'
+
+    def test_not_modified(self):
+        """Test that a request with the current tag is answered 304 with the tag."""
+        with pytest.raises(NotModified) as error:
+            check_etag(_request(if_none_match='"abc"'), Response(), '"abc"')
+
+        assert error.value.status_code == 304
+        assert error.value.headers == {"ETag": '"abc"'}
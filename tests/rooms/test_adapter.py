@@ -30,24 +30,24 @@ class TestRoomAdapter:
         """Test listing all rooms for a hotel."""
         result = await room_adapter.list_rooms(sample_hotel.id)
 
-        assert isinstance(result, list)
-        assert len(result) >= 2
-        assert all(isinstance(room, Room) for room in result)
-        assert all(room.hotel_id == sample_hotel.id for room in result)
+        assert isinstance(result.items, list)
+        assert len(result.items) >= 2
+        assert all(isinstance(room, Room) for room in result.items)
+        assert all(room.hotel_id == sample_hotel.id for room in result.items)
 
     async def test_list_rooms_with_price_filter(self, room_adapter, sample_hotel):
         """Test listing rooms with price range filter."""
         result = await room_adapter.list_rooms(sample_hotel.id, price_from=Decimal("85.0"), price_to=Decimal("95.0"))
 
-        assert len(result) >= 1
-        assert all(Decimal("85.0") <= room.price <= Decimal("95.0") for room in result)
+        assert len(result.items) >= 1
+        assert all(Decimal("85.0") <= room.price <= Decimal("95.0") for room in result.items)
 
     async def test_list_rooms_with_services_filter(self, room_adapter, sample_hotel):
         """Test listing rooms with services filter."""
         result = await room_adapter.list_rooms(sample_hotel.id, services={"wifi": True})
 
-        assert len(result) >= 1
-        assert all(room.services and room.services.get("wifi") is True for room in result)
+        assert len(result.items) >= 1
+        assert all(room.services and room.services.get("wifi") is True for room in result.items)
 
     async def test_get_room_success(self, room_adapter, existing_room):
         """Test getting room by ID."""
@@ -165,7 +165,7 @@ class TestRoomAdapter:
 
         assert all(
             Decimal("50.0") <= room.price <= Decimal("150.0") and room.services and room.services.get("wifi") is True
-            for room in result
+            for room in result.items
         )
 
     async def test_list_rooms_different_hotels(self, room_adapter, hotel, sample_hotel, rooms):
@@ -173,6 +173,6 @@ class TestRoomAdapter:
         hotel_rooms = await room_adapter.list_rooms(hotel.id)
         sample_hotel_rooms = await room_adapter.list_rooms(sample_hotel.id)
 
-        assert all(room.hotel_id == hotel.id for room in hotel_rooms)
-        assert all(room.hotel_id == sample_hotel.id for room in sample_hotel_rooms)
-        assert len(hotel_rooms) >= 3
+        assert all(room.hotel_id == hotel.id for room in hotel_rooms.items)
+        assert all(room.hotel_id == sample_hotel.id for room in sample_hotel_rooms.items)
+        assert len(hotel_rooms.items) >= 3
@@ -1,10 +1,13 @@
 import uuid
+from decimal import Decimal
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from src.apps.hotel.rooms.domain.models import Room
 from tests.fixtures.mocks import MockHotel, MockRoom, MockUser
+from tests.fixtures.queries import count_statements
 
 
 @pytest.fixture(autouse=True)
@@ -24,7 +27,7 @@ class TestRoomAPI:
         response = await http_client.get(f"/api/v1/hotels/{hotel.id}/rooms")
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) >= 1
 
@@ -229,6 +232,57 @@ class TestRoomAPI:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    async def test_delete_rooms_success(self, http_client: AsyncClient, valid_manager_token, rooms):
+        """Test deleting many rooms at once, skipping the missing ones."""
+        missing_id = uuid.uuid4()
+        response = await http_client.post(
+            "/api/v1/hotels/rooms/batch-delete",
+            json={"room_ids": [str(room.id) for room in rooms[:2]] + [str(missing_id)]},
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.json()["ids"]) == {str(room.id) for room in rooms[:2]}
+        # Verify deletion
+        for room in rooms[:2]:
+            get_response = await http_client.get(f"/api/v1/hotels/rooms/{room.id}")
+            assert get_response.status_code == status.HTTP_404_NOT_FOUND
+        get_response = await http_client.get(f"/api/v1/hotels/rooms/{rooms[2].id}")
+        assert get_response.status_code == status.HTTP_200_OK
+
+    async def test_delete_rooms_not_owned_forbidden(
+        self, http_client: AsyncClient, save_instances, valid_manager_token, user, hotel, rooms
+    ):
+        """Test that no room is deleted when one of them belongs to another owner."""
+        foreign_room = Room(
+            hotel_id=hotel.id,
+            owner=user.id,
+            name="Foreign Room",
+            price=Decimal("100.0"),
+            quantity=1,
+            description="Room of another owner",
+            services={},
+        )
+        await save_instances(MockRoom([foreign_room]))
+
+        response = await http_client.post(
+            "/api/v1/hotels/rooms/batch-delete",
+            json={"room_ids": [str(rooms[0].id), str(foreign_room.id)]},
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        get_response = await http_client.get(f"/api/v1/hotels/rooms/{rooms[0].id}")
+        assert get_response.status_code == status.HTTP_200_OK
+
+    async def test_delete_rooms_unauthorized(self, http_client: AsyncClient, rooms):
+        """Test deleting many rooms without authorization."""
+        response = await http_client.post(
+            "/api/v1/hotels/rooms/batch-delete", json={"room_ids": [str(room.id) for room in rooms]}
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
     async def test_list_rooms_with_filters(self, http_client: AsyncClient, hotel, sample_room):
         """Test filtering rooms by price range."""
         response = await http_client.get(
@@ -236,5 +290,80 @@ class TestRoomAPI:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
+
+    async def test_list_rooms_query_count(self, http_client: AsyncClient, sqlalchemy_engine, hotel, rooms):
+        """Test that listing rooms issues the version statement and a single select."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(f"/api/v1/hotels/{hotel.id}/rooms")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 2
+
+    async def test_get_room_by_id_query_count(self, http_client: AsyncClient, sqlalchemy_engine, sample_room):
+        """Test that getting room details issues a single select, its ETag comes with the details."""
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(f"/api/v1/hotels/rooms/{sample_room.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 1
+
+    async def test_list_rooms_etag(self, http_client: AsyncClient, sqlalchemy_engine, hotel, rooms):
+        """Test that a room listing revalidated with its ETag is answered 304 from the version statement alone."""
+        response = await http_client.get(f"/api/v1/hotels/{hotel.id}/rooms")
+        etag = response.headers["ETag"]
+
+        with count_statements(sqlalchemy_engine) as statements:
+            response = await http_client.get(f"/api/v1/hotels/{hotel.id}/rooms", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert len(statements) == 1
+
+    async def test_get_room_etag_changes_on_update(self, http_client: AsyncClient, valid_manager_token, sample_room):
+        """Test that updating a room changes the ETag of its details and of its hotel's listing."""
+        detail = await http_client.get(f"/api/v1/hotels/rooms/{sample_room.id}")
+        listing = await http_client.get(f"/api/v1/hotels/{sample_room.hotel_id}/rooms")
+
+        await http_client.patch(
+            f"/api/v1/hotels/rooms/{sample_room.id}",
+            json={"name": "Renamed Room", "price": "150.00"},
+            headers={"Authorization": f"Bearer {valid_manager_token}"},
+        )
+        new_detail = await http_client.get(
+            f"/api/v1/hotels/rooms/{sample_room.id}", headers={"If-None-Match": detail.headers["ETag"]}
+        )
+        new_listing = await http_client.get(
+            f"/api/v1/hotels/{sample_room.hotel_id}/rooms", headers={"If-None-Match": listing.headers["ETag"]}
+        )
+
+        assert new_detail.status_code == status.HTTP_200_OK
+        assert new_detail.json()["name"] == "Renamed Room"
+        assert new_listing.status_code == status.HTTP_200_OK
+        assert new_listing.headers["ETag"] != listing.headers["ETag"]
+
+    async def test_list_rooms_pagination(self, http_client: AsyncClient, hotel, rooms):
+        """Test that rooms are returned in pages linked by next_cursor."""
+        first = await http_client.get(f"/api/v1/hotels/{hotel.id}/rooms", params={"limit": 2})
+
+        assert first.status_code == status.HTTP_200_OK
+        first_page = first.json()
+        assert len(first_page["items"]) == 2
+        assert first_page["next_cursor"] is not None
+
+        second = await http_client.get(
+            f"/api/v1/hotels/{hotel.id}/rooms", params={"limit": 2, "cursor": first_page["next_cursor"]}
+        )
+
+        assert second.status_code == status.HTTP_200_OK
+        second_page = second.json()
+        assert second_page["next_cursor"] is None
+        room_ids = [room["id"] for room in first_page["items"] + second_page["items"]]
+        assert sorted(room_ids) == sorted(str(room.id) for room in rooms)
+
+    async def test_list_rooms_invalid_cursor(self, http_client: AsyncClient, hotel):
+        """Test that a malformed cursor is rejected."""
+        response = await http_client.get(f"/api/v1/hotels/{hotel.id}/rooms", params={"cursor": "garbage"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -6,6 +6,7 @@ import pytest
 from src.apps.hotel.rooms.application import exceptions
 from src.apps.hotel.rooms.application.service import RoomService
 from src.apps.hotel.rooms.domain import commands
+from src.apps.hotel.rooms.domain.results import RoomDetail
 from tests.fixtures.mocks import MockHotel, MockRoom, MockUser
 
 
@@ -29,14 +30,15 @@ class TestRoomService:
         cmd = commands.ListRoomsCommand(hotel_id=hotel.id, services=None, price_from=None, price_to=None)
         result = await room_service.list_rooms(cmd)
 
-        assert result == rooms
+        assert {room.id for room in result.items} == {room.id for room in rooms}
+        assert result.next_cursor is None
 
     async def test_get_room_success(self, room_service, sample_room):
         """Test getting an existing room."""
         cmd = commands.GetRoomCommand(room_id=sample_room.id)
         result = await room_service.get_room(cmd)
 
-        assert result == sample_room
+        assert result == RoomDetail.model_validate(sample_room)
         assert result.id == sample_room.id
 
     async def test_get_room_not_found(self, room_service):
@@ -84,6 +86,48 @@ class TestRoomService:
         with pytest.raises(exceptions.RoomAlreadyExistsError):
             await room_service.add_room(cmd)
 
+    async def test_add_rooms_success(self, room_service, sample_hotel):
+        """Test adding many rooms at once."""
+        cmd = commands.AddRoomsCommand(
+            user_id=sample_hotel.owner,
+            hotel_id=sample_hotel.id,
+            rooms=[
+                commands.NewRoom(
+                    name=f"Room {number}",
+                    price=Decimal("80.0"),
+                    quantity=2,
+                    description=None,
+                    services=None,
+                    image_id=None,
+                )
+                for number in range(20)
+            ],
+        )
+
+        result = await room_service.add_rooms(cmd)
+
+        assert len(result) == 20
+        assert len(set(result)) == 20
+
+    async def test_add_rooms_already_exists(self, room_service, sample_room):
+        """Test that adding many rooms fails as a whole when one of them already exists."""
+        new_room = commands.NewRoom(
+            name="Brand New Room",
+            price=Decimal("80.0"),
+            quantity=None,
+            description=None,
+            services=None,
+            image_id=None,
+        )
+        cmd = commands.AddRoomsCommand(
+            user_id=sample_room.owner,
+            hotel_id=sample_room.hotel_id,
+            rooms=[new_room, new_room.model_copy(update={"name": sample_room.name})],
+        )
+
+        with pytest.raises(exceptions.RoomAlreadyExistsError):
+            await room_service.add_rooms(cmd)
+
     async def test_update_room_success(self, room_service, sample_room):
         """Test updating an existing room."""
         cmd = commands.UpdateRoomCommand(
@@ -102,6 +146,26 @@ class TestRoomService:
         assert result is not None
         assert result == sample_room.id
 
+    async def test_update_room_invalidates_cached_detail(self, room_service, sample_room):
+        """Test that the room details served after an update reflect it."""
+        get_cmd = commands.GetRoomCommand(room_id=sample_room.id)
+        await room_service.get_room(get_cmd)
+
+        cmd = commands.UpdateRoomCommand(
+            room_id=sample_room.id,
+            user_id=sample_room.owner,
+            name="Renamed Room",
+            price=None,
+            quantity=None,
+            description=None,
+            services=None,
+            image_id=None,
+        )
+        await room_service.update_room(cmd)
+
+        result = await room_service.get_room(get_cmd)
+        assert result.name == "Renamed Room"
+
     async def test_update_room_not_found(self, room_service, sample_room):
         """Test updating a non-existent room."""
         room_id = uuid4()
@@ -147,6 +211,18 @@ class TestRoomService:
         with pytest.raises(exceptions.RoomNotFoundError):
             await room_service.get_room(cmd)
 
+    async def test_delete_rooms_success(self, room_service, manager, rooms):
+        """Test deleting many rooms at once, skipping the missing ones."""
+        cmd = commands.DeleteRoomsCommand(user_id=manager.id, room_ids=[rooms[0].id, rooms[1].id, uuid4()])
+        result = await room_service.delete_rooms(cmd)
+
+        assert set(result) == {rooms[0].id, rooms[1].id}
+        # Verify deletion
+        for room in rooms[:2]:
+            with pytest.raises(exceptions.RoomNotFoundError):
+                await room_service.get_room(commands.GetRoomCommand(room_id=room.id))
+        assert (await room_service.get_room(commands.GetRoomCommand(room_id=rooms[2].id))).id == rooms[2].id
+
     async def test_delete_room_not_found(self, room_service, sample_room):
         """Test deleting a non-existent room."""
         cmd = commands.DeleteRoomCommand(user_id=uuid4(), room_id=uuid4())
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
@@ -7,12 +10,16 @@ import pytest
 
 from src.apps.authentication.session.domain.enums import AuthTokenTypeEnum
 from src.common.interfaces import CustomLoggerProto
+from src.config import Configs
 from src.infrastructure.security.adapter import SecurityAdapter
+from src.infrastructure.security.cache import VerifiedTokenCache
 from src.infrastructure.security.exceptions import (
     ExpiredTokenError,
     InvalidTokenError,
     InvalidTokenTypeError,
+    PasswordHashingBusyError,
 )
+from src.infrastructure.security.hashing import PasswordHashingExecutor
 
 
 @pytest.fixture
@@ -37,6 +44,26 @@ def security_adapter(mock_config, mock_logger):
     return SecurityAdapter(config=mock_config, logger=Annotated[mock_logger, CustomLoggerProto])
 
 
+@pytest.fixture
+def token_cache() -> VerifiedTokenCache:
+    """Create a small verified token cache for testing."""
+    return VerifiedTokenCache(max_size=2)
+
+
+@pytest.fixture
+def cached_security_adapter(mock_logger, token_cache):
+    """Create a SecurityAdapter instance backed by a verified token cache."""
+    return SecurityAdapter(config=Configs(), logger=mock_logger, token_cache=token_cache)
+
+
+@pytest.fixture
+def hashing_executor():
+    """Create a password hashing executor with a single worker and no queue."""
+    executor = PasswordHashingExecutor(workers=1, queue_size=0, retry_after=3)
+    yield executor
+    executor.shutdown()
+
+
 @pytest.mark.anyio
 class TestSecurityAdapter:
     async def test_hash_password_returns_hashed_string(self, security_adapter):
@@ -253,3 +280,78 @@ class TestSecurityAdapter:
         result = security_adapter.verify_hashed_string("wrong_string", hashed)
 
         assert result is False
+
+    async def test_decode_token_is_served_from_cache(self, cached_security_adapter, token_cache):
+        """Test that a token verified once is decoded from the cache afterwards."""
+        created_at = datetime.now(UTC)
+        token = await cached_security_adapter.create_jwt_token(
+            token_type=AuthTokenTypeEnum.ACCESS,
+            user_id=uuid.uuid4(),
+            created_at=created_at,
+            expires_at=created_at + timedelta(hours=1),
+        )
+
+        first = await cached_security_adapter.decode_jwt_token(token)
+        second = await cached_security_adapter.decode_jwt_token(token)
+
+        assert first == second
+        assert token_cache.hits == 1
+        assert token_cache.misses == 1
+        assert token_cache.hit_ratio == pytest.approx(0.5)
+
+    async def test_invalid_token_is_not_cached(self, cached_security_adapter, token_cache):
+        """Test that tokens failing verification never enter the cache."""
+        with pytest.raises(InvalidTokenError):
+            await cached_security_adapter.decode_jwt_token("invalid.token.here")
+
+        assert len(token_cache) == 0
+
+    async def test_verify_password_on_hashing_executor(self, mock_config, mock_logger, hashing_executor):
+        """Test that password hashing and verification run on the dedicated executor."""
+        adapter = SecurityAdapter(config=mock_config, logger=mock_logger, hashing_executor=hashing_executor)
+
+        hashed = await adapter.hash_password("test_password_123")
+
+        assert await adapter.verify_hashed_password("test_password_123", hashed) is True
+
+
+@pytest.mark.anyio
+class TestPasswordHashingExecutor:
+    async def test_saturated_executor_rejects_work(self, hashing_executor):
+        """Test that work beyond the worker and queue capacity is rejected with a retry hint."""
+        release = threading.Event()
+        running = asyncio.ensure_future(hashing_executor.run("hash", release.wait))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHashingBusyError) as exc_info:
+            await hashing_executor.run("hash", release.is_set)
+
+        release.set()
+        assert await running is True
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "3"}
+        assert await hashing_executor.run("hash", release.is_set) is True
+
+
+class TestVerifiedTokenCache:
+    def test_entry_expires_with_token(self, token_cache):
+        """Test that cached payloads are dropped once the token expires."""
+        token_cache.put("expired", {"exp": time.time() - 1})
+        token_cache.put("short", {"exp": time.time() + 0.05})
+
+        assert token_cache.get("expired") is None
+        assert token_cache.get("short") is not None
+        time.sleep(0.1)
+        assert token_cache.get("short") is None
+
+    def test_least_recently_used_entry_is_evicted(self, token_cache):
+        """Test that the cache stays bounded by evicting the least recently used token."""
+        exp = time.time() + 60
+        token_cache.put("first", {"exp": exp})
+        token_cache.put("second", {"exp": exp})
+        token_cache.get("first")
+        token_cache.put("third", {"exp": exp})
+
+        assert len(token_cache) == 2
+        assert token_cache.get("second") is None
+        assert token_cache.get("first") is not None
@@ -78,16 +78,16 @@ class TestUserAdapter:
         """Test getting all users."""
         result = await user_adapter.get_users()
 
-        assert isinstance(result, list)
-        assert len(result) >= len(users)
-        assert all(isinstance(u, User) for u in result)
+        assert isinstance(result.items, list)
+        assert len(result.items) >= len(users)
+        assert all(isinstance(u, User) for u in result.items)
 
     async def test_get_users_with_filter(self, user_adapter, sample_user):
         """Test getting users with filter."""
         result = await user_adapter.get_users(email=sample_user.email)
 
-        assert len(result) == 1
-        assert result[0].email == sample_user.email
+        assert len(result.items) == 1
+        assert result.items[0].email == sample_user.email
 
     async def test_add_user_success(self, user_adapter, request_container):
         """Test adding a new user."""